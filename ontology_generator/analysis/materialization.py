@@ -0,0 +1,310 @@
+"""
+OWL RL materialization module for the ontology generator.
+
+This module provides an in-process, rule-based alternative to running HermiT for
+property materialization. It covers the OWL RL subset used by the specification:
+inverse, symmetric and transitive properties, sub-property and sub-class
+propagation, and domain/range typing. Rules run as iterated semi-naive SQL joins
+directly over the owlready2 quadstore, so no JVM or ontology export is needed.
+
+Materialization does not check consistency; use the HermiT reasoner for that.
+"""
+from typing import Dict, Iterable, Optional, Tuple
+
+from owlready2 import Ontology, Thing, LOADING
+
+from ontology_generator.utils.logging import analysis_logger
+from ontology_generator.utils import quadstore
+
+OWL_SYMMETRIC_PROPERTY = "http://www.w3.org/2002/07/owl#SymmetricProperty"
+OWL_TRANSITIVE_PROPERTY = "http://www.w3.org/2002/07/owl#TransitiveProperty"
+
+# Rules reported by materialize_owl_rl, in report order
+RL_RULES = ['inverse', 'symmetric', 'transitive', 'subproperty', 'domain', 'range', 'subclass']
+
+# Safety net for the fixpoint loop; real ontologies converge in a handful of rounds
+DEFAULT_MAX_ITERATIONS = 100
+
+_TEMP_TABLES = [
+    "rl_objprops", "rl_subclass", "rl_subprop", "rl_inverse", "rl_symmetric", "rl_transitive",
+    "rl_domain", "rl_range", "rl_delta", "rl_new", "rl_new_datas", "rl_types", "rl_added",
+]
+
+def _drop_temp_tables(world) -> None:
+    """Drop the materializer's temporary tables, if any."""
+    for table in _TEMP_TABLES:
+        quadstore.execute(world, f"DROP TABLE IF EXISTS temp.{table}")
+
+def _closure_sql(edge_predicate: int, equivalence_predicate: int) -> str:
+    """
+    Build a recursive query for the transitive closure of a hierarchy predicate.
+
+    Equivalence triples are treated as hierarchy edges in both directions.
+    Reflexive pairs are dropped.
+    """
+    return f"""
+        WITH RECURSIVE edges(sub, sup) AS (
+            SELECT s, o FROM objs WHERE p = {edge_predicate} AND s > 0 AND o > 0
+            UNION SELECT s, o FROM objs WHERE p = {equivalence_predicate} AND s > 0 AND o > 0
+            UNION SELECT o, s FROM objs WHERE p = {equivalence_predicate} AND s > 0 AND o > 0
+        ),
+        closure(sub, sup) AS (
+            SELECT sub, sup FROM edges
+            UNION SELECT closure.sub, edges.sup FROM closure JOIN edges ON edges.sub = closure.sup
+        )
+        SELECT sub, sup FROM closure WHERE sub != sup
+    """
+
+def _prepare_schema_tables(world) -> None:
+    """Extract the TBox axioms the rules need into small temporary tables."""
+    symmetric = world._abbreviate(OWL_SYMMETRIC_PROPERTY)
+    transitive = world._abbreviate(OWL_TRANSITIVE_PROPERTY)
+    rdf_type = quadstore.rdf_type
+
+    statements = [
+        "CREATE TABLE temp.rl_objprops (p INTEGER PRIMARY KEY)",
+        f"INSERT OR IGNORE INTO temp.rl_objprops SELECT s FROM objs WHERE p = {rdf_type} AND o = {quadstore.owl_object_property} AND s > 0",
+        "CREATE TABLE temp.rl_subclass (sub INTEGER, sup INTEGER, PRIMARY KEY (sub, sup)) WITHOUT ROWID",
+        "INSERT OR IGNORE INTO temp.rl_subclass " + _closure_sql(quadstore.rdfs_subclassof, quadstore.owl_equivalentclass),
+        f"DELETE FROM temp.rl_subclass WHERE sup = {quadstore.owl_thing}",
+        "CREATE TABLE temp.rl_subprop (sub INTEGER, sup INTEGER, PRIMARY KEY (sub, sup)) WITHOUT ROWID",
+        "INSERT OR IGNORE INTO temp.rl_subprop " + _closure_sql(quadstore.rdfs_subpropertyof, quadstore.owl_equivalentproperty),
+        "CREATE TABLE temp.rl_inverse (p INTEGER, q INTEGER, PRIMARY KEY (p, q)) WITHOUT ROWID",
+        f"INSERT OR IGNORE INTO temp.rl_inverse SELECT s, o FROM objs WHERE p = {quadstore.owl_inverse_property} AND s > 0 AND o > 0",
+        f"INSERT OR IGNORE INTO temp.rl_inverse SELECT o, s FROM objs WHERE p = {quadstore.owl_inverse_property} AND s > 0 AND o > 0",
+        "CREATE TABLE temp.rl_symmetric (p INTEGER PRIMARY KEY)",
+        f"INSERT OR IGNORE INTO temp.rl_symmetric SELECT s FROM objs WHERE p = {rdf_type} AND o = {symmetric} AND s > 0",
+        "CREATE TABLE temp.rl_transitive (p INTEGER PRIMARY KEY)",
+        f"INSERT OR IGNORE INTO temp.rl_transitive SELECT s FROM objs WHERE p = {rdf_type} AND o = {transitive} AND s > 0",
+        "CREATE TABLE temp.rl_domain (p INTEGER, cls INTEGER, PRIMARY KEY (p, cls)) WITHOUT ROWID",
+        f"INSERT OR IGNORE INTO temp.rl_domain SELECT s, o FROM objs WHERE p = {quadstore.rdf_domain} AND s > 0 AND o > 0 AND o != {quadstore.owl_thing}",
+        # Data property ranges are datatypes, so only object property ranges type individuals
+        "CREATE TABLE temp.rl_range (p INTEGER, cls INTEGER, PRIMARY KEY (p, cls)) WITHOUT ROWID",
+        f"""INSERT OR IGNORE INTO temp.rl_range SELECT s, o FROM objs
+            WHERE p = {quadstore.rdf_range} AND s IN (SELECT p FROM temp.rl_objprops) AND o > 0 AND o != {quadstore.owl_thing}""",
+        "CREATE TABLE temp.rl_added (s INTEGER, p INTEGER, o INTEGER)",
+    ]
+    for sql in statements:
+        quadstore.execute(world, sql)
+
+def _materialize_object_properties(world, c: int, max_iterations: int, counts: Dict[str, int]) -> int:
+    """
+    Run the property rules to a fixpoint with semi-naive evaluation.
+
+    Each round only joins the triples derived in the previous round (the delta)
+    against the rule tables and the full quadstore, so facts are never re-derived
+    from pairs that were already combined in an earlier round.
+
+    Returns:
+        int: Number of rounds run
+    """
+    quadstore.execute(world, "CREATE TABLE temp.rl_delta (s INTEGER, p INTEGER, o INTEGER, PRIMARY KEY (s, p, o)) WITHOUT ROWID")
+    quadstore.execute(world, """
+        INSERT OR IGNORE INTO temp.rl_delta
+        SELECT s, p, o FROM objs WHERE s > 0 AND o > 0 AND p IN (SELECT p FROM temp.rl_objprops)
+    """)
+
+    rule_queries = [
+        ("inverse", "SELECT d.o, i.q, d.s FROM temp.rl_delta d JOIN temp.rl_inverse i ON i.p = d.p"),
+        ("symmetric", "SELECT d.o, d.p, d.s FROM temp.rl_delta d JOIN temp.rl_symmetric sy ON sy.p = d.p"),
+        ("subproperty", "SELECT d.s, sp.sup, d.o FROM temp.rl_delta d JOIN temp.rl_subprop sp ON sp.sub = d.p"),
+        ("transitive", """SELECT d.s, d.p, t.o FROM temp.rl_delta d JOIN temp.rl_transitive tr ON tr.p = d.p
+                          JOIN objs t ON t.s = d.o AND t.p = d.p WHERE t.o > 0"""),
+        ("transitive", """SELECT t.s, d.p, d.o FROM temp.rl_delta d JOIN temp.rl_transitive tr ON tr.p = d.p
+                          JOIN objs t ON t.o = d.s AND t.p = d.p WHERE t.s > 0"""),
+    ]
+
+    rounds = 0
+    while rounds < max_iterations:
+        rounds += 1
+        quadstore.execute(world, "CREATE TABLE temp.rl_new (s INTEGER, p INTEGER, o INTEGER, rule TEXT, PRIMARY KEY (s, p, o)) WITHOUT ROWID")
+        for rule, select_sql in rule_queries:
+            quadstore.execute(world, f"INSERT OR IGNORE INTO temp.rl_new SELECT n.*, '{rule}' FROM ({select_sql}) n")
+        quadstore.execute(world, """
+            DELETE FROM temp.rl_new WHERE EXISTS (
+                SELECT 1 FROM objs WHERE objs.s = rl_new.s AND objs.p = rl_new.p AND objs.o = rl_new.o)
+        """)
+
+        new_by_rule = quadstore.fetch_all(world, "SELECT rule, COUNT(*) FROM temp.rl_new GROUP BY rule")
+        if not new_by_rule:
+            quadstore.execute(world, "DROP TABLE temp.rl_new")
+            break
+        for rule, count in new_by_rule:
+            counts[rule] += count
+
+        quadstore.execute(world, "INSERT OR IGNORE INTO objs (c, s, p, o) SELECT ?, s, p, o FROM temp.rl_new", (c,))
+        quadstore.execute(world, "INSERT INTO temp.rl_added SELECT s, p, o FROM temp.rl_new")
+        quadstore.execute(world, "DELETE FROM temp.rl_delta")
+        quadstore.execute(world, "INSERT INTO temp.rl_delta SELECT s, p, o FROM temp.rl_new")
+        quadstore.execute(world, "DROP TABLE temp.rl_new")
+        analysis_logger.debug(f"OWL RL round {rounds}: {dict(new_by_rule)}")
+    else:
+        analysis_logger.warning(f"OWL RL materialization stopped after {max_iterations} rounds without reaching a fixpoint.")
+    return rounds
+
+def _materialize_data_properties(world, c: int, counts: Dict[str, int]) -> None:
+    """Propagate data property values to super-properties (the closure is precomputed)."""
+    quadstore.execute(world, """
+        CREATE TABLE temp.rl_new_datas AS
+        SELECT DISTINCT d.s AS s, sp.sup AS p, d.o AS o, d.d AS d FROM datas d JOIN temp.rl_subprop sp ON sp.sub = d.p
+        WHERE d.s > 0 AND NOT EXISTS (
+            SELECT 1 FROM datas x WHERE x.s = d.s AND x.p = sp.sup AND x.o = d.o AND x.d IS d.d)
+    """)
+    counts['subproperty'] += quadstore.fetch_column(world, "SELECT COUNT(*) FROM temp.rl_new_datas")[0]
+    quadstore.execute(world, "INSERT OR IGNORE INTO datas (c, s, p, o, d) SELECT ?, s, p, o, d FROM temp.rl_new_datas", (c,))
+    quadstore.execute(world, "INSERT INTO temp.rl_added SELECT DISTINCT s, p, NULL FROM temp.rl_new_datas")
+
+def _materialize_types(world, c: int, include_superclass_types: bool, counts: Dict[str, int]) -> None:
+    """
+    Derive rdf:type triples from property domains/ranges and the class hierarchy.
+
+    By default only the most specific new types are written: a type that is
+    already implied by an asserted (or another new) type through the subclass
+    closure is skipped, which matches the direct types HermiT reports. With
+    include_superclass_types, every superclass type is materialized.
+    """
+    rdf_type = quadstore.rdf_type
+    quadstore.execute(world, "CREATE TABLE temp.rl_types (s INTEGER, cls INTEGER, rule TEXT, PRIMARY KEY (s, cls)) WITHOUT ROWID")
+    quadstore.execute(world, """
+        INSERT OR IGNORE INTO temp.rl_types
+        SELECT t.s, dm.cls, 'domain' FROM temp.rl_domain dm JOIN objs t ON t.p = dm.p WHERE t.s > 0
+    """)
+    quadstore.execute(world, """
+        INSERT OR IGNORE INTO temp.rl_types
+        SELECT t.s, dm.cls, 'domain' FROM temp.rl_domain dm JOIN datas t ON t.p = dm.p WHERE t.s > 0
+    """)
+    quadstore.execute(world, """
+        INSERT OR IGNORE INTO temp.rl_types
+        SELECT t.o, rg.cls, 'range' FROM temp.rl_range rg JOIN objs t ON t.p = rg.p WHERE t.o > 0
+    """)
+
+    if include_superclass_types:
+        quadstore.execute(world, f"""
+            INSERT OR IGNORE INTO temp.rl_types
+            SELECT x.s, sc.sup, 'subclass'
+            FROM (SELECT s, o AS cls FROM objs WHERE p = {rdf_type} AND s > 0
+                  UNION SELECT s, cls FROM temp.rl_types) x
+            JOIN temp.rl_subclass sc ON sc.sub = x.cls
+        """)
+
+    quadstore.execute(world, f"""
+        DELETE FROM temp.rl_types WHERE EXISTS (
+            SELECT 1 FROM objs t WHERE t.s = rl_types.s AND t.p = {rdf_type} AND t.o = rl_types.cls)
+    """)
+    if not include_superclass_types:
+        quadstore.execute(world, f"""
+            DELETE FROM temp.rl_types WHERE EXISTS (
+                SELECT 1 FROM objs t JOIN temp.rl_subclass sc ON sc.sub = t.o
+                WHERE t.s = rl_types.s AND t.p = {rdf_type} AND sc.sup = rl_types.cls)
+        """)
+        # Keep the most specific new type (equivalent classes are both kept)
+        quadstore.execute(world, """
+            DELETE FROM temp.rl_types WHERE EXISTS (
+                SELECT 1 FROM temp.rl_types other JOIN temp.rl_subclass sc ON sc.sub = other.cls
+                WHERE other.s = rl_types.s AND sc.sup = rl_types.cls
+                  AND NOT EXISTS (SELECT 1 FROM temp.rl_subclass r WHERE r.sub = rl_types.cls AND r.sup = other.cls))
+        """)
+
+    for rule, count in quadstore.fetch_all(world, "SELECT rule, COUNT(*) FROM temp.rl_types GROUP BY rule"):
+        counts[rule] += count
+    quadstore.execute(world, f"INSERT OR IGNORE INTO objs (c, s, p, o) SELECT ?, s, {rdf_type}, cls FROM temp.rl_types", (c,))
+    quadstore.execute(world, f"INSERT INTO temp.rl_added SELECT s, {rdf_type}, cls FROM temp.rl_types")
+
+def refresh_loaded_entities(world, added_triples: Iterable[Tuple[int, int, Optional[int]]]) -> int:
+    """
+    Bring already-loaded Python entities in line with triples added through SQL.
+
+    Cached property values are dropped so they are re-read from the quadstore,
+    and new types are added to is_a without writing triples again (the same
+    approach owlready2 uses after a HermiT run).
+
+    Args:
+        world: The owlready2 World the triples were added to
+        added_triples: (s, p, o) storids of the added triples; o is None for data values
+
+    Returns:
+        int: Number of loaded entities refreshed
+    """
+    rdf_type = quadstore.rdf_type
+    new_types: Dict[object, list] = {}
+    refreshed = set()
+
+    for s, p, o in added_triples:
+        if p == rdf_type:
+            entity = world._entities.get(s)
+            if entity is not None:
+                cls = world._get_by_storid(o)
+                if cls is not None:
+                    new_types.setdefault(entity, []).append(cls)
+            continue
+
+        prop = world._entities.get(p)
+        if prop is None:
+            continue
+        entity = world._entities.get(s)
+        if entity is not None and prop._python_name in entity.__dict__:
+            delattr(entity, prop._python_name)
+            refreshed.add(s)
+        inverse = getattr(prop, "_inverse_property", None)
+        target = world._entities.get(o) if o is not None else None
+        if inverse is not None and target is not None and inverse._python_name in target.__dict__:
+            delattr(target, inverse._python_name)
+            refreshed.add(o)
+
+    with LOADING: # Triples already exist, only update the Python objects
+        for entity, classes in new_types.items():
+            additions = [cls for cls in classes if cls not in entity.is_a]
+            if additions:
+                # owl:Thing is implied by any named type, as in HermiT's reparenting
+                entity.is_a.reinit([cls for cls in entity.is_a if cls is not Thing] + additions)
+                refreshed.add(entity.storid)
+    return len(refreshed)
+
+def materialize_owl_rl(onto: Ontology,
+                       target_onto: Optional[Ontology] = None,
+                       include_superclass_types: bool = False,
+                       max_iterations: int = DEFAULT_MAX_ITERATIONS) -> Dict[str, int]:
+    """
+    Materialize OWL RL property and type inferences directly in the quadstore.
+
+    Rules applied (OWL 2 RL rule names in brackets):
+    - inverse properties [prp-inv1/2]
+    - symmetric properties [prp-symp]
+    - transitive properties [prp-trp]
+    - sub-property and equivalent-property propagation [prp-spo1, prp-eqp1/2]
+    - domain and range typing [prp-dom, prp-rng]
+    - sub-class and equivalent-class typing [cax-sco, cax-eqc1/2]
+
+    Schema axioms are read from the whole world; inferred triples are written to
+    target_onto (the reasoned ontology itself by default, like sync_reasoner
+    inside a ``with onto:`` block).
+
+    Args:
+        onto: The ontology to materialize
+        target_onto: Ontology receiving the inferred triples (defaults to onto)
+        include_superclass_types: Also write types implied by the class hierarchy
+        max_iterations: Maximum number of semi-naive rounds for property rules
+
+    Returns:
+        Dict[str, int]: Number of inferred triples per rule (see RL_RULES)
+    """
+    world = onto.world
+    target = target_onto if target_onto is not None else onto
+    c = target.graph.c
+    counts = {rule: 0 for rule in RL_RULES}
+
+    _drop_temp_tables(world)
+    try:
+        _prepare_schema_tables(world)
+        rounds = _materialize_object_properties(world, c, max_iterations, counts)
+        _materialize_data_properties(world, c, counts)
+        _materialize_types(world, c, include_superclass_types, counts)
+        refreshed = refresh_loaded_entities(world, quadstore.fetch_all(world, "SELECT DISTINCT s, p, o FROM temp.rl_added"))
+    finally:
+        _drop_temp_tables(world)
+
+    analysis_logger.info(
+        f"OWL RL materialization added {sum(counts.values())} triples in {rounds} rounds "
+        f"({', '.join(f'{rule}: {counts[rule]}' for rule in RL_RULES)}); refreshed {refreshed} loaded entities."
+    )
+    return counts
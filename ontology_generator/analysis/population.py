@@ -8,10 +8,126 @@ from typing import Dict, List, Set, Tuple, Any, Optional
 from owlready2 import Ontology, Thing, ThingClass
 
 from ontology_generator.utils.logging import analysis_logger
+from ontology_generator.utils import quadstore
+
+# Number of sample instance names kept per populated class
+SAMPLE_INSTANCES_PER_CLASS = 10
+
+def _collect_property_usage_search(onto: Ontology) -> Tuple[Set[str], Set[str]]:
+    """Collects classes used in property domains/ranges via the owlready2 API."""
+    property_domain_classes = set()
+    property_range_classes = set()
+    
+    for prop in list(onto.object_properties()) + list(onto.data_properties()):
+        if hasattr(prop, 'domain') and prop.domain:
+            domains = prop.domain if isinstance(prop.domain, list) else [prop.domain]
+            for domain in domains:
+                if isinstance(domain, ThingClass):
+                    property_domain_classes.add(domain.name)
+        
+        if hasattr(prop, 'range') and prop.range:
+            ranges = prop.range if isinstance(prop.range, list) else [prop.range]
+            for range_item in ranges:
+                if isinstance(range_item, ThingClass):
+                    property_range_classes.add(range_item.name)
+    
+    return property_domain_classes, property_range_classes
+
+def _collect_class_population_search(onto: Ontology,
+                                     defined_classes: Dict[str, ThingClass]
+                                    ) -> Tuple[Dict[str, int], Dict[str, List[str]]]:
+    """Counts class members by materializing onto.search(is_a=...) for every class."""
+    population_counts = {}
+    class_instances = {}
+    
+    for class_name, class_obj in defined_classes.items():
+        # Skip owl:Thing which will have everything
+        if class_obj is Thing:
+            continue
+            
+        # Get all individuals of this class
+        instances = list(onto.search(is_a=class_obj))
+        count = len(instances)
+        population_counts[class_name] = count
+        
+        if count > 0:
+            # Store up to 10 instance names as examples
+            class_instances[class_name] = [ind.name for ind in instances[:SAMPLE_INSTANCES_PER_CLASS]]
+    
+    return population_counts, class_instances
+
+def _collect_property_usage_sql(onto: Ontology) -> Tuple[Set[str], Set[str]]:
+    """
+    Collects classes used in property domains/ranges with one quadstore query.
+    
+    Mirrors _collect_property_usage_search: only named classes (and owl:Thing)
+    count, datatype ranges and anonymous class expressions are ignored.
+    """
+    world = onto.world
+    rows = quadstore.fetch_all(world, """
+        SELECT DISTINCT d.p, d.o FROM objs d
+        WHERE d.p IN (?, ?) AND d.o > 0
+          AND d.s IN (SELECT s FROM objs WHERE c = ? AND p = ? AND o IN (?, ?))
+          AND (d.o = ? OR EXISTS (SELECT 1 FROM objs t WHERE t.s = d.o AND t.p = ? AND t.o = ?))
+    """, (quadstore.rdf_domain, quadstore.rdf_range,
+          onto.graph.c, quadstore.rdf_type, quadstore.owl_object_property, quadstore.owl_data_property,
+          quadstore.owl_thing, quadstore.rdf_type, quadstore.owl_class))
+    
+    property_domain_classes = set()
+    property_range_classes = set()
+    for predicate, class_storid in rows:
+        class_name = quadstore.storid_name(world, class_storid)
+        if predicate == quadstore.rdf_domain:
+            property_domain_classes.add(class_name)
+        else:
+            property_range_classes.add(class_name)
+    return property_domain_classes, property_range_classes
+
+def _collect_class_population_sql(onto: Ontology,
+                                  defined_classes: Dict[str, ThingClass]
+                                 ) -> Tuple[Dict[str, int], Dict[str, List[str]]]:
+    """
+    Counts class members with a single grouped recursive query over the quadstore.
+    
+    The membership semantics match onto.search(is_a=cls): the class itself, its
+    transitive subclasses and every entity typed with any of them. Samples reuse
+    the search's own SQL with a LIMIT, so they come back in the same order.
+    """
+    world = onto.world
+    classes = [(name, cls) for name, cls in defined_classes.items() if cls is not Thing]
+    if not classes:
+        return {}, {}
+    
+    storids = [cls.storid for _, cls in classes]
+    rows = quadstore.fetch_all(world, f"""
+        WITH RECURSIVE roots(root) AS (VALUES {", ".join("(?)" for _ in storids)}),
+        transit(root, x) AS (
+                  SELECT root, root FROM roots
+            UNION SELECT transit.root, objs.s FROM objs, transit
+                  WHERE objs.o = transit.x AND objs.p IN (?, ?)
+        )
+        SELECT root, COUNT(DISTINCT x) FROM transit
+        WHERE EXISTS (SELECT 1 FROM objs WHERE objs.s = transit.x)
+        GROUP BY root
+    """, (*storids, quadstore.rdfs_subclassof, quadstore.rdf_type))
+    counts_by_storid = dict(rows)
+    
+    population_counts = {}
+    class_instances = {}
+    for class_name, class_obj in classes:
+        count = counts_by_storid.get(class_obj.storid, 0)
+        population_counts[class_name] = count
+        if count > 0:
+            sql, params = onto.search(is_a=class_obj).sql_request()
+            sample_storids = quadstore.fetch_column(world, f"{sql} LIMIT {SAMPLE_INSTANCES_PER_CLASS}", params)
+            class_instances[class_name] = [quadstore.storid_name(world, storid) for storid in sample_storids]
+    
+    return population_counts, class_instances
 
 def analyze_ontology_population(onto: Ontology, 
                                 defined_classes: Dict[str, ThingClass], 
-                                specification: List[Dict[str, str]]
+                                specification: List[Dict[str, str]],
+                                backend: str = "sql"
                                ) -> Tuple[Dict[str, int], List[str], Dict[str, List[str]], Dict[str, List[str]]]:
     """
     Analyzes the population status of each class in the ontology.
@@ -20,6 +136,9 @@ def analyze_ontology_population(onto: Ontology,
         onto: The ontology object
         defined_classes: Dictionary mapping class names to class objects
         specification: The original ontology specification
+        backend: "sql" to count with aggregate queries against the quadstore,
+            or "search" to materialize onto.search(is_a=...) for every class.
+            Both produce the same results; "sql" falls back to "search" on error.
         
     Returns:
         tuple: (population_counts, empty_classes, class_instances, class_usage_info)
@@ -28,11 +147,7 @@ def analyze_ontology_population(onto: Ontology,
             - class_instances: Dict mapping class name to list of individual names
             - class_usage_info: Dict with additional usage analysis
     """
-    analysis_logger.info("Starting analysis of ontology population")
-    
-    population_counts = {}
-    empty_classes = []
-    class_instances = {}
+    analysis_logger.info(f"Starting analysis of ontology population (backend: {backend})")
     
     # Extract the spec-defined classes
     spec_defined_classes = set()
@@ -41,41 +156,23 @@ def analyze_ontology_population(onto: Ontology,
         if class_name:
             spec_defined_classes.add(class_name)
     
-    # Classes used in domain/range of properties
-    property_domain_classes = set()
-    property_range_classes = set()
+    population_counts = None
+    if backend == "sql":
+        try:
+            property_domain_classes, property_range_classes = _collect_property_usage_sql(onto)
+            population_counts, class_instances = _collect_class_population_sql(onto, defined_classes)
+        except Exception as e:
+            analysis_logger.warning(f"SQL population analysis failed ({e}). Falling back to the search backend.")
+            population_counts = None
+    elif backend != "search":
+        analysis_logger.warning(f"Unknown population analysis backend '{backend}'. Using the search backend.")
     
-    # Analyze property domains and ranges
-    for prop in list(onto.object_properties()) + list(onto.data_properties()):
-        if hasattr(prop, 'domain') and prop.domain:
-            domains = prop.domain if isinstance(prop.domain, list) else [prop.domain]
-            for domain in domains:
-                if isinstance(domain, ThingClass):
-                    property_domain_classes.add(domain.name)
-        
-        if hasattr(prop, 'range') and prop.range:
-            ranges = prop.range if isinstance(prop.range, list) else [prop.range]
-            for range_item in ranges:
-                if isinstance(range_item, ThingClass):
-                    property_range_classes.add(range_item.name)
+    if population_counts is None:
+        # Classes used in domain/range of properties
+        property_domain_classes, property_range_classes = _collect_property_usage_search(onto)
+        population_counts, class_instances = _collect_class_population_search(onto, defined_classes)
     
-    # Analyze instances
-    for class_name, class_obj in defined_classes.items():
-        # Skip owl:Thing which will have everything
-        if class_obj is Thing:
-            continue
-            
-        # Get all individuals of this class
-        instances = list(onto.search(is_a=class_obj))
-        count = len(instances)
-        population_counts[class_name] = count
-        
-        if count == 0:
-            empty_classes.append(class_name)
-        else:
-            # Store up to 10 instance names as examples
-            sample_instances = [ind.name for ind in instances[:10]]
-            class_instances[class_name] = sample_instances
+    empty_classes = [class_name for class_name, count in population_counts.items() if count == 0]
     
     # Create class usage analysis
     class_usage_info = {
@@ -113,7 +210,7 @@ def generate_population_report(population_counts: Dict[str, int],
     
     # Add header
     report_lines.append("\n" + "="*80)
-    report_lines.append(f"ONTOLOGY POPULATION REPORT")
+    report_lines.append("ONTOLOGY POPULATION REPORT")
     report_lines.append("="*80)
     
     # Summary statistics
@@ -121,7 +218,7 @@ def generate_population_report(population_counts: Dict[str, int],
     populated_classes = total_classes - len(empty_classes)
     total_individuals = sum(population_counts.values())
     
-    report_lines.append(f"\nSUMMARY:")
+    report_lines.append("\nSUMMARY:")
     report_lines.append(f"  • Total Classes: {total_classes}")
     report_lines.append(f"  • Populated Classes: {populated_classes} ({populated_classes/total_classes*100:.1f}%)")
     report_lines.append(f"  • Empty Classes: {len(empty_classes)} ({len(empty_classes)/total_classes*100:.1f}%)")
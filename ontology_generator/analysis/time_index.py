@@ -0,0 +1,247 @@
+"""
+Time-range index module for the ontology generator.
+
+This module indexes EventRecord intervals per resource and per production line
+so "events on line X between t1 and t2" is answered with a binary search instead
+of a scan over every individual. Each group keeps NumPy arrays of interval start
+and end times sorted by start, plus the running maximum of the end times; both
+are monotonic, so range, overlap and point-in-time queries bisect to a small
+window and only filter inside it.
+
+The index is built once, either from the events recorded on the PopulationContext
+in Pass 1 or from a loaded ontology, and holds arbitrary event handles (the
+EventRecord individuals by default).
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from owlready2 import World, Ontology
+
+from ontology_generator.config import DEFAULT_EVENT_DURATION_HOURS
+from ontology_generator.utils.logging import analysis_logger
+
+# (event handle, resource name, production line name, start, end)
+EventInterval = Tuple[Any, str, Optional[str], datetime, Optional[datetime]]
+
+_EVENT_INTERVALS_QUERY = """
+PREFIX onto: <{base}>
+SELECT ?event ?resource ?line ?start ?end
+WHERE {{
+    ?event a onto:EventRecord ; onto:involvesResource ?resource ; onto:occursDuring ?interval .
+    ?interval onto:startTime ?start .
+    OPTIONAL {{ ?interval onto:endTime ?end }}
+    OPTIONAL {{ ?resource onto:isPartOfProductionLine ?line }}
+}}
+"""
+
+def _to_datetime64(value: datetime) -> np.datetime64:
+    """Convert a datetime to microsecond datetime64 (aware values are normalized to naive UTC)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(value, "us")
+
+def _first(value: Any) -> Any:
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+class _IntervalArrays:
+    """Intervals of one group, sorted by start time."""
+    def __init__(self, handles: List[Any], starts: List[np.datetime64], ends: List[np.datetime64]):
+        order = np.argsort(np.array(starts, dtype="datetime64[us]"), kind="stable")
+        self.starts = np.array(starts, dtype="datetime64[us]")[order]
+        self.ends = np.array(ends, dtype="datetime64[us]")[order]
+        self.max_ends = np.maximum.accumulate(self.ends) if len(self.ends) else self.ends
+        self.handles = np.empty(len(handles), dtype=object)
+        self.handles[:] = handles
+        self.handles = self.handles[order]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def starting_between(self, start: Optional[np.datetime64], end: Optional[np.datetime64]) -> List[Any]:
+        lo = int(np.searchsorted(self.starts, start, "left")) if start is not None else 0
+        hi = int(np.searchsorted(self.starts, end, "left")) if end is not None else len(self)
+        return self.handles[lo:hi].tolist()
+
+    def overlapping(self, start: Optional[np.datetime64], end: Optional[np.datetime64]) -> List[Any]:
+        hi = int(np.searchsorted(self.starts, end, "left")) if end is not None else len(self)
+        if start is None:
+            return self.handles[:hi].tolist()
+        # Nothing before lo can reach start, unless it starts at/after start (zero-length intervals)
+        lo = min(int(np.searchsorted(self.max_ends, start, "right")), int(np.searchsorted(self.starts, start, "left")))
+        if lo >= hi:
+            return []
+        mask = (self.ends[lo:hi] > start) | (self.starts[lo:hi] >= start)
+        return self.handles[lo:hi][mask].tolist()
+
+    def active_at(self, moment: np.datetime64) -> List[Any]:
+        hi = int(np.searchsorted(self.starts, moment, "right"))
+        lo = int(np.searchsorted(self.max_ends, moment, "right"))
+        if lo >= hi:
+            return []
+        return self.handles[lo:hi][self.ends[lo:hi] > moment].tolist()
+
+class TimeRangeIndex:
+    """
+    Index of event intervals per resource and per production line.
+
+    Queries take an optional resource or line name (all events when neither is
+    given) and return event handles ordered by start time. Intervals are half-open
+    [start, end); events without an end time last DEFAULT_EVENT_DURATION_HOURS.
+
+    Attributes:
+        by_resource: Interval arrays per resource (equipment or line) name
+        by_line: Interval arrays per production line name, including its equipment's events
+    """
+    def __init__(self, intervals: Iterable[EventInterval], default_duration: Optional[timedelta] = None):
+        """
+        Build the index.
+
+        Args:
+            intervals: (event handle, resource name, line name, start, end) tuples; the line
+                defaults to the resource when None, and intervals without a start are skipped
+            default_duration: Duration assumed for events without an end time
+        """
+        default_duration = default_duration if default_duration is not None else timedelta(hours=DEFAULT_EVENT_DURATION_HOURS)
+        groups: Dict[Tuple[str, Optional[str]], Tuple[List[Any], List[np.datetime64], List[np.datetime64]]] = {}
+        skipped = 0
+        for handle, resource, line, start, end in intervals:
+            if not isinstance(start, datetime):
+                skipped += 1
+                continue
+            start64 = _to_datetime64(start)
+            end64 = _to_datetime64(end) if isinstance(end, datetime) else _to_datetime64(start + default_duration)
+            for key in (("all", None), ("resource", resource), ("line", line or resource)):
+                handles, starts, ends = groups.setdefault(key, ([], [], []))
+                handles.append(handle)
+                starts.append(start64)
+                ends.append(end64)
+        if skipped:
+            analysis_logger.warning(f"Time index skipped {skipped} events without a start time.")
+
+        self._all = _IntervalArrays(*groups.pop(("all", None), ([], [], [])))
+        self.by_resource: Dict[str, _IntervalArrays] = {}
+        self.by_line: Dict[str, _IntervalArrays] = {}
+        for (kind, name), arrays in groups.items():
+            (self.by_resource if kind == "resource" else self.by_line)[name] = _IntervalArrays(*arrays)
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    @classmethod
+    def from_event_facts(cls, event_facts: Iterable[Dict[str, Any]], default_duration: Optional[timedelta] = None) -> "TimeRangeIndex":
+        """
+        Build the index from the events recorded on a PopulationContext in Pass 1.
+
+        Args:
+            event_facts: PopulationContext.event_facts (EventRecord, TimeInterval, Equipment, ProductionLine, ...)
+            default_duration: Duration assumed for events without an end time
+
+        Returns:
+            TimeRangeIndex whose handles are the EventRecord individuals
+        """
+        def intervals():
+            seen = set()
+            for fact in event_facts:
+                event, interval = fact.get("EventRecord"), fact.get("TimeInterval")
+                if event is None or interval is None or event in seen:
+                    continue
+                seen.add(event)
+                line = fact.get("ProductionLine")
+                resource = fact.get("Equipment") or line
+                if resource is None:
+                    continue
+                yield (event, resource.name, line.name if line is not None else None,
+                       _first(getattr(interval, "startTime", None)), _first(getattr(interval, "endTime", None)))
+        return cls(intervals(), default_duration)
+
+    @classmethod
+    def from_ontology(cls, world: World, onto: Ontology, default_duration: Optional[timedelta] = None) -> "TimeRangeIndex":
+        """
+        Build the index from a loaded ontology with one SPARQL query.
+
+        Args:
+            world: The world holding the ontology
+            onto: The generated ontology (its base IRI prefixes the query)
+            default_duration: Duration assumed for events without an end time
+
+        Returns:
+            TimeRangeIndex whose handles are the EventRecord individuals
+        """
+        try:
+            rows = list(world.sparql(_EVENT_INTERVALS_QUERY.format(base=onto.base_iri)))
+        except Exception as e:
+            analysis_logger.warning(f"Could not read event intervals (missing classes/properties?): {e}")
+            rows = []
+        def intervals():
+            seen = set()
+            for event, resource, line, start, end in rows:
+                if event in seen: # An event on equipment of several lines repeats; keep the first
+                    continue
+                seen.add(event)
+                yield event, resource.name, line.name if line is not None else None, start, end
+        return cls(intervals(), default_duration)
+
+    def _arrays(self, resource: Optional[str], line: Optional[str]) -> Optional[_IntervalArrays]:
+        if resource is not None:
+            return self.by_resource.get(resource)
+        if line is not None:
+            return self.by_line.get(line)
+        return self._all
+
+    def starting_between(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                         resource: Optional[str] = None, line: Optional[str] = None) -> List[Any]:
+        """
+        Return events whose interval starts in [start, end).
+
+        Args:
+            start: Range start (open if None)
+            end: Range end, exclusive (open if None)
+            resource: Restrict to one resource name
+            line: Restrict to one production line name (used when no resource is given)
+
+        Returns:
+            Event handles ordered by start time
+        """
+        arrays = self._arrays(resource, line)
+        if arrays is None:
+            return []
+        return arrays.starting_between(_to_datetime64(start) if start else None, _to_datetime64(end) if end else None)
+
+    def overlapping(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                    resource: Optional[str] = None, line: Optional[str] = None) -> List[Any]:
+        """
+        Return events whose interval overlaps [start, end).
+
+        Args:
+            start: Range start (open if None)
+            end: Range end, exclusive (open if None)
+            resource: Restrict to one resource name
+            line: Restrict to one production line name (used when no resource is given)
+
+        Returns:
+            Event handles ordered by start time
+        """
+        arrays = self._arrays(resource, line)
+        if arrays is None:
+            return []
+        return arrays.overlapping(_to_datetime64(start) if start else None, _to_datetime64(end) if end else None)
+
+    def active_at(self, moment: datetime, resource: Optional[str] = None, line: Optional[str] = None) -> List[Any]:
+        """
+        Return events in progress at a point in time (start <= moment < end).
+
+        Args:
+            moment: The point in time
+            resource: Restrict to one resource name
+            line: Restrict to one production line name (used when no resource is given)
+
+        Returns:
+            Event handles ordered by start time
+        """
+        arrays = self._arrays(resource, line)
+        if arrays is None:
+            return []
+        return arrays.active_at(_to_datetime64(moment))
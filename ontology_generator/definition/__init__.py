@@ -1,5 +1,8 @@
 from .parser import (
     parse_specification, parse_property_mappings, validate_property_mappings,
-    read_data
+    read_data, RowFilter
 )
+from .data_files import resolve_data_files, read_data_files
+from .rows import Row, RowSchema, compact_rows
+from .columnar import is_columnar_path, read_columnar, projection_columns, typed_columns_from_mappings
 from .structure import define_ontology_structure, create_selective_classes
@@ -0,0 +1,186 @@
+"""
+Columnar data input module for the ontology generator.
+
+Warehouse extracts can be exported as Parquet or Arrow IPC (Feather) files
+instead of CSV. read_columnar() loads such a file with pyarrow and turns it into
+the same rows read_data() returns for CSV, with two differences that make it
+cheaper:
+
+- Column projection: only the columns the specification maps (plus the few
+  the population code reads by name) are loaded.
+- Typed columns: timestamp and numeric columns that the property mappings cast
+  to xsd:dateTime, a floating point or an integer type are passed on as Python
+  datetime/float/int values, so safe_cast() uses them without parsing text.
+  Every other column is converted to text, and nulls become empty strings as
+  in a CSV file.
+
+pyarrow is optional; reading a columnar file without it raises an ImportError
+that names the package.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from ontology_generator.utils.logging import logger
+from ontology_generator.definition.rows import Row, rows_from_columns
+from ontology_generator.config import (
+    SPEC_COL_RAW_DATA, XSD_TYPE_MAP, COLUMNAR_EXTRA_COLUMNS
+)
+
+COLUMNAR_EXTENSIONS = (".parquet", ".pq", ".arrow", ".feather", ".ipc")
+
+# Python types that are passed on typed; columns of other types are read as text
+TYPED_COLUMN_TYPES = (datetime, float, int)
+
+def is_columnar_path(path: str) -> bool:
+    """True if the path has a Parquet or Arrow IPC extension."""
+    return path.lower().endswith(COLUMNAR_EXTENSIONS)
+
+def projection_columns(specification: List[Dict[str, str]]) -> List[str]:
+    """
+    The data columns a run needs: those named in the specification and COLUMNAR_EXTRA_COLUMNS.
+
+    Args:
+        specification: The parsed specification rows
+
+    Returns:
+        Column names, in specification order
+    """
+    columns = [row.get(SPEC_COL_RAW_DATA, "").strip() for row in specification]
+    columns += COLUMNAR_EXTRA_COLUMNS
+    return list(dict.fromkeys(column for column in columns if column and column.upper() != "N/A"))
+
+def typed_columns_from_mappings(property_mappings: Dict[str, Dict[str, Dict[str, Any]]]) -> Dict[str, type]:
+    """
+    The columns that can be read typed: every data property mapped to the column
+    casts it to the same datetime, float or int type, and no object property
+    links by its value.
+
+    Args:
+        property_mappings: The parsed property mappings
+
+    Returns:
+        {column: Python type}
+    """
+    column_types: Dict[str, set] = {}
+    for mappings in property_mappings.values():
+        for details in mappings.get('data_properties', {}).values():
+            if details.get('column'):
+                column_types.setdefault(details['column'], set()).add(XSD_TYPE_MAP.get(details.get('data_type', 'xsd:string'), str))
+        for details in mappings.get('object_properties', {}).values():
+            if details.get('column'):
+                column_types.setdefault(details['column'], set()).add(str)
+    typed = {}
+    for column, types in column_types.items():
+        if len(types) == 1:
+            python_type = next(iter(types))
+            if python_type in TYPED_COLUMN_TYPES:
+                typed[column] = python_type
+    return typed
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Reading Parquet or Arrow data requires the 'pyarrow' package (pip install pyarrow)")
+    return pyarrow
+
+def _read_table(path: str, columns: Optional[List[str]]):
+    pa = _import_pyarrow()
+    if path.lower().endswith((".parquet", ".pq")):
+        import pyarrow.parquet as pq
+        if columns is not None:
+            available = set(pq.read_schema(path).names)
+            columns = [column for column in columns if column in available]
+        return pq.read_table(path, columns=columns)
+    # Arrow IPC: memory-mapped, so columns left out of the projection are never read
+    source = pa.memory_map(path, "r")
+    try:
+        table = pa.ipc.open_file(source).read_all()
+    except pa.ArrowInvalid:
+        source.seek(0)
+        table = pa.ipc.open_stream(source).read_all()
+    if columns is not None:
+        table = table.select([column for column in columns if column in table.column_names])
+    return table
+
+def _is_typed(arrow_type, python_type: type) -> bool:
+    import pyarrow.types as types
+    if python_type is datetime:
+        return types.is_timestamp(arrow_type)
+    return types.is_integer(arrow_type) or types.is_floating(arrow_type) or types.is_decimal(arrow_type)
+
+def _column_values(column, typed: bool) -> List[Any]:
+    """
+    The Python values of a column; nulls become empty strings.
+
+    Untyped columns are decoded once per distinct value (plants, lines, shift
+    times repeat), so the row values share the decoded objects. Values that are
+    not strings are converted with str(), as a CSV export writes them (1002.0
+    for a float, where an Arrow string cast gives "1002"), so individual names
+    and IDs do not depend on the input format.
+    """
+    import pyarrow as pa
+    if typed and not pa.types.is_timestamp(column.type):
+        values = column.to_pylist()
+        return ["" if value is None else value for value in values] if column.null_count else values
+    encoded = column.combine_chunks().dictionary_encode()
+    distinct = encoded.dictionary.to_pylist()
+    if not typed:
+        distinct = [value if isinstance(value, str) else str(value) for value in distinct]
+    distinct.append("")
+    return [distinct[index] for index in encoded.indices.fill_null(len(distinct) - 1).to_numpy().tolist()]
+
+def _filter_mask(table, row_filter) -> List[bool]:
+    keep = row_filter.bind(table.column_names)
+    indexes = [table.column_names.index(column) for column in row_filter.columns]
+    # The raw values as text, at the positions bind() expects
+    values = [None] * table.num_columns
+    for index in indexes:
+        values[index] = ["" if value is None else str(value) for value in table.column(index).to_pylist()]
+    record = [""] * table.num_columns
+    mask = []
+    for row_index in range(table.num_rows):
+        for index in indexes:
+            record[index] = values[index][row_index]
+        mask.append(keep(record))
+    return mask
+
+def read_columnar(path: str,
+                  columns: Optional[Iterable[str]] = None,
+                  typed_columns: Optional[Dict[str, type]] = None,
+                  row_filter: Optional[Any] = None) -> List[Row]:
+    """
+    Read a Parquet or Arrow IPC data file into rows.
+
+    Args:
+        path: The data file (.parquet/.pq, or .arrow/.feather/.ipc)
+        columns: Columns to read (default: all); columns missing from the file are ignored
+        typed_columns: {column: datetime, float or int} of columns passed on typed when
+            the file stores them as timestamps or numbers (see typed_columns_from_mappings)
+        row_filter: Optional active RowFilter; its columns are read even if not projected
+
+    Returns:
+        List of Row mappings (see definition.rows), in file order
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    import_columns = None
+    if columns is not None:
+        import_columns = list(columns)
+        if row_filter is not None:
+            import_columns += row_filter.columns
+        import_columns = list(dict.fromkeys(import_columns))
+    table = _read_table(path, import_columns)
+    logger.info(f"Read {table.num_rows} rows x {table.num_columns} columns from {path}.")
+    if row_filter is not None:
+        import pyarrow as pa
+        table = table.filter(pa.array(_filter_mask(table, row_filter), type=pa.bool_()))
+
+    typed_columns = typed_columns or {}
+    names = table.column_names
+    typed = {name for name in names
+             if name in typed_columns and _is_typed(table.schema.field(name).type, typed_columns[name])}
+    logger.debug("Columns passed on typed: %s", sorted(typed))
+    values = [_column_values(table.column(name), name in typed) for name in names]
+    return rows_from_columns(names, values)
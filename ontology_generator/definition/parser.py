@@ -5,14 +5,23 @@ This module provides functions for parsing the ontology specification file.
 """
 import csv
 from collections import defaultdict
-from typing import List, Dict, Any, Optional
+from datetime import date
+from typing import List, Dict, Any, Optional, Callable, Iterable, Mapping, Sequence
 
 from ontology_generator.utils.logging import logger
+from ontology_generator.definition.data_files import resolve_data_files, read_data_files
+from ontology_generator.definition.columnar import is_columnar_path, read_columnar
+from ontology_generator.definition.rows import compact_rows
+from ontology_generator.export.ntriples import compression_for_path
+from ontology_generator.utils.quarantine import (
+    QUARANTINE_COLUMNS, is_jsonl_path, read_quarantine_jsonl
+)
 from ontology_generator.config import (
     SPEC_COL_ENTITY, SPEC_COL_PROPERTY, SPEC_COL_PROP_TYPE,
     SPEC_COL_RAW_DATA, SPEC_COL_TARGET_RANGE, SPEC_COL_PROP_CHARACTERISTICS,
     SPEC_COL_INVERSE_PROPERTY, SPEC_COL_DOMAIN, SPEC_COL_TARGET_LINK_CONTEXT,
-    SPEC_COL_PROGRAMMATIC, SPEC_COL_NOTES
+    SPEC_COL_PROGRAMMATIC, SPEC_COL_NOTES,
+    FILTER_PLANT_COLUMN, FILTER_LINE_COLUMN, FILTER_DATE_COLUMNS
 )
 
 def parse_specification(spec_file_path: str) -> List[Dict[str, str]]:
@@ -326,24 +335,204 @@ def validate_property_mappings(property_mappings: Dict[str, Dict[str, Dict[str,
     
     return validation_passed
 
-def read_data(data_file_path: str) -> List[Dict[str, str]]:
+class RowFilter:
+    """
+    Selects data rows by plant, line and date while the data file is read.
+
+    The criteria are compared with the raw string values of a row, before the
+    row is turned into a dictionary or any value is cast, so reading a slice of
+    a large extract costs little more than scanning it. Dates compare on the
+    leading YYYY-MM-DD of the date column (a date or a local timestamp such as
+    '2025-02-04 15:20:53.000 -0500'); both bounds are inclusive.
+
+    Attributes:
+        plants: Accepted PLANT values (None: any)
+        lines: Accepted LINE_NAME values (None: any)
+        date_from: First accepted day, 'YYYY-MM-DD' (None: no lower bound)
+        date_to: Last accepted day, 'YYYY-MM-DD' (None: no upper bound)
+        date_column: Column the date bounds apply to
+        kept: Rows accepted so far
+        skipped: {criterion ('plant', 'line', 'date'): rows rejected by it}
+    """
+    def __init__(self,
+                 plants: Optional[Iterable[str]] = None,
+                 lines: Optional[Iterable[str]] = None,
+                 date_from: Optional[str] = None,
+                 date_to: Optional[str] = None,
+                 date_column: str = FILTER_DATE_COLUMNS[0]):
+        self.plants = set(plants) if plants else None
+        self.lines = set(lines) if lines else None
+        self.date_from = date.fromisoformat(date_from).isoformat() if date_from else None
+        self.date_to = date.fromisoformat(date_to).isoformat() if date_to else None
+        if self.date_from and self.date_to and self.date_from > self.date_to:
+            raise ValueError(f"Date range is empty: {self.date_from} is after {self.date_to}")
+        self.date_column = date_column
+        self.kept = 0
+        self.skipped: Dict[str, int] = {}
+
+    @property
+    def is_active(self) -> bool:
+        """True if any criterion is set."""
+        return bool(self.plants or self.lines or self.date_from or self.date_to)
+
+    @property
+    def skipped_count(self) -> int:
+        """Rows rejected so far."""
+        return sum(self.skipped.values())
+
+    def copy(self) -> "RowFilter":
+        """A filter with the same criteria and zero counts."""
+        return RowFilter(self.plants, self.lines, self.date_from, self.date_to, self.date_column)
+
+    def add_counts(self, kept: int, skipped: Dict[str, int]) -> None:
+        """Add the counts of a filter copy (e.g. one data file part)."""
+        self.kept += kept
+        for criterion, count in skipped.items():
+            self.skipped[criterion] = self.skipped.get(criterion, 0) + count
+
+    def describe(self) -> str:
+        """Human-readable criteria, e.g. "PLANT in ['MX11'], PRODUCTIONDATE_DAY_LOC 2025-02-05..2025-02-06"."""
+        parts = []
+        if self.plants:
+            parts.append(f"{FILTER_PLANT_COLUMN} in {sorted(self.plants)}")
+        if self.lines:
+            parts.append(f"{FILTER_LINE_COLUMN} in {sorted(self.lines)}")
+        if self.date_from or self.date_to:
+            parts.append(f"{self.date_column} {self.date_from or ''}..{self.date_to or ''}")
+        return ", ".join(parts) or "no filter"
+
+    @property
+    def columns(self) -> List[str]:
+        """The columns the active criteria compare."""
+        return [column for _, column, _ in self._criteria()]
+
+    def _criteria(self) -> List[tuple]:
+        """(criterion, column, test of the raw value) for every active criterion."""
+        criteria = []
+        if self.plants:
+            criteria.append(("plant", FILTER_PLANT_COLUMN, self.plants.__contains__))
+        if self.lines:
+            criteria.append(("line", FILTER_LINE_COLUMN, self.lines.__contains__))
+        if self.date_from or self.date_to:
+            low, high = self.date_from or "", self.date_to or "9999-12-31"
+            criteria.append(("date", self.date_column, lambda value: low <= value[:10] <= high))
+        return criteria
+
+    def bind(self, header: Sequence[str]) -> Callable[[Sequence[str]], bool]:
+        """
+        Compile the criteria into a predicate over the raw fields of a CSV record.
+
+        Args:
+            header: The column names of the file
+
+        Returns:
+            Function returning True for records to keep; it updates kept/skipped
+
+        Raises:
+            ValueError: If a filtered column is not in the header
+        """
+        bound = []
+        for criterion, column, test in self._criteria():
+            if column not in header:
+                raise ValueError(f"Cannot filter by {criterion}: column '{column}' is not in the data file")
+            bound.append((criterion, header.index(column), test))
+        skipped = self.skipped
+
+        def keep(values: Sequence[str]) -> bool:
+            for criterion, index, test in bound:
+                if index >= len(values) or not test(values[index].strip()):
+                    skipped[criterion] = skipped.get(criterion, 0) + 1
+                    return False
+            self.kept += 1
+            return True
+        return keep
+
+    def matches(self, row: Dict[str, Any]) -> bool:
+        """Predicate over an already built row dictionary (e.g. a JSONL quarantine row)."""
+        columns = self.columns
+        return self.bind(columns)([str(row.get(column) or "") for column in columns])
+
+def _compact_data_rows(fieldnames: List[str], records: Iterable[List[str]]) -> List[Mapping[str, Any]]:
+    """Build compact rows, dropping the leading columns of a CSV quarantine file."""
+    skip = len(QUARANTINE_COLUMNS)
+    if fieldnames[:skip] == QUARANTINE_COLUMNS:
+        logger.info(f"Read a quarantine file; dropped the columns {QUARANTINE_COLUMNS}.")
+        return compact_rows(fieldnames[skip:], (values[skip:] for values in records))
+    return compact_rows(fieldnames, records)
+
+def read_data(data_file_path: str, row_filter: Optional[RowFilter] = None,
+              workers: Optional[int] = None,
+              columns: Optional[Iterable[str]] = None,
+              typed_columns: Optional[Dict[str, type]] = None) -> List[Mapping[str, Any]]:
     """
     Reads the operational data CSV file.
+
+    The path can also be a directory or a glob pattern of several CSV parts, and
+    files may be gzip (.gz) or zstd (.zst) compressed; parts are decompressed and
+    decoded in parallel and their rows concatenated in sorted path order (see
+    definition.data_files).
+
+    Parquet and Arrow IPC files are read with pyarrow (see definition.columnar):
+    only the given columns are loaded, and the typed_columns stored as
+    timestamps or numbers are returned as datetime/float/int values instead of
+    strings.
+
+    A quarantine file written with --quarantine (CSV or JSONL) is accepted as
+    well; its quarantine columns are dropped, so rejected rows can be fixed and
+    reprocessed from it alone.
+
+    With an active row_filter, rows are selected on their raw values before
+    they are turned into rows; the filter counts the kept and skipped rows.
+
+    CSV and columnar rows are compact Row mappings (see definition.rows): the
+    rows of a file share one column index and one object per distinct value of
+    each column, and behave like the dicts csv.DictReader returns.
     
     Args:
         data_file_path: Path to the data CSV file
+        row_filter: Optional RowFilter selecting the plants, lines and dates to read
+        workers: Worker processes for multi-part input (default: one per part, at most the CPU count)
+        columns: Columns to read from a Parquet/Arrow file (default: all; ignored for CSV)
+        typed_columns: {column: datetime, float or int} passed on typed from a Parquet/Arrow file
         
     Returns:
-        A list of dictionaries representing the data rows
+        A list of mappings representing the data rows
     """
     logger.info(f"Reading data file: {data_file_path}")
-    data_rows: List[Dict[str, str]] = []
+    data_rows: List[Mapping[str, Any]] = []
     try:
-        with open(data_file_path, mode='r', encoding='utf-8-sig') as infile:
-            reader = csv.DictReader(infile)
-            data_rows = list(reader)
+        if row_filter is not None and not row_filter.is_active:
+            row_filter = None
+        if is_jsonl_path(data_file_path):
+            data_rows = read_quarantine_jsonl(data_file_path)
+            if row_filter:
+                data_rows = [row for row in data_rows if row_filter.matches(row)]
+            logger.info(f"Successfully read {len(data_rows)} quarantined data rows.")
+            return data_rows
+        if is_columnar_path(data_file_path):
+            data_rows = read_columnar(data_file_path, columns, typed_columns, row_filter)
+            if row_filter:
+                logger.info(f"Row filter ({row_filter.describe()}) kept {row_filter.kept} rows, "
+                            f"skipped {row_filter.skipped_count} {row_filter.skipped}.")
             logger.info(f"Successfully read {len(data_rows)} data rows.")
             return data_rows
+        paths = resolve_data_files(data_file_path)
+        if len(paths) > 1 or compression_for_path(paths[0]):
+            fieldnames, records = read_data_files(paths, row_filter, workers)
+            data_rows = _compact_data_rows(fieldnames, records)
+        else:
+            with open(data_file_path, mode='r', encoding='utf-8-sig') as infile:
+                reader = csv.reader(infile)
+                fieldnames = next(reader, None) or []
+                keep = row_filter.bind(fieldnames) if row_filter else None
+                # Streamed: the records of the file are never all held as lists of strings
+                data_rows = _compact_data_rows(fieldnames, (values for values in reader
+                                                            if values and (keep is None or keep(values))))
+        if row_filter:
+            logger.info(f"Row filter ({row_filter.describe()}) kept {row_filter.kept} rows, "
+                        f"skipped {row_filter.skipped_count} {row_filter.skipped}.")
+        logger.info(f"Successfully read {len(data_rows)} data rows{f' from {len(paths)} files' if len(paths) > 1 else ''}.")
+        return data_rows
     except FileNotFoundError:
         logger.error(f"Data file not found: {data_file_path}")
         raise
@@ -0,0 +1,10 @@
+"""Export package for the ontology generator."""
+from .ntriples import (
+    stream_ontology, NTriplesStreamWriter, open_compressed_output, compression_for_path
+)
+from .snapshot import (
+    write_snapshot, load_snapshot, load_ontology, snapshot_path_for, snapshot_is_fresh, SNAPSHOT_SUFFIX
+)
+from .facts import (
+    export_fact_tables, build_event_fact_table, build_dimension_table, write_table
+)
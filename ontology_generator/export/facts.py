@@ -0,0 +1,254 @@
+"""
+Columnar fact-table export module for the ontology generator.
+
+This module writes the populated events as a denormalized fact table (one row
+per EventRecord with its TimeInterval, resource, line, state, reason, shift and
+AE metrics) plus small dimension tables for equipment and materials. Rows come
+from the events recorded on the PopulationContext in Pass 1 and from the
+individual registry, so no SPARQL or ontology search is involved.
+
+The AE rollups accumulated during population (population.rollups) are written
+alongside as an 'ae_rollups' table.
+
+Tables are written as Parquet when pyarrow is installed, otherwise as CSV.
+"""
+import csv
+import os
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from owlready2 import Thing
+
+from ontology_generator.utils.logging import main_logger
+from ontology_generator.population.core import PopulationContext, IndividualRegistry
+
+FACT_FORMATS = ['auto', 'parquet', 'csv']
+
+# Entities joined into each event row: (entity type, only its identifier property?)
+EVENT_FACT_ENTITIES: List[Tuple[str, bool]] = [
+    ("EventRecord", False),
+    ("TimeInterval", False),
+    ("ProductionLine", True),
+    ("Equipment", True),
+    ("OperationalState", False),
+    ("OperationalReason", False),
+    ("Shift", False),
+    ("Material", True),
+    ("ProductionRequest", True),
+]
+
+# Identifier property of entities that are only referenced from the fact table
+ENTITY_ID_PROPERTIES = {
+    "ProductionLine": "lineId",
+    "Equipment": "equipmentId",
+    "Material": "materialId",
+    "ProductionRequest": "requestId",
+}
+
+def _pyarrow_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def _data_property_names(property_mappings: Dict[str, Dict[str, Dict[str, Any]]], entity: str) -> List[str]:
+    return list(property_mappings.get(entity, {}).get('data_properties', {}).keys())
+
+def _plain(value: Any) -> Any:
+    """Convert owlready2 values to plain Python values (locstr -> str)."""
+    if isinstance(value, str):
+        return str(value)
+    return value
+
+def _read_values(individual: Thing, prop_names: List[str]) -> List[Any]:
+    """Read the first value of each data property from an individual (None if unset)."""
+    values = []
+    for prop_name in prop_names:
+        value = getattr(individual, prop_name, None)
+        if isinstance(value, list):
+            value = value[0] if value else None
+        values.append(_plain(value))
+    return values
+
+class _ValueCache:
+    """Reads each shared individual's values once (lines, shifts, states, ... repeat across events)."""
+    def __init__(self):
+        self._values: Dict[Tuple[str, Thing], List[Any]] = {}
+
+    def get(self, entity: str, individual: Thing, prop_names: List[str]) -> List[Any]:
+        key = (entity, individual)
+        values = self._values.get(key)
+        if values is None:
+            values = self._values[key] = _read_values(individual, prop_names)
+        return values
+
+def build_event_fact_table(context: PopulationContext,
+                           property_mappings: Dict[str, Dict[str, Dict[str, Any]]]) -> Dict[str, List[Any]]:
+    """
+    Build the denormalized event fact table from the events recorded in Pass 1.
+
+    Columns are the EventRecord individual name and resource type, followed by
+    the mapped data properties of the event and its linked entities (only the
+    identifier for lines, equipment, materials and requests, whose details live
+    in dimension tables). A property name already used by an earlier entity is
+    prefixed with its entity name.
+
+    Args:
+        context: The PopulationContext whose event_facts were recorded in Pass 1
+        property_mappings: The parsed property mappings
+
+    Returns:
+        Dict mapping column names to equally long value lists
+    """
+    layout: List[Tuple[str, List[str], List[str]]] = [] # (entity, property names, column names)
+    used = {"event", "resourceType"}
+    for entity, id_only in EVENT_FACT_ENTITIES:
+        if id_only:
+            prop_names = [ENTITY_ID_PROPERTIES[entity]]
+        else:
+            prop_names = _data_property_names(property_mappings, entity)
+        columns = []
+        for prop_name in prop_names:
+            column = prop_name if prop_name not in used else f"{entity}.{prop_name}"
+            used.add(column)
+            columns.append(column)
+        layout.append((entity, prop_names, columns))
+
+    table: Dict[str, List[Any]] = {"event": [], "resourceType": []}
+    for _, _, columns in layout:
+        for column in columns:
+            table[column] = []
+
+    cache = _ValueCache()
+    for fact in context.event_facts:
+        event = fact["EventRecord"]
+        table["event"].append(event.name)
+        table["resourceType"].append("Equipment" if fact.get("Equipment") is not None else "Line")
+        for entity, prop_names, columns in layout:
+            individual = fact.get(entity)
+            if individual is None:
+                values = [None] * len(columns)
+            elif entity in ("EventRecord", "TimeInterval"):
+                values = _read_values(individual, prop_names) # One per event, nothing to share
+            else:
+                values = cache.get(entity, individual, prop_names)
+            for column, value in zip(columns, values):
+                table[column].append(value)
+    return table
+
+def build_dimension_table(registry: IndividualRegistry,
+                          entity: str,
+                          property_mappings: Dict[str, Dict[str, Dict[str, Any]]],
+                          extra_columns: Optional[Dict[str, Dict[Thing, Any]]] = None) -> Dict[str, List[Any]]:
+    """
+    Build a dimension table for one entity type from the individual registry.
+
+    Args:
+        registry: The registry of created individuals, keyed by (entity type, unique id)
+        entity: Entity type to list (e.g. "Equipment", "Material")
+        property_mappings: The parsed property mappings
+        extra_columns: Optional additional columns as {column: {individual: value}}
+
+    Returns:
+        Dict mapping column names to equally long value lists, sorted by individual name
+    """
+    prop_names = _data_property_names(property_mappings, entity)
+    extra_columns = extra_columns or {}
+    individuals = sorted({ind for (entity_type, _), ind in registry.items() if entity_type == entity}, key=lambda ind: ind.name)
+
+    table: Dict[str, List[Any]] = {"individual": [ind.name for ind in individuals]}
+    for prop_name in prop_names:
+        table[prop_name] = []
+    for column in extra_columns:
+        table[column] = []
+    for ind in individuals:
+        for prop_name, value in zip(prop_names, _read_values(ind, prop_names)):
+            table[prop_name].append(value)
+        for column, values in extra_columns.items():
+            table[column].append(values.get(ind))
+    return table
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+def write_table(table: Dict[str, List[Any]], path_without_extension: str, format: str = "auto") -> str:
+    """
+    Write a column table as Parquet (pyarrow) or CSV.
+
+    Args:
+        table: Dict mapping column names to value lists
+        path_without_extension: Output path; '.parquet' or '.csv' is appended
+        format: 'parquet', 'csv' or 'auto' (Parquet when pyarrow is installed)
+
+    Returns:
+        str: The written file path
+    """
+    if format not in FACT_FORMATS:
+        raise ValueError(f"Unknown fact table format '{format}'. Expected one of {FACT_FORMATS}.")
+    if format == "auto":
+        format = "parquet" if _pyarrow_available() else "csv"
+
+    if format == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet output requires the 'pyarrow' package (pip install pyarrow)")
+        path = path_without_extension + ".parquet"
+        pq.write_table(pa.table(table), path)
+        return path
+
+    path = path_without_extension + ".csv"
+    columns = list(table.keys())
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(zip(*(map(_csv_value, table[column]) for column in columns)))
+    return path
+
+def export_fact_tables(context: PopulationContext,
+                       registry: IndividualRegistry,
+                       property_mappings: Dict[str, Dict[str, Dict[str, Any]]],
+                       output_dir: str,
+                       format: str = "auto") -> Dict[str, str]:
+    """
+    Write the event fact table and the equipment/material dimension tables.
+
+    Args:
+        context: The PopulationContext from population (events and equipment placements)
+        registry: The registry of created individuals
+        property_mappings: The parsed property mappings
+        output_dir: Directory for the tables (created if needed)
+        format: 'parquet', 'csv' or 'auto'
+
+    Returns:
+        Dict mapping table names ('event_facts', 'equipment', 'materials' and, when AE
+        rollups were accumulated, 'ae_rollups') to file paths
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Equipment class and line come from the Pass 1 placement index rather than object property lookups
+    equipment_class, equipment_line = {}, {}
+    for line_ind, placements in context.equipment_line_index.items():
+        for equipment_ind, (class_id, _, _) in placements.items():
+            equipment_class[equipment_ind] = class_id
+            equipment_line[equipment_ind] = line_ind.name
+
+    tables = {
+        "event_facts": build_event_fact_table(context, property_mappings),
+        "equipment": build_dimension_table(registry, "Equipment", property_mappings,
+                                           extra_columns={"equipmentClassId": equipment_class, "productionLine": equipment_line}),
+        "materials": build_dimension_table(registry, "Material", property_mappings),
+    }
+    if context.ae_rollups is not None and len(context.ae_rollups):
+        tables["ae_rollups"] = context.ae_rollups.to_table()
+    paths = {}
+    for name, table in tables.items():
+        paths[name] = write_table(table, os.path.join(output_dir, name), format)
+        main_logger.info(f"Wrote {len(next(iter(table.values())))} rows to {paths[name]}.")
+    return paths
@@ -0,0 +1,152 @@
+"""
+Quadstore snapshot module for the ontology generator.
+
+This module writes a generated world as a compact SQLite quadstore next to the
+OWL file and loads it back without re-parsing RDF/XML. A snapshot records the
+size and modification time of the OWL file it was written alongside, so a
+snapshot left behind by an older run is ignored instead of silently used.
+
+A snapshot holds the same triples as the generated world, so entities are
+listed in generation order rather than in the order of the OWL file.
+"""
+import os
+import sqlite3
+from typing import Optional, Tuple
+
+from owlready2 import World, Ontology
+
+from ontology_generator.utils.logging import main_logger
+
+SNAPSHOT_SUFFIX = ".snapshot.sqlite3"
+
+# Metadata table added to the snapshot; owlready2 ignores tables it does not know
+_METADATA_TABLE = "ontology_generator_snapshot"
+
+def snapshot_path_for(owl_file_path: str) -> str:
+    """Return the snapshot path stored next to an OWL file (e.g. out.owl -> out.snapshot.sqlite3)."""
+    base, _ = os.path.splitext(owl_file_path)
+    return base + SNAPSHOT_SUFFIX
+
+def is_snapshot_file(path: str) -> bool:
+    """Check whether a file is an SQLite database rather than an RDF serialization."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(16) == b"SQLite format 3\x00"
+    except OSError:
+        return False
+
+def _source_signature(owl_file_path: str) -> Tuple[str, str]:
+    stat = os.stat(owl_file_path)
+    return str(stat.st_size), str(stat.st_mtime_ns)
+
+def write_snapshot(onto: Ontology, snapshot_path: str, source_owl_path: Optional[str] = None) -> str:
+    """
+    Copy the ontology's world into a vacuumed SQLite snapshot.
+
+    The whole quadstore is copied with SQLite's online backup, so this works for
+    both in-memory and persistent worlds, then vacuumed to drop free pages.
+
+    Args:
+        onto: The ontology to snapshot (its IRI is recorded for loading)
+        snapshot_path: Destination file; an existing file is replaced
+        source_owl_path: OWL file the snapshot accompanies, recorded to detect stale snapshots
+
+    Returns:
+        str: The snapshot path
+    """
+    world = onto.world
+    world.graph.commit()
+
+    tmp_path = snapshot_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    dest = sqlite3.connect(tmp_path)
+    try:
+        world.graph.db.backup(dest)
+        dest.execute(f"CREATE TABLE IF NOT EXISTS {_METADATA_TABLE} (key TEXT PRIMARY KEY, value TEXT)")
+        dest.execute(f"DELETE FROM {_METADATA_TABLE}")
+        metadata = [("ontology_iri", onto.base_iri)]
+        if source_owl_path and os.path.exists(source_owl_path):
+            size, mtime = _source_signature(source_owl_path)
+            metadata += [("source_size", size), ("source_mtime_ns", mtime)]
+        dest.executemany(f"INSERT INTO {_METADATA_TABLE} VALUES (?, ?)", metadata)
+        dest.commit()
+        dest.execute("VACUUM")
+    finally:
+        dest.close()
+    os.replace(tmp_path, snapshot_path)
+
+    main_logger.info(f"Wrote quadstore snapshot to {snapshot_path} ({os.path.getsize(snapshot_path) / 1e6:.1f} MB).")
+    return snapshot_path
+
+def _read_metadata(snapshot_path: str) -> dict:
+    conn = sqlite3.connect(f"file:{snapshot_path}?mode=ro", uri=True)
+    try:
+        return dict(conn.execute(f"SELECT key, value FROM {_METADATA_TABLE}"))
+    except sqlite3.OperationalError:
+        return {} # Plain owlready2 quadstore without our metadata
+    finally:
+        conn.close()
+
+def snapshot_is_fresh(snapshot_path: str, owl_file_path: str) -> bool:
+    """
+    Check that a snapshot was written alongside the current version of an OWL file.
+
+    Args:
+        snapshot_path: Snapshot file
+        owl_file_path: OWL file the snapshot should match
+
+    Returns:
+        bool: True if the recorded size and modification time match the OWL file
+    """
+    if not (os.path.exists(snapshot_path) and os.path.exists(owl_file_path)):
+        return False
+    metadata = _read_metadata(snapshot_path)
+    size, mtime = _source_signature(owl_file_path)
+    return metadata.get("source_size") == size and metadata.get("source_mtime_ns") == mtime
+
+def load_snapshot(snapshot_path: str, ontology_iri: Optional[str] = None) -> Tuple[World, Ontology]:
+    """
+    Open a snapshot as a read-only owlready2 World.
+
+    Args:
+        snapshot_path: Snapshot file
+        ontology_iri: Ontology to return (default: the one recorded in the snapshot,
+            else the ontology with the most triples)
+
+    Returns:
+        Tuple of (world, ontology)
+    """
+    metadata = _read_metadata(snapshot_path)
+    world = World(filename=snapshot_path, exclusive=False, read_only=True)
+    ontology_iri = ontology_iri or metadata.get("ontology_iri")
+    if ontology_iri is None:
+        c = world.graph.execute(
+            "SELECT c FROM (SELECT c FROM objs UNION ALL SELECT c FROM datas) GROUP BY c ORDER BY COUNT(*) DESC LIMIT 1"
+        ).fetchone()[0]
+        ontology_iri = world.graph.execute("SELECT iri FROM ontologies WHERE c = ?", (c,)).fetchone()[0]
+    onto = world.get_ontology(ontology_iri)
+    main_logger.info(f"Loaded quadstore snapshot {snapshot_path} ({onto.base_iri}).")
+    return world, onto
+
+def load_ontology(path: str, use_snapshot: bool = True) -> Tuple[World, Ontology]:
+    """
+    Load a generated ontology, preferring a fresh snapshot over parsing the OWL file.
+
+    Args:
+        path: An OWL file, or a snapshot file
+        use_snapshot: Look for a fresh snapshot next to the OWL file
+
+    Returns:
+        Tuple of (world, ontology)
+    """
+    if is_snapshot_file(path):
+        return load_snapshot(path)
+    snapshot_path = snapshot_path_for(path)
+    if use_snapshot and os.path.exists(snapshot_path):
+        if snapshot_is_fresh(snapshot_path, path):
+            return load_snapshot(snapshot_path)
+        main_logger.warning(f"Ignoring snapshot {snapshot_path}: it does not match the current {path}.")
+    world = World()
+    onto = world.get_ontology(path).load()
+    return world, onto
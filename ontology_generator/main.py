@@ -13,21 +13,21 @@ from datetime import datetime, date, time
 from typing import List, Dict, Any, Optional, Tuple
 
 from owlready2 import (
-    World, Ontology, sync_reasoner, Thing,
-    OwlReadyInconsistentOntologyError, locstr, default_world,
-    ThingClass, FunctionalProperty, InverseFunctionalProperty, TransitiveProperty, SymmetricProperty, AsymmetricProperty, ReflexiveProperty, IrreflexiveProperty, Nothing
+    World, Ontology, sync_reasoner,
+    OwlReadyInconsistentOntologyError, locstr, default_world
 )
 
 from ontology_generator.config import (
     DEFAULT_ONTOLOGY_IRI, init_xsd_type_map, DEFAULT_EQUIPMENT_SEQUENCE,
-    DEFAULT_EVENT_LINKING_BUFFER_MINUTES, DEFAULT_EVENT_DURATION_HOURS
+    DEFAULT_EVENT_LINKING_BUFFER_MINUTES, DEFAULT_EVENT_DURATION_HOURS, FILTER_DATE_COLUMNS
 )
 from ontology_generator.utils.logging import (
-    main_logger, configure_logging, analysis_logger
+    main_logger, configure_logging, analysis_logger, reset_repeated_warnings
 )
 from ontology_generator.definition import (
     parse_specification, define_ontology_structure, create_selective_classes,
-    parse_property_mappings, validate_property_mappings, read_data
+    parse_property_mappings, validate_property_mappings, read_data, RowFilter,
+    resolve_data_files, is_columnar_path, projection_columns, typed_columns_from_mappings
 )
 from ontology_generator.population import (
     setup_equipment_instance_relationships
@@ -35,9 +35,17 @@ from ontology_generator.population import (
 from ontology_generator.analysis import (
     analyze_ontology_population, generate_population_report,
     generate_optimization_recommendations, generate_reasoning_report,
+    ReasoningReportCollector, materialize_owl_rl,
+    run_partitioned_reasoning, generate_partition_report,
     generate_equipment_sequence_report, analyze_equipment_sequences
 )
 from ontology_generator.utils import safe_cast # Import directly from utils now
+from ontology_generator.export import stream_ontology, compression_for_path, write_snapshot, snapshot_path_for, load_ontology, export_fact_tables
+from ontology_generator.population.rollups import create_rollup_individuals
+from ontology_generator.utils.phases import PhaseTimer, phase
+from ontology_generator.utils.profiling import PhaseProfiler, profile_row
+from ontology_generator.utils.quarantine import QuarantineWriter
+from ontology_generator.utils.metrics import metrics
 
 # Initialize XSD type map and datetime types
 init_xsd_type_map(locstr)
@@ -48,13 +56,22 @@ def populate_ontology_from_data(onto: Ontology,
                                 defined_properties: Dict[str, object],
                                 property_is_functional: Dict[str, bool],
                                 specification: List[Dict[str, str]],
-                                property_mappings: Dict[str, Dict[str, Dict[str, Any]]] = None
+                                property_mappings: Dict[str, Dict[str, Dict[str, Any]]] = None,
+                                population_strategy: str = "row",
+                                quarantine: Optional[object] = None,
+                                ae_rollups: bool = False,
+                                collect_event_facts: bool = False
                               ) -> Tuple[int, Dict[str, object], Dict[str, int], List[Tuple[object, object, object, object]], Dict, Optional[object]]:
     """
     Populates the ontology with individuals and relations from data rows using a two-pass approach.
     Pass 1: Creates individuals and sets data properties.
     Pass 2: Creates object property relationships between individuals.
 
+    With population_strategy="dimension", Pass 1 first creates the master-data
+    individuals once per distinct dimension tuple (population.dimensions) and
+    then streams the rows through a fact path that creates only the
+    TimeInterval and EventRecord of each row.
+
     Args:
         onto: The ontology to populate
         data_rows: The data rows from the data CSV file
@@ -63,18 +80,27 @@ def populate_ontology_from_data(onto: Ontology,
         property_is_functional: Dictionary indicating functionality of properties
         specification: The parsed specification
         property_mappings: Optional property mappings dictionary
+        population_strategy: 'row' (every row creates/updates all its individuals) or 'dimension'
+        quarantine: Optional QuarantineWriter that receives the rejected rows with their reason codes
+        ae_rollups: Accumulate AE/OEE rollups of the events (needed for --ae-rollups and --export-facts)
+        collect_event_facts: Keep each event's individuals on the context (needed for --export-facts)
         
     Returns:
         tuple: (failed_rows_count, created_equipment_class_inds, equipment_class_positions, created_events_context, all_created_individuals_by_uid, population_context)
     """
     # Ensure imports required *within* this function are present
-    from ontology_generator.population.core import PopulationContext
+    from ontology_generator.population.core import PopulationContext, resolve_column_links
     from ontology_generator.population.row_processor import process_single_data_row_pass1, process_single_data_row_pass2 # Import needed here
+    from ontology_generator.population.dimensions import resolve_dimensions, process_fact_row
 
     main_logger.info(f"Starting ontology population with {len(data_rows)} data rows (Two-Pass Strategy).")
 
     # Create population context
     context = PopulationContext(onto, defined_classes, defined_properties, property_is_functional)
+    context.quarantine = quarantine
+    context.collect_event_facts = collect_event_facts
+    if ae_rollups and property_mappings and "EventRecord" in property_mappings:
+        context.start_ae_rollups(property_mappings)
 
     # --- Pre-checks (Essential Classes and Properties) ---
     essential_classes_names = [
@@ -114,14 +140,29 @@ def populate_ontology_from_data(onto: Ontology,
     pass1_successful_rows = 0
     pass1_failed_rows = 0
 
-    with onto:  # Use the ontology context for creating individuals
+    row_dimensions = None
+    if population_strategy == "dimension":
+        main_logger.info("Dimension-first population: resolving master-data individuals once per distinct tuple.")
+        with onto, phase("dimensions"):
+            row_dimensions = resolve_dimensions(data_rows, context, property_mappings, all_created_individuals_by_uid)
+
+    pass1_start = timing.perf_counter()
+    with onto, phase("pass1"):  # Use the ontology context for creating individuals
         for i, row in enumerate(data_rows):
+            profile_row(i)
             row_num = i + 2  # 1-based index + header row = line number in CSV
 
             # Call the dedicated row processing function for Pass 1
-            success, created_inds_in_row, event_context, eq_class_info = process_single_data_row_pass1(
-                row, row_num, context, property_mappings, all_created_individuals_by_uid # Pass registry for get_or_create logic
-            )
+            row_start = timing.perf_counter()
+            if row_dimensions is not None:
+                success, created_inds_in_row, event_context, eq_class_info = process_fact_row(
+                    row, row_num, context, property_mappings, all_created_individuals_by_uid, row_dimensions[i]
+                )
+            else:
+                success, created_inds_in_row, event_context, eq_class_info = process_single_data_row_pass1(
+                    row, row_num, context, property_mappings, all_created_individuals_by_uid # Pass registry for get_or_create logic
+                )
+            metrics.observe("row_seconds", timing.perf_counter() - row_start, phase="pass1")
 
             if success:
                 pass1_successful_rows += 1
@@ -150,6 +191,7 @@ def populate_ontology_from_data(onto: Ontology,
                 individuals_by_row[i] = {} # Ensure entry exists even if row failed
                 # Error logging handled within process_single_data_row_pass1
 
+    _record_pass_metrics("pass1", pass1_successful_rows, pass1_failed_rows, timing.perf_counter() - pass1_start)
     main_logger.info(f"Pass 1 Complete. Successful rows: {pass1_successful_rows}, Failed rows: {pass1_failed_rows}.")
     main_logger.info(f"Total unique individuals created (approx): {len(all_created_individuals_by_uid)}")
 
@@ -188,8 +230,13 @@ def populate_ontology_from_data(onto: Ontology,
     # We pass the full registry instead of a simplified context.
     linking_context = all_created_individuals_by_uid
 
-    with onto: # Context manager might not be strictly needed here if only setting properties
+    # Resolve column-based links once per distinct value instead of per row
+    column_links = resolve_column_links(data_rows, property_mappings, linking_context, main_logger)
+
+    pass2_start = timing.perf_counter()
+    with onto, phase("pass2"): # Context manager might not be strictly needed here if only setting properties
         for i, row in enumerate(data_rows):
+            profile_row(i)
             row_num = i + 2
             # Skip rows that failed significantly in Pass 1 (e.g., couldn't create core individuals)
             if i not in individuals_by_row or not individuals_by_row[i]:
@@ -200,9 +247,12 @@ def populate_ontology_from_data(onto: Ontology,
             created_inds_this_row = individuals_by_row[i]
 
             # Call the dedicated row processing function for Pass 2
+            row_start = timing.perf_counter()
+            row_links = {entity: {prop: targets[i] for prop, targets in links.items()} for entity, links in column_links.items()}
             success = process_single_data_row_pass2(
-                row, row_num, context, property_mappings, created_inds_this_row, linking_context
+                row, row_num, context, property_mappings, created_inds_this_row, linking_context, row_links
             )
+            metrics.observe("row_seconds", timing.perf_counter() - row_start, phase="pass2")
 
             if success:
                 pass2_successful_rows += 1
@@ -210,6 +260,7 @@ def populate_ontology_from_data(onto: Ontology,
                 pass2_failed_rows += 1
                 # Logging handled within process_single_data_row_pass2
 
+    _record_pass_metrics("pass2", pass2_successful_rows, pass2_failed_rows, timing.perf_counter() - pass2_start)
     main_logger.info(f"Pass 2 Complete. Rows successfully linked: {pass2_successful_rows}, Rows failed/skipped linking: {pass2_failed_rows}.")
 
     # Determine overall failed count - TKT-006: Improve failure reporting
@@ -229,6 +280,68 @@ def populate_ontology_from_data(onto: Ontology,
     return final_failed_rows, created_equipment_class_inds, equipment_class_positions, created_events_context, all_created_individuals_by_uid, context
 
 
+def _record_pass_metrics(pass_name: str, successful_rows: int, failed_rows: int, seconds: float) -> None:
+    """Record row counts and throughput of a population pass."""
+    metrics.inc("rows_total", successful_rows, phase=pass_name, outcome="success")
+    metrics.inc("rows_total", failed_rows, phase=pass_name, outcome="failed")
+    if seconds > 0:
+        metrics.set("rows_per_second", (successful_rows + failed_rows) / seconds, phase=pass_name)
+
+def _record_run_metrics(phase_timer: PhaseTimer, population_context, data_file_path: str, success: bool, seconds: float) -> None:
+    """Record per-phase, input and property usage metrics at the end of a run."""
+    for name, entry in phase_timer.phases.items():
+        metrics.set("phase_seconds", entry["seconds"], phase=name)
+        if entry["peak_rss_mb"] is not None:
+            metrics.set("phase_peak_rss_bytes", int(entry["peak_rss_mb"] * 1024 * 1024), phase=name)
+        if "quadstore_writes" in entry:
+            metrics.set("phase_quadstore_writes", entry["quadstore_writes"], phase=name)
+    if data_file_path:
+        try:
+            metrics.set("input_bytes", sum(os.path.getsize(path) for path in resolve_data_files(data_file_path)))
+        except OSError:
+            pass
+    if population_context is not None:
+        for prop_name, count in population_context._property_usage_count.items():
+            if count:
+                metrics.inc("property_values_set_total", count, property=prop_name)
+    metrics.set("run_success", 1 if success else 0)
+    metrics.set("run_seconds", seconds)
+    metrics.set("run_timestamp_seconds", int(timing.time()))
+
+def _write_run_metrics(args, phase_timer: PhaseTimer, success: bool, logger) -> None:
+    """Write the JSON run summary and/or Prometheus textfile if requested."""
+    try:
+        if args.metrics_json:
+            timings = phase_timer.to_dict()
+            metrics.write_json(args.metrics_json,
+                               run={"data_file": args.data_file, "output_file": args.output_file, "success": success,
+                                    "total_seconds": timings["total_seconds"], "peak_rss_mb": timings["peak_rss_mb"]},
+                               phases=timings["phases"])
+            logger.info(f"Run metrics written to {args.metrics_json}")
+        if args.metrics_textfile:
+            metrics.write_prometheus(args.metrics_textfile)
+            logger.info(f"Prometheus metrics written to {args.metrics_textfile}")
+    except Exception as metrics_err:
+        logger.error(f"Failed to write run metrics: {metrics_err}", exc_info=True)
+
+def _write_profile(args, phase_timer: PhaseTimer, logger) -> None:
+    """Write the per-phase profiles and the profile summary if requested."""
+    if not args.profile_dir or not isinstance(phase_timer, PhaseProfiler):
+        return
+    try:
+        written = phase_timer.write()
+        logger.info(f"Profiles written to {args.profile_dir} ({len(written)} files); see profile_summary.txt")
+    except Exception as profile_err:
+        logger.error(f"Failed to write profiles: {profile_err}", exc_info=True)
+
+def _close_quarantine(quarantine: QuarantineWriter, logger) -> None:
+    """Flush and close the quarantine file and log how many rows it received."""
+    try:
+        quarantine.close()
+        quarantine.log_summary(logger)
+    except Exception as quarantine_err:
+        logger.error(f"Failed to write quarantine file {quarantine.path}: {quarantine_err}", exc_info=True)
+
 def _log_initial_parameters(args, logger):
     logger.info("--- Starting Ontology Generation ---")
     logger.info(f"Specification file: {args.spec_file}")
@@ -236,12 +349,38 @@ def _log_initial_parameters(args, logger):
     logger.info(f"Output OWL file: {args.output_file}")
     logger.info(f"Ontology IRI: {args.iri}")
     logger.info(f"Save format: {args.format}")
+    if args.compress:
+        logger.info(f"Output compression: {args.compress}")
+    if args.snapshot:
+        logger.info(f"Write quadstore snapshot: {snapshot_path_for(args.output_file)}")
+    if args.facts_dir:
+        logger.info(f"Export fact tables to: {args.facts_dir} (format: {args.facts_format})")
+    if args.ae_rollups:
+        logger.info("Store AE rollups as AERollup individuals: True")
+    if args.metrics_json or args.metrics_textfile:
+        logger.info(f"Run metrics: JSON {args.metrics_json}, Prometheus textfile {args.metrics_textfile}")
+    logger.info(f"Population strategy: {args.population_strategy}")
+    if args.row_filter is not None and args.row_filter.is_active:
+        logger.info(f"Row filter: {args.row_filter.describe()}")
+    if args.read_workers:
+        logger.info(f"Data file read workers: {args.read_workers}")
+    if args.parallel_stages:
+        logger.info("Parallel equipment: one ParallelStage per line and sequence position")
+    if args.quarantine:
+        logger.info(f"Quarantine rejected rows to: {args.quarantine}")
+    if args.profile_dir:
+        logger.info(f"Profile phases to: {args.profile_dir} (Pass 1/Pass 2 rows sampled: one in {args.profile_sample_rows})")
     logger.info(f"Run reasoner: {args.reasoner}")
+    if args.reasoner:
+        logger.info(f"Reasoner mode: {args.reasoner_mode}")
+        if args.reasoner_mode == "partitioned":
+            logger.info(f"Partition options: {args.partition_options}")
     if args.worlddb:
         logger.info(f"Using persistent world DB: {args.worlddb}")
     logger.info(f"Reasoner report max entities: {args.max_report_entities}")
     logger.info(f"Reasoner report verbose: {args.full_report}")
     logger.info(f"Analyze population: {args.analyze_population}")
+    logger.info(f"Population analysis backend: {args.population_analysis_backend}")
     logger.info(f"Strict adherence: {args.strict_adherence}")
     logger.info(f"Skip classes: {args.skip_classes}")
     logger.info(f"Optimize ontology: {args.optimize_ontology}")
@@ -309,11 +448,20 @@ def _define_tbox(onto, specification, strict_adherence, skip_classes, logger):
     logger.info("TBox definition complete.")
     return defined_classes, defined_properties, property_is_functional
 
-def _read_operational_data(data_file_path, logger):
+def _read_operational_data(data_file_path, logger, row_filter=None, workers=None, specification=None, property_mappings=None):
     logger.info(f"Reading operational data from: {data_file_path}")
     try:
-        data_rows = read_data(data_file_path)
+        columns, typed_columns = None, None
+        if is_columnar_path(data_file_path) and specification:
+            # Only the mapped columns; timestamps and numbers stay typed
+            columns = projection_columns(specification)
+            typed_columns = typed_columns_from_mappings(property_mappings or {})
+            logger.info(f"Columnar input: reading {len(columns)} specification columns, up to {len(typed_columns)} typed.")
+        data_rows = read_data(data_file_path, row_filter, workers, columns, typed_columns)
         logger.info(f"Read {len(data_rows)} data rows.")
+        if row_filter is not None:
+            for criterion, count in row_filter.skipped.items():
+                metrics.inc("rows_filtered_total", count, criterion=criterion)
         if not data_rows:
             logger.warning("No data rows read. Ontology population will be skipped.")
         return data_rows
@@ -321,7 +469,8 @@ def _read_operational_data(data_file_path, logger):
         logger.error(f"Failed to read data file {data_file_path}: {read_err}", exc_info=True)
         return None # Indicate failure
 
-def _populate_abox(onto, data_rows, defined_classes, defined_properties, prop_is_functional, specification, property_mappings, logger):
+def _populate_abox(onto, data_rows, defined_classes, defined_properties, prop_is_functional, specification, property_mappings, logger,
+                   population_strategy="row", quarantine=None, ae_rollups=False, collect_event_facts=False):
     """
     Populate the ontology from data rows (ABox).
     
@@ -334,6 +483,10 @@ def _populate_abox(onto, data_rows, defined_classes, defined_properties, prop_is
         specification: The parsed specification
         property_mappings: The parsed property mappings
         logger: The logger to use
+        population_strategy: 'row' or 'dimension' (see populate_ontology_from_data)
+        quarantine: Optional QuarantineWriter that receives the rejected rows
+        ae_rollups: Accumulate AE/OEE rollups during Pass 1
+        collect_event_facts: Keep the event facts for the fact-table export
         
     Returns:
         Tuple containing:
@@ -351,7 +504,8 @@ def _populate_abox(onto, data_rows, defined_classes, defined_properties, prop_is
         (failed_rows_count, created_eq_classes, eq_class_positions, 
          created_events_context, all_created_individuals_by_uid, population_context) = populate_ontology_from_data(
             onto, data_rows, defined_classes, defined_properties, 
-            prop_is_functional, specification, property_mappings
+            prop_is_functional, specification, property_mappings, population_strategy, quarantine, ae_rollups,
+            collect_event_facts
         )
         
         # TKT-009: Fix - Log property usage report right after population
@@ -385,10 +539,12 @@ def _populate_abox(onto, data_rows, defined_classes, defined_properties, prop_is
         logger.error(f"Error during ontology population: {e}", exc_info=True)
         return False, 0, {}, {}, [], {}, None
 
-def _run_analysis_and_optimization(onto, defined_classes, specification, optimize_ontology, output_owl_path, logger):
+def _run_analysis_and_optimization(onto, defined_classes, specification, optimize_ontology, output_owl_path, logger, analysis_backend="sql"):
     logger.info("Analyzing ontology population status...")
     try:
-        population_counts, empty_classes, class_instances, class_usage_info = analyze_ontology_population(onto, defined_classes, specification)
+        population_counts, empty_classes, class_instances, class_usage_info = analyze_ontology_population(
+            onto, defined_classes, specification, backend=analysis_backend
+        )
         population_report = generate_population_report(population_counts, empty_classes, class_instances, defined_classes, class_usage_info)
         logger.info("Ontology Population Analysis Complete")
         print(population_report) # Print to console
@@ -425,7 +581,7 @@ def _run_analysis_and_optimization(onto, defined_classes, specification, optimiz
         logger.error(f"Error analyzing ontology population: {analysis_exc}", exc_info=False)
         # Continue despite analysis failure
 
-def _setup_sequence_relationships(onto, created_eq_classes, eq_class_positions, defined_classes, defined_properties, property_is_functional, logger, population_context=None):
+def _setup_sequence_relationships(onto, created_eq_classes, eq_class_positions, defined_classes, defined_properties, property_is_functional, logger, population_context=None, parallel_stages=False):
     """
     Setup equipment instance sequence relationships using the sequence module.
     
@@ -438,6 +594,7 @@ def _setup_sequence_relationships(onto, created_eq_classes, eq_class_positions,
         property_is_functional: Dict indicating whether properties are functional
         logger: Logger instance
         population_context: The population context for property usage tracking
+        parallel_stages: Group parallel equipment into ParallelStage individuals instead of isParallelWith links
         
     Returns:
         PopulationContext or None: The population context with property usage tracking if available
@@ -465,14 +622,15 @@ def _setup_sequence_relationships(onto, created_eq_classes, eq_class_positions,
             # Call the function to setup equipment instance relationships with context
             ret_val = setup_equipment_instance_relationships(
                 onto, defined_classes, defined_properties, property_is_functional, 
-                eq_class_positions, population_context
+                eq_class_positions, population_context, parallel_stages=parallel_stages
             )
             # Return the original context
             return population_context
         else:
             # Call without context (original behavior)
             ret_val = setup_equipment_instance_relationships(
-                onto, defined_classes, defined_properties, property_is_functional, eq_class_positions
+                onto, defined_classes, defined_properties, property_is_functional, eq_class_positions,
+                parallel_stages=parallel_stages
             )
             
             # TKT-004: Handle both old and new return value formats
@@ -529,67 +687,38 @@ def _setup_sequence_relationships(onto, created_eq_classes, eq_class_positions,
 #         logger.error(f"Error processing structural relationships: {e}", exc_info=True)
 #         return 0  # Indicate no links were created due to error
 
-def _run_reasoning_phase(onto, world, world_db_path, reasoner_report_max_entities, reasoner_report_verbose, logger):
-    logger.info("Applying reasoner (ensure HermiT or compatible reasoner is installed)...")
+def _run_reasoning_phase(onto, world, world_db_path, reasoner_report_max_entities, reasoner_report_verbose, logger, reasoner_mode="hermit",
+                         partition_options=None):
+    partition_summary = None
+    if reasoner_mode == "rl":
+        logger.info("Applying in-process OWL RL materialization (no consistency check)...")
+    elif reasoner_mode == "partitioned":
+        logger.info("Applying partitioned reasoning (TBox once, ABox partitions in worker processes)...")
+    else:
+        logger.info("Applying reasoner (ensure HermiT or compatible reasoner is installed)...")
     reasoning_successful = True
+    report_collector = None
     try:
         active_world = world if world_db_path else default_world
+        # Snapshot the quadstore so the report only covers genuinely inferred triples
+        report_collector = ReasoningReportCollector(onto)
         with onto:
-            pre_stats = {
-                'classes': len(list(onto.classes())), 'object_properties': len(list(onto.object_properties())),
-                'data_properties': len(list(onto.data_properties())), 'individuals': len(list(onto.individuals()))
-            }
+            pre_stats = report_collector.snapshot()
             logger.info("Starting reasoning process...")
             reasoning_start_time = timing.time()
-            sync_reasoner(infer_property_values=True, debug=0) # Pass world implicitly via onto context?
+            if reasoner_mode == "rl":
+                materialize_owl_rl(onto)
+            elif reasoner_mode == "partitioned":
+                partition_summary = run_partitioned_reasoning(onto, **(partition_options or {}))
+            else:
+                sync_reasoner(infer_property_values=True, debug=0) # Pass world implicitly via onto context?
             reasoning_end_time = timing.time()
             logger.info(f"Reasoning finished in {reasoning_end_time - reasoning_start_time:.2f} seconds.")
 
             # Post-reasoning analysis and report generation
             inconsistent = list(active_world.inconsistent_classes())
-            inferred_hierarchy = {}
-            inferred_properties = {}
-            inferred_individuals = {}
-            for cls in onto.classes():
-                current_subclasses = set(cls.subclasses())
-                inferred_subs = [sub.name for sub in current_subclasses if sub != cls and sub != Nothing] 
-                equivalent_classes = [eq.name for eq in cls.equivalent_to if eq != cls and isinstance(eq, ThingClass)]
-                if inferred_subs or equivalent_classes:
-                    inferred_hierarchy[cls.name] = {'subclasses': inferred_subs, 'equivalent': equivalent_classes}
-
-            inferrable_chars = {
-                'FunctionalProperty': FunctionalProperty, 'InverseFunctionalProperty': InverseFunctionalProperty,
-                'TransitiveProperty': TransitiveProperty, 'SymmetricProperty': SymmetricProperty,
-                'AsymmetricProperty': AsymmetricProperty, 'ReflexiveProperty': ReflexiveProperty,
-                'IrreflexiveProperty': IrreflexiveProperty,
-            }
-            for prop in list(onto.object_properties()) + list(onto.data_properties()):
-                inferred_chars_for_prop = [char_name for char_name, char_class in inferrable_chars.items() if char_class in prop.is_a]
-                if inferred_chars_for_prop: inferred_properties[prop.name] = inferred_chars_for_prop
-
-            logger.info("Collecting simplified individual inferences (post-reasoning state).")
-            for ind in onto.individuals():
-                current_types = [c.name for c in ind.is_a if c is not Thing]
-                current_props = {}
-                for prop in list(onto.object_properties()) + list(onto.data_properties()):
-                    try:
-                        values = prop[ind]
-                        if not isinstance(values, list): values = [values] if values is not None else []
-                        if values:
-                            formatted_values = []
-                            for v in values:
-                                if isinstance(v, Thing): formatted_values.append(v.name)
-                                elif isinstance(v, locstr): formatted_values.append(f'"{v}"@{v.lang}')
-                                else: formatted_values.append(repr(v))
-                            if formatted_values: current_props[prop.name] = formatted_values
-                    except Exception: continue
-                if current_types or current_props:
-                    inferred_individuals[ind.name] = {'types': current_types, 'properties': current_props}
-
-            post_stats = {
-                'classes': len(list(onto.classes())), 'object_properties': len(list(onto.object_properties())),
-                'data_properties': len(list(onto.data_properties())), 'individuals': len(list(onto.individuals()))
-            }
+            logger.info("Collecting inferences by diffing the quadstore against the pre-reasoning snapshot.")
+            post_stats, inferred_hierarchy, inferred_properties, inferred_individuals = report_collector.collect()
             report, has_issues = generate_reasoning_report(
                 onto, pre_stats, post_stats, inconsistent, inferred_hierarchy,
                 inferred_properties, inferred_individuals, True, # Assuming reasoner ran
@@ -598,6 +727,15 @@ def _run_reasoning_phase(onto, world, world_db_path, reasoner_report_max_entitie
             )
             logger.info("\nReasoning Report:\n" + report)
 
+            if partition_summary:
+                # Failed or inconsistent partitions are reported, but do not fail the run
+                partition_report, partition_issues = generate_partition_report(
+                    partition_summary, max_entities=reasoner_report_max_entities, verbose=reasoner_report_verbose
+                )
+                logger.info("\nPartition Report:\n" + partition_report)
+                if partition_issues:
+                    logger.warning("Some reasoning partitions failed, timed out or were inconsistent; their inferences are missing.")
+
             if has_issues or inconsistent:
                 logger.warning("Reasoning completed but potential issues or inconsistencies were identified.")
                 if inconsistent: reasoning_successful = False
@@ -606,6 +744,7 @@ def _run_reasoning_phase(onto, world, world_db_path, reasoner_report_max_entitie
     except OwlReadyInconsistentOntologyError:
         logger.error("REASONING FAILED: Ontology is inconsistent!")
         reasoning_successful = False
+        if report_collector: report_collector.discard()
         try:
             active_world = world if world_db_path else default_world
             inconsistent = list(active_world.inconsistent_classes())
@@ -618,11 +757,13 @@ def _run_reasoning_phase(onto, world, world_db_path, reasoner_report_max_entitie
     except Exception as e:
         logger.error(f"An error occurred during reasoning: {e}", exc_info=True)
         reasoning_successful = False
+        if report_collector: report_collector.discard()
 
     logger.info("Reasoning phase finished.")
     return reasoning_successful
 
-def _save_ontology_file(onto, world, output_owl_path, save_format, world_db_path, population_successful, reasoning_successful, logger):
+def _save_ontology_file(onto, world, output_owl_path, save_format, world_db_path, population_successful, reasoning_successful, logger,
+                        compression=None, snapshot=False):
     should_save_primary = population_successful and reasoning_successful
     final_output_path = output_owl_path
     save_failed = False
@@ -640,10 +781,19 @@ def _save_ontology_file(onto, world, output_owl_path, save_format, world_db_path
 
     logger.info(f"Saving ontology in '{save_format}' format...")
     try:
-        # Use the world associated with the ontology for saving, especially if persistent
-        # If world is None (in-memory case after setup failure?), this will likely fail, which is ok.
-        onto.save(file=final_output_path, format=save_format)
+        if save_format in ("ntriples", "nquads"):
+            # Stream straight from the quadstore in a reproducible order, compressing on the fly
+            stream_ontology(onto, final_output_path, format=save_format, compression=compression)
+        else:
+            if compression or compression_for_path(final_output_path):
+                logger.warning(f"Compression is only supported for ntriples/nquads; saving '{save_format}' uncompressed.")
+            # Use the world associated with the ontology for saving, especially if persistent
+            # If world is None (in-memory case after setup failure?), this will likely fail, which is ok.
+            onto.save(file=final_output_path, format=save_format)
         logger.info("Ontology saved successfully.")
+        if snapshot:
+            # Quadstore copy next to the output, so analysis tools can skip re-parsing it
+            write_snapshot(onto, snapshot_path_for(final_output_path), source_owl_path=final_output_path)
     except Exception as save_err:
         logger.error(f"Failed to save ontology to {final_output_path}: {save_err}", exc_info=True)
         save_failed = True # Indicate saving failed
@@ -663,7 +813,28 @@ def main_ontology_generation(spec_file_path: str,
                              strict_adherence: bool = False,
                              skip_classes: List[str] = None,
                              optimize_ontology: bool = False,
-                             event_buffer_minutes: Optional[int] = None
+                             event_buffer_minutes: Optional[int] = None,
+                             population_analysis_backend: str = "sql",
+                             reasoner_mode: str = "hermit",
+                             partition_engine: str = "hermit",
+                             partition_workers: Optional[int] = None,
+                             partition_timeout: Optional[float] = 600,
+                             partition_memory_mb: Optional[int] = None,
+                             tbox_cache_dir: Optional[str] = None,
+                             compression: Optional[str] = None,
+                             save_snapshot: bool = False,
+                             facts_dir: Optional[str] = None,
+                             facts_format: str = "auto",
+                             ae_rollups: bool = False,
+                             metrics_json: Optional[str] = None,
+                             metrics_textfile: Optional[str] = None,
+                             population_strategy: str = "row",
+                             profile_dir: Optional[str] = None,
+                             profile_sample_rows: int = 1,
+                             quarantine_path: Optional[str] = None,
+                             row_filter: Optional[RowFilter] = None,
+                             read_workers: Optional[int] = None,
+                             parallel_stages: bool = False
                             ) -> bool:
     """
     Main function to generate the ontology by orchestrating helper functions.
@@ -673,6 +844,10 @@ def main_ontology_generation(spec_file_path: str,
     """
     start_time = timing.time()
     main_logger.info("--- Ontology Generation Process Started ---")
+    phase_timer = PhaseProfiler(profile_dir, row_sample_every=profile_sample_rows) if profile_dir else PhaseTimer()
+    phase_timer.start()
+    metrics.reset()
+    reset_repeated_warnings()
 
     # Use a dummy args object for logging if needed, or adapt helpers
     # For simplicity, let's create a temporary Namespace-like object
@@ -692,6 +867,29 @@ def main_ontology_generation(spec_file_path: str,
     args.skip_classes = skip_classes
     args.optimize_ontology = optimize_ontology
     args.event_buffer_minutes = event_buffer_minutes
+    args.population_analysis_backend = population_analysis_backend
+    args.reasoner_mode = reasoner_mode
+    args.compress = compression
+    args.snapshot = save_snapshot
+    args.facts_dir = facts_dir
+    args.facts_format = facts_format
+    args.ae_rollups = ae_rollups
+    args.metrics_json = metrics_json
+    args.metrics_textfile = metrics_textfile
+    args.population_strategy = population_strategy
+    args.profile_dir = profile_dir
+    args.profile_sample_rows = profile_sample_rows
+    args.quarantine = quarantine_path
+    args.row_filter = row_filter
+    args.read_workers = read_workers
+    args.parallel_stages = parallel_stages
+    args.partition_options = {
+        'engine': partition_engine,
+        'max_workers': partition_workers,
+        'timeout': partition_timeout,
+        'memory_mb': partition_memory_mb,
+        'tbox_cache_dir': tbox_cache_dir,
+    }
 
     world = None
     onto = None
@@ -699,34 +897,45 @@ def main_ontology_generation(spec_file_path: str,
     reasoning_successful = True # Assume success unless reasoner runs and fails
     save_failed = False
     population_context = None  # TKT-002: Track population context for property usage reporting
+    quarantine = None
+    overall_success = False
 
     try:
         # 1. Log Initial Parameters
         _log_initial_parameters(args, main_logger)
 
         # 2. Parse Specification and Mappings
-        specification, property_mappings = _parse_spec_and_mappings(args.spec_file, main_logger)
+        with phase("spec"):
+            specification, property_mappings = _parse_spec_and_mappings(args.spec_file, main_logger)
         if specification is None: return False
 
         # 3. Setup World and Ontology
-        world, onto = _setup_world_and_ontology(args.iri, args.worlddb, main_logger)
+        with phase("tbox"):
+            world, onto = _setup_world_and_ontology(args.iri, args.worlddb, main_logger)
         if onto is None: return False
+        phase_timer.add_probe("quadstore_writes", lambda: world.graph.db.total_changes)
 
         # 4. Define Ontology Structure (TBox)
-        defined_classes, defined_properties, property_is_functional = _define_tbox(
-            onto, specification, args.strict_adherence, args.skip_classes, main_logger
-        )
+        with phase("tbox"):
+            defined_classes, defined_properties, property_is_functional = _define_tbox(
+                onto, specification, args.strict_adherence, args.skip_classes, main_logger
+            )
         # Handle case where TBox definition might yield nothing critical?
         # Current _define_tbox logs warning, main flow continues.
 
         # 5. Read Operational Data
-        data_rows = _read_operational_data(args.data_file, main_logger)
+        with phase("read"):
+            data_rows = _read_operational_data(args.data_file, main_logger, args.row_filter, args.read_workers,
+                                               specification, property_mappings)
         if data_rows is None: return False # Indicate failure if reading failed
+        if args.quarantine:
+            quarantine = QuarantineWriter(args.quarantine, fieldnames=data_rows[0].keys() if data_rows else None)
 
         # 6. Populate Ontology (ABox)
         population_result = _populate_abox(
             onto, data_rows, defined_classes, defined_properties, property_is_functional,
-            specification, property_mappings, main_logger
+            specification, property_mappings, main_logger, args.population_strategy, quarantine,
+            ae_rollups=bool(args.ae_rollups or args.facts_dir), collect_event_facts=bool(args.facts_dir)
         )
         
         # TKT-009: Fix - Ensure the tuple unpacking aligns with what _populate_abox returns
@@ -745,8 +954,10 @@ def main_ontology_generation(spec_file_path: str,
                 
             # Still attempt to save in debug mode
             reasoning_successful = False
-            save_failed = _save_ontology_file(onto, world, args.output_file, args.format, args.worlddb, 
-                                           population_successful, reasoning_successful, main_logger)
+            with phase("save"):
+                save_failed = _save_ontology_file(onto, world, args.output_file, args.format, args.worlddb,
+                                               population_successful, reasoning_successful, main_logger, compression=args.compress,
+                                               snapshot=args.snapshot)
             return not save_failed # Return overall status
 
         # 7. Process Structural Relationships (NEW STEP)
@@ -763,10 +974,11 @@ def main_ontology_generation(spec_file_path: str,
         #main_logger.info(f"Created {structural_links} structural links between entities.")
                 
         # 8. Setup Equipment Sequence Relationships (Using PopulationContext for property tracking)
-        seq_context = _setup_sequence_relationships(
-            onto, created_eq_classes, eq_class_positions, defined_classes, defined_properties, 
-            property_is_functional, main_logger, population_context
-        )
+        with phase("sequencing"):
+            seq_context = _setup_sequence_relationships(
+                onto, created_eq_classes, eq_class_positions, defined_classes, defined_properties,
+                property_is_functional, main_logger, population_context, parallel_stages=args.parallel_stages
+            )
         
         # TKT-009: Fix - Log property usage after sequence relationships are set up
         if seq_context and hasattr(seq_context, 'log_property_usage_report'):
@@ -785,15 +997,38 @@ def main_ontology_generation(spec_file_path: str,
             main_logger.info("TKT-009: Logging final property usage report")
             population_context.log_property_usage_report()
 
-        # 10. Analyze Population & Optimize (Optional)
+        # 9. Store AE/OEE Rollups (Optional)
+        # Sums were accumulated per (line, equipment, shift, date, state, reason) during Pass 1
+        if args.ae_rollups and population_context and population_context.ae_rollups is not None:
+            try:
+                with phase("rollups"):
+                    create_rollup_individuals(onto, population_context.ae_rollups)
+            except Exception as rollup_err:
+                main_logger.error(f"Failed to create AE rollup individuals: {rollup_err}", exc_info=True)
+
+        # 10. Export Event Fact Tables (Optional)
+        # Built from the events recorded in Pass 1 and the individual registry, not from the ontology
+        if args.facts_dir:
+            try:
+                with phase("facts"):
+                    export_fact_tables(population_context, all_created_individuals_by_uid, property_mappings,
+                                       args.facts_dir, format=args.facts_format)
+            except Exception as facts_err:
+                main_logger.error(f"Failed to export fact tables to {args.facts_dir}: {facts_err}", exc_info=True)
+
+        # 11. Analyze Population & Optimize (Optional)
         if population_successful and args.analyze_population:
-            _run_analysis_and_optimization(onto, defined_classes, specification, args.optimize_ontology, args.output_file, main_logger)
+            with phase("analysis"):
+                _run_analysis_and_optimization(onto, defined_classes, specification, args.optimize_ontology, args.output_file, main_logger,
+                                               analysis_backend=args.population_analysis_backend)
         elif not args.analyze_population:
             main_logger.warning("Skipping ontology population analysis as requested.")
 
-        # 11. Apply Reasoning (Optional)
+        # 12. Apply Reasoning (Optional)
         if args.reasoner and population_successful:
-            reasoning_successful = _run_reasoning_phase(onto, world, args.worlddb, args.max_report_entities, args.full_report, main_logger)
+            with phase("reasoning"):
+                reasoning_successful = _run_reasoning_phase(onto, world, args.worlddb, args.max_report_entities, args.full_report, main_logger,
+                                                            reasoner_mode=args.reasoner_mode, partition_options=args.partition_options)
         elif args.reasoner and not population_successful:
             main_logger.warning("Skipping reasoning due to prior population failure.")
             reasoning_successful = False # Ensure overall success reflects this skipped step
@@ -806,14 +1041,16 @@ def main_ontology_generation(spec_file_path: str,
         else:
             main_logger.warning("TKT-002: Population context not available for final property usage report")
 
-        # 12. Save Ontology
+        # 13. Save Ontology
         # Saving logic depends on population and reasoning success
         # The helper returns True if saving *failed*
-        save_failed = _save_ontology_file(onto, world, args.output_file, args.format, args.worlddb, population_successful, reasoning_successful, main_logger)
+        with phase("save"):
+            save_failed = _save_ontology_file(onto, world, args.output_file, args.format, args.worlddb, population_successful, reasoning_successful, main_logger,
+                                              compression=args.compress, snapshot=args.snapshot)
         if save_failed:
             return False # Saving failed, overall process is unsuccessful
 
-        # 13. Determine overall success
+        # 14. Determine overall success
         overall_success = population_successful and reasoning_successful and not save_failed
         return overall_success
 
@@ -822,8 +1059,16 @@ def main_ontology_generation(spec_file_path: str,
         return False
 
     finally:
+        if quarantine is not None:
+            _close_quarantine(quarantine, main_logger)
         end_time = timing.time()
+        phase_timer.stop()
         main_logger.info(f"--- Ontology Generation Finished --- Total time: {end_time - start_time:.2f} seconds")
+        if phase_timer.phases:
+            main_logger.info(f"Phase timings: {phase_timer.summary()}")
+        _record_run_metrics(phase_timer, population_context, args.data_file, overall_success, end_time - start_time)
+        _write_run_metrics(args, phase_timer, overall_success, main_logger)
+        _write_profile(args, phase_timer, main_logger)
         
         # Log suppressed message counts
         from ontology_generator.utils.logging import log_suppressed_message_counts
@@ -945,9 +1190,12 @@ def test_property_mappings(spec_file_path: str):
 def analyze_equipment_sequence_in_ontology(owl_file_path: str, verbose: bool = False) -> bool:
     """
     Standalone function to analyze equipment sequences in an existing ontology file.
+
+    A fresh quadstore snapshot next to the OWL file (see --snapshot) is loaded
+    instead of parsing the file.
     
     Args:
-        owl_file_path: Path to the OWL file to analyze
+        owl_file_path: Path to the OWL file (or snapshot) to analyze
         verbose: Enable verbose output
         
     Returns:
@@ -964,16 +1212,10 @@ def analyze_equipment_sequence_in_ontology(owl_file_path: str, verbose: bool = F
             analyze_equipment_sequences,
             generate_enhanced_sequence_report
         )
-        from owlready2 import get_ontology, IRIS
         
         logger.info(f"Loading ontology from {owl_file_path} for sequence analysis...")
-        # Initialize owlready2 world and load ontology
-        from owlready2 import World
-        world = World()
-        onto = world.get_ontology(owl_file_path).load()
-        
-        # Get namespace
-        IRIS.prefixes[""] = onto.base_iri
+        # Prefer a fresh snapshot over parsing the OWL file
+        world, onto = load_ontology(owl_file_path)
         
         logger.info(f"Loaded ontology: {onto.base_iri}")
         
@@ -1005,20 +1247,65 @@ def main():
     """Main entry point for the ontology generator."""
     parser = argparse.ArgumentParser(description="Generate an OWL ontology from specification and data CSV files.")
     parser.add_argument("spec_file", help="Path to the ontology specification CSV file (e.g., opera_spec.csv).")
-    parser.add_argument("data_file", help="Path to the operational data CSV file (e.g., sample_data.csv).")
+    parser.add_argument("data_file", help="Path to the operational data CSV file (e.g., sample_data.csv), optionally gzip (.gz) or zstd (.zst) compressed, or a Parquet/Arrow IPC file (.parquet, .arrow, .feather; requires pyarrow); a directory or a quoted glob pattern reads all matching parts in sorted order.")
     parser.add_argument("output_file", help="Path to save the generated OWL ontology file (e.g., manufacturing.owl).")
     parser.add_argument("--iri", default=DEFAULT_ONTOLOGY_IRI, help=f"Base IRI for the ontology (default: {DEFAULT_ONTOLOGY_IRI}).")
     parser.add_argument("--format", default="rdfxml", choices=["rdfxml", "ntriples", "nquads", "owlxml"], help="Format for saving the ontology (default: rdfxml).")
+    parser.add_argument("--compress", default=None, choices=["gzip", "zstd"],
+                        help="Compress ntriples/nquads output on the fly (default: inferred from a .gz/.zst output extension; zstd needs the 'zstandard' package).")
+    parser.add_argument("--snapshot", action="store_true", dest="save_snapshot",
+                        help="Also write a vacuumed SQLite quadstore snapshot next to the output (<output>.snapshot.sqlite3) for fast reloading by --analyze-sequences and the analyzer scripts.")
+    parser.add_argument("--export-facts", default=None, metavar="DIR", dest="facts_dir",
+                        help="Write an event fact table and equipment/material dimension tables to DIR for analytics.")
+    parser.add_argument("--facts-format", default="auto", choices=["auto", "parquet", "csv"],
+                        help="Format of the --export-facts tables; 'auto' writes Parquet when pyarrow is installed, else CSV (default: auto).")
+    parser.add_argument("--ae-rollups", action="store_true",
+                        help="Store AE/OEE sums per line, equipment, shift, production date, state and reason as AERollup individuals (the ae_rollups table is always written with --export-facts).")
+    parser.add_argument("--metrics-json", default=None, metavar="FILE",
+                        help="Write a JSON run summary: rows/sec per pass, individuals per class, get_or_create hits, cast failures per column, time/RSS/quadstore writes per phase.")
+    parser.add_argument("--metrics-prom", default=None, metavar="FILE", dest="metrics_textfile",
+                        help="Write the run metrics as a Prometheus textfile-collector file (e.g. ontology_generator.prom).")
+    parser.add_argument("--plant", action="append", default=None, dest="plants", metavar="PLANT",
+                        help="Only read rows of this plant (PLANT column); repeat for several plants. Rows are filtered on their raw values while the data file is read.")
+    parser.add_argument("--line", action="append", default=None, dest="lines", metavar="LINE",
+                        help="Only read rows of this production line (LINE_NAME column); repeat for several lines.")
+    parser.add_argument("--from", default=None, dest="date_from", metavar="YYYY-MM-DD",
+                        help="Only read rows on or after this day in --date-column.")
+    parser.add_argument("--to", default=None, dest="date_to", metavar="YYYY-MM-DD",
+                        help="Only read rows on or before this day in --date-column.")
+    parser.add_argument("--date-column", default=FILTER_DATE_COLUMNS[0], choices=FILTER_DATE_COLUMNS,
+                        help=f"Column --from/--to apply to (default: {FILTER_DATE_COLUMNS[0]}).")
+    parser.add_argument("--read-workers", type=int, default=None, metavar="N",
+                        help="Worker processes decompressing and parsing the parts of a multi-file data_file (default: one per part, at most the CPU count; 1 reads in-process).")
+    parser.add_argument("--quarantine", default=None, metavar="FILE",
+                        help="Write rows rejected during population to FILE (CSV, or JSON Lines for a .jsonl path) with their row number, phase and reason code; the file can be passed back as data_file to reprocess them.")
+    parser.add_argument("--profile", default=None, metavar="DIR", dest="profile_dir",
+                        help="Profile every phase with cProfile and tracemalloc; write <phase>.pstats files and a profile_summary.txt/.json (top functions and allocation sites per phase) to DIR.")
+    parser.add_argument("--profile-sample-rows", type=int, default=1, metavar="N",
+                        help="With --profile, profile only every Nth row of Pass 1 and Pass 2 to keep the overhead low on big inputs (default: 1, every row).")
     parser.add_argument("--reasoner", action="store_true", help="Run the reasoner after population.")
+    parser.add_argument("--reasoner-mode", default="hermit", choices=["hermit", "rl", "partitioned"],
+                        help="Reasoner used with --reasoner: 'hermit' (Java, full consistency check), 'rl' (in-process OWL RL property/type materialization) or 'partitioned' (TBox once, ABox per production line in worker processes) (default: hermit).")
+    parser.add_argument("--partition-engine", default="hermit", choices=["hermit", "rl"], help="Engine used for each partition with --reasoner-mode partitioned (default: hermit).")
+    parser.add_argument("--partition-workers", type=int, default=None, help="Maximum parallel partition workers (default: CPU count).")
+    parser.add_argument("--partition-timeout", type=float, default=600, metavar="SECONDS", help="Time allowed per reasoning partition (default: 600).")
+    parser.add_argument("--partition-memory", type=int, default=None, metavar="MB", help="Memory cap per partition worker (JVM heap for HermiT).")
+    parser.add_argument("--tbox-cache-dir", default=None, help="Directory caching the classified TBox between partitioned reasoning runs.")
     parser.add_argument("--worlddb", default=None, help="Path to use/create a persistent SQLite world database (e.g., my_ontology.sqlite3).")
     parser.add_argument("--max-report-entities", type=int, default=10, help="Maximum number of entities to show per category in the reasoner report (default: 10).")
     parser.add_argument("--full-report", action="store_true", help="Show full details in the reasoner report (all entities).")
     parser.add_argument("--no-analyze-population", action="store_false", dest="analyze_population", help="Skip analysis and reporting of ontology population (analysis is on by default).")
+    parser.add_argument("--population-analysis-backend", default="sql", choices=["sql", "search"],
+                       help="How population analysis counts class members: aggregate queries against the quadstore (sql) or one onto.search per class (search). Both produce the same report (default: sql).")
+    parser.add_argument("--population-strategy", default="row", choices=["row", "dimension"],
+                       help="Pass 1 strategy: create/update all individuals of every row (row), or create master-data individuals once per distinct tuple and stream only events and intervals per row (dimension) (default: row).")
+    parser.add_argument("--parallel-stages", action="store_true",
+                        help="Group equipment sharing a sequence position on a line into one ParallelStage individual (isMemberOfStage links) instead of linking every pair with isParallelWith.")
     parser.add_argument("--strict-adherence", action="store_true", help="Only create classes explicitly defined in the specification.")
     parser.add_argument("--skip-classes", type=str, nargs='+', help="List of class names to skip during ontology creation.")
     parser.add_argument("--optimize", action="store_true", dest="optimize_ontology", help="Generate detailed optimization recommendations.")
     parser.add_argument("--test-mappings", action="store_true", help="Test the property mapping functionality only, without generating the ontology.")
-    parser.add_argument("--analyze-sequences", metavar="OWL_FILE", help="Analyze equipment sequences in an existing ontology file.")
+    parser.add_argument("--analyze-sequences", metavar="OWL_FILE", help="Analyze equipment sequences in an existing ontology file (a fresh snapshot next to it is used if present).")
     parser.add_argument("--event-buffer", type=int, default=None, metavar="MINUTES", 
                        help=f"Time buffer in minutes for event linking (default: {DEFAULT_EVENT_LINKING_BUFFER_MINUTES}).")
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose (DEBUG level) logging.")
@@ -1036,6 +1323,11 @@ def main():
         test_property_mappings(args.spec_file)
         sys.exit(0)
 
+    try:
+        row_filter = RowFilter(args.plants, args.lines, args.date_from, args.date_to, args.date_column)
+    except ValueError as filter_err:
+        parser.error(f"Invalid row filter: {filter_err}")
+
     # Setup Logging Level
     log_level = logging.INFO
     if args.verbose: 
@@ -1056,7 +1348,28 @@ def main():
         strict_adherence=args.strict_adherence,
         skip_classes=args.skip_classes,
         optimize_ontology=args.optimize_ontology,
-        event_buffer_minutes=args.event_buffer
+        event_buffer_minutes=args.event_buffer,
+        population_analysis_backend=args.population_analysis_backend,
+        reasoner_mode=args.reasoner_mode,
+        partition_engine=args.partition_engine,
+        partition_workers=args.partition_workers,
+        partition_timeout=args.partition_timeout,
+        partition_memory_mb=args.partition_memory,
+        tbox_cache_dir=args.tbox_cache_dir,
+        compression=args.compress,
+        save_snapshot=args.save_snapshot,
+        facts_dir=args.facts_dir,
+        facts_format=args.facts_format,
+        ae_rollups=args.ae_rollups,
+        metrics_json=args.metrics_json,
+        metrics_textfile=args.metrics_textfile,
+        population_strategy=args.population_strategy,
+        profile_dir=args.profile_dir,
+        profile_sample_rows=args.profile_sample_rows,
+        quarantine_path=args.quarantine,
+        row_filter=row_filter,
+        read_workers=args.read_workers,
+        parallel_stages=args.parallel_stages
     )
     
     # Exit with appropriate code
@@ -323,7 +323,7 @@ def process_production_request(
     request_id_col = request_id_map["column"]
     request_id = safe_cast(row.get(request_id_col), str)
     if not request_id:
-        pop_logger.debug(f"Missing or invalid Request ID in column '{request_id_col}'. Skipping request creation.")
+        pop_logger.debug("Missing or invalid Request ID in column '%s'. Skipping request creation.", request_id_col)
         return None
 
     # Check for batch property mapping - may be optional but useful for identification
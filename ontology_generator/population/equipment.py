@@ -90,9 +90,9 @@ def parse_equipment_class(equipment_name: Optional[str], equipment_type: Optiona
     actual_model = equipment_model if equipment_model else model
     
     # Log equipment name for debugging
-    pop_logger.debug(f"Attempting to parse equipment class from: '{equipment_name}'")
+    pop_logger.debug("Attempting to parse equipment class from: '%s'", equipment_name)
     if actual_model:
-        pop_logger.debug(f"Equipment model information: '{actual_model}'")
+        pop_logger.debug("Equipment model information: '%s'", actual_model)
     
     # --- Method 1: Direct match from configuration map ---
     if equipment_name and isinstance(equipment_name, str):
@@ -100,7 +100,7 @@ def parse_equipment_class(equipment_name: Optional[str], equipment_type: Optiona
             if pattern in equipment_name:
                 match_method = "Config Map"
                 matched_class = class_name
-                pop_logger.info(f"Found equipment class '{matched_class}' via pattern '{pattern}' in config map")
+                pop_logger.info("Found equipment class '%s' via pattern '%s' in config map", matched_class, pattern)
                 break
                 
     # --- Method 2: Parse from EQUIPMENT_NAME with underscore ---
@@ -127,23 +127,23 @@ def parse_equipment_class(equipment_name: Optional[str], equipment_type: Optiona
                         match_method = "Name Underscore Parsing (Exact Match)"
                         matched_class = known_class  # Use the properly capitalized version
                         match_found = True
-                        pop_logger.info(f"Parsed equipment class '{matched_class}' via exact match from '{equipment_name}'")
+                        pop_logger.info("Parsed equipment class '%s' via exact match from '%s'", matched_class, equipment_name)
                         break
                     elif known_class.lower().startswith(base_class.lower()):
                         # Known class starts with our parsed base class - likely a match
                         match_method = "Name Underscore Parsing (Prefix Match)"
                         matched_class = known_class
                         match_found = True
-                        pop_logger.info(f"Parsed equipment class '{matched_class}' via prefix match from '{equipment_name}'")
+                        pop_logger.info("Parsed equipment class '%s' via prefix match from '%s'", matched_class, equipment_name)
                         break
                 
                 # If we didn't find a match in known classes but have a valid class name
                 if not match_found and len(base_class) >= 3:
                     match_method = "Name Underscore Parsing (New Class)"
                     matched_class = base_class
-                    pop_logger.info(f"Parsed potential new equipment class '{matched_class}' from '{equipment_name}'")
+                    pop_logger.info("Parsed potential new equipment class '%s' from '%s'", matched_class, equipment_name)
             else:
-                pop_logger.debug(f"Part after underscore '{base_class}' looks like a line ID, not a valid equipment class")
+                pop_logger.debug("Part after underscore '%s' looks like a line ID, not a valid equipment class", base_class)
     
     # --- Method 3: Known Class Matching (without underscore) ---
     if not matched_class and equipment_name and isinstance(equipment_name, str):
@@ -154,20 +154,20 @@ def parse_equipment_class(equipment_name: Optional[str], equipment_type: Optiona
         paren_match = re.search(r'\((.*?)\)', cleaned_name)
         if paren_match:
             paren_content = paren_match.group(1).strip()
-            pop_logger.debug(f"Found parenthesized content: '{paren_content}'")
+            pop_logger.debug("Found parenthesized content: '%s'", paren_content)
             
             # Try to extract from parenthesized content first (higher priority)
             for known_class in KNOWN_EQUIPMENT_CLASSES:
                 if known_class.lower() in paren_content.lower():
                     match_method = "Parenthesized Content Match"
                     matched_class = known_class
-                    pop_logger.info(f"Extracted equipment class '{matched_class}' from parenthesized content in '{equipment_name}'")
+                    pop_logger.info("Extracted equipment class '%s' from parenthesized content in '%s'", matched_class, equipment_name)
                     break
         
         if not matched_class:
             # Remove trailing numbers
             base_name = re.sub(r'\d+$', '', cleaned_name)
-            pop_logger.debug(f"Cleaned base name for matching: '{base_name}'")
+            pop_logger.debug("Cleaned base name for matching: '%s'", base_name)
             
             # Clean up any remaining non-alphanumeric characters for better matching
             cleaned_base = re.sub(r'[^a-zA-Z0-9\s]', '', base_name).strip()
@@ -178,7 +178,7 @@ def parse_equipment_class(equipment_name: Optional[str], equipment_type: Optiona
                 if cleaned_base.lower() == known_class.lower():
                     match_method = "Known Class Exact Match"
                     matched_class = known_class  # Use the properly capitalized version
-                    pop_logger.info(f"Matched equipment name '{equipment_name}' to known class '{matched_class}' (exact match)")
+                    pop_logger.info("Matched equipment name '%s' to known class '%s' (exact match)", equipment_name, matched_class)
                     break
                 
                 # 2. Check if cleaned name starts with known class (case-insensitive)
@@ -188,14 +188,14 @@ def parse_equipment_class(equipment_name: Optional[str], equipment_type: Optiona
                     if not remainder or not re.search(r'[a-zA-Z]', remainder):
                         match_method = "Known Class Prefix Match"
                         matched_class = known_class
-                        pop_logger.info(f"Extracted equipment class '{matched_class}' from '{equipment_name}' via prefix match")
+                        pop_logger.info("Extracted equipment class '%s' from '%s' via prefix match", matched_class, equipment_name)
                         break
                 
                 # 3. Check if a known class is embedded within the name
                 if known_class.lower() in cleaned_base.lower():
                     match_method = "Known Class Substring Match" 
                     matched_class = known_class
-                    pop_logger.info(f"Found equipment class '{matched_class}' embedded within '{equipment_name}'")
+                    pop_logger.info("Found equipment class '%s' embedded within '%s'", matched_class, equipment_name)
                     break
                 
                 # 4. Check for word boundary matches (most precise)
@@ -203,25 +203,25 @@ def parse_equipment_class(equipment_name: Optional[str], equipment_type: Optiona
                 if re.search(word_pattern, cleaned_base.lower()):
                     match_method = "Known Class Word Match"
                     matched_class = known_class
-                    pop_logger.info(f"Found equipment class '{matched_class}' as a complete word in '{equipment_name}'")
+                    pop_logger.info("Found equipment class '%s' as a complete word in '%s'", matched_class, equipment_name)
                     break
     
     # --- Method 4: Equipment Model Inspection ---
     if not matched_class and actual_model and isinstance(actual_model, str):
         model_to_use = actual_model.strip()
-        pop_logger.debug(f"Attempting to parse class from equipment model: '{model_to_use}'")
+        pop_logger.debug("Attempting to parse class from equipment model: '%s'", model_to_use)
         
         # Look for known classes in the model information
         for known_class in KNOWN_EQUIPMENT_CLASSES:
             if known_class.lower() in model_to_use.lower():
                 match_method = "Model-Based Match"
                 matched_class = known_class
-                pop_logger.info(f"Extracted equipment class '{matched_class}' from model '{model_to_use}'")
+                pop_logger.info("Extracted equipment class '%s' from model '%s'", matched_class, model_to_use)
                 break
     
     # --- Method 5: Generic String Extraction (most permissive, last resort) ---
     if not matched_class and equipment_name and isinstance(equipment_name, str):
-        pop_logger.debug(f"Attempting generic string extraction as last resort for '{equipment_name}'")
+        pop_logger.debug("Attempting generic string extraction as last resort for '%s'", equipment_name)
         # Remove any line ID prefix first
         cleaned_name = re.sub(r'^(FIPCO|LINE)\d*_?', '', equipment_name)
         
@@ -254,11 +254,11 @@ def parse_equipment_class(equipment_name: Optional[str], equipment_type: Optiona
                 if similar_to_known and most_similar_known:
                     match_method = "Generic Extraction (Similar to Known Class)"
                     matched_class = most_similar_known
-                    pop_logger.info(f"Extracted equipment class '{matched_class}' via similarity to extracted candidate '{best_candidate}'")
+                    pop_logger.info("Extracted equipment class '%s' via similarity to extracted candidate '%s'", matched_class, best_candidate)
                 else:
                     match_method = "Generic String Extraction"
                     matched_class = best_candidate
-                    pop_logger.info(f"Extracted potential equipment class '{matched_class}' via generic parsing from candidates: {[c[0] for c in candidate_classes]}")
+                    pop_logger.info("Extracted potential equipment class '%s' via generic parsing from candidates: %s", matched_class, [c[0] for c in candidate_classes])
     
     # Final validation and logging
     if matched_class:
@@ -268,7 +268,7 @@ def parse_equipment_class(equipment_name: Optional[str], equipment_type: Optiona
                 matched_class = known_class  # Use the properly capitalized version
                 break
         
-        pop_logger.info(f"Successfully parsed equipment class '{matched_class}' from '{equipment_name}' using method: {match_method}")
+        pop_logger.info("Successfully parsed equipment class '%s' from '%s' using method: %s", matched_class, equipment_name, match_method)
         return matched_class
     else:
         # More detailed logging for troubleshooting
@@ -346,7 +346,7 @@ def process_equipment_and_class(
     
     # If this is a Line type entry, don't create Equipment - it's handled by ProductionLine processing
     if eq_type.lower() == 'line':
-        pop_logger.debug(f"EQUIPMENT_TYPE is 'Line' for '{eq_name}' - skipping Equipment instance creation.")
+        pop_logger.debug("EQUIPMENT_TYPE is 'Line' for '%s' - skipping Equipment instance creation.", eq_name)
         return None, None, None
     
     # Get equipment ID - critical for uniquely identifying the equipment instance
@@ -370,14 +370,14 @@ def process_equipment_and_class(
         equipment_model_col = equipment_model_map.get('column')
         if equipment_model_col in row:
             equipment_model = row.get(equipment_model_col, '').strip()
-            pop_logger.info(f"TKT-004: Found equipmentModel value '{equipment_model}' in column '{equipment_model_col}' for equipment '{eq_name}'")
+            pop_logger.debug("TKT-004: Found equipmentModel value '%s' in column '%s' for equipment '%s'", equipment_model, equipment_model_col, eq_name)
         else:
             pop_logger.warning(f"TKT-004: equipmentModel column '{equipment_model_col}' not found in row data for equipment '{eq_name}'")
     else:
         # Fall back to direct column lookup
         equipment_model = row.get('EQUIPMENT_MODEL', '').strip() if 'EQUIPMENT_MODEL' in row else None
         if equipment_model:
-            pop_logger.info(f"TKT-004: Found equipmentModel value '{equipment_model}' in EQUIPMENT_MODEL column for equipment '{eq_name}'")
+            pop_logger.debug("TKT-004: Found equipmentModel value '%s' in EQUIPMENT_MODEL column for equipment '%s'", equipment_model, eq_name)
         else:
             pop_logger.warning(f"TKT-004: EQUIPMENT_MODEL column not found in row data for equipment '{eq_name}'")
 
@@ -397,7 +397,7 @@ def process_equipment_and_class(
         eq_class_id_value = row[eq_class_col].strip()
         if eq_class_id_value:
             eq_class_base_name = eq_class_id_value
-            pop_logger.debug(f"Using equipment class '{eq_class_base_name}' from column '{eq_class_col}'")
+            pop_logger.debug("Using equipment class '%s' from column '%s'", eq_class_base_name, eq_class_col)
     
     # Method 2: Try to parse from equipment name if not yet determined
     if not eq_class_base_name:
@@ -410,7 +410,7 @@ def process_equipment_and_class(
             eq_class_base_name = parsed_class
             eq_class_id_value = parsed_class  # Use parsed value as ID value
             is_parsed_from_name = True
-            pop_logger.debug(f"Parsed equipment class '{eq_class_base_name}' from equipment name '{eq_name}'")
+            pop_logger.debug("Parsed equipment class '%s' from equipment name '%s'", eq_class_base_name, eq_name)
     
     # If still no class name, use a default or return None
     if not eq_class_base_name:
@@ -435,7 +435,7 @@ def process_equipment_and_class(
         # rather than using the full equipment name
         eq_class_unique_id = eq_class_base_name
         
-        pop_logger.debug(f"Creating/retrieving EquipmentClass individual with unique ID: '{eq_class_unique_id}'")
+        pop_logger.debug("Creating/retrieving EquipmentClass individual with unique ID: '%s'", eq_class_unique_id)
         
         eq_class_ind = get_or_create_individual(
             cls_EquipmentClass, 
@@ -454,11 +454,11 @@ def process_equipment_and_class(
             # Try to get from config first
             if eq_class_base_name in KNOWN_EQUIPMENT_CLASSES:
                 sequence_position = KNOWN_EQUIPMENT_CLASSES.index(eq_class_base_name) + 1
-                pop_logger.debug(f"Retrieved sequence position {sequence_position} for {eq_class_base_name} from KNOWN_EQUIPMENT_CLASSES")
+                pop_logger.debug("Retrieved sequence position %s for %s from KNOWN_EQUIPMENT_CLASSES", sequence_position, eq_class_base_name)
             
             # TKT-005: Explicitly set equipmentClassId to ensure it matches the base name
             # This ensures the EquipmentClass can be properly identified and linked
-            pop_logger.info(f"TKT-005: Setting equipmentClassId='{eq_class_base_name}' for EquipmentClass individual '{eq_class_unique_id}'")
+            pop_logger.info("TKT-005: Setting equipmentClassId='%s' for EquipmentClass individual '%s'", eq_class_base_name, eq_class_unique_id)
             context.set_prop(eq_class_ind, "equipmentClassId", eq_class_base_name)
             
             # Apply data property mappings for EquipmentClass
@@ -498,7 +498,7 @@ def process_equipment_and_class(
             # Key modification for TKT-002-2c: Explicitly use EQUIPMENT_ID for unique identification
             eq_unique_id = eq_id
             
-            pop_logger.debug(f"Creating/retrieving Equipment individual with unique ID: '{eq_unique_id}'")
+            pop_logger.debug("Creating/retrieving Equipment individual with unique ID: '%s'", eq_unique_id)
             
             eq_ind = get_or_create_individual(
                 cls_Equipment,
@@ -522,7 +522,7 @@ def process_equipment_and_class(
                     if member_of_class_prop:
                         # Set the memberOfClass relationship
                         context.set_prop(eq_ind, "memberOfClass", eq_class_ind)
-                        pop_logger.info(f"TKT-005: Linked equipment '{eq_id}' to its class '{eq_class_base_name}' via memberOfClass property")
+                        pop_logger.info("TKT-005: Linked equipment '%s' to its class '%s' via memberOfClass property", eq_id, eq_class_base_name)
                     else:
                         pop_logger.error(f"CRITICAL: Required property 'memberOfClass' not found. Cannot link equipment to class.")
                 elif not eq_class_ind:
@@ -531,9 +531,9 @@ def process_equipment_and_class(
                 # TKT-002: Set sequencePosition property on the Equipment individual based on its class
                 # First check if the sequencePosition property exists
                 sequence_position_prop = context.get_prop("sequencePosition")
+                position_value = None
                 if sequence_position_prop:
                     # Determine sequence position from equipment class
-                    position_value = None
                     
                     # Try to get line ID for line-specific sequence positions
                     line_id = None
@@ -548,19 +548,19 @@ def process_equipment_and_class(
                         from ontology_generator.config import LINE_SPECIFIC_EQUIPMENT_SEQUENCE
                         if line_id and line_id in LINE_SPECIFIC_EQUIPMENT_SEQUENCE and eq_class_base_name in LINE_SPECIFIC_EQUIPMENT_SEQUENCE[line_id]:
                             position_value = LINE_SPECIFIC_EQUIPMENT_SEQUENCE[line_id].get(eq_class_base_name)
-                            pop_logger.debug(f"Using line-specific sequence position {position_value} for {eq_class_base_name} on line {line_id}")
+                            pop_logger.debug("Using line-specific sequence position %s for %s on line %s", position_value, eq_class_base_name, line_id)
                         
                         # Otherwise, use the default sequence from DEFAULT_EQUIPMENT_SEQUENCE
                         if position_value is None:
                             from ontology_generator.config import DEFAULT_EQUIPMENT_SEQUENCE
                             position_value = DEFAULT_EQUIPMENT_SEQUENCE.get(eq_class_base_name)
                             if position_value:
-                                pop_logger.debug(f"Using default sequence position {position_value} for {eq_class_base_name}")
+                                pop_logger.debug("Using default sequence position %s for %s", position_value, eq_class_base_name)
                     
                     # Set the sequencePosition if we found a value
                     if position_value is not None:
                         context.set_prop(eq_ind, "sequencePosition", position_value)
-                        pop_logger.debug(f"TKT-006: Set sequencePosition={position_value} for equipment {eq_id} of class {eq_class_base_name}")
+                        pop_logger.debug("TKT-006: Set sequencePosition=%s for equipment %s of class %s", position_value, eq_id, eq_class_base_name)
                     else:
                         pop_logger.warning(f"TKT-006: No sequence position found for equipment class {eq_class_base_name}")
                 else:
@@ -574,6 +574,9 @@ def process_equipment_and_class(
                         # Set bidirectional links
                         context.set_prop(eq_ind, "isPartOfProductionLine", line_ind)
                         
+                        # Record the placement so sequence setup can group equipment by line directly
+                        context.record_equipment_placement(line_ind, eq_ind, eq_class_base_name, position_value, eq_id)
+                        
                         # TKT-010: Set associatedLineId property for later reference
                         # Check if the property exists
                         associated_line_id_prop = context.get_prop("associatedLineId")
@@ -587,20 +590,20 @@ def process_equipment_and_class(
                                 
                                 if line_id_val:
                                     context.set_prop(eq_ind, "associatedLineId", line_id_val)
-                                    pop_logger.debug(f"TKT-010: Set associatedLineId={line_id_val} for equipment {eq_id}")
+                                    pop_logger.debug("TKT-010: Set associatedLineId=%s for equipment %s", line_id_val, eq_id)
                             else:
                                 # Fallback: Try to find LINE_NAME in row data
                                 if "LINE_NAME" in row:
                                     line_name_val = row.get("LINE_NAME")
                                     if line_name_val:
                                         context.set_prop(eq_ind, "associatedLineId", line_name_val)
-                                        pop_logger.debug(f"TKT-010: Set associatedLineId={line_name_val} from LINE_NAME column for equipment {eq_id}")
+                                        pop_logger.debug("TKT-010: Set associatedLineId=%s from LINE_NAME column for equipment %s", line_name_val, eq_id)
                         
                         # Check for existence of hasEquipmentPart property before attempting to set it
                         has_part_prop = context.get_prop("hasEquipmentPart")
                         if has_part_prop:
                             context.set_prop(line_ind, "hasEquipmentPart", eq_ind)
-                            pop_logger.debug(f"Linked equipment '{eq_name}' to production line")
+                            pop_logger.debug("Linked equipment '%s' to production line", eq_name)
                         else:
                             pop_logger.warning(f"Required property mapping 'hasEquipmentPart' not found. Cannot link line to equipment.")
                     else:
@@ -613,7 +616,7 @@ def process_equipment_and_class(
                         line_name_val = row.get("LINE_NAME")
                         if line_name_val:
                             context.set_prop(eq_ind, "associatedLineId", line_name_val)
-                            pop_logger.debug(f"TKT-010: Set associatedLineId={line_name_val} from LINE_NAME column for equipment {eq_id} (no line_ind available)")
+                            pop_logger.debug("TKT-010: Set associatedLineId=%s from LINE_NAME column for equipment %s (no line_ind available)", line_name_val, eq_id)
         except Exception as e:
             pop_logger.error(f"Error creating Equipment '{eq_id}': {e}")
     
@@ -64,10 +64,10 @@ def process_shift(
     end_time_str = safe_cast(row.get(end_time_map['column']), str)
 
     if not shift_id:
-        pop_logger.debug(f"Missing shift ID in column '{shift_id_col}'. Skipping shift creation.")
+        pop_logger.debug("Missing shift ID in column '%s'. Skipping shift creation.", shift_id_col)
         return None
     if not start_time_str:
-        pop_logger.debug(f"Missing shift start time in column '{start_time_map['column']}'. Skipping shift creation.")
+        pop_logger.debug("Missing shift start time in column '%s'. Skipping shift creation.", start_time_map['column'])
         return None
 
     # Create a unique base name, e.g., ShiftID_StartTime
@@ -124,7 +124,7 @@ def process_shift(
                     "end_datetime": end_datetime
                 }
                 context.store_individual_data(shift_ind, temporal_data)
-                pop_logger.debug(f"Stored temporal data for shift {shift_id}: {start_datetime} to {end_datetime}")
+                pop_logger.debug("Stored temporal data for shift %s: %s to %s", shift_id, start_datetime, end_datetime)
         except Exception as e:
             pop_logger.warning(f"Failed to parse shift times for temporal lookup: {e}")
 
@@ -162,7 +162,7 @@ def process_state(
     state_desc_col = state_desc_map['column']
     state_desc = safe_cast(row.get(state_desc_col), str)
     if not state_desc:
-        pop_logger.debug(f"Missing state description in column '{state_desc_col}'. Skipping state creation.")
+        pop_logger.debug("Missing state description in column '%s'. Skipping state creation.", state_desc_col)
         return None
 
     # Use description as the base name (assuming descriptions are reasonably unique states)
@@ -212,13 +212,13 @@ def process_reason(
     elif alt_reason_desc_map and alt_reason_desc_map.get('column'):
         reason_desc_col = alt_reason_desc_map['column']
         reason_desc = safe_cast(row.get(reason_desc_col), str)
-        pop_logger.debug(f"Using altReasonDescription column '{reason_desc_col}' for reason.")
+        pop_logger.debug("Using altReasonDescription column '%s' for reason.", reason_desc_col)
     else:
         pop_logger.warning("Required property mapping for reason description (reasonDescription or altReasonDescription) not found. Skipping reason creation.")
         return None
 
     if not reason_desc:
-        pop_logger.debug(f"Missing reason description in column '{reason_desc_col}'. Skipping reason creation.")
+        pop_logger.debug("Missing reason description in column '%s'. Skipping reason creation.", reason_desc_col)
         return None
 
     # Use description as the base name
@@ -309,7 +309,7 @@ def process_time_interval(
         if end_time_str:
             valid_end_time = True
         else:
-            pop_logger.debug(f"Row {row_num}: No endTime value in column '{end_col}'.")
+            pop_logger.debug("Row %s: No endTime value in column '%s'.", row_num, end_col)
             if infer_missing_end_time and valid_start_time:
                 # Logic to infer end time would go here if we needed it
                 # For now, we're just focusing on property checks
@@ -351,7 +351,8 @@ def process_event_record(
     material_ind: Optional[Thing] = None, # Optional context
     request_ind: Optional[Thing] = None, # Optional context
     pass_num: int = 1,
-    row_num: int = -1
+    row_num: int = -1,
+    match_shift_by_time: bool = True
 ) -> Tuple[Optional[Thing], Optional[Tuple]]:
     """
     Processes EventRecord from a row (Pass 1: Create/Data Props and critical links).
@@ -362,6 +363,10 @@ def process_event_record(
     - state_ind: The operational state of the resource
     - reason_ind: Optional reason for the state
 
+    With match_shift_by_time=False the event is linked to shift_ind directly
+    instead of searching all shifts for one containing the event's start time
+    (used by dimension-first population, where the shift is resolved up front).
+
     Returns:
         Tuple: (event_ind, event_tuple)
                - event_ind: The created event individual
@@ -451,7 +456,7 @@ def process_event_record(
             try:
                 event_start_datetime = datetime.fromisoformat(str(start_time_val))
             except (ValueError, TypeError):
-                pop_logger.debug(f"Row {row_num}: Could not parse event start time as datetime: {start_time_val}")
+                pop_logger.debug("Row %s: Could not parse event start time as datetime: %s", row_num, start_time_val)
     
     # Extract state description for labeling if available
     state_desc = "Unknown State"
@@ -495,7 +500,7 @@ def process_event_record(
             occurred_during_crew_prop = context.get_prop("occurredDuringCrew")
             if occurred_during_crew_prop:
                 context.set_prop(event_ind, "occurredDuringCrew", str(crew_id_value).strip())
-                pop_logger.debug(f"Row {row_num}: Added CREW_ID '{crew_id_value}' to event via occurredDuringCrew property")
+                pop_logger.debug("Row %s: Added CREW_ID '%s' to event via occurredDuringCrew property", row_num, crew_id_value)
             else:
                 pop_logger.warning(f"Row {row_num}: Property 'occurredDuringCrew' not found. Cannot set crew ID.")
         
@@ -538,7 +543,7 @@ def process_event_record(
             else:
                 # Set involvesResource to only the appropriate resource type (equipment or line)
                 context.set_prop(event_ind, "involvesResource", resource_ind)
-                pop_logger.debug(f"Row {row_num}: Linked event to {resource_type} '{resource_ind.name}' via involvesResource")
+                pop_logger.debug("Row %s: Linked event to %s '%s' via involvesResource", row_num, resource_type, resource_ind.name)
         else:
             pop_logger.warning(f"Row {row_num}: Required property 'involvesResource' not found. Cannot link event to resource.")
         
@@ -549,12 +554,12 @@ def process_event_record(
             matching_shift = None
             
             # Check if we have a valid event start time to use for lookup
-            if event_start_datetime:
+            if event_start_datetime and match_shift_by_time:
                 cls_Shift = context.get_class("Shift")
                 if cls_Shift:
                     # Find all shifts in the ontology
                     all_shifts = list(context.onto.search(type=cls_Shift))
-                    pop_logger.debug(f"Row {row_num}: Checking {len(all_shifts)} shifts for temporal containment of event")
+                    pop_logger.debug("Row %s: Checking %s shifts for temporal containment of event", row_num, len(all_shifts))
                     
                     # Iterate through shifts and find one that contains the event's start time
                     for candidate_shift in all_shifts:
@@ -572,7 +577,7 @@ def process_event_record(
                             # Check if event start time is within shift bounds
                             if shift_start <= event_start_datetime < shift_end:
                                 matching_shift = candidate_shift
-                                pop_logger.debug(f"Row {row_num}: Found matching shift: {candidate_shift.name} ({shift_start} to {shift_end})")
+                                pop_logger.debug("Row %s: Found matching shift: %s (%s to %s)", row_num, candidate_shift.name, shift_start, shift_end)
                                 break
             
             # If we found a temporally matching shift, use it instead of the row's direct shift
@@ -581,7 +586,9 @@ def process_event_record(
                 
                 # Log if we're replacing the row's shift with a better temporal match
                 if shift_ind and matching_shift != shift_ind:
-                    pop_logger.info(f"Row {row_num}: TKT-BUG-003: Replaced incorrect row shift with temporally matching shift {matching_shift.name}")
+                    pop_logger.info("Row %s: TKT-BUG-003: Replaced incorrect row shift with temporally matching shift %s", row_num, matching_shift.name)
+            elif shift_ind and not match_shift_by_time:
+                context.set_prop(event_ind, "duringShift", shift_ind)
             elif shift_ind:  
                 # Fallback: Use the row's shift if available and we couldn't find a temporal match
                 context.set_prop(event_ind, "duringShift", shift_ind)
@@ -619,6 +626,48 @@ def process_event_record(
     
     return event_ind, event_context
 
+def get_event_resource_base_id(
+    row: Dict[str, Any],
+    equipment_ind: Optional[Thing],
+    line_ind: Optional[Thing],
+    row_num: int
+) -> str:
+    """
+    Determines the resource ID used to name a row's TimeInterval.
+
+    This duplicates some logic from process_event_record but is needed early for interval naming.
+
+    Args:
+        row: Data row (EQUIPMENT_TYPE selects the line or the equipment).
+        equipment_ind: Equipment individual of the row, if any.
+        line_ind: Line individual of the row, if any.
+        row_num: Original row number (for logging).
+
+    Returns:
+        str: The equipment or line ID, or a fallback derived from the row.
+    """
+    resource_base_id = None
+    resource_type_hint = row.get('EQUIPMENT_TYPE', 'Equipment').strip()
+
+    # Verify that both the required individuals (line_ind or equipment_ind) are available based on EQUIPMENT_TYPE
+    if resource_type_hint == 'Line' and not line_ind:
+        pop_logger.warning(f"Row {row_num}: EQUIPMENT_TYPE is 'Line' but no line_ind was provided. Event processing may fail.")
+    elif resource_type_hint == 'Equipment' and not equipment_ind:
+        pop_logger.warning(f"Row {row_num}: EQUIPMENT_TYPE is 'Equipment' but no equipment_ind was provided. Event processing may fail.")
+        
+    if resource_type_hint == 'Line':
+        if line_ind:
+            resource_base_id = line_ind.lineId[0] if hasattr(line_ind, 'lineId') and line_ind.lineId else line_ind.name
+    else: # Default to Equipment
+        if equipment_ind:
+            resource_base_id = equipment_ind.equipmentId[0] if hasattr(equipment_ind, 'equipmentId') and equipment_ind.equipmentId else equipment_ind.name
+
+    if not resource_base_id:
+         pop_logger.warning(f"Row {row_num}: Could not determine resource_base_id early for interval naming (TypeHint: {resource_type_hint}, Line: {line_ind}, Eq: {equipment_ind}). Using fallback.")
+         resource_base_id = f"UnknownResource_{hash(str(row))}" # Example: Use row hash for fallback uniqueness
+
+    return resource_base_id
+
 def process_event_related(
     row: Dict[str, Any],
     context: PopulationContext,
@@ -673,26 +722,7 @@ def process_event_related(
         pop_logger.warning(f"No valid row_num provided or found in row. Using fallback value. This may cause naming issues.")
 
     # Determine resource_base_id needed for interval processing
-    # This duplicates some logic from process_event_record but is needed early for interval naming
-    resource_base_id = None
-    resource_type_hint = row.get('EQUIPMENT_TYPE', 'Equipment').strip()
-
-    # Verify that both the required individuals (line_ind or equipment_ind) are available based on EQUIPMENT_TYPE
-    if resource_type_hint == 'Line' and not line_ind:
-        pop_logger.warning(f"Row {actual_row_num}: EQUIPMENT_TYPE is 'Line' but no line_ind was provided. Event processing may fail.")
-    elif resource_type_hint == 'Equipment' and not equipment_ind:
-        pop_logger.warning(f"Row {actual_row_num}: EQUIPMENT_TYPE is 'Equipment' but no equipment_ind was provided. Event processing may fail.")
-        
-    if resource_type_hint == 'Line':
-        if line_ind:
-            resource_base_id = line_ind.lineId[0] if hasattr(line_ind, 'lineId') and line_ind.lineId else line_ind.name
-    else: # Default to Equipment
-        if equipment_ind:
-            resource_base_id = equipment_ind.equipmentId[0] if hasattr(equipment_ind, 'equipmentId') and equipment_ind.equipmentId else equipment_ind.name
-
-    if not resource_base_id:
-         pop_logger.warning(f"Row {actual_row_num}: Could not determine resource_base_id early for interval naming (TypeHint: {resource_type_hint}, Line: {line_ind}, Eq: {equipment_ind}). Using fallback.")
-         resource_base_id = f"UnknownResource_{hash(str(row))}" # Example: Use row hash for fallback uniqueness
+    resource_base_id = get_event_resource_base_id(row, equipment_ind, line_ind, actual_row_num)
 
     # Process in dependency order (roughly)
     shift_ind = process_shift(row, context, property_mappings, all_created_individuals_by_uid, pass_num)
@@ -0,0 +1,204 @@
+"""
+AE/OEE rollup module for the ontology generator.
+
+This module pre-aggregates the per-event AE metrics (downtime, runtime, effective
+runtime, good/reject quantities, maintenance and available time) per
+(line, equipment, shift, production date, state, reason) while the ontology is
+populated. Pass 1 appends one group id and one row of metric values per event to
+flat buffers; the sums are computed once with NumPy bincount. The rollups can be
+stored as AERollup summary individuals and exported as a table, so KPI queries
+read one value per group instead of re-summing every EventRecord.
+"""
+import types
+from array import array
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from owlready2 import Ontology, Thing, ThingClass, ObjectProperty, DataProperty, FunctionalProperty
+
+from ontology_generator.config import AE_ROLLUP_METRIC_PROPERTIES, AE_ROLLUP_DATE_COLUMN
+from ontology_generator.utils.logging import pop_logger
+from ontology_generator.utils.types import safe_cast, sanitize_name
+
+ROLLUP_CLASS_NAME = "AERollup"
+
+# Group dimensions: (table column, entity type in the event fact, linking object property)
+ROLLUP_DIMENSIONS: List[Tuple[str, Optional[str], Optional[str]]] = [
+    ("line", "ProductionLine", "summarizesLine"),
+    ("equipment", "Equipment", "summarizesEquipment"),
+    ("shift", "Shift", "summarizesShift"),
+    ("productionDate", None, None),
+    ("state", "OperationalState", "summarizesState"),
+    ("reason", "OperationalReason", "summarizesReason"),
+]
+
+# (line, equipment, shift, production date, state, reason); individuals or None
+RollupKey = Tuple[Optional[Thing], Optional[Thing], Optional[Thing], Optional[date], Optional[Thing], Optional[Thing]]
+
+def _total_property_name(metric: str) -> str:
+    """Name of the summary property for a metric (downtimeMinutes -> totalDowntimeMinutes)."""
+    return "total" + metric[0].upper() + metric[1:]
+
+class AERollupAccumulator:
+    """
+    Accumulates AE metrics per rollup group during population.
+
+    Attributes:
+        metrics: Metric property names, in column order
+        integer_metrics: Metrics mapped as xsd:integer (summed and stored as int)
+        event_count: Number of events added
+    """
+    def __init__(self, property_mappings: Dict[str, Dict[str, Dict[str, Any]]],
+                 date_column: Optional[str] = AE_ROLLUP_DATE_COLUMN):
+        """
+        Initialize the accumulator from the EventRecord property mappings.
+
+        Args:
+            property_mappings: The parsed property mappings; only metrics mapped to a
+                raw data column are accumulated
+            date_column: Raw data column holding the production day
+        """
+        event_props = (property_mappings or {}).get("EventRecord", {}).get("data_properties", {})
+        self.metrics = [m for m in AE_ROLLUP_METRIC_PROPERTIES if event_props.get(m, {}).get("column")]
+        self._columns = [event_props[m]["column"] for m in self.metrics]
+        self.integer_metrics = {m for m in self.metrics if event_props[m].get("data_type") in ("xsd:integer", "xsd:int", "xsd:long")}
+        self.date_column = date_column
+        self.event_count = 0
+        self._group_ids: Dict[RollupKey, int] = {}
+        self._event_groups = array("l")
+        self._values = array("d")
+
+    def __len__(self) -> int:
+        return len(self._group_ids)
+
+    def add(self, row_individuals: Dict[str, Thing], row: Dict[str, Any]) -> None:
+        """
+        Add one event's metrics to its group.
+
+        Args:
+            row_individuals: Individuals created for the row (EventRecord, ProductionLine, Equipment, Shift, ...)
+            row: The raw data row the metrics are read from
+        """
+        production_date = safe_cast(row.get(self.date_column), date) if self.date_column else None
+        if production_date is None:
+            interval = row_individuals.get("TimeInterval")
+            start = getattr(interval, "startTime", None) if interval is not None else None
+            if isinstance(start, list):
+                start = start[0] if start else None
+            production_date = start.date() if isinstance(start, datetime) else None
+
+        key = tuple(row_individuals.get(entity) if entity else production_date for _, entity, _ in ROLLUP_DIMENSIONS)
+        group_id = self._group_ids.setdefault(key, len(self._group_ids))
+        self._event_groups.append(group_id)
+        for column in self._columns:
+            self._values.append(safe_cast(row.get(column), float, 0.0))
+        self.event_count += 1
+
+    def groups(self) -> List[Tuple[RollupKey, int, Dict[str, Any]]]:
+        """
+        Sum the accumulated metrics per group.
+
+        Returns:
+            List of (group key, event count, {metric: sum}) sorted by line, equipment,
+            shift, date, state and reason name
+        """
+        if not self._group_ids:
+            return []
+        group_ids = np.frombuffer(self._event_groups, dtype=np.dtype("l"))
+        values = np.frombuffer(self._values, dtype=np.float64).reshape(-1, len(self.metrics)) if self.metrics else None
+        n_groups = len(self._group_ids)
+        counts = np.bincount(group_ids, minlength=n_groups)
+        sums = [np.bincount(group_ids, weights=values[:, i], minlength=n_groups) for i in range(len(self.metrics))]
+
+        groups = []
+        for key, group_id in self._group_ids.items():
+            totals = {}
+            for metric, metric_sums in zip(self.metrics, sums):
+                total = metric_sums[group_id].item()
+                totals[metric] = int(round(total)) if metric in self.integer_metrics else total
+            groups.append((key, int(counts[group_id]), totals))
+        groups.sort(key=lambda group: tuple("" if v is None else (v.isoformat() if isinstance(v, date) else v.name) for v in group[0]))
+        return groups
+
+    def to_table(self) -> Dict[str, List[Any]]:
+        """
+        Return the rollups as a column table.
+
+        Returns:
+            Dict with one column per dimension (individual names, production date),
+            'eventCount' and one 'total<Metric>' column per metric
+        """
+        table: Dict[str, List[Any]] = {column: [] for column, _, _ in ROLLUP_DIMENSIONS}
+        table["eventCount"] = []
+        for metric in self.metrics:
+            table[_total_property_name(metric)] = []
+        for key, count, totals in self.groups():
+            for (column, entity, _), value in zip(ROLLUP_DIMENSIONS, key):
+                table[column].append(value.name if entity and value is not None else value)
+            table["eventCount"].append(count)
+            for metric in self.metrics:
+                table[_total_property_name(metric)].append(totals[metric])
+        return table
+
+def _ensure_rollup_schema(onto: Ontology, metrics: List[str], integer_metrics: set) -> ThingClass:
+    """Create the AERollup class and its properties in the ontology if they do not exist."""
+    with onto:
+        rollup_class = onto[ROLLUP_CLASS_NAME] or types.new_class(ROLLUP_CLASS_NAME, (Thing,))
+        for _, entity, prop_name in ROLLUP_DIMENSIONS:
+            if prop_name and onto[prop_name] is None:
+                prop = types.new_class(prop_name, (ObjectProperty, FunctionalProperty))
+                prop.domain = [rollup_class]
+                if onto[entity] is not None:
+                    prop.range = [onto[entity]]
+        data_props = [("productionDate", date), ("eventCount", int)]
+        data_props += [(_total_property_name(m), int if m in integer_metrics else float) for m in metrics]
+        for prop_name, range_type in data_props:
+            if onto[prop_name] is None:
+                prop = types.new_class(prop_name, (DataProperty, FunctionalProperty))
+                prop.domain = [rollup_class]
+                prop.range = [range_type]
+    return rollup_class
+
+def create_rollup_individuals(onto: Ontology, accumulator: AERollupAccumulator) -> int:
+    """
+    Store the rollups as AERollup summary individuals.
+
+    Each individual links to its line, equipment, shift, state and reason
+    (summarizesLine, ...) and carries productionDate, eventCount and one
+    total<Metric> value per metric. The class and properties are added to the
+    ontology on first use.
+
+    Args:
+        onto: The ontology to add the individuals to
+        accumulator: The accumulator filled during population
+
+    Returns:
+        int: Number of summary individuals created
+    """
+    groups = accumulator.groups()
+    if not groups:
+        pop_logger.info("No events were accumulated; no AE rollup individuals created.")
+        return 0
+    rollup_class = _ensure_rollup_schema(onto, accumulator.metrics, accumulator.integer_metrics)
+
+    used_names = set()
+    with onto:
+        for key, count, totals in groups:
+            parts = [v.isoformat() if isinstance(v, date) else v.name for v in key if v is not None]
+            name = sanitize_name(f"{ROLLUP_CLASS_NAME}_{'_'.join(parts)}")
+            if name in used_names:
+                name = f"{name}_{len(used_names)}"
+            used_names.add(name)
+
+            rollup = rollup_class(name, namespace=onto)
+            for (_, entity, prop_name), value in zip(ROLLUP_DIMENSIONS, key):
+                if value is None:
+                    continue
+                setattr(rollup, prop_name if entity else "productionDate", value)
+            rollup.eventCount = count
+            for metric, total in totals.items():
+                setattr(rollup, _total_property_name(metric), total)
+
+    pop_logger.info(f"Created {len(groups)} {ROLLUP_CLASS_NAME} individuals summarizing {accumulator.event_count} events.")
+    return len(groups)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+End-to-End Pipeline Benchmark
+
+This script runs main_ontology_generation on synthetic extracts of increasing
+size (written by generate_synthetic_data.py) and records wall time and peak RSS
+per phase: spec parsing, TBox, read, Pass 1, Pass 2, sequencing, analysis,
+reasoning and save. Each size runs in a fresh process so memory peaks do not
+carry over between runs. Reasoning is skipped by default, so the benchmark runs
+on any Linux box without a JVM; `--reasoner-mode rl` times the in-process OWL RL
+materializer instead.
+
+Results are written as JSON. With `--baseline` they are compared phase by phase
+against a stored result file, and the script exits with status 1 when a phase
+got slower (or used more memory) than the threshold allows.
+
+Usage:
+    python benchmark_pipeline.py --sizes 1000 10000 100000 --output results.json
+    python benchmark_pipeline.py --baseline baseline.json --threshold 0.2 --output results.json
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+# Add src directory to path to import the ontology_generator package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from ontology_generator.main import main_ontology_generation
+from ontology_generator.utils.phases import PhaseTimer
+
+from generate_synthetic_data import DEFAULT_TEMPLATE_DATA_PATH, write_synthetic_data
+
+DEFAULT_SPEC_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'Ontology_specifications', 'OPERA_ISA95_OWL_ONT_V27.csv'
+))
+
+def run_pipeline(spec_path, data_path, output_path, save_format, reasoner_mode, log_level, population_strategy="row"):
+    """Run one generation in the current process and return its phase results."""
+    logging.basicConfig(level=log_level)
+    logging.getLogger().setLevel(log_level)
+    with PhaseTimer() as timer:
+        success = main_ontology_generation(spec_path, data_path, output_path, save_format=save_format,
+                                           use_reasoner=reasoner_mode is not None,
+                                           reasoner_mode=reasoner_mode or "hermit",
+                                           population_strategy=population_strategy)
+    result = timer.to_dict()
+    result["success"] = bool(success)
+    return result
+
+def synthetic_data(workdir, rows, template_path, seed):
+    """Path of the synthetic extract for a size, generated on first use."""
+    path = os.path.join(workdir, f"synthetic_{rows}_seed{seed}.csv")
+    if not os.path.exists(path):
+        write_synthetic_data(path, rows, template_path, seed=seed)
+    return path
+
+def compare_results(current, baseline, threshold, min_seconds, min_mb):
+    """
+    Compare phase times and peaks against a baseline.
+
+    A phase regresses when it is more than `threshold` (a fraction) slower or
+    larger than in the baseline and the difference exceeds min_seconds / min_mb,
+    so tiny phases do not flag timer noise.
+
+    Returns:
+        List of (size, phase, metric, baseline value, current value, regressed) tuples
+    """
+    rows = []
+    for size, run in current["runs"].items():
+        base_run = baseline.get("runs", {}).get(size)
+        if not base_run:
+            continue
+        phases = dict(run["phases"], total={"seconds": run["total_seconds"], "peak_rss_mb": run["peak_rss_mb"]})
+        base_phases = dict(base_run["phases"], total={"seconds": base_run["total_seconds"], "peak_rss_mb": base_run["peak_rss_mb"]})
+        for name, entry in phases.items():
+            base_entry = base_phases.get(name)
+            if not base_entry:
+                continue
+            for metric, floor in (("seconds", min_seconds), ("peak_rss_mb", min_mb)):
+                value, base_value = entry.get(metric), base_entry.get(metric)
+                if value is None or base_value is None:
+                    continue
+                regressed = value > base_value * (1 + threshold) and value - base_value > floor
+                rows.append((size, name, metric, base_value, value, regressed))
+    return rows
+
+def main():
+    """Main function to run the pipeline benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark main_ontology_generation per phase on synthetic extracts of increasing size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Data row counts to benchmark.")
+    parser.add_argument("--spec", default=DEFAULT_SPEC_PATH, help="Path to the ontology specification CSV file.")
+    parser.add_argument("--template", default=DEFAULT_TEMPLATE_DATA_PATH, help="Template extract for the synthetic data.")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed (default: 0).")
+    parser.add_argument("--workdir", default=None, help="Directory for synthetic data and outputs (default: a temporary directory). Data files are reused.")
+    parser.add_argument("--format", default="rdfxml", choices=["rdfxml", "ntriples"], help="Output format to save (default: rdfxml).")
+    parser.add_argument("--reasoner-mode", default=None, choices=["hermit", "rl", "partitioned"], help="Run reasoning with this mode (default: skip reasoning).")
+    parser.add_argument("--population-strategy", default="row", choices=["row", "dimension"], help="Pass 1 population strategy (default: row).")
+    parser.add_argument("--output", "-o", default="benchmark_results.json", help="Result JSON file (default: benchmark_results.json).")
+    parser.add_argument("--baseline", default=None, help="Baseline result JSON to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown/growth per phase as a fraction (default: 0.2).")
+    parser.add_argument("--min-seconds", type=float, default=0.5, help="Ignore time differences below this many seconds (default: 0.5).")
+    parser.add_argument("--min-mb", type=float, default=50.0, help="Ignore peak RSS differences below this many MB (default: 50).")
+    parser.add_argument("--log-level", default="WARNING", help="Log level of the generation runs (default: WARNING).")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    workdir = args.workdir or tempfile.mkdtemp(prefix="ontology_benchmark_")
+    os.makedirs(workdir, exist_ok=True)
+
+    results = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "format": args.format,
+        "reasoner_mode": args.reasoner_mode,
+        "population_strategy": args.population_strategy,
+        "runs": {},
+    }
+    spawn = multiprocessing.get_context("spawn")
+    for rows in args.sizes:
+        data_path = synthetic_data(workdir, rows, args.template, args.seed)
+        output_path = os.path.join(workdir, f"output_{rows}.{'owl' if args.format == 'rdfxml' else 'nt'}")
+        logging.info(f"Running the pipeline on {rows} rows...")
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+            run = pool.submit(run_pipeline, args.spec, data_path, output_path, args.format,
+                              args.reasoner_mode, args.log_level, args.population_strategy).result()
+        run["rows"] = rows
+        results["runs"][str(rows)] = run
+        logging.info(f"{rows} rows: {'ok' if run['success'] else 'FAILED'} in {time.perf_counter() - started:.1f} s")
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"{'rows':>8} {'phase':<12} {'seconds':>9} {'peak MB':>9}")
+    for size, run in results["runs"].items():
+        for name, entry in run["phases"].items():
+            peak = f"{entry['peak_rss_mb']:.0f}" if entry["peak_rss_mb"] is not None else "n/a"
+            print(f"{size:>8} {name:<12} {entry['seconds']:>9.2f} {peak:>9}")
+        print(f"{size:>8} {'total':<12} {run['total_seconds']:>9.2f} {run['peak_rss_mb'] or 0:>9.0f}")
+    print(f"Results written to {args.output}")
+
+    failed = [size for size, run in results["runs"].items() if not run["success"]]
+    if failed:
+        print(f"Generation failed for sizes: {', '.join(failed)}")
+    if not args.baseline:
+        sys.exit(1 if failed else 0)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    comparison = compare_results(results, baseline, args.threshold, args.min_seconds, args.min_mb)
+    regressions = [row for row in comparison if row[5]]
+    print(f"\nComparison with {args.baseline} (threshold {args.threshold:.0%}):")
+    print(f"{'rows':>8} {'phase':<12} {'metric':<12} {'baseline':>10} {'current':>10} {'change':>8}")
+    for size, name, metric, base_value, value, regressed in comparison:
+        change = f"{(value - base_value) / base_value:+.0%}" if base_value else "n/a"
+        print(f"{size:>8} {name:<12} {metric:<12} {base_value:>10.2f} {value:>10.2f} {change:>8}{'  REGRESSION' if regressed else ''}")
+    print(f"{len(regressions)} regression(s).")
+    sys.exit(1 if regressions or failed else 0)
+
+if __name__ == "__main__":
+    main()
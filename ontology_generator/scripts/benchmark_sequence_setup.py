@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Equipment Sequence Setup Benchmark
+
+This script measures setup_equipment_instance_relationships on synthetic plants
+with thousands of production lines. Equipment is created through the regular
+Pass 1 processors so the line index recorded on the PopulationContext is the
+same one a real run produces. Each configuration is timed twice: once with the
+population index and once with the legacy ontology search, optionally with
+extra event individuals in the ontology to show how the search path scales
+with total ontology size rather than equipment count.
+
+Usage:
+    python benchmark_sequence_setup.py --lines 1000 2000 5000 --events-per-line 20
+"""
+
+import argparse
+import contextlib
+import io
+import logging
+import os
+import sys
+import time
+
+# Add src directory to path to import the ontology_generator package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from owlready2 import World
+
+from ontology_generator.definition import parse_specification, parse_property_mappings, define_ontology_structure, read_data
+from ontology_generator.population.core import PopulationContext
+from ontology_generator.population.asset import process_asset_hierarchy
+from ontology_generator.population.equipment import process_equipment_and_class
+from ontology_generator.population.sequence import setup_equipment_instance_relationships
+from ontology_generator.config import DEFAULT_EQUIPMENT_SEQUENCE
+
+DEFAULT_SPEC_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'Ontology_specifications', 'OPERA_ISA95_OWL_ONT_V27.csv'
+))
+DEFAULT_TEMPLATE_DATA_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'mx_toothpaste_finishing_sample_100lines.csv'
+))
+
+def build_population(specification, property_mappings, template_row, num_lines, equipment_per_class, events_per_line):
+    """
+    Build a synthetic ontology with Pass 1 processors.
+
+    Returns:
+        Tuple of (onto, defined_classes, defined_properties, property_is_functional, context)
+    """
+    world = World()
+    onto = world.get_ontology("http://example.com/benchmark/sequence.owl#")
+    defined_classes, defined_properties, property_is_functional = define_ontology_structure(onto, specification)
+    context = PopulationContext(onto, defined_classes, defined_properties, property_is_functional)
+    registry = {}
+    cls_EventRecord = defined_classes.get("EventRecord")
+
+    with onto:
+        for line_num in range(num_lines):
+            line_name = f"BENCH{line_num:05d}"
+            base_row = dict(template_row)
+            base_row.update({
+                'PLANT': f"P{line_num // 500:03d}",
+                'GH_FOCUSFACTORY': f"FF{line_num // 100:03d}",
+                'GH_AREA': f"AREA{line_num // 50:03d}",
+                'PHYSICAL_AREA': f"AREA{line_num // 50:03d}",
+                'LINE_NAME': line_name,
+            })
+            _, _, _, line_ind = process_asset_hierarchy(base_row, context, property_mappings, registry, pass_num=1)
+
+            for class_name in DEFAULT_EQUIPMENT_SEQUENCE:
+                for unit in range(equipment_per_class):
+                    row = dict(base_row)
+                    row.update({
+                        'EQUIPMENT_TYPE': 'Equipment',
+                        'EQUIPMENT_NAME': f"{line_name}_{class_name}{unit + 1}",
+                        'EQUIPMENT_ID': f"{line_num}{len(registry)}",
+                        'EQUIPMENT_MODEL': class_name,
+                    })
+                    process_equipment_and_class(row, context, property_mappings, registry, line_ind, pass_num=1)
+
+            # Unrelated individuals that only grow the ontology
+            if cls_EventRecord:
+                for event_num in range(events_per_line):
+                    cls_EventRecord(f"Event_{line_name}_{event_num}")
+
+    return onto, defined_classes, defined_properties, property_is_functional, context
+
+def time_sequence_setup(specification, property_mappings, template_row, num_lines, equipment_per_class, events_per_line, use_index):
+    """Build a fresh population and time one sequence setup call on it."""
+    onto, classes, props, is_functional, context = build_population(
+        specification, property_mappings, template_row, num_lines, equipment_per_class, events_per_line
+    )
+    if not use_index:
+        context.equipment_line_index.clear()
+
+    # The setup prints a summary report; keep the benchmark output readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        relationships, _ = setup_equipment_instance_relationships(
+            onto, classes, props, is_functional, {}, population_context=context
+        )
+        elapsed = time.perf_counter() - start
+    return elapsed, relationships
+
+def main():
+    """Main function to run the sequence setup benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark equipment sequence setup with and without the population line index.")
+    parser.add_argument("--spec", default=DEFAULT_SPEC_PATH, help="Path to the ontology specification CSV file.")
+    parser.add_argument("--template-data", default=DEFAULT_TEMPLATE_DATA_PATH, help="Data CSV whose first row supplies the non-key columns of every synthetic row.")
+    parser.add_argument("--lines", type=int, nargs="+", default=[1000, 2000, 4000], help="Numbers of production lines to benchmark.")
+    parser.add_argument("--equipment-per-class", type=int, default=1, help="Parallel units per equipment class on each line.")
+    parser.add_argument("--events-per-line", type=int, default=0, help="Unrelated event individuals per line, to grow the ontology.")
+    args = parser.parse_args()
+
+    # Population and sequencing are very chatty at INFO; only keep errors
+    logging.basicConfig(level=logging.ERROR)
+    logging.getLogger().setLevel(logging.ERROR)
+
+    specification = parse_specification(args.spec)
+    if not specification:
+        print(f"Error: could not parse specification '{args.spec}'.")
+        sys.exit(1)
+    property_mappings = parse_property_mappings(specification)
+    template_rows = read_data(args.template_data)
+    if not template_rows:
+        print(f"Error: could not read template data '{args.template_data}'.")
+        sys.exit(1)
+    template_row = template_rows[0]
+
+    print(f"{'lines':>8} {'equipment':>10} {'events':>8} {'index (s)':>10} {'search (s)':>11} {'speedup':>8} {'links':>8}")
+    for num_lines in args.lines:
+        indexed_time, indexed_links = time_sequence_setup(
+            specification, property_mappings, template_row, num_lines, args.equipment_per_class, args.events_per_line, use_index=True
+        )
+        search_time, search_links = time_sequence_setup(
+            specification, property_mappings, template_row, num_lines, args.equipment_per_class, args.events_per_line, use_index=False
+        )
+        if indexed_links != search_links:
+            print(f"Warning: relationship counts differ for {num_lines} lines ({indexed_links} vs {search_links})")
+        equipment_count = num_lines * len(DEFAULT_EQUIPMENT_SEQUENCE) * args.equipment_per_class
+        speedup = search_time / indexed_time if indexed_time else float("inf")
+        print(f"{num_lines:>8} {equipment_count:>10} {num_lines * args.events_per_line:>8} "
+              f"{indexed_time:>10.3f} {search_time:>11.3f} {speedup:>7.2f}x {indexed_links:>8}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+SPARQL Query Benchmark
+
+This script times the query templates generated by ontology_analyzer.py, plus a
+few operational queries (downtime by reason, events per shift, equipment per
+line), against a generated ontology. Each query is run cold (parsed and
+translated to SQL), then warm from the prepared-query cache, and through the
+rdflib bridge when rdflib is installed. Results are streamed to /dev/null so
+only query cost is measured.
+
+Usage:
+    python benchmark_sparql.py output.owl --repeat 20
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+# Add src directory to path to import the ontology_generator package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from owlready2 import World
+
+from ontology_generator.export.snapshot import load_ontology
+from ontology_generator.query.sparql import PreparedQueryCache, run_query
+
+from ontology_analyzer import generate_sparql_query_templates
+
+def operational_queries(onto):
+    """Queries analysts run against generated ontologies, as (name, text) pairs."""
+    prefix = f"PREFIX onto: <{onto.base_iri}>\nPREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>\n"
+    return [
+        ("Downtime by reason", prefix + """
+SELECT ?reason (SUM(?downtime) AS ?minutes) (COUNT(?event) AS ?events)
+WHERE {
+    ?event rdf:type onto:EventRecord ; onto:eventHasReason ?r ; onto:downtimeMinutes ?downtime .
+    ?r onto:reasonDescription ?reason .
+}
+GROUP BY ?reason ORDER BY DESC(?minutes)
+"""),
+        ("Events per shift", prefix + """
+SELECT ?shift (COUNT(?event) AS ?events)
+WHERE {
+    ?event rdf:type onto:EventRecord ; onto:duringShift ?s .
+    ?s onto:shiftId ?shift .
+}
+GROUP BY ?shift
+"""),
+        ("Equipment per line", prefix + """
+SELECT ?line ?equipment
+WHERE {
+    ?equipment rdf:type onto:Equipment ; onto:isPartOfProductionLine ?line .
+}
+ORDER BY ?line
+"""),
+        ("Event time ranges", prefix + """
+SELECT ?event ?start ?end
+WHERE {
+    ?event rdf:type onto:EventRecord ; onto:occursDuring ?interval .
+    ?interval onto:startTime ?start .
+    OPTIONAL { ?interval onto:endTime ?end }
+}
+"""),
+    ]
+
+def time_rdflib(world, query, repeat):
+    """Median seconds per run through the rdflib bridge, or None without rdflib."""
+    try:
+        graph = world.as_rdflib_graph()
+    except ImportError:
+        return None
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in graph.query(query):
+            pass
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+def main():
+    """Main function to run the SPARQL benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark native SPARQL queries (cold, cached) against the rdflib bridge.")
+    parser.add_argument("ontology", help="OWL file or quadstore snapshot to query.")
+    parser.add_argument("--repeat", type=int, default=10, help="Warm runs per query (default: 10).")
+    parser.add_argument("--rdflib-repeat", type=int, default=1, help="rdflib bridge runs per query (default: 1).")
+    parser.add_argument("--no-rdflib", action="store_true", help="Skip the rdflib bridge comparison.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    logging.getLogger().setLevel(logging.ERROR)
+
+    world, onto = load_ontology(args.ontology)
+    queries = generate_sparql_query_templates(onto) + operational_queries(onto)
+
+    print(f"{'query':<32} {'rows':>7} {'cold ms':>9} {'warm ms':>9} {'rdflib ms':>10}")
+    with open(os.devnull, "w") as sink:
+        for name, text in queries:
+            World._prepare_sparql.cache_clear() # Cold runs must parse and translate the query again
+            cache = PreparedQueryCache()
+            try:
+                cold = run_query(world, text, sink, cache=cache, name=name)
+            except Exception as e:
+                print(f"{name[:32]:<32} failed: {e}")
+                continue
+            warm = [run_query(world, text, sink, cache=cache, name=name)['execute_ms'] for _ in range(args.repeat)]
+            rdflib_seconds = None if args.no_rdflib else time_rdflib(world, text, args.rdflib_repeat)
+            rdflib_text = f"{rdflib_seconds * 1000:.1f}" if rdflib_seconds is not None else "n/a"
+            print(f"{name[:32]:<32} {cold['rows']:>7} {cold['prepare_ms'] + cold['execute_ms']:>9.2f} "
+                  f"{statistics.median(warm):>9.2f} {rdflib_text:>10}")
+
+if __name__ == "__main__":
+    main()
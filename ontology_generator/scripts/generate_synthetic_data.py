@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Synthetic OPERA Data Generator
+
+This script writes synthetic OPERA extracts of any size for scale testing. The
+column layout and value distributions are learned from a template extract (by
+default mx_toothpaste_finishing_sample_100lines.csv): state/reason/category
+combinations, event durations per state, which time buckets a state books its
+duration into, materials, order rates, line models and shift patterns.
+
+The generated data is coherent rather than resampled row by row:
+- every plant has lines, and every line has a Filler plus an ordered subset of
+  the other DEFAULT_EQUIPMENT_SEQUENCE classes (named <line>_<Class>);
+- each line and equipment keeps its own clock, so events of one resource follow
+  each other without gaps, and their shift, crew and production day follow the
+  template's shift pattern;
+- a line runs one production order (material, rate) at a time and starts a new
+  one after each changeover event;
+- running periods are followed by production count records whose good quantity
+  is effective runtime times the order rate.
+
+Rows are streamed to disk one at a time, so memory stays constant whatever the
+size; a .gz output path is gzip-compressed.
+
+Usage:
+    python generate_synthetic_data.py synthetic_100k.csv --rows 100000 --seed 7
+    python generate_synthetic_data.py synthetic_10m.csv.gz --rows 10000000 --plants 40
+"""
+
+import argparse
+import bisect
+import csv
+import gzip
+import logging
+import math
+import os
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Add src directory to path to import the ontology_generator package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from ontology_generator.config import DEFAULT_EQUIPMENT_SEQUENCE
+
+DEFAULT_TEMPLATE_DATA_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'mx_toothpaste_finishing_sample_100lines.csv'
+))
+
+# Columns that receive an event's duration (in minutes) depending on its state and reason
+TIME_BUCKET_COLUMNS = [
+    "BUSINESS_EXTERNAL_TIME", "PLANT_AVAILABLE_TIME", "PLANT_DECISION_TIME", "PRODUCTION_AVAILABLE_TIME",
+    "DOWNTIME", "RUN_TIME", "NOT_ENTERED", "WAITING_TIME", "PLANT_EXPERIMENTATION", "ALL_MAINTENANCE",
+    "AUTONOMOUS_MAINTENANCE", "PLANNED_MAINTENANCE", "CHANGEOVER_DURATION", "CLEANING_AND_SANITIZATION",
+    "LUNCH_AND_BREAK", "LUNCH", "BREAK", "MEETING_AND_TRAINING", "NO_DEMAND",
+]
+# Columns describing an event's classification, sampled together from one template row
+EVENT_CLASS_COLUMNS = [
+    "UTIL_STATE_DESCRIPTION", "UTIL_REASON_DESCRIPTION", "UTIL_ALT_LANGUAGE_REASON",
+    "AE_MODEL_CATEGORY", "DOWNTIME_DRIVER", "CO_TYPE", "CO_ORIGINAL_TYPE",
+]
+MATERIAL_COLUMNS = [
+    "MATERIAL_ID", "SHORT_MATERIAL_ID", "SIZE_TYPE", "MATERIAL_UOM", "UOM_ST", "UOM_ST_SAP", "TP_UOM", "PRIMARY_CONV_FACTOR",
+]
+LINE_COLUMNS = ["COMPLEXITY", "MODEL", "AVG_THROUGHPUT_MTD", "AVG_THROUGHPUT_YTD"]
+
+RUNNING_STATE = "RUNNING"
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def _minutes(value: float) -> str:
+    return str(round(value, 6))
+
+def _float(value: str, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+def _parse_time(value: str) -> Tuple[Optional[datetime], str]:
+    """Parse '2025-02-05 22:40:21.000 -0500' into (naive datetime, '-0500')."""
+    parts = value.strip().split(" ")
+    if len(parts) < 2:
+        return None, ""
+    try:
+        moment = datetime.strptime(f"{parts[0]} {parts[1].split('.')[0]}", TIME_FORMAT)
+    except ValueError:
+        return None, ""
+    return moment, parts[2] if len(parts) > 2 else ""
+
+class TemplateProfile:
+    """
+    Schema and value distributions learned from a template extract.
+
+    Attributes:
+        header: Column names in template order
+        constants: Columns with a single value in the template
+        event_classes: Classification tuples (EVENT_CLASS_COLUMNS) per state
+        count_classes: Classification tuples of production count records
+        state_weights: Event count per state
+        durations: Observed non-zero durations (minutes) per state
+        time_buckets: Columns booked with the duration per (state, reason), with a per-state fallback
+        changeover_states: States whose events are changeovers
+        materials: Distinct material column tuples
+        order_rates: Observed production order rates
+        line_profiles: Distinct line attribute tuples (LINE_COLUMNS)
+        shifts: (name, start hour, start minute, duration minutes) sorted by start
+        crews: Crew ids
+        utc_offset: Offset suffix of the template's local times
+        line_event_share: Share of events booked on the line itself
+        missing_end_share: Share of events without an end time
+    """
+    def __init__(self, template_path: str):
+        with open(template_path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            self.header = list(reader.fieldnames or [])
+            rows = list(reader)
+        if not rows:
+            raise ValueError(f"Template {template_path} has no data rows.")
+
+        values: Dict[str, set] = {column: set() for column in self.header}
+        for row in rows:
+            for column in self.header:
+                values[column].add(row[column])
+        self.constants = {column: next(iter(v)) for column, v in values.items() if len(v) == 1}
+
+        self.event_classes: Dict[str, List[Tuple[str, ...]]] = {}
+        self.count_classes: List[Tuple[str, ...]] = []
+        self.durations: Dict[str, List[float]] = {}
+        bucket_counts: Dict[Tuple[str, str], Counter] = {}
+        state_bucket_counts: Dict[str, Counter] = {}
+        self.state_weights: Counter = Counter()
+        self.changeover_states = set()
+        for row in rows:
+            event_class = tuple(row.get(column, "") for column in EVENT_CLASS_COLUMNS)
+            state, reason = event_class[0], event_class[1]
+            total = _float(row.get("TOTAL_TIME"))
+            if total == 0 and _float(row.get("GOOD_PRODUCTION_QTY")) > 0:
+                self.count_classes.append(event_class)
+                continue
+            self.state_weights[state] += 1
+            self.event_classes.setdefault(state, []).append(event_class)
+            if _float(row.get("CHANGEOVER_COUNT")) > 0:
+                self.changeover_states.add(state)
+            if total > 0:
+                self.durations.setdefault(state, []).append(total)
+                booked = [c for c in TIME_BUCKET_COLUMNS if abs(_float(row.get(c)) - total) < 1e-3]
+                bucket_counts.setdefault((state, reason), Counter()).update(booked)
+                state_bucket_counts.setdefault(state, Counter()).update(booked)
+        # A bucket belongs to a state/reason when most of its template rows book into it
+        self.time_buckets: Dict[Any, List[str]] = {}
+        for key, counts in list(bucket_counts.items()) + list(state_bucket_counts.items()):
+            n = max(counts.values()) if counts else 0
+            self.time_buckets[key] = [c for c in TIME_BUCKET_COLUMNS if counts[c] * 2 >= n and counts[c] > 0]
+        all_durations = [d for ds in self.durations.values() for d in ds] or [30.0]
+        for state in self.state_weights:
+            self.durations.setdefault(state, all_durations)
+
+        self.materials = sorted({tuple(row.get(c, "") for c in MATERIAL_COLUMNS) for row in rows})
+        self.order_rates = [r for r in (_float(row.get("PRODUCTION_ORDER_RATE")) for row in rows) if r > 0] or [60.0]
+        self.line_profiles = sorted({tuple(row.get(c, "") for c in LINE_COLUMNS) for row in rows})
+        self.crews = sorted(values.get("CREW_ID", set()) - {""}) or ["A", "B", "C", "D"]
+
+        shifts = {}
+        self.utc_offset = ""
+        for row in rows:
+            start, offset = _parse_time(row.get("SHIFT_START_DATE_LOC", ""))
+            self.utc_offset = self.utc_offset or offset
+            if start is not None and row.get("SHIFT_NAME"):
+                shifts[row["SHIFT_NAME"]] = (start.hour, start.minute, _float(row.get("SHIFT_DURATION_MIN"), 480.0))
+        self.shifts = sorted(((name, h, m, d) for name, (h, m, d) in shifts.items()), key=lambda s: (s[1], s[2])) or [("Shift1", 6, 0, 480.0)]
+
+        self.line_event_share = sum(row.get("EQUIPMENT_TYPE") == "Line" for row in rows) / len(rows)
+        self.missing_end_share = sum(not row.get("JOB_END_TIME_LOC") for row in rows) / len(rows)
+        self.template_order_id = int(min(_float(row.get("PRODUCTION_ORDER_ID"), 1e8) for row in rows))
+
+class _Resource:
+    """A line or equipment with its own event clock and last state."""
+    __slots__ = ("line", "name", "is_line", "values", "clock", "state", "run_minutes")
+
+    def __init__(self, line: "_Line", name: str, is_line: bool, values: List[Tuple[int, str]], clock: datetime):
+        self.line = line
+        self.name = name
+        self.is_line = is_line
+        self.values = values
+        self.clock = clock
+        self.state = RUNNING_STATE
+        self.run_minutes = 0.0
+
+class _Line:
+    """A production line with its plant, attributes, equipment and current production order."""
+    __slots__ = ("plant", "name", "attributes", "resources", "order_rate", "values")
+
+    def __init__(self, plant: Dict[str, str], name: str, attributes: Tuple[str, ...]):
+        self.plant = plant
+        self.name = name
+        self.attributes = attributes
+        self.resources: List[_Resource] = []
+        self.order_rate = 0.0
+        self.values: List[Tuple[int, str]] = []
+
+class SyntheticDataGenerator:
+    """
+    Generates coherent synthetic OPERA rows from a TemplateProfile.
+
+    Rows are lists in header order, copied from a base row of template constants;
+    the values that only change per line/order, resource, shift or event
+    classification are cached as (column position, value) pairs, so each event
+    only formats its own times and durations.
+
+    Attributes:
+        profile: The learned template profile
+        lines: Generated production lines
+        header: Output column names (the template's)
+    """
+    def __init__(self, profile: TemplateProfile, num_plants: int = 1, lines_per_plant: int = 12,
+                 seed: int = 0, start: Optional[datetime] = None):
+        """
+        Build the plant/line/equipment layout.
+
+        Args:
+            profile: Template profile to sample from
+            num_plants: Number of plants
+            lines_per_plant: Production lines per plant
+            seed: Random seed (the same seed and sizes produce the same file)
+            start: Time of the first events (default: 2025-01-01 06:00)
+        """
+        self.profile = profile
+        self.header = profile.header
+        self.rng = random.Random(seed)
+        self.start = start or datetime(2025, 1, 1, 6, 0)
+        self._next_order_id = profile.template_order_id
+        self._changeover_states = profile.changeover_states
+        self._states = list(profile.state_weights)
+        self._state_cumulative = []
+        total = 0
+        for state in self._states:
+            total += profile.state_weights[state]
+            self._state_cumulative.append(total)
+
+        # Columns missing from the template write to one extra slot, dropped on output
+        self._index = {column: i for i, column in enumerate(self.header)}
+        self._sink = len(self.header)
+        self._base = [profile.constants.get(column, "") for column in self.header] + [""]
+        for column, zero in [(c, "0.0") for c in TIME_BUCKET_COLUMNS + ["EFFECTIVE_RUNTIME"]] + \
+                            [(c, "0") for c in ("GOOD_PRODUCTION_QTY", "REJECT_PRODUCTION_QTY", "CHANGEOVER_COUNT")]:
+            self._base[self._pos(column)] = zero
+        self._time_suffix = f".000 {profile.utc_offset}".rstrip()
+        self._bucket_positions = {key: [self._pos(column) for column in columns]
+                                  for key, columns in profile.time_buckets.items()}
+        self._class_values: Dict[Tuple[str, ...], List[Tuple[int, str]]] = {}
+        self._shift_values: Dict[datetime, List[Tuple[int, str]]] = {}
+
+        base_plant = profile.constants.get("PLANT", "PL01")
+        self.lines: List[_Line] = []
+        equipment_number = 1000
+        sequence = sorted(DEFAULT_EQUIPMENT_SEQUENCE.items(), key=lambda item: item[1])
+        for p in range(num_plants):
+            plant_id = base_plant if p == 0 else f"{base_plant[:2]}{p:03d}"
+            plant = {"PLANT": plant_id}
+            if p and "PLANT_DESCRIPTION" in profile.constants:
+                plant["PLANT_DESCRIPTION"] = f"{profile.constants['PLANT_DESCRIPTION']} {p}"
+            for l in range(lines_per_plant):
+                line = _Line(plant, f"{plant_id}L{l + 1:03d}", self.rng.choice(profile.line_profiles))
+                classes = [name for name, _ in sequence if name == "Filler" or self.rng.random() < 0.7]
+                names = [(line.name, True)] + [(f"{line.name}_{cls}", False) for cls in classes]
+                for name, is_line in names:
+                    equipment_number += 1
+                    clock = self.start + timedelta(seconds=self.rng.randrange(3600))
+                    values = self._values({"EQUIPMENT_NAME": name, "EQUIPMENT_ID": f"{equipment_number}.0",
+                                           "EQUIPMENT_TYPE": "Line" if is_line else "Equipment"}.items())
+                    line.resources.append(_Resource(line, name, is_line, values, clock))
+                self._new_order(line)
+                self.lines.append(line)
+
+    def _pos(self, column: str) -> int:
+        return self._index.get(column, self._sink)
+
+    def _values(self, pairs) -> List[Tuple[int, str]]:
+        """(column, value) pairs as (position, value) pairs."""
+        return [(self._pos(column), value) for column, value in pairs]
+
+    def _new_order(self, line: _Line) -> None:
+        self._next_order_id += 1
+        order = f"{self._next_order_id}.0"
+        material = self.rng.choice(self.profile.materials)
+        line.order_rate = self.rng.choice(self.profile.order_rates)
+        line.values = self._values(list(line.plant.items()) + list(zip(MATERIAL_COLUMNS, material)) +
+                                   list(zip(LINE_COLUMNS, line.attributes)) +
+                                   [("LINE_NAME", line.name), ("PRODUCTION_ORDER_ID", order),
+                                    ("PRODUCTION_ORDER_DESC", order), ("PRODUCTION_ORDER_RATE", str(line.order_rate))])
+
+    def _next_state(self, resource: _Resource) -> str:
+        if resource.state != RUNNING_STATE and RUNNING_STATE in self.profile.state_weights and self.rng.random() < 0.5:
+            return RUNNING_STATE
+        pick = self.rng.random() * self._state_cumulative[-1]
+        return self._states[bisect.bisect_right(self._state_cumulative, pick)]
+
+    def _shift(self, moment: datetime) -> Tuple[str, datetime, float, int]:
+        """Return (name, start, duration minutes, index) of the shift containing a moment."""
+        shifts = self.profile.shifts
+        for day_offset in (0, -1):
+            day = moment.date() + timedelta(days=day_offset)
+            for index, (name, hour, minute, duration) in reversed(list(enumerate(shifts))):
+                start = datetime(day.year, day.month, day.day, hour, minute)
+                if start <= moment < start + timedelta(minutes=duration):
+                    return name, start, duration, index
+        name, hour, minute, duration = shifts[0]
+        day = moment.date()
+        return name, datetime(day.year, day.month, day.day, hour, minute), duration, 0
+
+    def _format_time(self, moment: datetime) -> str:
+        return moment.isoformat(" ", "seconds") + self._time_suffix
+
+    def _shift_columns(self, moment: datetime) -> List[Tuple[int, str]]:
+        """Shift, crew and production day values for an event starting at a moment."""
+        shift_name, shift_start, shift_minutes, shift_index = self._shift(moment)
+        values = self._shift_values.get(shift_start)
+        if values is None:
+            production_day = shift_start.date()
+            values = self._shift_values[shift_start] = self._values([
+                ("SHIFT_NAME", shift_name),
+                ("SHIFT_START_DATE_LOC", self._format_time(shift_start)),
+                ("SHIFT_END_DATE_LOC", self._format_time(shift_start + timedelta(minutes=shift_minutes, seconds=-1))),
+                ("SHIFT_DURATION_MIN", str(shift_minutes)),
+                ("CREW_ID", self.profile.crews[(production_day.toordinal() + shift_index) % len(self.profile.crews)]),
+                ("PRODUCTIONDATE_DAY_LOC", production_day.isoformat()),
+                ("PRODUCTIONDATE_MONTH_LOC", production_day.replace(day=1).isoformat()),
+                ("PRODUCTIONDATE_QUARTER_LOC", production_day.replace(month=(production_day.month - 1) // 3 * 3 + 1, day=1).isoformat()),
+                ("PRODUCTIONDATE_YEAR_LOC", production_day.replace(month=1, day=1).isoformat()),
+                ("DAYS_MTD", str(production_day.day)),
+                ("DAYS_YTD", str(production_day.timetuple().tm_yday)),
+            ])
+        return values
+
+    def _row(self, resource: _Resource, event_class: Tuple[str, ...], start: datetime, minutes: float,
+             has_end: bool) -> List[str]:
+        row = self._base.copy()
+        class_values = self._class_values.get(event_class)
+        if class_values is None:
+            class_values = self._class_values[event_class] = self._values(zip(EVENT_CLASS_COLUMNS, event_class))
+        for values in (resource.line.values, resource.values, class_values, self._shift_columns(start)):
+            for position, value in values:
+                row[position] = value
+        pos = self._pos
+        row[pos("JOB_START_TIME_LOC")] = self._format_time(start)
+        if has_end:
+            row[pos("JOB_END_TIME_LOC")] = self._format_time(start + timedelta(minutes=minutes))
+        else:
+            row[pos("JOB_END_TIME_LOC")] = ""
+        row[pos("TOTAL_TIME")] = _minutes(minutes)
+        row[pos("TOTAL_TIME_SECONDS")] = str(int(round(minutes * 60)))
+        return row
+
+    def _event_rows(self, resource: _Resource) -> List[List[str]]:
+        """Advance a resource by one event (plus a count record after running time)."""
+        profile = self.profile
+        rng = self.rng
+        pos = self._pos
+        state = self._next_state(resource)
+        event_class = rng.choice(profile.event_classes[state])
+        minutes = rng.choice(profile.durations[state]) * rng.uniform(0.5, 1.5)
+        start = resource.clock
+        row = self._row(resource, event_class, start, minutes, rng.random() >= profile.missing_end_share)
+        booked = self._bucket_positions.get((state, event_class[1])) or self._bucket_positions.get(state, [])
+        if booked:
+            duration = _minutes(minutes)
+            for position in booked:
+                row[position] = duration
+        rows = [row]
+
+        resource.clock = start + timedelta(minutes=minutes)
+        if state in self._changeover_states:
+            row[pos("CHANGEOVER_COUNT")] = "1"
+            if resource.is_line:
+                self._new_order(resource.line)
+        if state == RUNNING_STATE:
+            resource.run_minutes += minutes
+        elif resource.run_minutes and profile.count_classes:
+            # Production count record for the running time since the last one
+            effective = resource.run_minutes * rng.uniform(0.6, 0.98)
+            count = self._row(resource, rng.choice(profile.count_classes), start, 0.0, True)
+            count[pos("EFFECTIVE_RUNTIME")] = _minutes(effective)
+            count[pos("GOOD_PRODUCTION_QTY")] = str(int(round(effective * resource.line.order_rate)))
+            if rng.random() < 0.1:
+                count[pos("REJECT_PRODUCTION_QTY")] = str(rng.randint(1, 200))
+            rows.append(count)
+            resource.run_minutes = 0.0
+        resource.state = state
+        return rows
+
+    def rows(self, count: int) -> Iterator[List[str]]:
+        """
+        Yield exactly count rows as lists of values in header order.
+
+        Args:
+            count: Number of rows to generate
+        """
+        rng = self.rng
+        emitted = 0
+        while emitted < count:
+            line = self.lines[rng.randrange(len(self.lines))]
+            if rng.random() < self.profile.line_event_share or len(line.resources) == 1:
+                resource = line.resources[0]
+            else:
+                resource = line.resources[rng.randrange(1, len(line.resources))]
+            for row in self._event_rows(resource):
+                if emitted >= count:
+                    break
+                row.pop() # The slot of columns missing from the template
+                yield row
+                emitted += 1
+
+def default_plant_count(rows: int, lines_per_plant: int = 12) -> int:
+    """Plants for a row count, keeping roughly 15k rows per line (about a year of events)."""
+    return max(1, math.ceil(rows / (15000 * lines_per_plant)))
+
+def write_synthetic_data(output_path: str, rows: int, template_path: str = DEFAULT_TEMPLATE_DATA_PATH,
+                         num_plants: Optional[int] = None, lines_per_plant: int = 12, seed: int = 0,
+                         start: Optional[datetime] = None) -> str:
+    """
+    Write a synthetic extract to a CSV file (gzip-compressed for a .gz path).
+
+    Args:
+        output_path: Destination file
+        rows: Number of data rows
+        template_path: Template extract providing the schema and distributions
+        num_plants: Number of plants (default: scaled with rows)
+        lines_per_plant: Production lines per plant
+        seed: Random seed
+        start: Time of the first events
+
+    Returns:
+        str: The output path
+    """
+    profile = TemplateProfile(template_path)
+    generator = SyntheticDataGenerator(profile, num_plants or default_plant_count(rows, lines_per_plant),
+                                       lines_per_plant, seed, start)
+    opener = gzip.open if output_path.endswith(".gz") else open
+    started = time.perf_counter()
+    with opener(output_path, "wt", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(generator.header)
+        for i, row in enumerate(generator.rows(rows), 1):
+            writer.writerow(row)
+            if i % 1000000 == 0:
+                logging.info(f"{i} rows written ({i / (time.perf_counter() - started):.0f} rows/s)")
+    logging.info(f"Wrote {rows} rows for {len(generator.lines)} lines "
+                 f"({sum(len(line.resources) for line in generator.lines)} resources) to {output_path} "
+                 f"in {time.perf_counter() - started:.1f} s")
+    return output_path
+
+def main():
+    """Main function to generate a synthetic OPERA extract."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic OPERA extract with the template's schema and value distributions.")
+    parser.add_argument("output", help="Output CSV path (.gz for gzip compression).")
+    parser.add_argument("--rows", type=int, default=1000, help="Number of data rows (default: 1000).")
+    parser.add_argument("--plants", type=int, default=None, help="Number of plants (default: about one per 180k rows).")
+    parser.add_argument("--lines-per-plant", type=int, default=12, help="Production lines per plant (default: 12).")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0).")
+    parser.add_argument("--start", default="2025-01-01T06:00:00", help="Time of the first events (ISO format).")
+    parser.add_argument("--template", default=DEFAULT_TEMPLATE_DATA_PATH, help="Template extract (default: the 100-line sample).")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    write_synthetic_data(args.output, args.rows, args.template, args.plants, args.lines_per_plant,
+                         args.seed, datetime.fromisoformat(args.start))
+
+if __name__ == "__main__":
+    main()
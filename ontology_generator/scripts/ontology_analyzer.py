@@ -15,15 +15,17 @@ from owlready2 import *
 
 # Add parent directory to path to import from src package
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from ontology_generator.export.snapshot import load_ontology as load_generated_ontology
 
 def load_ontology(file_path):
-    """Load the ontology from the given file path."""
+    """Load the ontology from the given file path (or a fresh snapshot next to it)."""
     print(f"Loading ontology from {file_path}...")
     try:
         # Set up Owlready2 to handle RDF/XML and OWL files
         onto_path.append(os.path.dirname(os.path.abspath(file_path)))
-        world = World()
-        onto = world.get_ontology(file_path).load()
+        world, onto = load_generated_ontology(file_path)
         print(f"Successfully loaded ontology: {onto.base_iri}")
         return world, onto
     except Exception as e:
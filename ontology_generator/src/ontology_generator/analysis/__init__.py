@@ -2,8 +2,16 @@ from .population import (
     analyze_ontology_population, generate_population_report,
     generate_optimization_recommendations
 )
-from .reasoning import generate_reasoning_report
+from .reasoning import (
+    generate_reasoning_report, collect_quadstore_stats,
+    ReasoningReportCollector
+)
+from .materialization import materialize_owl_rl
+from .partitioned_reasoning import (
+    run_partitioned_reasoning, generate_partition_report
+)
 from .sequence_analysis import (
     get_equipment_sequence_for_line, generate_equipment_sequence_report,
-    analyze_equipment_sequences
+    analyze_equipment_sequences, get_parallel_equipment_pairs
 )
+from .time_index import TimeRangeIndex
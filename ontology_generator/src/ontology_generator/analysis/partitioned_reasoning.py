@@ -0,0 +1,539 @@
+"""
+Partitioned reasoning module for the ontology generator.
+
+This module reasons over the ABox in independent partitions instead of one
+reasoner call over the whole world. The TBox is classified once (and cached),
+individuals are split per production line by following partition properties
+such as isPartOfProductionLine, and every partition is reasoned together with
+the classified TBox in its own process with a timeout and memory cap. Inferred
+triples of consistent partitions are merged back into the ontology; partitions
+that fail, time out or are inconsistent are reported individually, and the
+inferences of inconsistent partitions are counted but not merged.
+
+Inferences that need facts from two different partitions are not found.
+Individuals shared between lines (plants, shifts, materials, ...) are reasoned
+in a separate 'shared' partition and copied with their types into every line
+partition that references them.
+"""
+import hashlib
+import multiprocessing
+import os
+import pickle
+import time as timing
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from owlready2 import World, Ontology, OwlReadyInconsistentOntologyError, sync_reasoner
+
+from ontology_generator.utils.logging import analysis_logger
+from ontology_generator.utils import quadstore
+from ontology_generator.analysis.materialization import materialize_owl_rl, refresh_loaded_entities
+
+try:
+    import resource
+except ImportError: # Not available on Windows; memory caps are then skipped
+    resource = None
+
+# Engines that can reason over a partition
+PARTITION_ENGINES = ['hermit', 'rl']
+
+# Class whose individuals seed the partitions, and the properties linking members to them
+DEFAULT_PARTITION_CLASS = "ProductionLine"
+DEFAULT_PARTITION_PROPERTIES = ['isPartOfProductionLine', 'involvesResource']
+
+DEFAULT_PARTITION_TIMEOUT_SECONDS = 600
+SHARED_PARTITION = "shared"
+TBOX_PARTITION = "tbox"
+
+PARTITION_ONTOLOGY_IRI = "http://partitioned-reasoning.local/partition#"
+
+# Classified TBox triples by cache key, for repeated runs in one process
+_TBOX_CACHE: Dict[str, List[tuple]] = {}
+
+# --- Triple transfer ---
+# Triples cross process boundaries as plain tuples of IRIs so workers can build
+# their own World: ("o", s, p, o) for object triples and ("d", s, p, value, datatype)
+# for data triples. Blank nodes are written as "_:<n>"; datatype is an IRI, a
+# "@lang" tag, or 0.
+
+def _term(world: World, storid: int) -> str:
+    """Convert a storid to a transferable term."""
+    if storid < 0:
+        return f"_:{-storid}"
+    return world._unabbreviate(storid)
+
+def _export_rows(world: World, obj_rows, data_rows) -> List[tuple]:
+    """Convert quadstore rows to transferable triples."""
+    triples = [("o", _term(world, s), _term(world, p), _term(world, o)) for s, p, o in obj_rows]
+    for s, p, o, d in data_rows:
+        datatype = world._unabbreviate(d) if isinstance(d, int) and d > 0 else d
+        triples.append(("d", _term(world, s), _term(world, p), o, datatype))
+    return triples
+
+def _import_triples(onto: Ontology, triples: List[tuple], skip_blank_nodes: bool = False) -> List[Tuple[int, int, Optional[int]]]:
+    """
+    Add transferable triples to an ontology, skipping triples that already exist.
+
+    Args:
+        onto: The ontology receiving the triples
+        triples: Triples in the transfer format
+        skip_blank_nodes: Drop triples mentioning blank nodes instead of creating new ones
+
+    Returns:
+        List of (s, p, o) storids added (o is None for data triples)
+    """
+    world = onto.world
+    blank_nodes: Dict[str, int] = {}
+    added = []
+
+    def storid(term: str) -> Optional[int]:
+        if term.startswith("_:"):
+            if skip_blank_nodes:
+                return None
+            if term not in blank_nodes:
+                blank_nodes[term] = world.new_blank_node()
+            return blank_nodes[term]
+        return world._abbreviate(term)
+
+    for triple in triples:
+        s, p = storid(triple[1]), storid(triple[2])
+        if s is None or p is None:
+            continue
+        if triple[0] == "o":
+            o = storid(triple[3])
+            if o is None or world._has_obj_triple_spo(s, p, o):
+                continue
+            onto._add_obj_triple_spo(s, p, o)
+            added.append((s, p, o))
+        else:
+            value, datatype = triple[3], triple[4]
+            if isinstance(datatype, str) and not datatype.startswith("@"):
+                datatype = world._abbreviate(datatype)
+            if world._has_data_triple_spod(s, p, value, datatype):
+                continue
+            onto._add_data_triple_spod(s, p, value, datatype)
+            added.append((s, p, None))
+    return added
+
+def _all_rows(world: World) -> Tuple[Set[tuple], Set[tuple]]:
+    """Return the distinct object and data triples of a world."""
+    objs = set(quadstore.execute(world, "SELECT s, p, o FROM objs"))
+    datas = set(quadstore.execute(world, "SELECT s, p, o, d FROM datas"))
+    return objs, datas
+
+def reason_over_triples(triples: List[tuple], engine: str = "hermit") -> Dict[str, Any]:
+    """
+    Reason over a set of triples in a fresh World and return the inferred triples.
+
+    This is what a partition worker runs; it can also be called in-process.
+
+    Args:
+        triples: TBox and ABox triples in the transfer format
+        engine: 'hermit' (sync_reasoner) or 'rl' (materialize_owl_rl)
+
+    Returns:
+        dict: {'status': 'ok'|'inconsistent', 'inferred': [...], 'inconsistent_classes': [...]}
+    """
+    world = World()
+    onto = world.get_ontology(PARTITION_ONTOLOGY_IRI)
+    _import_triples(onto, triples)
+    objs_before, datas_before = _all_rows(world)
+
+    try:
+        with onto:
+            if engine == "rl":
+                materialize_owl_rl(onto)
+            else:
+                sync_reasoner(world, infer_property_values=True, debug=0)
+    except OwlReadyInconsistentOntologyError:
+        return {'status': 'inconsistent', 'inferred': [], 'inconsistent_classes': []}
+
+    inconsistent = [_term(world, cls.storid) for cls in world.inconsistent_classes()]
+    objs_after, datas_after = _all_rows(world)
+    inferred = _export_rows(
+        world,
+        sorted(row for row in objs_after - objs_before if row[0] > 0 and row[2] > 0),
+        sorted((row for row in datas_after - datas_before if row[0] > 0), key=repr)
+    )
+    return {
+        'status': 'inconsistent' if inconsistent else 'ok',
+        'inferred': inferred,
+        'inconsistent_classes': inconsistent,
+    }
+
+def _partition_worker(conn, triples: List[tuple], engine: str, memory_mb: Optional[int]) -> None:
+    """Process entry point: cap memory, reason, and send the result back."""
+    try:
+        if memory_mb:
+            if engine == "hermit":
+                # The JVM is a child of this process; size its heap instead of capping address space
+                from owlready2 import reasoning
+                reasoning.JAVA_MEMORY = memory_mb
+            elif resource is not None:
+                limit = memory_mb * 1024 * 1024
+                resource.setrlimit(resource.RLIMIT_AS, (limit, resource.getrlimit(resource.RLIMIT_AS)[1]))
+        result = reason_over_triples(triples, engine)
+    except MemoryError:
+        result = {'status': 'failed', 'error': f"exceeded memory cap of {memory_mb} MB"}
+    except Exception as e:
+        result = {'status': 'failed', 'error': f"{type(e).__name__}: {e}"}
+    conn.send(result)
+    conn.close()
+
+def _run_in_workers(jobs: Iterator[Tuple[str, Callable[[], List[tuple]]]],
+                    engine: str,
+                    max_workers: int,
+                    timeout: Optional[float],
+                    memory_mb: Optional[int]) -> Dict[str, Dict[str, Any]]:
+    """
+    Run partition jobs in separate processes, at most max_workers at a time.
+
+    Each job is (name, build_triples); triples are only built when the job starts
+    so at most max_workers partitions are held in memory.
+
+    Returns:
+        Dict mapping job name to its result dict (with 'elapsed' added)
+    """
+    context = multiprocessing.get_context("spawn")
+    results: Dict[str, Dict[str, Any]] = {}
+    running: Dict[str, Tuple[Any, Any, float]] = {}
+    pending = iter(jobs)
+    exhausted = False
+
+    def finish(name: str, result: Dict[str, Any]) -> None:
+        process, conn, start = running.pop(name)
+        process.join(timeout=5)
+        if process.is_alive():
+            process.kill()
+        conn.close()
+        result['elapsed'] = timing.time() - start
+        results[name] = result
+
+    while running or not exhausted:
+        while not exhausted and len(running) < max_workers:
+            job = next(pending, None)
+            if job is None:
+                exhausted = True
+                break
+            name, build_triples = job
+            parent_conn, child_conn = context.Pipe(duplex=False)
+            process = context.Process(target=_partition_worker, args=(child_conn, build_triples(), engine, memory_mb), daemon=True)
+            process.start()
+            child_conn.close()
+            running[name] = (process, parent_conn, timing.time())
+
+        if not running:
+            break
+        wait_time = 0.5
+        if timeout is not None:
+            next_deadline = min(start for _, _, start in running.values()) + timeout
+            wait_time = max(0.0, min(wait_time, next_deadline - timing.time()))
+        wait([conn for _, conn, _ in running.values()] + [proc.sentinel for proc, _, _ in running.values()], timeout=wait_time)
+
+        now = timing.time()
+        for name, (process, conn, start) in list(running.items()):
+            if conn.poll():
+                try:
+                    finish(name, conn.recv())
+                except EOFError:
+                    finish(name, {'status': 'failed', 'error': f"worker exited with code {process.exitcode}"})
+            elif not process.is_alive():
+                finish(name, {'status': 'failed', 'error': f"worker exited with code {process.exitcode}"})
+            elif timeout is not None and now - start > timeout:
+                process.terminate()
+                finish(name, {'status': 'timeout', 'error': f"no result after {timeout:.0f} seconds"})
+    return results
+
+# --- Partitioning ---
+
+def _individual_table(world: World) -> None:
+    """(Re)create a temp table with the storids of all named individuals."""
+    quadstore.execute(world, "DROP TABLE IF EXISTS temp.partition_individuals")
+    quadstore.execute(world, "CREATE TABLE temp.partition_individuals (s INTEGER PRIMARY KEY)")
+    quadstore.execute(world, f"""
+        INSERT OR IGNORE INTO temp.partition_individuals
+        SELECT s FROM objs WHERE p = {quadstore.rdf_type} AND o = {quadstore.owl_named_individual} AND s > 0
+    """)
+
+def export_tbox(onto: Ontology) -> List[tuple]:
+    """
+    Export every triple that does not mention a named individual.
+
+    Returns:
+        List of TBox triples in the transfer format
+    """
+    world = onto.world
+    _individual_table(world)
+    try:
+        obj_rows = quadstore.fetch_all(world, """
+            SELECT DISTINCT s, p, o FROM objs
+            WHERE s NOT IN (SELECT s FROM temp.partition_individuals)
+              AND o NOT IN (SELECT s FROM temp.partition_individuals)
+        """)
+        data_rows = quadstore.fetch_all(world, """
+            SELECT DISTINCT s, p, o, d FROM datas WHERE s NOT IN (SELECT s FROM temp.partition_individuals)
+        """)
+    finally:
+        quadstore.execute(world, "DROP TABLE IF EXISTS temp.partition_individuals")
+    return _export_rows(world, obj_rows, data_rows)
+
+def assign_partitions(onto: Ontology,
+                      partition_class: str = DEFAULT_PARTITION_CLASS,
+                      partition_properties: Optional[List[str]] = None,
+                      lines_per_partition: int = 1) -> Dict[str, List[int]]:
+    """
+    Split the named individuals into partitions.
+
+    Each individual of partition_class seeds a partition; an individual joins the
+    partition of the individual it points to through one of the partition
+    properties (e.g. Equipment -> isPartOfProductionLine -> line, then
+    EventRecord -> involvesResource -> equipment). Individuals reachable from
+    several seeds join the first one by IRI. Everything else goes to the shared
+    partition.
+
+    Args:
+        onto: The populated ontology
+        partition_class: Name of the class whose individuals seed partitions
+        partition_properties: Names of the object properties linking members to seeds
+        lines_per_partition: Number of seeds grouped into one partition
+
+    Returns:
+        Dict mapping partition name to member storids (the shared partition last)
+    """
+    world = onto.world
+    seed_class = onto[partition_class]
+    property_storids = [prop.storid for prop in (onto[name] for name in (partition_properties or DEFAULT_PARTITION_PROPERTIES)) if prop is not None]
+    _individual_table(world)
+
+    try:
+        membership: Dict[int, int] = {}
+        if seed_class is not None:
+            for ind, seed in quadstore.execute(world, f"""
+                WITH RECURSIVE member(ind, seed) AS (
+                    SELECT s, s FROM objs WHERE p = {quadstore.rdf_type} AND o = ? AND s > 0
+                    UNION
+                    SELECT t.s, member.seed FROM objs t JOIN member ON t.o = member.ind
+                    WHERE t.p IN ({quadstore.sql_placeholders(property_storids) or 'NULL'}) AND t.s > 0
+                )
+                SELECT member.ind, r.iri FROM member JOIN resources r ON r.storid = member.seed
+                ORDER BY member.ind, r.iri
+            """, (seed_class.storid, *property_storids)):
+                membership.setdefault(ind, seed)
+        all_individuals = quadstore.fetch_column(world, "SELECT s FROM temp.partition_individuals ORDER BY s")
+    finally:
+        quadstore.execute(world, "DROP TABLE IF EXISTS temp.partition_individuals")
+
+    members_by_seed: Dict[str, List[int]] = {}
+    for ind in all_individuals:
+        if ind in membership:
+            members_by_seed.setdefault(membership[ind], []).append(ind)
+
+    partitions: Dict[str, List[int]] = {}
+    seeds = sorted(members_by_seed)
+    step = max(1, lines_per_partition)
+    for index in range(0, len(seeds), step):
+        group = seeds[index:index + step]
+        name = group[0].rsplit("#", 1)[-1].rsplit("/", 1)[-1]
+        if len(group) > 1:
+            name = f"{name} (+{len(group) - 1})"
+        partitions[name] = [ind for seed in group for ind in members_by_seed[seed]]
+
+    shared = [ind for ind in all_individuals if ind not in membership]
+    if shared:
+        partitions[SHARED_PARTITION] = shared
+    return partitions
+
+def export_partition(onto: Ontology, members: List[int]) -> List[tuple]:
+    """
+    Export the ABox triples of a partition.
+
+    Includes every triple whose subject or object is a member, plus the types of
+    non-member individuals those triples reference, so domain/range and class
+    reasoning still sees them.
+
+    Returns:
+        List of ABox triples in the transfer format
+    """
+    world = onto.world
+    quadstore.execute(world, "DROP TABLE IF EXISTS temp.partition_members")
+    quadstore.execute(world, "CREATE TABLE temp.partition_members (s INTEGER PRIMARY KEY)")
+    try:
+        world.graph.db.executemany("INSERT OR IGNORE INTO temp.partition_members VALUES (?)", ((m,) for m in members))
+        obj_rows = quadstore.fetch_all(world, f"""
+            SELECT s, p, o FROM objs WHERE s IN (SELECT s FROM temp.partition_members)
+            UNION SELECT s, p, o FROM objs WHERE o IN (SELECT s FROM temp.partition_members) AND s > 0
+            UNION SELECT t.s, t.p, t.o FROM objs t
+                  WHERE t.p = {quadstore.rdf_type} AND t.s IN (
+                      SELECT o FROM objs WHERE s IN (SELECT s FROM temp.partition_members) AND o > 0
+                      UNION SELECT s FROM objs WHERE o IN (SELECT s FROM temp.partition_members) AND s > 0)
+        """)
+        data_rows = quadstore.fetch_all(world, """
+            SELECT DISTINCT s, p, o, d FROM datas WHERE s IN (SELECT s FROM temp.partition_members)
+        """)
+    finally:
+        quadstore.execute(world, "DROP TABLE IF EXISTS temp.partition_members")
+    return _export_rows(world, obj_rows, data_rows)
+
+# --- TBox classification ---
+
+def _tbox_cache_key(tbox: List[tuple], engine: str) -> str:
+    """Hash the TBox triples and engine into a cache key."""
+    digest = hashlib.sha256(engine.encode("utf-8"))
+    for triple in sorted(tbox, key=repr):
+        digest.update(repr(triple).encode("utf-8"))
+    return digest.hexdigest()
+
+def classify_tbox(onto: Ontology,
+                  engine: str = "hermit",
+                  timeout: Optional[float] = DEFAULT_PARTITION_TIMEOUT_SECONDS,
+                  memory_mb: Optional[int] = None,
+                  cache_dir: Optional[str] = None) -> Tuple[List[tuple], Dict[str, Any]]:
+    """
+    Classify the TBox once, reusing a cached classification when the TBox is unchanged.
+
+    Args:
+        onto: The ontology whose TBox is classified
+        engine: Reasoning engine (see PARTITION_ENGINES)
+        timeout: Seconds allowed for classification
+        memory_mb: Memory cap for the classification process
+        cache_dir: Directory for persistent classification caches (optional)
+
+    Returns:
+        tuple: (classified TBox triples, result dict with 'status' and 'cached')
+    """
+    tbox = export_tbox(onto)
+    key = _tbox_cache_key(tbox, engine)
+    cache_path = os.path.join(cache_dir, f"tbox_{key}.pickle") if cache_dir else None
+
+    if key in _TBOX_CACHE:
+        return _TBOX_CACHE[key], {'status': 'ok', 'cached': True, 'inferred': []}
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                _TBOX_CACHE[key] = pickle.load(f)
+            analysis_logger.info(f"Loaded classified TBox from cache: {cache_path}")
+            return _TBOX_CACHE[key], {'status': 'ok', 'cached': True, 'inferred': []}
+        except Exception as e:
+            analysis_logger.warning(f"Could not read TBox cache {cache_path}: {e}")
+
+    result = _run_in_workers(iter([(TBOX_PARTITION, lambda: tbox)]), engine, 1, timeout, memory_mb)[TBOX_PARTITION]
+    if result['status'] != 'ok':
+        # Partitions still get the asserted TBox; the reasoner classifies it again in each
+        analysis_logger.warning(f"TBox classification {result['status']}: {result.get('error', '')}")
+        return tbox, result
+
+    classified = tbox + result['inferred']
+    _TBOX_CACHE[key] = classified
+    if cache_path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump(classified, f)
+        except OSError as e:
+            analysis_logger.warning(f"Could not write TBox cache {cache_path}: {e}")
+    result['cached'] = False
+    return classified, result
+
+# --- Orchestration ---
+
+def run_partitioned_reasoning(onto: Ontology,
+                              engine: str = "hermit",
+                              max_workers: Optional[int] = None,
+                              timeout: Optional[float] = DEFAULT_PARTITION_TIMEOUT_SECONDS,
+                              memory_mb: Optional[int] = None,
+                              tbox_cache_dir: Optional[str] = None,
+                              lines_per_partition: int = 1,
+                              partition_class: str = DEFAULT_PARTITION_CLASS,
+                              partition_properties: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Reason over the ontology in parallel ABox partitions and merge the inferences.
+
+    Args:
+        onto: The populated ontology; inferred triples of 'ok' partitions are added to it
+        engine: Reasoning engine for the TBox and every partition (see PARTITION_ENGINES)
+        max_workers: Maximum concurrent worker processes (defaults to the CPU count)
+        timeout: Seconds allowed per partition
+        memory_mb: Memory cap per worker (JVM heap for HermiT, address space for rl)
+        tbox_cache_dir: Directory for persistent TBox classification caches
+        lines_per_partition: Number of production lines reasoned together in one partition
+        partition_class: Name of the class whose individuals seed partitions
+        partition_properties: Names of the object properties linking members to seeds
+
+    Returns:
+        dict: {'tbox': result, 'partitions': [result, ...], 'merged_triples': int}; each
+            partition result has 'name', 'individuals', 'status', 'inferred_count',
+            'elapsed' and optionally 'error' and 'inconsistent_classes'; inferred_count
+            includes the (unmerged) inferences of inconsistent partitions
+    """
+    if engine not in PARTITION_ENGINES:
+        raise ValueError(f"Unknown partition engine '{engine}'. Expected one of {PARTITION_ENGINES}.")
+    world = onto.world
+    max_workers = max_workers or os.cpu_count() or 1
+
+    start = timing.time()
+    tbox, tbox_result = classify_tbox(onto, engine, timeout, memory_mb, tbox_cache_dir)
+    added = _import_triples(onto, tbox_result.get('inferred', []), skip_blank_nodes=True)
+    analysis_logger.info(
+        f"TBox: {len(tbox)} triples ({'cached' if tbox_result.get('cached') else tbox_result['status']}) "
+        f"in {timing.time() - start:.2f}s"
+    )
+
+    partitions = assign_partitions(onto, partition_class, partition_properties, lines_per_partition)
+    analysis_logger.info(f"Reasoning {len(partitions)} ABox partitions with up to {max_workers} '{engine}' workers.")
+
+    jobs = ((name, (lambda members=members: tbox + export_partition(onto, members))) for name, members in partitions.items())
+    results = _run_in_workers(jobs, engine, max_workers, timeout, memory_mb)
+
+    summary = []
+    for name, members in partitions.items():
+        result = results[name]
+        inferred = result.pop('inferred', [])
+        if result['status'] == 'ok': # Inconsistent partitions entail anything; keep their inferences out
+            added.extend(_import_triples(onto, inferred, skip_blank_nodes=True))
+        result.update({'name': name, 'individuals': len(members), 'inferred_count': len(inferred)})
+        if result['status'] != 'ok':
+            analysis_logger.warning(f"Partition '{name}' {result['status']}: {result.get('error') or result.get('inconsistent_classes')}")
+        summary.append(result)
+
+    refresh_loaded_entities(world, added)
+    tbox_result.pop('inferred', None)
+    return {'tbox': tbox_result, 'partitions': summary, 'merged_triples': len(added)}
+
+def generate_partition_report(summary: Dict[str, Any], max_entities: int = 10, verbose: bool = False) -> Tuple[str, bool]:
+    """
+    Generate a report of a partitioned reasoning run.
+
+    Args:
+        summary: The dict returned by run_partitioned_reasoning
+        max_entities: Maximum number of healthy partitions listed
+        verbose: List every partition
+
+    Returns:
+        tuple: (report_str, has_issues)
+    """
+    partitions = summary['partitions']
+    problems = [p for p in partitions if p['status'] != 'ok']
+    lines = [
+        "=== PARTITIONED REASONING ===",
+        f"TBox classification: {'cached' if summary['tbox'].get('cached') else summary['tbox']['status']}",
+        f"Partitions: {len(partitions)} ({len(partitions) - len(problems)} ok, {len(problems)} with issues)",
+        f"Merged inferred triples: {summary['merged_triples']}",
+    ]
+    if problems:
+        lines.append("\nPartitions with issues:")
+        for p in problems:
+            detail = p.get('error') or ", ".join(p.get('inconsistent_classes', []))
+            line = f"  • {p['name']} ({p['individuals']} individuals): {p['status'].upper()} {detail}".rstrip()
+            if p.get('inferred_count'):
+                line += f" ({p['inferred_count']} inferred triples not merged)"
+            lines.append(line)
+
+    healthy = [p for p in partitions if p['status'] == 'ok']
+    shown = healthy if verbose else healthy[:max_entities]
+    if shown:
+        lines.append("\nPartition timings:")
+        for p in sorted(shown, key=lambda p: -p['elapsed']):
+            lines.append(f"  • {p['name']}: {p['individuals']} individuals, {p['inferred_count']} inferred triples, {p['elapsed']:.2f}s")
+        if len(healthy) > len(shown):
+            lines.append(f"  ... and {len(healthy) - len(shown)} more")
+    return "\n".join(lines), bool(problems)
@@ -1,13 +1,197 @@
 """
 Reasoning analysis module for the ontology generator.
 
-This module provides functions for generating reasoning reports.
+This module provides functions for generating reasoning reports, and a collector
+that gathers the report inputs by diffing the quadstore around a reasoner run.
 """
-from typing import Dict, List, Tuple, Any, Set
+from typing import Dict, List, Tuple, Any, Set, Optional
 
-from owlready2 import Ontology, ThingClass
+from owlready2 import Ontology, ThingClass, locstr
 
 from ontology_generator.utils.logging import analysis_logger
+from ontology_generator.utils import quadstore
+
+# Property characteristics reported as inferred when the reasoner adds them
+INFERRABLE_PROPERTY_CHARACTERISTICS = [
+    'FunctionalProperty', 'InverseFunctionalProperty', 'TransitiveProperty', 'SymmetricProperty',
+    'AsymmetricProperty', 'ReflexiveProperty', 'IrreflexiveProperty',
+]
+OWL_NAMESPACE = "http://www.w3.org/2002/07/owl#"
+RDFS_NAMESPACE = "http://www.w3.org/2000/01/rdf-schema#"
+
+def _iri_to_name(iri: Optional[str]) -> str:
+    """Derives the short entity name from an IRI (fragment or last path segment)."""
+    if not iri:
+        return str(iri)
+    return iri.rsplit("#", 1)[-1].rsplit("/", 1)[-1]
+
+def collect_quadstore_stats(onto: Ontology) -> Dict[str, int]:
+    """
+    Counts classes, properties and individuals declared in an ontology with one aggregate query.
+    
+    The counts match len(list(onto.classes())), onto.object_properties(),
+    onto.data_properties() and onto.individuals() without loading any entity.
+    
+    Args:
+        onto: The ontology object
+        
+    Returns:
+        Dict with 'classes', 'object_properties', 'data_properties' and 'individuals' counts
+    """
+    type_keys = {
+        quadstore.owl_class: 'classes',
+        quadstore.owl_object_property: 'object_properties',
+        quadstore.owl_data_property: 'data_properties',
+        quadstore.owl_named_individual: 'individuals',
+    }
+    rows = quadstore.fetch_all(onto.world, f"""
+        SELECT o, COUNT(DISTINCT s) FROM objs
+        WHERE c = ? AND p = ? AND s > 0 AND o IN ({quadstore.sql_placeholders(type_keys)})
+        GROUP BY o
+    """, (onto.graph.c, quadstore.rdf_type, *type_keys))
+    stats = {key: 0 for key in type_keys.values()}
+    for type_storid, count in rows:
+        stats[type_keys[type_storid]] = count
+    return stats
+
+class ReasoningReportCollector:
+    """
+    Collects the inputs of generate_reasoning_report by diffing the quadstore.
+    
+    Call snapshot() before running the reasoner and collect() afterwards. The
+    snapshot copies the (s, p, o) triples into temporary tables, so collect()
+    only reports triples the reasoner genuinely added, and its cost is
+    proportional to the number of inferences rather than individuals × properties.
+    
+    Attributes:
+        onto: The ontology being reasoned over
+        pre_stats: Statistics captured by snapshot()
+    """
+    _OBJS_TABLE = "temp.reasoning_snapshot_objs"
+    _DATAS_TABLE = "temp.reasoning_snapshot_datas"
+
+    def __init__(self, onto: Ontology):
+        """
+        Initialize the collector.
+        
+        Args:
+            onto: The ontology that will be reasoned over
+        """
+        self.onto = onto
+        self.world = onto.world
+        self.pre_stats: Optional[Dict[str, int]] = None
+        self._has_snapshot = False
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Capture pre-reasoning statistics and a copy of the current triples.
+        
+        Returns:
+            The pre-reasoning statistics
+        """
+        self.discard()
+        self.pre_stats = collect_quadstore_stats(self.onto)
+        quadstore.execute(self.world, f"CREATE TABLE {self._OBJS_TABLE} (s INTEGER, p INTEGER, o INTEGER, PRIMARY KEY (s, p, o)) WITHOUT ROWID")
+        quadstore.execute(self.world, f"INSERT OR IGNORE INTO {self._OBJS_TABLE} SELECT s, p, o FROM objs")
+        quadstore.execute(self.world, f"CREATE TABLE {self._DATAS_TABLE} (s INTEGER, p INTEGER, o BLOB, d INTEGER, PRIMARY KEY (s, p, o, d)) WITHOUT ROWID")
+        quadstore.execute(self.world, f"INSERT OR IGNORE INTO {self._DATAS_TABLE} SELECT s, p, o, d FROM datas")
+        self._has_snapshot = True
+        analysis_logger.debug(f"Captured pre-reasoning quadstore snapshot: {self.pre_stats}")
+        return self.pre_stats
+
+    def discard(self) -> None:
+        """Drop the snapshot tables, if any."""
+        quadstore.execute(self.world, f"DROP TABLE IF EXISTS {self._OBJS_TABLE}")
+        quadstore.execute(self.world, f"DROP TABLE IF EXISTS {self._DATAS_TABLE}")
+        self._has_snapshot = False
+
+    def collect(self) -> Tuple[Dict[str, int], Dict[str, Dict[str, List[str]]], Dict[str, List[str]], Dict[str, Dict[str, Any]]]:
+        """
+        Diff the quadstore against the snapshot and build the report inputs.
+        
+        Returns:
+            tuple: (post_stats, inferred_hierarchy, inferred_properties, inferred_individuals)
+                in the shapes expected by generate_reasoning_report
+        """
+        if not self._has_snapshot:
+            raise RuntimeError("ReasoningReportCollector.collect() called without a snapshot")
+        
+        post_stats = collect_quadstore_stats(self.onto)
+        inferred_hierarchy: Dict[str, Dict[str, List[str]]] = {}
+        inferred_properties: Dict[str, List[str]] = {}
+        inferred_individuals: Dict[str, Dict[str, Any]] = {}
+        
+        kind_types = (quadstore.owl_class, quadstore.owl_object_property, quadstore.owl_data_property)
+        subclass_of = quadstore.rdfs_subclassof
+        equivalent_class = self.world._abbreviate(OWL_NAMESPACE + "equivalentClass")
+        characteristic_storids = {
+            self.world._abbreviate(OWL_NAMESPACE + name): name for name in INFERRABLE_PROPERTY_CHARACTERISTICS
+        }
+        ignored_types = {quadstore.owl_named_individual, quadstore.owl_thing, quadstore.owl_ontology}
+        
+        def individual_entry(name: str) -> Dict[str, Any]:
+            return inferred_individuals.setdefault(name, {'types': [], 'properties': {}})
+        
+        # Object triples added by the reasoner (blank nodes are skipped)
+        new_objs = quadstore.execute(self.world, f"""
+            SELECT n.s, n.p, n.o, rs.iri, rp.iri, ro.iri,
+                   (SELECT t.o FROM objs t WHERE t.s = n.s AND t.p = ? AND t.o IN (?, ?, ?) LIMIT 1)
+            FROM (SELECT DISTINCT s, p, o FROM objs
+                  WHERE s > 0 AND o > 0
+                    AND NOT EXISTS (SELECT 1 FROM {self._OBJS_TABLE} sn
+                                    WHERE sn.s = objs.s AND sn.p = objs.p AND sn.o = objs.o)) n
+            LEFT JOIN resources rs ON rs.storid = n.s
+            LEFT JOIN resources rp ON rp.storid = n.p
+            LEFT JOIN resources ro ON ro.storid = n.o
+            ORDER BY rs.iri, rp.iri, ro.iri
+        """, (quadstore.rdf_type, *kind_types))
+        
+        for s, p, o, s_iri, p_iri, o_iri, s_kind in new_objs:
+            s_name, o_name = _iri_to_name(s_iri), _iri_to_name(o_iri)
+            if s_kind == quadstore.owl_class:
+                if p == subclass_of and o != quadstore.owl_thing:
+                    inferred_hierarchy.setdefault(o_name, {'subclasses': [], 'equivalent': []})['subclasses'].append(s_name)
+                elif p == equivalent_class:
+                    inferred_hierarchy.setdefault(s_name, {'subclasses': [], 'equivalent': []})['equivalent'].append(o_name)
+            elif s_kind in (quadstore.owl_object_property, quadstore.owl_data_property):
+                if p == quadstore.rdf_type and o in characteristic_storids:
+                    inferred_properties.setdefault(s_name, []).append(characteristic_storids[o])
+            elif p == quadstore.rdf_type:
+                if o not in ignored_types:
+                    individual_entry(s_name)['types'].append(o_name)
+            elif p_iri and not p_iri.startswith((OWL_NAMESPACE, RDFS_NAMESPACE)):
+                individual_entry(s_name)['properties'].setdefault(_iri_to_name(p_iri), []).append(o_name)
+        
+        # Data triples added by the reasoner
+        new_datas = quadstore.execute(self.world, f"""
+            SELECT n.o, n.d, rs.iri, rp.iri
+            FROM (SELECT DISTINCT s, p, o, d FROM datas
+                  WHERE s > 0
+                    AND NOT EXISTS (SELECT 1 FROM {self._DATAS_TABLE} sn
+                                    WHERE sn.s = datas.s AND sn.p = datas.p AND sn.o = datas.o AND sn.d IS datas.d)
+                    AND NOT EXISTS (SELECT 1 FROM objs t WHERE t.s = datas.s AND t.p = ? AND t.o IN (?, ?, ?))) n
+            LEFT JOIN resources rs ON rs.storid = n.s
+            LEFT JOIN resources rp ON rp.storid = n.p
+            ORDER BY rs.iri, rp.iri
+        """, (quadstore.rdf_type, *kind_types))
+        
+        for o, d, s_iri, p_iri in new_datas:
+            if not p_iri or p_iri.startswith((OWL_NAMESPACE, RDFS_NAMESPACE)):
+                continue
+            value = self.world._to_python(o, d)
+            if isinstance(value, locstr):
+                formatted = f'"{value}"@{value.lang}'
+            else:
+                formatted = repr(value)
+            individual_entry(_iri_to_name(s_iri))['properties'].setdefault(_iri_to_name(p_iri), []).append(formatted)
+        
+        self.discard()
+        analysis_logger.info(
+            f"Reasoning diff: {sum(len(v['subclasses']) + len(v['equivalent']) for v in inferred_hierarchy.values())} class axioms, "
+            f"{sum(len(v) for v in inferred_properties.values())} property characteristics, "
+            f"{len(inferred_individuals)} individuals with inferred facts"
+        )
+        return post_stats, inferred_hierarchy, inferred_properties, inferred_individuals
 
 def generate_reasoning_report(onto: Ontology,
                              pre_stats: Dict[str, int],
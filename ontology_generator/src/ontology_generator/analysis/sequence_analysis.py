@@ -118,6 +118,36 @@ def get_equipment_sequence_for_line(onto: Ontology, line_individual: Thing) -> L
     analysis_logger.info(f"Determined sequence with {len(sequence)} equipment for line {line_individual.name}")
     return sequence
 
+def get_parallel_equipment_pairs(onto: Ontology) -> List[Tuple[Thing, Thing]]:
+    """
+    Lists the pairs of parallel equipment (same line and sequence position).
+
+    Works with both models produced by sequence setup: pairs are derived from
+    shared ParallelStage membership (isMemberOfStage) when stages were created,
+    and read from the asserted isParallelWith links otherwise.
+
+    Args:
+        onto: The ontology object
+
+    Returns:
+        Sorted list of (equipment, equipment) pairs, each pair ordered by name
+    """
+    pairs = set()
+    stage_class = onto["ParallelStage"]
+    if stage_class is not None and onto["isMemberOfStage"] is not None:
+        members_by_stage: Dict[Thing, List[Thing]] = {}
+        for equipment, stage in onto.isMemberOfStage.get_relations():
+            members_by_stage.setdefault(stage, []).append(equipment)
+        for members in members_by_stage.values():
+            members = sorted(set(members), key=lambda e: e.name)
+            pairs.update((a, b) for i, a in enumerate(members) for b in members[i + 1:])
+        analysis_logger.info(f"Derived parallel equipment from {len(members_by_stage)} ParallelStage individuals")
+    if onto["isParallelWith"] is not None:
+        for a, b in onto.isParallelWith.get_relations():
+            if a is not b:
+                pairs.add((a, b) if a.name <= b.name else (b, a))
+    return sorted(pairs, key=lambda pair: (pair[0].name, pair[1].name))
+
 def generate_equipment_sequence_report(onto: Ontology) -> str:
     """
     Generates a report of equipment sequences for all lines in the ontology.
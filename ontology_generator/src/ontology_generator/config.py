@@ -26,6 +26,26 @@ DEFAULT_EVENT_LINKING_BUFFER_MINUTES = 5
 # Used for temporal matching when end times are not available in the source data
 DEFAULT_EVENT_DURATION_HOURS = 2
 
+# AE/OEE Rollup Configuration
+# EventRecord metric properties summed per (line, equipment, shift, production date, state, reason)
+AE_ROLLUP_METRIC_PROPERTIES = [
+    "downtimeMinutes", "runTimeMinutes", "effectiveRuntimeMinutes",
+    "goodProductionQuantity", "rejectProductionQuantity", "allMaintenanceTimeMinutes",
+    "plantAvailableTimeMinutes", "productionAvailableTimeMinutes",
+]
+# Raw data column holding the production day; the event start date is used when it is missing
+AE_ROLLUP_DATE_COLUMN = "PRODUCTIONDATE_DAY_LOC"
+
+# Read-time row filters (--plant, --line, --from/--to)
+# Raw data columns the filters compare; dates compare on the leading YYYY-MM-DD of the value
+FILTER_PLANT_COLUMN = "PLANT"
+FILTER_LINE_COLUMN = "LINE_NAME"
+FILTER_DATE_COLUMNS = ["PRODUCTIONDATE_DAY_LOC", "JOB_START_TIME_LOC", "SHIFT_START_DATE_LOC"]
+
+# Columnar (Parquet/Arrow) input reads only the specification's columns and these,
+# which the population code reads by name without a mapping
+COLUMNAR_EXTRA_COLUMNS = ["EVENT_TYPE", "EQUIPMENT_TYPE"]
+
 # -----------------------------------------------------------------------------
 # SPECIFICATION COLUMN NAMES
 # -----------------------------------------------------------------------------
@@ -78,14 +98,13 @@ class MessageFilter(logging.Filter):
     """
     def __init__(self, suppressed_messages):
         super().__init__()
+        from ontology_generator.utils.logging import MessageMatcher # Imported here: utils.logging imports config
         self.suppressed_messages = suppressed_messages
+        self.matcher = MessageMatcher(suppressed_messages)
         
     def filter(self, record):
         # Return False to suppress the message
-        for msg in self.suppressed_messages:
-            if msg in record.getMessage():
-                return False
-        return True
+        return self.matcher.match(record.getMessage()) is None
 
 def setup_logging_filters():
     """
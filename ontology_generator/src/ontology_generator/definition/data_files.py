@@ -0,0 +1,144 @@
+"""
+Data file input module for the ontology generator.
+
+Extracts often arrive as several CSV parts, compressed with gzip or zstd. This
+module resolves a data path (a file, a directory or a glob pattern) to its
+parts and reads them without decompressing to disk:
+
+- resolve_data_files() lists the parts in sorted order, so the rows always
+  come in the same order.
+- read_data_files() decompresses and decodes the parts in a process pool (one
+  task per part) and returns their records in part order, after checking that
+  every part has the same header as the first one.
+
+Each part is read as UTF-8 with an optional byte-order mark, like a single data
+file. A RowFilter is applied inside the workers, so skipped rows are never sent
+back to the parent process.
+"""
+import csv
+import glob
+import gzip
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, List, Optional, Sequence, TextIO, Tuple
+
+from ontology_generator.export.ntriples import compression_for_path
+from ontology_generator.utils.logging import logger
+
+# File patterns read from a data directory
+DATA_FILE_PATTERNS = ["*.csv", "*.csv.gz", "*.csv.gzip", "*.csv.zst", "*.csv.zstd"]
+
+# (header, records, rows kept, {criterion: rows skipped}) of one part
+PartResult = Tuple[List[str], List[List[str]], int, dict]
+
+def _has_glob_pattern(path: str) -> bool:
+    return any(char in path for char in "*?[")
+
+def resolve_data_files(data_path: str) -> List[str]:
+    """
+    List the data files a data path refers to.
+
+    Args:
+        data_path: A file, a directory (its *.csv[.gz|.zst] files) or a glob pattern
+
+    Returns:
+        Sorted list of file paths; a plain file path is returned as is, even if it does not exist
+
+    Raises:
+        FileNotFoundError: If a directory or pattern matches no data files
+    """
+    if os.path.isdir(data_path):
+        paths = sorted({path for pattern in DATA_FILE_PATTERNS for path in glob.glob(os.path.join(data_path, pattern))})
+    elif _has_glob_pattern(data_path) and not os.path.exists(data_path):
+        paths = sorted(path for path in glob.glob(data_path) if os.path.isfile(path))
+    else:
+        return [data_path]
+    if not paths:
+        raise FileNotFoundError(f"No data files found for '{data_path}'")
+    return paths
+
+def open_data_file(path: str) -> TextIO:
+    """
+    Open a data file for CSV reading, decompressing gzip (.gz) or zstd (.zst) on the fly.
+
+    zstd requires the optional zstandard package.
+
+    Args:
+        path: The data file
+
+    Returns:
+        A text stream (UTF-8, byte-order mark removed, newline='' for the csv module)
+    """
+    compression = compression_for_path(path)
+    if compression is None:
+        return open(path, mode='r', encoding='utf-8-sig', newline='')
+    if compression == "gzip":
+        return io.TextIOWrapper(gzip.open(path, "rb"), encoding='utf-8-sig', newline='')
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("Reading zstd-compressed data requires the 'zstandard' package (pip install zstandard)")
+    raw = open(path, "rb")
+    return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True), encoding='utf-8-sig', newline='')
+
+def read_data_part(path: str, row_filter: Optional[Any] = None) -> PartResult:
+    """
+    Read the records of one data file (runs in a worker process).
+
+    Args:
+        path: The data file
+        row_filter: Optional RowFilter; a copy counts this part's kept and skipped rows
+
+    Returns:
+        (header, records, rows kept, {criterion: rows skipped}); blank lines are dropped
+    """
+    part_filter = row_filter.copy() if row_filter is not None else None
+    with open_data_file(path) as infile:
+        records = csv.reader(infile)
+        header = next(records, None) or []
+        if part_filter is not None:
+            keep = part_filter.bind(header)
+            rows = [values for values in records if values and keep(values)]
+            return header, rows, part_filter.kept, part_filter.skipped
+        rows = [values for values in records if values]
+        return header, rows, len(rows), {}
+
+def read_data_files(paths: Sequence[str], row_filter: Optional[Any] = None,
+                    workers: Optional[int] = None) -> Tuple[List[str], List[List[str]]]:
+    """
+    Read several data files in parallel, in the given order.
+
+    Args:
+        paths: The data files (e.g. from resolve_data_files)
+        row_filter: Optional RowFilter; its counts are updated with the totals of all parts
+        workers: Worker processes (default: one per part, at most the CPU count; 1 reads in-process)
+
+    Returns:
+        (header, records of all parts in order)
+
+    Raises:
+        ValueError: If a part's header differs from the first part's
+    """
+    workers = min(len(paths), workers or os.cpu_count() or 1)
+    if workers > 1:
+        logger.info(f"Reading {len(paths)} data files with {workers} worker processes.")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(read_data_part, paths, repeat(row_filter)))
+    else:
+        parts = [read_data_part(path, row_filter) for path in paths]
+
+    header = parts[0][0] if parts else []
+    records: List[List[str]] = []
+    for path, (part_header, part_records, kept, skipped) in zip(paths, parts):
+        if part_header != header:
+            missing = [column for column in header if column not in part_header]
+            extra = [column for column in part_header if column not in header]
+            raise ValueError(f"Header of data file '{path}' differs from '{paths[0]}' "
+                             f"(missing: {missing}, extra: {extra}, same columns in another order: {not missing and not extra})")
+        records.extend(part_records)
+        if row_filter is not None:
+            row_filter.add_counts(kept, skipped)
+        logger.debug("Read %s rows from %s.", len(part_records), path)
+    return header, records
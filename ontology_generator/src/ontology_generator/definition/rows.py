@@ -0,0 +1,204 @@
+"""
+Compact data row module for the ontology generator.
+
+A data row used to be a dict of ~90 column names to strings, with a new string
+object for every field of every row, although columns such as PLANT,
+LINE_NAME, SHIFT_NAME or UTIL_STATE_DESCRIPTION repeat a handful of values.
+read_data() now returns Row objects instead:
+
+- RowSchema: the column name -> position map, shared by all rows of a file.
+- Row: a mapping over a tuple of values and the shared schema (no per-row
+  dict). It supports the dict operations the population code uses (get, [],
+  in, keys/items/values, assignment of new keys such as row_num) and compares
+  equal to the dict with the same items.
+- compact_rows(): builds the rows of a file, interning the values of the
+  low-cardinality columns so that rows share one object per distinct value.
+"""
+import gc
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Sequence
+
+class _Missing:
+    """Marks a position that has no value in a row (deleted, or a key added to the schema by another row)."""
+    __slots__ = ()
+
+    def __reduce__(self):
+        return "_MISSING" # Pickled by reference, so unpickled rows keep the same marker
+
+_MISSING = _Missing()
+
+# Records interned between checks for columns with mostly distinct values
+INTERN_CHUNK_ROWS = 4096
+
+class RowSchema:
+    """
+    Column name -> value position map shared by the rows of one data file.
+
+    Keys set on a row that are not columns (e.g. row_num) are appended to the
+    schema; rows that never set them simply have no value at that position.
+
+    Attributes:
+        index: {key: position}, in column order
+        width: Number of positions
+    """
+    __slots__ = ("index", "width")
+
+    def __init__(self, columns: Iterable[Hashable]):
+        self.index: Dict[Hashable, int] = {}
+        self.width = 0
+        for column in columns:
+            # A repeated column name keeps its first place and its last value, as in csv.DictReader
+            self.index[column] = self.width
+            self.width += 1
+
+    def position(self, key: Hashable) -> int:
+        """The position of a key, appending it to the schema if it is new."""
+        index = self.index.get(key)
+        if index is None:
+            index = self.index[key] = self.width
+            self.width += 1
+        return index
+
+class Row(MutableMapping):
+    """
+    A data row: a mapping of column name to value, stored as a tuple of values
+    and a RowSchema shared with the other rows of the file.
+
+    The values tuple is turned into a list the first time the row is changed.
+    """
+    __slots__ = ("_schema", "_values")
+
+    def __init__(self, schema: RowSchema, values: Sequence[Any]):
+        self._schema = schema
+        self._values = values
+
+    def __getitem__(self, key):
+        index = self._schema.index.get(key)
+        if index is not None and index < len(self._values):
+            value = self._values[index]
+            if value is not _MISSING:
+                return value
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        index = self._schema.index.get(key)
+        if index is None or index >= len(self._values):
+            return default
+        value = self._values[index]
+        return default if value is _MISSING else value
+
+    def __contains__(self, key) -> bool:
+        index = self._schema.index.get(key)
+        return index is not None and index < len(self._values) and self._values[index] is not _MISSING
+
+    def __setitem__(self, key, value) -> None:
+        index = self._schema.position(key)
+        values = self._values
+        if not isinstance(values, list):
+            values = self._values = list(values)
+        if index >= len(values):
+            values.extend([_MISSING] * (index + 1 - len(values)))
+        values[index] = value
+
+    def __delitem__(self, key) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self[key] = _MISSING
+
+    def __iter__(self) -> Iterator:
+        values = self._values
+        count = len(values)
+        for key, index in list(self._schema.index.items()):
+            if index < count and values[index] is not _MISSING:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def copy(self) -> "Row":
+        """A row with the same schema and its own values."""
+        return Row(self._schema, self._values if isinstance(self._values, tuple) else list(self._values))
+
+@contextmanager
+def _gc_paused():
+    """
+    Pause the cyclic garbage collector. Rows cannot form reference cycles, and
+    collections triggered while hundreds of thousands of them are created only
+    re-scan the rows built so far (they more than double the build time).
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+def compact_rows(header: Sequence[Hashable], records: Iterable[Sequence[Any]]) -> List[Row]:
+    """
+    Build the rows of a data file, with one shared object per distinct value of each column.
+
+    Each record is interned in C (map over the columns' dict.setdefault), so
+    this costs little more than building dicts. Records are consumed in chunks
+    of INTERN_CHUNK_ROWS; after each chunk the caches of columns that hold
+    mostly distinct values (timestamps, durations) are cleared, so only
+    low-cardinality columns keep being interned across the whole file.
+
+    Records shorter than the header get None for the missing columns and longer
+    ones keep the extra fields as a list under the None key, as with csv.DictReader.
+
+    Args:
+        header: The column names
+        records: The field values of each row (any iterable, e.g. a csv.reader)
+
+    Returns:
+        List of Row, one per record, sharing one RowSchema
+    """
+    schema = RowSchema(header)
+    width = len(header)
+    caches: List[Dict[Any, Any]] = [{} for _ in range(width)]
+    setdefault = dict.setdefault
+    rows: List[Row] = []
+    records = iter(records)
+    with _gc_paused():
+        while True:
+            chunk = list(islice(records, INTERN_CHUNK_ROWS))
+            if not chunk:
+                break
+            rows.extend([Row(schema, tuple(map(setdefault, caches, values, values))) if len(values) == width
+                         else Row(schema, _ragged_values(schema, caches, values, width))
+                         for values in chunk])
+            for cache in caches:
+                if len(cache) > INTERN_CHUNK_ROWS // 2:
+                    cache.clear()
+    return rows
+
+def _ragged_values(schema: RowSchema, caches: List[Dict[Any, Any]], values: Sequence[Any], width: int) -> tuple:
+    fitted = list(map(dict.setdefault, caches, values, values))
+    if len(values) < width:
+        fitted.extend([None] * (width - len(values)))
+    else:
+        index = schema.position(None)
+        fitted.extend([_MISSING] * (index - width))
+        fitted.append(list(values[width:]))
+    return tuple(fitted)
+
+def rows_from_columns(names: Sequence[Hashable], columns: List[List[Any]]) -> List[Row]:
+    """
+    Build rows from column value lists (e.g. a columnar file), sharing one RowSchema.
+
+    Args:
+        names: The column names
+        columns: The values of each column, all of the same length
+
+    Returns:
+        List of Row
+    """
+    schema = RowSchema(names)
+    with _gc_paused():
+        return [Row(schema, values) for values in zip(*columns)]
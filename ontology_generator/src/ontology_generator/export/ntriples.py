@@ -0,0 +1,269 @@
+"""
+Streaming N-Triples / N-Quads export module for the ontology generator.
+
+This module writes an ontology straight from the owlready2 quadstore to an
+N-Triples or N-Quads file. Triples are read with a cursor in subject-IRI order
+and written one subject block at a time, optionally through gzip or zstd
+compression, so memory stays flat regardless of ontology size.
+
+The output is byte-for-byte reproducible for the same quadstore content: lines
+are ordered by subject IRI and then by their text, blank nodes are labelled in
+order of first use, and compressed streams carry no timestamps or file names.
+"""
+import gzip
+import io
+import os
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from owlready2 import Ontology
+
+from ontology_generator.utils.logging import main_logger
+from ontology_generator.utils import quadstore
+
+EXPORT_FORMATS = ['ntriples', 'nquads']
+COMPRESSIONS = ['gzip', 'zstd']
+
+# Rows fetched from the quadstore per round trip
+DEFAULT_BATCH_SIZE = 50000
+
+# owlready2's quads view puts objs first, so its o column gets INTEGER affinity and
+# numeric-looking literals ("143.0") come back converted; list datas first instead
+_TRIPLES_SQL = "SELECT c, s, p, o, d FROM datas UNION ALL SELECT c, s, p, o, NULL FROM objs"
+
+_EXTENSION_COMPRESSION = {'.gz': 'gzip', '.gzip': 'gzip', '.zst': 'zstd', '.zstd': 'zstd'}
+
+def compression_for_path(path: str) -> Optional[str]:
+    """Return the compression implied by a file extension ('.gz', '.zst'), if any."""
+    return _EXTENSION_COMPRESSION.get(os.path.splitext(path)[1].lower())
+
+def open_compressed_output(path: str, compression: Optional[str] = None) -> BinaryIO:
+    """
+    Open a binary output stream, compressing on the fly.
+
+    gzip streams are written with mtime 0 and no embedded file name so identical
+    content gives identical bytes. zstd requires the optional zstandard package.
+
+    Args:
+        path: Output file path
+        compression: None, 'gzip' or 'zstd'
+
+    Returns:
+        A writable binary file object; closing it closes the underlying file
+    """
+    if compression is None:
+        return open(path, "wb")
+    if compression == "gzip":
+        raw = open(path, "wb")
+        return _ClosingWrapper(gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0), raw)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd compression requires the 'zstandard' package (pip install zstandard)")
+        raw = open(path, "wb")
+        return zstandard.ZstdCompressor(write_checksum=True).stream_writer(raw, closefd=True)
+    raise ValueError(f"Unknown compression '{compression}'. Expected one of {COMPRESSIONS}.")
+
+class _ClosingWrapper(io.RawIOBase):
+    """Writes to a compressor and closes both the compressor and the raw file."""
+    def __init__(self, compressor, raw):
+        self._compressor = compressor
+        self._raw = raw
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        return self._compressor.write(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._compressor.close()
+            self._raw.close()
+        super().close()
+
+def _escape_literal(value) -> str:
+    """Escape a literal the same way owlready2's N-Triples serializer does."""
+    if isinstance(value, str):
+        return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return str(value)
+
+class NTriplesStreamWriter:
+    """
+    Writes the triples of one ontology as N-Triples or N-Quads.
+
+    Attributes:
+        onto: The ontology being exported
+        format: 'ntriples' or 'nquads'
+        triples_written: Number of lines written so far
+    """
+    def __init__(self, onto: Ontology, stream: BinaryIO, format: str = "ntriples", batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Initialize the writer.
+
+        Args:
+            onto: The ontology to export (only its own triples are written, as with onto.save)
+            stream: Binary output stream
+            format: 'ntriples' or 'nquads'
+            batch_size: Rows fetched from the quadstore per round trip
+        """
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{format}'. Expected one of {EXPORT_FORMATS}.")
+        self.onto = onto
+        self.world = onto.world
+        self.format = format
+        self.batch_size = batch_size
+        self.triples_written = 0
+        self._stream = stream
+        self._c = onto.graph.c
+        self._iri_cache: Dict[int, str] = {}
+        self._blank_labels: Dict[int, str] = {}
+        self._graph_suffix = ""
+        if format == "nquads":
+            graph_iri = quadstore.fetch_column(self.world, "SELECT iri FROM ontologies WHERE c = ?", (self._c,))[0]
+            self._graph_suffix = f" <{graph_iri}>"
+
+    def _iri(self, storid: int) -> str:
+        iri = self._iri_cache.get(storid)
+        if iri is None:
+            if len(self._iri_cache) > 100000:
+                self._iri_cache.clear()
+            iri = self._iri_cache[storid] = self.world._unabbreviate(storid)
+        return iri
+
+    def _object_term(self, o, d) -> str:
+        if d is None:
+            return f"<{self._iri(o)}>"
+        literal = _escape_literal(o)
+        if isinstance(d, str) and d.startswith("@"):
+            return f'"{literal}"{d}'
+        if d == 0:
+            return f'"{literal}"'
+        return f'"{literal}"^^<{self._iri(d)}>'
+
+    def _blank_rows(self, storid: int) -> List[Tuple[int, object, object]]:
+        return quadstore.fetch_all(self.world, f"SELECT p, o, d FROM ({_TRIPLES_SQL}) WHERE c = ? AND s = ?", (self._c, storid))
+
+    def _signature(self, storid: int, seen: Tuple[int, ...] = ()) -> str:
+        """Canonical text of a blank node's content, used to order blank nodes deterministically."""
+        if storid in seen:
+            return "_:"
+        parts = []
+        for p, o, d in self._blank_rows(storid):
+            obj = f"[{self._signature(o, seen + (storid,))}]" if d is None and o < 0 else self._object_term(o, d)
+            parts.append(f"<{self._iri(p)}> {obj}")
+        return " ; ".join(sorted(parts))
+
+    def _label(self, storid: int) -> str:
+        label = self._blank_labels.get(storid)
+        if label is None:
+            label = self._blank_labels[storid] = f"_:b{len(self._blank_labels)}"
+        return label
+
+    def _subject_block(self, subject: str, rows) -> List[str]:
+        """
+        Render one subject's triples, followed by the blank nodes it references.
+
+        Rows are sorted by their text; blank node objects sort by their content
+        and are labelled in that order, then written depth-first after the block.
+        """
+        keyed = []
+        for p, o, d in rows:
+            predicate = f"<{self._iri(p)}>"
+            if d is None and o < 0:
+                keyed.append((f"{predicate} [{self._signature(o)}]", predicate, o))
+            else:
+                keyed.append((f"{predicate} {self._object_term(o, d)}", None, None))
+        keyed.sort(key=lambda item: item[0])
+
+        lines, children = [], []
+        for text, predicate, blank in keyed:
+            if blank is None:
+                lines.append(f"{subject} {text}{self._graph_suffix} .\n")
+            else:
+                new_blank = blank not in self._blank_labels
+                lines.append(f"{subject} {predicate} {self._label(blank)}{self._graph_suffix} .\n")
+                if new_blank:
+                    children.append(blank)
+        for blank in children:
+            lines.extend(self._subject_block(self._label(blank), self._blank_rows(blank)))
+        return lines
+
+    def _write_lines(self, lines: List[str]) -> None:
+        self._stream.write("".join(lines).encode("utf8"))
+        self.triples_written += len(lines)
+
+    def write_ontology(self) -> int:
+        """
+        Stream every triple of the ontology.
+
+        Named subjects are read in IRI order; blank nodes are written after the
+        first subject referencing them, and unreferenced blank nodes (e.g. class
+        axioms) last, ordered by content.
+
+        Returns:
+            int: Number of triples written
+        """
+        cursor = quadstore.execute(self.world, f"""
+            SELECT r.iri, q.s, q.p, q.o, q.d FROM ({_TRIPLES_SQL}) q JOIN resources r ON r.storid = q.s
+            WHERE q.c = ? AND q.s > 0
+            ORDER BY r.iri
+        """, (self._c,))
+
+        current_iri, current_rows = None, []
+        while True:
+            batch = cursor.fetchmany(self.batch_size)
+            if not batch:
+                break
+            out: List[str] = []
+            for iri, s, p, o, d in batch:
+                if iri != current_iri:
+                    if current_rows:
+                        out.extend(self._subject_block(f"<{current_iri}>", current_rows))
+                    current_iri, current_rows = iri, []
+                current_rows.append((p, o, d))
+            self._write_lines(out)
+        if current_rows:
+            self._write_lines(self._subject_block(f"<{current_iri}>", current_rows))
+
+        # Blank nodes no named subject points to
+        orphans = [
+            s for s in quadstore.fetch_column(self.world, f"SELECT DISTINCT s FROM ({_TRIPLES_SQL}) WHERE c = ? AND s < 0", (self._c,))
+            if s not in self._blank_labels
+        ]
+        referenced = set(quadstore.fetch_column(
+            self.world, "SELECT DISTINCT o FROM objs WHERE c = ? AND s < 0 AND o < 0", (self._c,)
+        ))
+        roots = sorted((s for s in orphans if s not in referenced), key=lambda s: (self._signature(s), s))
+        for blank in roots:
+            if blank not in self._blank_labels:
+                self._write_lines(self._subject_block(self._label(blank), self._blank_rows(blank)))
+        for blank in orphans: # Cycles made only of blank nodes
+            if blank not in self._blank_labels:
+                self._write_lines(self._subject_block(self._label(blank), self._blank_rows(blank)))
+        return self.triples_written
+
+def stream_ontology(onto: Ontology,
+                    path: str,
+                    format: str = "ntriples",
+                    compression: Optional[str] = None,
+                    batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """
+    Write an ontology to an N-Triples/N-Quads file without building it in memory.
+
+    Args:
+        onto: The ontology to export
+        path: Output file path
+        format: 'ntriples' or 'nquads'
+        compression: None, 'gzip' or 'zstd' (defaults to the one implied by the extension)
+        batch_size: Rows fetched from the quadstore per round trip
+
+    Returns:
+        int: Number of triples written
+    """
+    compression = compression or compression_for_path(path)
+    with open_compressed_output(path, compression) as stream:
+        writer = NTriplesStreamWriter(onto, stream, format, batch_size)
+        count = writer.write_ontology()
+    main_logger.info(f"Streamed {count} triples to {path} ({format}{', ' + compression if compression else ''}).")
+    return count
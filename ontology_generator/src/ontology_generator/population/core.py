@@ -5,6 +5,7 @@ This module provides the base functionality for ontology population, including t
 PopulationContext class and property application functions.
 """
 from typing import Dict, Any, Optional, List, Set, Tuple, Union, Callable
+from collections import Counter
 import logging
 import pandas as pd
 
@@ -14,11 +15,18 @@ from owlready2 import (
 )
 
 from ontology_generator.utils.logging import pop_logger
+from ontology_generator.utils.metrics import metrics
 from ontology_generator.config import XSD_TYPE_MAP
 from ontology_generator.utils.types import safe_cast, sanitize_name
 
 # Type Alias for registry used in linking
 IndividualRegistry = Dict[Tuple[str, str], Thing] # Key: (entity_type_str, unique_id_str), Value: Individual Object
+# Type Alias for the equipment placement index emitted during Pass 1
+EquipmentLineIndex = Dict[Thing, Dict[Thing, Tuple[str, Optional[int], str]]] # Key: line individual, Value: {equipment individual: (equipment_class_id, sequence_position, equipment_id)}
+# Type Alias for one event and the individuals created with it in the same row
+EventFact = Dict[str, Thing] # Key: entity_type_str (EventRecord, TimeInterval, Shift, ...), Value: Individual Object
+# Type Alias for the resolved targets of column-based links
+ColumnLinks = Dict[str, Dict[str, List[Optional[Thing]]]] # Key: entity_type_str, Value: {prop_name: target individual per data row}
 
 class PopulationContext:
     """
@@ -56,6 +64,12 @@ class PopulationContext:
         self._property_usage_count = {prop_name: 0 for prop_name in defined_properties}
         self._property_misses = set()  # Track property names that were requested but not found
         self._individual_data_cache = {}  # Cache for storing data associated with individuals
+        self.equipment_line_index: EquipmentLineIndex = {}  # Line -> equipment placements, consumed by sequence setup
+        self.collect_event_facts = False  # Keep event_facts (set for the fact-table export)
+        self.event_facts: List[EventFact] = []  # One entry per EventRecord when collect_event_facts, consumed by the fact-table export
+        self._time_index = None  # TimeRangeIndex over the events, built on first use
+        self.ae_rollups = None  # AERollupAccumulator fed by record_event_fact, see start_ae_rollups
+        self.quarantine = None  # QuarantineWriter receiving rejected rows, see reject_row
 
     def get_class(self, name: str) -> Optional[ThingClass]:
         """
@@ -164,6 +178,104 @@ class PopulationContext:
             return self._individual_data_cache.get(individual.name)
         return None
     
+    def record_equipment_placement(self,
+                                   line_ind: Thing,
+                                   equipment_ind: Thing,
+                                   equipment_class_id: str,
+                                   sequence_position: Optional[int],
+                                   equipment_id: str) -> None:
+        """
+        Record which line and class an equipment individual belongs to.
+        
+        Pass 1 already knows these facts when it links an Equipment to its
+        ProductionLine, so recording them here lets sequence setup group
+        equipment without searching the ontology or re-reading properties.
+        Repeated rows for the same equipment overwrite the earlier entry.
+        
+        Args:
+            line_ind: The ProductionLine individual
+            equipment_ind: The Equipment individual
+            equipment_class_id: The equipmentClassId of the equipment's class
+            sequence_position: The sequencePosition assigned in Pass 1 (or None)
+            equipment_id: The equipmentId used for stable sorting
+        """
+        if line_ind is None or equipment_ind is None:
+            return
+        self.equipment_line_index.setdefault(line_ind, {})[equipment_ind] = (
+            equipment_class_id, sequence_position, equipment_id
+        )
+    
+    def start_ae_rollups(self, property_mappings: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+        """
+        Start accumulating AE/OEE rollups for the events recorded from now on.
+
+        Args:
+            property_mappings: The parsed property mappings (locate the metric columns)
+        """
+        from ontology_generator.population.rollups import AERollupAccumulator
+        self.ae_rollups = AERollupAccumulator(property_mappings)
+        pop_logger.debug("Accumulating AE rollups for metrics: %s", self.ae_rollups.metrics)
+
+    def record_event_fact(self, row_individuals: Dict[str, Thing], row: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record an event together with the individuals created for it in Pass 1.
+
+        The fact-table export reads events from these records instead of
+        querying the ontology for EventRecords and following their links; they
+        are kept only when collect_event_facts is set, as they cost memory per
+        event. When AE rollups are enabled, the row's metrics are added to its
+        rollup group.
+
+        Args:
+            row_individuals: Individuals created/found for one data row, keyed by entity type
+            row: The raw data row (needed for AE rollups)
+        """
+        if row_individuals.get("EventRecord") is None:
+            return
+        if self.collect_event_facts:
+            self.event_facts.append(dict(row_individuals))
+        self._time_index = None
+        if self.ae_rollups is not None and row is not None:
+            self.ae_rollups.add(row_individuals, row)
+
+    def reject_row(self, row: Dict[str, Any], row_num: int, phase: str, reason: str, detail: str = "") -> None:
+        """
+        Record a row that failed population.
+
+        The rejection is counted per phase and reason code and, when a quarantine
+        file is attached (self.quarantine), the row is queued for it.
+
+        Args:
+            row: The raw data row
+            row_num: Line number of the row in the input file
+            phase: Population phase that rejected the row ('pass1', 'dimensions', 'pass2')
+            reason: Reason code (see utils.quarantine.QUARANTINE_REASONS)
+            detail: Free-text detail, e.g. the exception message
+        """
+        metrics.inc("rows_rejected_total", phase=phase, reason=reason)
+        if self.quarantine is not None:
+            self.quarantine.add(row, row_num, phase, reason, detail)
+
+    def get_time_index(self):
+        """
+        Get the time-range index over the events recorded so far.
+
+        The index is built once, from event_facts when they are collected and
+        from the ontology otherwise, and rebuilt only after new events are
+        recorded.
+
+        Returns:
+            TimeRangeIndex: Event intervals per resource and production line
+        """
+        if self._time_index is None:
+            from ontology_generator.analysis.time_index import TimeRangeIndex
+            if self.collect_event_facts:
+                self._time_index = TimeRangeIndex.from_event_facts(self.event_facts)
+            else:
+                self._time_index = TimeRangeIndex.from_ontology(self.onto.world, self.onto)
+            pop_logger.debug("Built time-range index over %s events", len(self._time_index))
+        return self._time_index
+
     # TKT-002: New diagnostic method to report property usage statistics
     def report_property_usage(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -208,13 +320,13 @@ class PopulationContext:
         report = self.report_property_usage()
         
         pop_logger.info("TKT-002: Property Usage Report")
-        pop_logger.info(f"  Total properties defined: {report['total_properties']}")
-        pop_logger.info(f"  Properties accessed: {report['total_accessed']}/{report['total_properties']} ({report['total_accessed']/report['total_properties']*100:.1f}%)")
-        pop_logger.info(f"  Properties used (set on individuals): {report['total_used']}/{report['total_properties']} ({report['total_used']/report['total_properties']*100:.1f}%)")
+        pop_logger.info("  Total properties defined: %s", report['total_properties'])
+        pop_logger.info("  Properties accessed: %s/%s (%.1f%%)", report['total_accessed'], report['total_properties'], report['total_accessed']/report['total_properties']*100)
+        pop_logger.info("  Properties used (set on individuals): %s/%s (%.1f%%)", report['total_used'], report['total_properties'], report['total_used']/report['total_properties']*100)
         
         if report['unused_count'] > 0:
-            pop_logger.info(f"  Unused properties: {report['unused_count']} properties were never used")
-            pop_logger.debug(f"  Unused property names: {', '.join(sorted(report['unused_properties'][:20]))}{' ...' if len(report['unused_properties']) > 20 else ''}")
+            pop_logger.info("  Unused properties: %s properties were never used", report['unused_count'])
+            pop_logger.debug("  Unused property names: %s%s", ', '.join(sorted(report['unused_properties'][:20])), ' ...' if len(report['unused_properties']) > 20 else '')
         
         if report['accessed_but_unused']:
             pop_logger.warning(f"  TKT-002: {len(report['accessed_but_unused'])} properties were accessed but never successfully used: {', '.join(sorted(report['accessed_but_unused']))}")
@@ -222,7 +334,7 @@ class PopulationContext:
         if report['property_misses']:
             pop_logger.warning(f"  TKT-002: {len(report['property_misses'])} undefined properties were requested: {', '.join(sorted(report['property_misses']))}")
         
-        pop_logger.info(f"  Most used properties: {', '.join([f'{name} ({count})' for name, count in report['most_used'][:5]])}")
+        pop_logger.info("  Most used properties: %s", ', '.join([f'{name} ({count})' for name, count in report['most_used'][:5]]))
 
 
 def _set_property_value(individual: Thing, prop: PropertyClass, value: Any, is_functional: bool, context: Optional[PopulationContext] = None) -> None:
@@ -252,7 +364,7 @@ def _set_property_value(individual: Thing, prop: PropertyClass, value: Any, is_f
             # Simple direct comparison works for primitives and owlready individuals/locstr
             if current_value != value:
                 setattr(individual, prop_name, value)
-                pop_logger.debug(f"Set functional property {individual.name}.{prop.name} = {repr(value)}")
+                pop_logger.debug("Set functional property %s.%s = %r", individual.name, prop.name, value)
                 value_was_set = True
         else:
             # Non-Functional: Use append, check if value already exists.
@@ -266,7 +378,7 @@ def _set_property_value(individual: Thing, prop: PropertyClass, value: Any, is_f
             # Check if value already exists to avoid duplicates
             if value not in current_values:
                 current_values.append(value)
-                pop_logger.debug(f"Appended non-functional property {individual.name}.{prop.name} = {repr(value)}")
+                pop_logger.debug("Appended non-functional property %s.%s = %r", individual.name, prop.name, value)
                 value_was_set = True
 
         # TKT-009: Fix - Track usage count only if we actually changed something
@@ -296,21 +408,22 @@ def set_prop_if_col_exists(
     # Column exists but might be empty/None/NaN
     raw_value = row.get(col_name)
     if pd.isna(raw_value) or raw_value == '' or raw_value is None:
-        logger.debug(f"Column '{col_name}' exists but has null/empty value for property '{prop_name}' on individual '{individual.name}'")
+        logger.debug("Column '%s' exists but has null/empty value for property '%s' on individual '%s'", col_name, prop_name, individual.name)
         return False
 
     # Cast value to target type
     value = cast_func(raw_value, target_type)
     if value is None:  # Cast failed
+        metrics.inc("cast_failures_total", column=col_name, type=target_type.__name__)
         logger.warning(f"Failed to cast value '{raw_value}' from column '{col_name}' to type {target_type.__name__} for property '{prop_name}' on individual '{individual.name}'")
         return False
 
     # Set the property
     context.set_prop(individual, prop_name, value)
     
-    # TKT-004: Add specific success logging for equipmentModel property
+    # TKT-004: Add specific debug logging for equipmentModel property (per row)
     if prop_name == 'equipmentModel':
-        logger.info(f"TKT-004: Successfully set equipmentModel = '{value}' (from column {col_name}) on {individual.name}")
+        logger.debug("TKT-004: Successfully set equipmentModel = '%s' (from column %s) on %s", value, col_name, individual.name)
     
     # TKT-006: Add specific debug logging for AE model metrics
     ae_metrics = [
@@ -323,7 +436,7 @@ def set_prop_if_col_exists(
     ]
     
     if prop_name in ae_metrics:
-        logger.debug(f"TKT-006: Successfully set AE model metric {prop_name} from column {col_name} on {individual.name}")
+        logger.debug("TKT-006: Successfully set AE model metric %s from column %s on %s", prop_name, col_name, individual.name)
     
     return True
 
@@ -382,7 +495,8 @@ def get_or_create_individual(
     # Check registry first
     if registry_key in registry:
         existing_individual = registry[registry_key]
-        pop_logger.debug(f"Found existing individual '{existing_individual.name}' (Key: {registry_key}) in registry.")
+        metrics.inc("get_or_create_total", result="hit")
+        pop_logger.debug("Found existing individual '%s' (Key: %s) in registry.", existing_individual.name, registry_key)
         # Add labels if found and labels provided
         if add_labels:
             for label in add_labels:
@@ -406,8 +520,9 @@ def get_or_create_individual(
         if existing_by_iri and isinstance(existing_by_iri, onto_class):
             # TKT-003: Add the individual to the registry and return it
             # This handles cases where individuals were created outside the registry
-            pop_logger.debug(f"TKT-003: Individual with name '{individual_name}' already exists in ontology but not registry (Key: {registry_key}). Adding to registry and returning existing one.")
+            pop_logger.debug("TKT-003: Individual with name '%s' already exists in ontology but not registry (Key: %s). Adding to registry and returning existing one.", individual_name, registry_key)
             registry[registry_key] = existing_by_iri
+            metrics.inc("get_or_create_total", result="ontology")
             
             # Add labels if provided
             if add_labels:
@@ -428,7 +543,7 @@ def get_or_create_individual(
             if double_check:
                 # Another thread/process created it while we were checking
                 if isinstance(double_check, onto_class):
-                    pop_logger.debug(f"TKT-003: Race condition - individual '{individual_name}' was created between checks. Adding to registry and returning.")
+                    pop_logger.debug("TKT-003: Race condition - individual '%s' was created between checks. Adding to registry and returning.", individual_name)
                     registry[registry_key] = double_check
                     
                     # Add labels if provided
@@ -444,7 +559,9 @@ def get_or_create_individual(
             
             # Create the new individual
             new_individual = onto_class(individual_name)
-            pop_logger.info(f"Created new individual '{individual_name}' (Class: {class_name_str}, Base: '{individual_name_base}')")
+            metrics.inc("get_or_create_total", result="created")
+            metrics.inc("individuals_created_total", owl_class=class_name_str)
+            pop_logger.info("Created new individual '%s' (Class: %s, Base: '%s')", individual_name, class_name_str, individual_name_base)
 
             # Add labels if provided
             if add_labels:
@@ -482,7 +599,7 @@ def apply_data_property_mappings(
         # These are programmatic/config properties like sequencePosition
         # that will be populated elsewhere (not from data rows)
         if 'column' not in details:
-            logger.debug(f"Skipping programmatic/config property {entity_name}.{prop_name} - no column specified in mapping")
+            logger.debug("Skipping programmatic/config property %s.%s - no column specified in mapping", entity_name, prop_name)
             continue
             
         col_name = details.get('column')
@@ -499,7 +616,7 @@ def apply_data_property_mappings(
         if prop_name == 'equipmentModel':
             if col_name in row:
                 raw_value = row.get(col_name)
-                logger.info(f"TKT-004: Found equipmentModel column '{col_name}' with value '{raw_value}' for {entity_name} {individual.name}")
+                logger.debug("TKT-004: Found equipmentModel column '%s' with value '%s' for %s %s", col_name, raw_value, entity_name, individual.name)
             else:
                 logger.warning(f"TKT-004: equipmentModel column '{col_name}' not found in row data for {entity_name} {individual.name}")
 
@@ -526,7 +643,7 @@ def apply_data_property_mappings(
         ]
         
         if prop_name in ae_metrics:
-            logger.debug(f"TKT-006: Successfully set AE model metric {prop_name} from column {col_name} on {individual.name}")
+            logger.debug("TKT-006: Successfully set AE model metric %s from column %s on %s", prop_name, col_name, individual.name)
 
 def apply_object_property_mappings(
     individual: Thing,
@@ -537,9 +654,16 @@ def apply_object_property_mappings(
     logger, # Pass logger explicitly
     linking_context: IndividualRegistry, # The GLOBAL registry of ALL individuals
     individuals_in_row: Dict[str, Thing], # Individuals created/found specifically for THIS row in Pass 1
-    exclude_structural: bool = False
+    exclude_structural: bool = False,
+    resolved_targets: Optional[Dict[str, Optional[Thing]]] = None # {prop_name: target} from resolve_column_links
 ) -> None:
-    """Applies ONLY object property mappings, using linking_context or individuals_in_row to find targets."""
+    """
+    Applies ONLY object property mappings, using linking_context or individuals_in_row to find targets.
+
+    Column-based links take their target from resolved_targets when the property is
+    in it (unresolved IDs were already summarized by resolve_column_links); otherwise
+    the column value is sanitized and looked up in linking_context.
+    """
     if not mappings or 'object_properties' not in mappings:
         return
 
@@ -555,7 +679,7 @@ def apply_object_property_mappings(
     for prop_name, details in obj_prop_mappings.items():
         # Skip structural properties if requested
         if exclude_structural and prop_name in structural_properties:
-            logger.debug(f"Skipping structural property {entity_name}.{prop_name} for post-processing")
+            logger.debug("Skipping structural property %s.%s for post-processing", entity_name, prop_name)
             continue
             
         target_class_name = details.get('target_class')
@@ -574,35 +698,42 @@ def apply_object_property_mappings(
         # Add debug for EventRecord.involvesResource specifically
         if entity_name == "EventRecord" and prop_name == "involvesResource":
             if hasattr(individual, "involvesResource") and individual.involvesResource:
-                logger.debug(f"EventRecord {individual.name} already has involvesResource set to {individual.involvesResource.name if hasattr(individual.involvesResource, 'name') else individual.involvesResource}")
+                logger.debug("EventRecord %s already has involvesResource set to %s", individual.name, individual.involvesResource.name if hasattr(individual.involvesResource, 'name') else individual.involvesResource)
                 # Skip this property if already set
                 continue
             else:
                 # If missing both column and target_link_context, skip with a more specific message
                 if not col_name and not link_context_key:
-                    logger.debug(f"Skipping {entity_name}.{prop_name} in Pass 2 since it's handled in Pass 1 directly and missing column/target_link_context")
+                    logger.debug("Skipping %s.%s in Pass 2 since it's handled in Pass 1 directly and missing column/target_link_context", entity_name, prop_name)
                     continue
 
         # Find the target individual
         target_individual: Optional[Thing] = None
         lookup_method = "None"
 
-        if col_name:
+        if col_name and resolved_targets is not None and prop_name in resolved_targets:
+            # --- Link via Column Lookup (resolved once per distinct value) ---
+            target_individual = resolved_targets[prop_name]
+            lookup_method = f"Column '{col_name}' (Resolved)"
+            if not target_individual:
+                continue
+
+        elif col_name:
             # --- Link via Column Lookup (using GLOBAL registry) ---
             target_base_id = safe_cast(row.get(col_name), str)
             lookup_method = f"Column '{col_name}' (Registry Lookup)"
             if not target_base_id:
-                logger.debug(f"Row {row.get('row_num', 'N/A')} - No target ID found in column '{col_name}' for link {entity_name}.{prop_name}. Skipping link.")
+                logger.debug("Row %s - No target ID found in column '%s' for link %s.%s. Skipping link.", row.get('row_num', 'N/A'), col_name, entity_name, prop_name)
                 continue
 
-            # Find target in the GLOBAL registry
-            registry_key = (target_class_name, target_base_id)
+            # Find target in the GLOBAL registry (keyed by the sanitized ID, as in get_or_create_individual)
+            registry_key = (target_class_name, sanitize_name(target_base_id))
             target_individual = linking_context.get(registry_key)
             if not target_individual:
                  logger.warning(f"Link target {target_class_name} with ID '{target_base_id}' (from {lookup_method}) not found in global registry for relation {entity_name}.{prop_name}. Skipping link for {individual.name}.")
                  continue
             else:
-                 logger.debug(f"Found link target {target_individual.name} for {entity_name}.{prop_name} via registry key {registry_key}.")
+                 logger.debug("Found link target %s for %s.%s via registry key %s.", target_individual.name, entity_name, prop_name, registry_key)
 
         elif link_context_key:
              # --- Link via Context Key (using CURRENT row's individuals) ---
@@ -613,10 +744,10 @@ def apply_object_property_mappings(
                  continue
 
              # Added for TKT-002: Extra debugging for ProductionLine context lookups
-             if entity_name == "Equipment" and prop_name == "isPartOfProductionLine":
-                 logger.debug(f"Row {row.get('row_num', 'N/A')} - Equipment.isPartOfProductionLine context lookup - Available keys in individuals_in_row: {list(individuals_in_row.keys())}")
+             if entity_name == "Equipment" and prop_name == "isPartOfProductionLine" and logger.isEnabledFor(logging.DEBUG):
+                 logger.debug("Row %s - Equipment.isPartOfProductionLine context lookup - Available keys in individuals_in_row: %s", row.get('row_num', 'N/A'), list(individuals_in_row.keys()))
                  if "EQUIPMENT_TYPE" in row:
-                     logger.debug(f"Row {row.get('row_num', 'N/A')} - EQUIPMENT_TYPE value in row: {row.get('EQUIPMENT_TYPE')}")
+                     logger.debug("Row %s - EQUIPMENT_TYPE value in row: %s", row.get('row_num', 'N/A'), row.get('EQUIPMENT_TYPE'))
 
              target_individual = individuals_in_row.get(link_context_key)
              if not target_individual:
@@ -627,7 +758,7 @@ def apply_object_property_mappings(
                      logger.warning(f"Context entity '{link_context_key}' required for {entity_name}.{prop_name} not found in individuals_in_row dictionary for row {row.get('row_num', 'N/A')}. Skipping link.")
                  continue
              else:
-                 logger.debug(f"Found link target {target_individual.name} for {entity_name}.{prop_name} via row context key '{link_context_key}'.")
+                 logger.debug("Found link target %s for %s.%s via row context key '%s'.", target_individual.name, entity_name, prop_name, link_context_key)
 
         else:
             # Should not happen if parser validation is correct
@@ -649,22 +780,73 @@ def apply_object_property_mappings(
             # Add specific debug for important links
             if entity_name == "EventRecord":
                 if prop_name == "involvesResource":
-                    logger.debug(f"Successfully linked EventRecord {individual.name} to resource {target_individual.name} via {prop_name}")
+                    logger.debug("Successfully linked EventRecord %s to resource %s via %s", individual.name, target_individual.name, prop_name)
                 # TKT-004: Add specific logging for event context relationships
                 elif prop_name == "duringShift":
-                    logger.info(f"Successfully linked EventRecord {individual.name} to Shift {target_individual.name} via context key '{link_context_key}'")
+                    logger.info("Successfully linked EventRecord %s to Shift %s via context key '%s'", individual.name, target_individual.name, link_context_key)
                 elif prop_name == "occursDuring":
-                    logger.info(f"Successfully linked EventRecord {individual.name} to TimeInterval {target_individual.name} via context key '{link_context_key}'")
+                    logger.info("Successfully linked EventRecord %s to TimeInterval %s via context key '%s'", individual.name, target_individual.name, link_context_key)
                 elif prop_name == "eventHasState":
-                    logger.info(f"Successfully linked EventRecord {individual.name} to OperationalState {target_individual.name} via context key '{link_context_key}'")
+                    logger.info("Successfully linked EventRecord %s to OperationalState %s via context key '%s'", individual.name, target_individual.name, link_context_key)
                 elif prop_name == "eventHasReason":
-                    logger.info(f"Successfully linked EventRecord {individual.name} to OperationalReason {target_individual.name} via context key '{link_context_key}'")
+                    logger.info("Successfully linked EventRecord %s to OperationalReason %s via context key '%s'", individual.name, target_individual.name, link_context_key)
             
             # Added for TKT-002: Track Equipment-Line links specifically
             if entity_name == "Equipment" and prop_name == "isPartOfProductionLine":
-                logger.info(f"Successfully linking Equipment {individual.name} to Line {target_individual.name} via context key '{link_context_key}'")
+                logger.info("Successfully linking Equipment %s to Line %s via context key '%s'", individual.name, target_individual.name, link_context_key)
 
     # logger.debug(f"Applied {links_applied_count} object property links for {entity_name} individual {individual.name}. Row {row.get('row_num', 'N/A')}.")
 
 
+def resolve_column_links(
+    data_rows: List[Dict[str, Any]],
+    property_mappings: Dict[str, Dict[str, Dict[str, Any]]],
+    registry: IndividualRegistry,
+    logger=pop_logger
+) -> ColumnLinks:
+    """
+    Resolves the targets of all column-based object property links in one join per mapping.
+
+    The distinct values of each link column are cast and sanitized once (as
+    get_or_create_individual sanitizes IDs) and looked up in the registry; every
+    row then takes its target from the resolved column. IDs not found are logged
+    once per mapping with their row counts instead of once per row.
+
+    Args:
+        data_rows: The data rows.
+        property_mappings: The parsed property mappings.
+        registry: The central registry of individuals created in Pass 1.
+        logger: Logger for the unresolved-ID summaries.
+
+    Returns:
+        {entity_type: {prop_name: target individual or None per data row}} for
+        the mappings that link via 'column'
+    """
+    column_links: ColumnLinks = {}
+    for entity_name, mappings in (property_mappings or {}).items():
+        for prop_name, details in mappings.get('object_properties', {}).items():
+            col_name = details.get('column')
+            target_class_name = details.get('target_class')
+            if not col_name or not target_class_name:
+                continue
+
+            column = [row.get(col_name) for row in data_rows]
+            targets_by_value: Dict[Any, Optional[Thing]] = {}
+            for value in set(column):
+                target_base_id = safe_cast(value, str)
+                targets_by_value[value] = registry.get((target_class_name, sanitize_name(target_base_id))) if target_base_id else None
+            targets = [targets_by_value[value] for value in column]
+            column_links.setdefault(entity_name, {})[prop_name] = targets
+
+            unresolved = Counter(value for value, target in zip(column, targets)
+                                 if target is None and safe_cast(value, str))
+            if unresolved:
+                rows_unresolved = sum(unresolved.values())
+                metrics.inc("unresolved_links_total", rows_unresolved, link=f"{entity_name}.{prop_name}")
+                examples = ", ".join(f"'{value}' ({count})" for value, count in unresolved.most_common(5))
+                logger.warning(f"{rows_unresolved} rows: link {entity_name}.{prop_name} from column '{col_name}' not resolved for {len(unresolved)} distinct IDs not found in the {target_class_name} registry (most frequent: {examples}).")
+            logger.debug("Resolved %s.%s from column '%s': %s distinct values.", entity_name, prop_name, col_name, len(targets_by_value))
+    return column_links
+
+
 # --- DEPRECATED - Combined function (keep for reference temporarily?) ---
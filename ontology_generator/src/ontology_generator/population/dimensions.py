@@ -0,0 +1,296 @@
+"""
+Dimension-first population module for the ontology generator.
+
+The row-by-row Pass 1 re-resolves every master-data individual (plant, area,
+line, equipment, material, order, shift, state, reason) on every row and
+re-applies its data properties, although a few thousand distinct values repeat
+across millions of rows. Dimension-first population splits Pass 1 in two:
+
+1. resolve_dimensions() groups the rows by the columns each dimension is built
+   from and runs the existing processor once per distinct tuple.
+2. process_fact_row() streams the rows and creates only the per-row facts
+   (TimeInterval, EventRecord), linked to the pre-resolved dimension individuals.
+
+Distinct tuples are processed in the order of their last occurrence, so a
+functional property shared by several tuples ends up with the value of the last
+row, as in row-by-row population.
+"""
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from owlready2 import Thing
+
+from ontology_generator.utils.logging import pop_logger
+from ontology_generator.utils.metrics import metrics
+from ontology_generator.population.core import PopulationContext
+from ontology_generator.population.asset import process_asset_hierarchy, process_material, process_production_request
+from ontology_generator.population.equipment import process_equipment_and_class
+from ontology_generator.population.events import (
+    process_shift, process_state, process_reason, process_time_interval, process_event_record,
+    get_event_resource_base_id
+)
+
+# Type Alias for registry
+IndividualRegistry = Dict[Tuple[str, str], Thing] # Key: (entity_type_str, unique_id_str), Value: Individual Object
+RowIndividuals = Dict[str, Thing] # Key: entity_type_str, Value: Individual Object for this row
+RowDimensions = Tuple[RowIndividuals, Optional[Tuple]] # (dimension individuals, equipment class info)
+
+# Entity types in the order row-by-row Pass 1 adds them to a row's individuals
+ROW_ENTITY_ORDER = [
+    "Plant", "Area", "ProcessCell", "ProductionLine", "Equipment", "EquipmentClass",
+    "Material", "ProductionRequest", "Shift", "TimeInterval", "OperationalState",
+    "OperationalReason", "EventRecord"
+]
+
+# Raw columns the equipment processor reads besides the mapped ones
+EQUIPMENT_FALLBACK_COLUMNS = ["EQUIPMENT_TYPE", "EQUIPMENT_NAME", "EQUIPMENT_ID", "EQUIPMENT_MODEL", "LINE_NAME"]
+
+def dimension_columns(property_mappings: Dict[str, Dict[str, Dict[str, Any]]],
+                      entity_types: Sequence[str], extra_columns: Sequence[str] = ()) -> List[str]:
+    """
+    Columns the data properties of some entity types are read from.
+
+    Args:
+        property_mappings: The parsed property mappings
+        entity_types: Entity types of the dimension (e.g. the asset hierarchy)
+        extra_columns: Raw columns the processor reads besides the mapped ones
+
+    Returns:
+        List of distinct column names, in mapping order
+    """
+    columns = []
+    for entity_type in entity_types:
+        for details in property_mappings.get(entity_type, {}).get("data_properties", {}).values():
+            column = details.get("column")
+            if column and column not in columns:
+                columns.append(column)
+    for column in extra_columns:
+        if column not in columns:
+            columns.append(column)
+    return columns
+
+def _resolve_distinct(name: str, data_rows: List[Dict[str, Any]], row_indices: Sequence[int],
+                      key_of: Callable[[int], Hashable], process: Callable[[int], Any],
+                      results: List[Any], failed_rows: Set[int],
+                      reject: Optional[Callable[[int, str], None]] = None) -> None:
+    """
+    Run a dimension processor once per distinct key and store its result for every row.
+
+    Args:
+        name: Dimension name (for logging and metrics)
+        data_rows: All data rows
+        row_indices: Rows the dimension applies to
+        key_of: Returns the key of a row index
+        process: Processor called with the index of one row of each distinct key
+        results: Per-row results, filled in place
+        failed_rows: Row indices whose key could not be processed, extended in place
+        reject: Called with the index and error of every row added to failed_rows (once
+            per row: rows already in failed_rows are not rejected again)
+    """
+    keys = {}
+    last_row = {} # {key: last row index}, in order of last occurrence
+    for i in row_indices:
+        key = keys[i] = key_of(i)
+        last_row.pop(key, None)
+        last_row[key] = i
+
+    resolved = {}
+    failed_keys = {}
+    for key, i in last_row.items():
+        try:
+            resolved[key] = process(i)
+        except Exception as e:
+            pop_logger.error("Row %s - Dimension '%s': Critical error resolving %s: %s", i + 2, name, key, e, exc_info=True)
+            failed_keys[key] = f"{name}: {type(e).__name__}: {e}"
+
+    for i, key in keys.items():
+        if key in failed_keys:
+            if i in failed_rows:
+                continue
+            failed_rows.add(i)
+            if reject is not None:
+                reject(i, failed_keys[key])
+        else:
+            results[i] = resolved[key]
+    metrics.inc("dimension_tuples_total", len(last_row), dimension=name)
+    pop_logger.debug("Dimension '%s': %s distinct tuples for %s rows.", name, len(last_row), len(keys))
+
+def resolve_dimensions(
+    data_rows: List[Dict[str, Any]],
+    context: PopulationContext,
+    property_mappings: Dict[str, Dict[str, Dict[str, Any]]],
+    all_created_individuals_by_uid: IndividualRegistry
+) -> List[Optional[RowDimensions]]:
+    """
+    Creates the master-data individuals of all rows, once per distinct dimension tuple.
+
+    The asset hierarchy is resolved first; rows without a Plant fail, as in
+    row-by-row Pass 1. Equipment is keyed by its columns and the row's line,
+    since it is linked to the line. As a row-by-row Pass 1 aborts a row at its
+    first failing dimension, each dimension only runs over the rows that have
+    not failed yet. Failed rows are rejected once, through context.reject_row.
+
+    Args:
+        data_rows: The data rows.
+        context: The PopulationContext.
+        property_mappings: The parsed property mappings.
+        all_created_individuals_by_uid: The central registry to populate and use for get_or_create.
+
+    Returns:
+        List with, per row, (dimension individuals keyed by entity type, equipment class info),
+        or None for rows that failed.
+    """
+    n_rows = len(data_rows)
+    failed_rows: Set[int] = set()
+
+    def columns_key(columns: List[str]) -> Callable[[int], Hashable]:
+        return lambda i: tuple(data_rows[i].get(column) for column in columns)
+
+    def reject(i: int, detail: str) -> None:
+        context.reject_row(data_rows[i], i + 2, "dimensions", "dimension_error", detail)
+
+    # --- Asset hierarchy (Plant, Area, ProcessCell, ProductionLine) ---
+    assets: List[Any] = [None] * n_rows
+    asset_columns = dimension_columns(property_mappings, ["Plant", "Area", "ProcessCell", "ProductionLine"])
+    _resolve_distinct(
+        "asset", data_rows, range(n_rows), columns_key(asset_columns),
+        lambda i: process_asset_hierarchy(data_rows[i], context, property_mappings, all_created_individuals_by_uid, pass_num=1),
+        assets, failed_rows, reject
+    )
+    for i, hierarchy in enumerate(assets):
+        if i not in failed_rows and not (hierarchy and hierarchy[0]):
+            pop_logger.error("Row %s - Pass 1: Failed to process mandatory Plant. Aborting row.", i + 2)
+            context.reject_row(data_rows[i], i + 2, "dimensions", "missing_plant")
+            failed_rows.add(i)
+    def remaining() -> List[int]:
+        return [i for i in range(n_rows) if i not in failed_rows]
+
+    # --- Equipment & Equipment Class (only for EQUIPMENT_TYPE 'Equipment' rows) ---
+    equipment: List[Any] = [None] * n_rows
+    equipment_key = columns_key(dimension_columns(property_mappings, ["Equipment", "EquipmentClass"], EQUIPMENT_FALLBACK_COLUMNS))
+    _resolve_distinct(
+        "equipment", data_rows, [i for i in remaining() if _equipment_type(data_rows[i]) == 'Equipment'],
+        lambda i: (assets[i][3],) + equipment_key(i),
+        lambda i: process_equipment_and_class(
+            data_rows[i], context, property_mappings, all_created_individuals_by_uid, assets[i][3], pass_num=1
+        ),
+        equipment, failed_rows, reject
+    )
+
+    # --- Material, ProductionRequest, Shift, OperationalState, OperationalReason ---
+    single_dimensions = [
+        ("Material", process_material),
+        ("ProductionRequest", process_production_request),
+        ("Shift", process_shift),
+        ("OperationalState", process_state),
+        ("OperationalReason", process_reason),
+    ]
+    singles: Dict[str, List[Any]] = {}
+    for entity_type, processor in single_dimensions:
+        singles[entity_type] = [None] * n_rows
+        _resolve_distinct(
+            entity_type, data_rows, remaining(), columns_key(dimension_columns(property_mappings, [entity_type])),
+            lambda i, processor=processor: processor(data_rows[i], context, property_mappings, all_created_individuals_by_uid, pass_num=1),
+            singles[entity_type], failed_rows, reject
+        )
+
+    row_dimensions: List[Optional[RowDimensions]] = [None] * n_rows
+    for i in remaining():
+        plant_ind, area_ind, pcell_ind, line_ind = assets[i]
+        equipment_ind, eq_class_ind, eq_class_info = equipment[i] or (None, None, None)
+        found = {
+            "Plant": plant_ind, "Area": area_ind, "ProcessCell": pcell_ind, "ProductionLine": line_ind,
+            "Equipment": equipment_ind, "EquipmentClass": eq_class_ind,
+        }
+        for entity_type, _ in single_dimensions:
+            found[entity_type] = singles[entity_type][i]
+        row_dimensions[i] = ({entity_type: ind for entity_type, ind in found.items() if ind}, eq_class_info)
+
+    pop_logger.info("Resolved the dimensions of %s rows (%s failed).", n_rows - len(failed_rows), len(failed_rows))
+    return row_dimensions
+
+def _equipment_type(row: Dict[str, Any]) -> str:
+    return row.get('EQUIPMENT_TYPE', '').strip() if 'EQUIPMENT_TYPE' in row else 'Equipment'
+
+def process_fact_row(
+    row: Dict[str, Any],
+    row_num: int,
+    context: PopulationContext,
+    property_mappings: Dict[str, Dict[str, Dict[str, Any]]],
+    all_created_individuals_by_uid: IndividualRegistry,
+    dimensions: Optional[RowDimensions]
+) -> Tuple[bool, RowIndividuals, Optional[Tuple], Optional[Tuple]]:
+    """
+    Processes a single data row after resolve_dimensions: creates its TimeInterval and EventRecord.
+
+    The event is linked to the row's pre-resolved individuals; its shift is the
+    row's Shift (no search over all shifts).
+
+    Args:
+        row: The data row dictionary.
+        row_num: The original row number (for logging and naming).
+        context: The PopulationContext.
+        property_mappings: The parsed property mappings.
+        all_created_individuals_by_uid: The central registry to populate and use for get_or_create.
+        dimensions: The row's entry from resolve_dimensions (None if the row failed).
+
+    Returns:
+        Tuple: (success_flag, created_individuals_in_row, event_context_tuple, eq_class_info_tuple),
+               as process_single_data_row_pass1
+    """
+    if dimensions is None:
+        return False, {}, None, None
+    dimension_inds, eq_class_info = dimensions
+    row_inds: RowIndividuals = dict(dimension_inds)
+    event_context = None
+    success = True
+
+    try:
+        # Add row_num to the row dictionary for use by downstream processors
+        row['row_num'] = row_num
+        equipment_ind = row_inds.get("Equipment")
+        line_ind = row_inds.get("ProductionLine")
+
+        resource_base_id = get_event_resource_base_id(row, equipment_ind, line_ind, row_num)
+        time_interval_ind = process_time_interval(
+            row, context, resource_base_id, row_num, property_mappings, all_created_individuals_by_uid, pass_num=1
+        )
+        if time_interval_ind:
+            row_inds["TimeInterval"] = time_interval_ind
+
+        event_ind, event_context = process_event_record(
+            row, context, property_mappings, all_created_individuals_by_uid,
+            time_interval_ind=time_interval_ind,
+            shift_ind=row_inds.get("Shift"),
+            state_ind=row_inds.get("OperationalState"),
+            reason_ind=row_inds.get("OperationalReason"),
+            equipment_ind=equipment_ind,
+            line_ind=line_ind,
+            material_ind=row_inds.get("Material"),
+            request_ind=row_inds.get("ProductionRequest"),
+            pass_num=1,
+            row_num=row_num,
+            match_shift_by_time=False
+        )
+        if event_ind:
+            row_inds["EventRecord"] = event_ind
+        elif row.get('EVENT_TYPE', '').strip():
+            pop_logger.warning(f"Row {row_num} - Pass 1: Missing critical event context for event with type '{row.get('EVENT_TYPE')}'. Marking row as failed.")
+            context.reject_row(row, row_num, "pass1", "missing_event", f"EVENT_TYPE '{row.get('EVENT_TYPE')}'")
+            success = False
+
+        created_inds_this_row = {entity_type: row_inds[entity_type] for entity_type in ROW_ENTITY_ORDER if entity_type in row_inds}
+        # TKT-002: Store row data with individual
+        for individual in created_inds_this_row.values():
+            context.store_individual_data(individual, row)
+
+        # Keep the event and its linked individuals for the fact-table export and AE rollups
+        context.record_event_fact(created_inds_this_row, row)
+    except Exception as e:
+        pop_logger.error("Row %s - Pass 1: Critical error processing row: %s", row_num, e, exc_info=True)
+        context.reject_row(row, row_num, "pass1", "pass1_error", f"{type(e).__name__}: {e}")
+        return False, {}, None, None
+    finally:
+        if 'row_num' in row:
+            del row['row_num']
+
+    return success, created_inds_this_row, event_context, eq_class_info
@@ -44,7 +44,7 @@ def process_single_data_row_pass1(
                - event_context_tuple (Optional[Tuple]): Context for linking events later.
                - eq_class_info_tuple (Optional[Tuple]): Info for equipment class tracking.
     """
-    row_proc_logger.debug(f"Row {row_num} - Pass 1 Start")
+    row_proc_logger.debug("Row %s - Pass 1 Start", row_num)
     created_inds_this_row: RowIndividuals = {}
     event_context = None
     eq_class_info = None
@@ -77,7 +77,8 @@ def process_single_data_row_pass1(
             context.store_individual_data(line_ind, row)
             
         if not plant_ind:
-             row_proc_logger.error(f"Row {row_num} - Pass 1: Failed to process mandatory Plant. Aborting row.")
+             row_proc_logger.error("Row %s - Pass 1: Failed to process mandatory Plant. Aborting row.", row_num)
+             context.reject_row(row, row_num, "pass1", "missing_plant")
              return False, {}, None, None
 
         # --- 2. Process Equipment & Equipment Class ---
@@ -87,7 +88,7 @@ def process_single_data_row_pass1(
         equipment_type = row.get('EQUIPMENT_TYPE', '').strip() if 'EQUIPMENT_TYPE' in row else 'Equipment'
         
         # TKT-003: Log the equipment type for traceability
-        row_proc_logger.debug(f"Row {row_num} - TKT-003: Processing row with EQUIPMENT_TYPE='{equipment_type}'")
+        row_proc_logger.debug("Row %s - TKT-003: Processing row with EQUIPMENT_TYPE='%s'", row_num, equipment_type)
         
         if equipment_type == 'Equipment':
             # Only process equipment and class if it's actually an equipment type
@@ -104,7 +105,7 @@ def process_single_data_row_pass1(
                 
             if eq_class_info_out: eq_class_info = eq_class_info_out
         elif equipment_type == 'Line':
-            row_proc_logger.debug(f"Row {row_num} - TKT-003: Row has EQUIPMENT_TYPE='Line', skipping equipment processing")
+            row_proc_logger.debug("Row %s - TKT-003: Row has EQUIPMENT_TYPE='Line', skipping equipment processing", row_num)
             # Verify that we have a line_ind for line events
             if not line_ind:
                 row_proc_logger.warning(f"Row {row_num} - TKT-003: EQUIPMENT_TYPE is 'Line' but no line individual was created. Event linking may fail.")
@@ -160,14 +161,18 @@ def process_single_data_row_pass1(
                 critical_event_failure = True
                 # Don't return immediately, continue processing to gather all potential errors
 
+        # Keep the event and its linked individuals for the fact-table export and AE rollups
+        context.record_event_fact(created_inds_this_row, row)
+
         # --- 6. Process Person (Example) ---
         # person_ind = process_person(row, context, property_mappings, all_created_individuals_by_uid, pass_num=1)
         # if person_ind: created_inds_this_row["Person"] = person_ind
 
-        row_proc_logger.debug(f"Row {row_num} - Pass 1 End. Created/found {len(created_inds_this_row)} individuals.")
+        row_proc_logger.debug("Row %s - Pass 1 End. Created/found %s individuals.", row_num, len(created_inds_this_row))
 
     except Exception as e:
-        row_proc_logger.error(f"Row {row_num} - Pass 1: Critical error processing row: {e}", exc_info=True)
+        row_proc_logger.error("Row %s - Pass 1: Critical error processing row: %s", row_num, e, exc_info=True)
+        context.reject_row(row, row_num, "pass1", "pass1_error", f"{type(e).__name__}: {e}")
         success = False
         created_inds_this_row = {} # Clear partial results on error
     finally:
@@ -176,6 +181,8 @@ def process_single_data_row_pass1(
             del row['row_num']
 
     # TKT-006: Final success check including critical event failures
+    if critical_event_failure and success:
+        context.reject_row(row, row_num, "pass1", "missing_event", f"EVENT_TYPE '{row.get('EVENT_TYPE')}'")
     if critical_event_failure:
         success = False
 
@@ -188,7 +195,8 @@ def process_single_data_row_pass2(
     context: PopulationContext,
     property_mappings: Dict[str, Dict[str, Dict[str, Any]]],
     individuals_in_row: RowIndividuals,
-    linking_context: IndividualRegistry
+    linking_context: IndividualRegistry,
+    resolved_links: Optional[Dict[str, Dict[str, Optional[Thing]]]] = None
 ) -> bool:
     """
     Processes a single data row during Pass 2: Applies object property mappings.
@@ -200,11 +208,13 @@ def process_single_data_row_pass2(
         property_mappings: The parsed property mappings.
         individuals_in_row: Dictionary of individuals created/retrieved for THIS row in Pass 1.
         linking_context: The central registry of ALL created individuals from Pass 1.
+        resolved_links: This row's targets of column-based links ({entity_type: {prop_name: target}}),
+            from resolve_column_links; links not in it are looked up per row.
 
     Returns:
         bool: True if linking was attempted successfully (even if some links failed safely), False on critical error.
     """
-    row_proc_logger.debug(f"Row {row_num} - Pass 2 Start")
+    row_proc_logger.debug("Row %s - Pass 2 Start", row_num)
     success = True # Assume success unless critical error
 
     # Add row_num to row dict temporarily for potential use in logging within apply funcs
@@ -228,7 +238,8 @@ def process_single_data_row_pass2(
                     row_proc_logger,
                     linking_context,
                     individuals_in_row,
-                    exclude_structural=True
+                    exclude_structural=True,
+                    resolved_targets=resolved_links.get(entity_type) if resolved_links else None
                 )
 
         # TKT-004: Establish asset hierarchy links based on individuals created for this row
@@ -242,26 +253,27 @@ def process_single_data_row_pass2(
             locatedInPlant_prop = context.get_prop("locatedInPlant")
             if locatedInPlant_prop:
                 context.set_prop(area_ind, "locatedInPlant", plant_ind)
-                row_proc_logger.debug(f"TKT-004: Set Area {area_ind.name} locatedInPlant to Plant {plant_ind.name}")
+                row_proc_logger.debug("TKT-004: Set Area %s locatedInPlant to Plant %s", area_ind.name, plant_ind.name)
         
         # Set ProcessCell.partOfArea = Area
         if area_ind and pcell_ind:
             partOfArea_prop = context.get_prop("partOfArea")
             if partOfArea_prop:
                 context.set_prop(pcell_ind, "partOfArea", area_ind)
-                row_proc_logger.debug(f"TKT-004: Set ProcessCell {pcell_ind.name} partOfArea to Area {area_ind.name}")
+                row_proc_logger.debug("TKT-004: Set ProcessCell %s partOfArea to Area %s", pcell_ind.name, area_ind.name)
         
         # Set ProductionLine.locatedInProcessCell = ProcessCell
         if pcell_ind and line_ind:
             locatedInProcessCell_prop = context.get_prop("locatedInProcessCell")
             if locatedInProcessCell_prop:
                 context.set_prop(line_ind, "locatedInProcessCell", pcell_ind)
-                row_proc_logger.debug(f"TKT-004: Set ProductionLine {line_ind.name} locatedInProcessCell to ProcessCell {pcell_ind.name}")
+                row_proc_logger.debug("TKT-004: Set ProductionLine %s locatedInProcessCell to ProcessCell %s", line_ind.name, pcell_ind.name)
 
-        row_proc_logger.debug(f"Row {row_num} - Pass 2 End.")
+        row_proc_logger.debug("Row %s - Pass 2 End.", row_num)
 
     except Exception as e:
-        row_proc_logger.error(f"Row {row_num} - Pass 2: Critical error during linking: {e}", exc_info=True)
+        row_proc_logger.error("Row %s - Pass 2: Critical error during linking: %s", row_num, e, exc_info=True)
+        context.reject_row(row, row_num, "pass2", "pass2_error", f"{type(e).__name__}: {e}")
         success = False
     finally:
         # Clean up temporary key
@@ -398,14 +410,14 @@ def process_structural_relationships(
                                 context.set_prop(line_ind, "hasEquipmentPart", eq_ind)
                                 links_created += 1
                                 equipment_line_links += 1
-                                log.debug(f"Linked Equipment {eq_ind.name} to Line {line_ind.name} via isPartOfProductionLine/hasEquipmentPart (column approach)")
+                                log.debug("Linked Equipment %s to Line %s via isPartOfProductionLine/hasEquipmentPart (column approach)", eq_ind.name, line_ind.name)
                                 
                                 # Record the link type for statistics
                                 links_by_type["Equipment->Line"] = links_by_type.get("Equipment->Line", 0) + 1
                 
                 # Method 2: TKT-010 - Link via target_link_context (new implementation)
                 elif target_link_context:
-                    log.info(f"TKT-010: Using target_link_context '{target_link_context}' for isPartOfProductionLine relationships")
+                    log.info("TKT-010: Using target_link_context '%s' for isPartOfProductionLine relationships", target_link_context)
                     
                     # For each equipment, find and link to the appropriate line using associated data
                     for eq_ind in equipment_individuals:
@@ -434,7 +446,7 @@ def process_structural_relationships(
                                     
                                     if str(line_id) == str(line_identifier):
                                         candidate_line = line_ind
-                                        log.debug(f"TKT-010: Found line {line_ind.name} with ID {line_id} matching equipment's associatedLineId {line_identifier}")
+                                        log.debug("TKT-010: Found line %s with ID %s matching equipment's associatedLineId %s", line_ind.name, line_id, line_identifier)
                                         break
                         
                         # Approach 2: Check for LINE_NAME in stored equipment data
@@ -449,7 +461,7 @@ def process_structural_relationships(
                                         
                                         if str(line_id) == str(line_name_value):
                                             candidate_line = line_ind
-                                            log.debug(f"TKT-010: Found line {line_ind.name} with ID {line_id} matching equipment's LINE_NAME {line_name_value}")
+                                            log.debug("TKT-010: Found line %s with ID %s matching equipment's LINE_NAME %s", line_ind.name, line_id, line_name_value)
                                             break
                         
                         # If we found a candidate line, create the link
@@ -470,17 +482,17 @@ def process_structural_relationships(
                                 context.set_prop(candidate_line, "hasEquipmentPart", eq_ind)
                                 links_created += 1
                                 equipment_line_links += 1
-                                log.info(f"TKT-010: Linked Equipment {eq_ind.name} to Line {candidate_line.name} via isPartOfProductionLine/hasEquipmentPart (context approach)")
+                                log.info("TKT-010: Linked Equipment %s to Line %s via isPartOfProductionLine/hasEquipmentPart (context approach)", eq_ind.name, candidate_line.name)
                                 
                                 # Record the link type for statistics
                                 links_by_type["Equipment->Line (Context)"] = links_by_type.get("Equipment->Line (Context)", 0) + 1
                         else:
-                            log.debug(f"TKT-010: Could not find appropriate line for equipment {eq_ind.name} using context approach")
+                            log.debug("TKT-010: Could not find appropriate line for equipment %s using context approach", eq_ind.name)
                 
                 else:
                     log.warning(f"TKT-010: No column or target_link_context specified for isPartOfProductionLine property mapping. Cannot link equipment to lines.")
                 
-                log.info(f"Created {equipment_line_links} Equipment-Line links")
+                log.info("Created %s Equipment-Line links", equipment_line_links)
     
     # TKT-002: Generate property usage report after all structural relationships are processed
     log.info("TKT-002: Generating property usage report")
@@ -488,7 +500,7 @@ def process_structural_relationships(
     
     # Log summary of links created
     for link_type, count in links_by_type.items():
-        log.info(f"Created {count} {link_type} structural links")
+        log.info("Created %s %s structural links", count, link_type)
     
-    log.info(f"Post-processing complete: Created {links_created} structural links in total")
+    log.info("Post-processing complete: Created %s structural links in total", links_created)
     return links_created 
\ No newline at end of file
@@ -2,15 +2,27 @@
 Sequence relationship module for the ontology generator.
 
 This module provides functions for setting up equipment sequence relationships.
+
+Parallel equipment (equipment sharing a sequence position on a line) is linked
+pairwise with the symmetric isParallelWith property by default, which takes
+k*(k-1)/2 links for k parallel machines (doubled by a reasoner). With
+parallel_stages=True, each (line, position) becomes one ParallelStage individual
+instead: equipment links to its stage (isMemberOfStage), stages link to their
+line and to the adjacent stages, and pairwise parallelism is derived when needed
+(see analysis.sequence_analysis.get_parallel_equipment_pairs).
 """
+import types
 from typing import Dict, Any, List, Optional, Tuple
 
-from owlready2 import Thing, Ontology, ThingClass, PropertyClass
+from owlready2 import Thing, Ontology, ThingClass, PropertyClass, ObjectProperty, DataProperty, FunctionalProperty
 
 from ontology_generator.utils.logging import pop_logger
+from ontology_generator.utils.types import sanitize_name
 from ontology_generator.population.core import PopulationContext, _set_property_value
 from ontology_generator.config import DEFAULT_EQUIPMENT_SEQUENCE, LINE_SPECIFIC_EQUIPMENT_SEQUENCE
 
+PARALLEL_STAGE_CLASS_NAME = "ParallelStage"
+
 def _safe_sort_by_position(items, default_position=999999):
     """
     Safely sorts items by position value, handling None values gracefully.
@@ -31,22 +43,90 @@ def _safe_sort_by_position(items, default_position=999999):
         
     return sorted(items, key=get_safe_position)
 
+def _ensure_parallel_stage_schema(onto: Ontology, cls_Equipment: ThingClass, cls_ProductionLine: ThingClass) -> ThingClass:
+    """Create the ParallelStage class and its properties in the ontology if they do not exist."""
+    with onto:
+        stage_class = onto[PARALLEL_STAGE_CLASS_NAME] or types.new_class(PARALLEL_STAGE_CLASS_NAME, (Thing,))
+        # (name, bases, domain, range, inverse)
+        object_props = [
+            ("isMemberOfStage", (ObjectProperty,), cls_Equipment, stage_class, "hasStageMember"),
+            ("hasStageMember", (ObjectProperty,), stage_class, cls_Equipment, "isMemberOfStage"),
+            ("isStageOfProductionLine", (ObjectProperty, FunctionalProperty), stage_class, cls_ProductionLine, None),
+            ("stageIsImmediatelyUpstreamOf", (ObjectProperty,), stage_class, stage_class, "stageIsImmediatelyDownstreamOf"),
+            ("stageIsImmediatelyDownstreamOf", (ObjectProperty,), stage_class, stage_class, "stageIsImmediatelyUpstreamOf"),
+        ]
+        for prop_name, bases, domain, range_class, _ in object_props:
+            if onto[prop_name] is None:
+                prop = types.new_class(prop_name, bases)
+                prop.domain = [domain]
+                prop.range = [range_class]
+        for prop_name, _, _, _, inverse_name in object_props:
+            if inverse_name and onto[prop_name].inverse_property is None:
+                onto[prop_name].inverse_property = onto[inverse_name]
+        if onto["stagePosition"] is None:
+            prop = types.new_class("stagePosition", (DataProperty, FunctionalProperty))
+            prop.domain = [stage_class]
+            prop.range = [int]
+    return stage_class
+
+def _create_parallel_stages(onto: Ontology,
+                            stage_class: ThingClass,
+                            line_ind: Thing,
+                            sorted_equipment: List[Tuple[Thing, int, str]]) -> Tuple[int, int]:
+    """
+    Create one ParallelStage per sequence position of a line and link equipment and stages to it.
+
+    Each equipment gets one isMemberOfStage link and each stage one link to the
+    next stage, so the links grow linearly with the equipment on the line.
+    Inverses (hasStageMember, stageIsImmediatelyDownstreamOf) are declared, not stored.
+
+    Args:
+        onto: The ontology
+        stage_class: The ParallelStage class
+        line_ind: The ProductionLine individual
+        sorted_equipment: (equipment, position, equipmentId) sorted by position
+
+    Returns:
+        Tuple of (stages created, stages with more than one member)
+    """
+    members_by_position: Dict[int, List[Thing]] = {}
+    for equipment, position, _ in sorted_equipment:
+        members_by_position.setdefault(position, []).append(equipment)
+
+    previous_stage = None
+    for position, members in members_by_position.items():
+        stage = stage_class(sanitize_name(f"{PARALLEL_STAGE_CLASS_NAME}_{line_ind.name}_{position}"), namespace=onto)
+        stage.isStageOfProductionLine = line_ind
+        stage.stagePosition = position
+        for equipment in members:
+            if stage not in equipment.isMemberOfStage:
+                equipment.isMemberOfStage.append(stage)
+        if previous_stage is not None and stage not in previous_stage.stageIsImmediatelyUpstreamOf:
+            previous_stage.stageIsImmediatelyUpstreamOf.append(stage)
+        previous_stage = stage
+    return len(members_by_position), sum(1 for members in members_by_position.values() if len(members) > 1)
+
 def setup_equipment_instance_relationships(onto: Ontology,
                                           defined_classes: Dict[str, ThingClass],
                                           defined_properties: Dict[str, PropertyClass],
                                           property_is_functional: Dict[str, bool],
                                           equipment_class_positions: Dict[str, int],
-                                          population_context: Optional[object] = None) -> Tuple[int, Optional[object]]:
+                                          population_context: Optional[object] = None,
+                                          parallel_stages: bool = False) -> Tuple[int, Optional[object]]:
     """
     Establish upstream/downstream relationships between equipment *instances* within the same production line.
     
     The approach:
-    1. Group equipment instances by production line
+    1. Group equipment instances by production line, using the line index recorded
+       by Pass 1 on the population context when available (falling back to an
+       ontology search otherwise)
     2. For each line:
         a. Determine equipment class sequence positions using line-specific or default configuration
         b. Assign sequencePosition to each Equipment instance based on its class's position
         c. Sort instances on the line by sequencePosition and then by equipmentId (for same position)
         d. Link sorted instances with isImmediatelyUpstreamOf/isImmediatelyDownstreamOf relationships
+        e. Link equipment at the same position: pairwise with isParallelWith, or
+           through one ParallelStage per position with parallel_stages
     
     Args:
         onto: The ontology
@@ -54,7 +134,10 @@ def setup_equipment_instance_relationships(onto: Ontology,
         defined_properties: Dictionary of defined properties
         property_is_functional: Dictionary indicating whether properties are functional
         equipment_class_positions: Dictionary mapping equipment class names to sequence positions
-        population_context: Optional PopulationContext for property usage tracking
+        population_context: Optional PopulationContext for property usage tracking and
+            its equipment_line_index
+        parallel_stages: Model parallel equipment as ParallelStage individuals
+            instead of pairwise isParallelWith links
         
     Returns:
         Tuple of (number of relationships created, context with property usage tracking)
@@ -115,16 +198,30 @@ def setup_equipment_instance_relationships(onto: Ontology,
         pop_logger.error(f"Missing required components for equipment sequencing: {', '.join(missing_components)}")
         return 0, context
     
+    stage_class = None
+    if parallel_stages:
+        # Stages replace the pairwise links
+        prop_isParallelWith = None
+        stage_class = _ensure_parallel_stage_schema(onto, cls_Equipment, cls_ProductionLine)
+        pop_logger.info(f"Parallel equipment will be grouped into {PARALLEL_STAGE_CLASS_NAME} individuals per line and sequence position.")
     # TKT-007: Check if isParallelWith property exists
-    if not prop_isParallelWith:
+    elif not prop_isParallelWith:
         pop_logger.warning("'isParallelWith' property not found. Parallel equipment relationships will not be established.")
 
     if not prop_isImmediatelyDownstreamOf:
         pop_logger.warning("'isImmediatelyDownstreamOf' inverse property not found. Only forward instance relationships will be set.")
 
+    def safe_get_equipment_id(equipment: Thing) -> str:
+        """Helper to safely get equipmentId or fallback to name for sorting."""
+        if prop_equipmentId:
+            equipment_id = getattr(equipment, prop_equipmentId.python_name, None)
+            if equipment_id:
+                return str(equipment_id)
+        return equipment.name
+
     # Group equipment instances by line
-    pop_logger.info("Grouping equipment instances by production line...")
-    line_equipment_map: Dict[Thing, List[Thing]] = {}  # {line_individual: [equipment_instances]}
+    # Each entry is (equipment_individual, equipment_class_id, sequence_position, equipment_id)
+    line_equipment_map: Dict[Thing, List[Tuple[Thing, Optional[str], Optional[int], str]]] = {}
     
     # Track lines with equipment but no sequence
     lines_without_sequence: List[str] = []
@@ -136,43 +233,65 @@ def setup_equipment_instance_relationships(onto: Ontology,
     total_equipment_with_sequence_position = 0  # Track how many have sequencePosition set
     
     # Step 1: Group all Equipment instances by ProductionLine
-    for equipment_inst in onto.search(type=cls_Equipment):
-        total_equipment_processed += 1
-        
-        # Get the line(s) this equipment belongs to
-        equipment_lines = getattr(equipment_inst, prop_isPartOfProductionLine.python_name, [])
-        if not equipment_lines:
-            pop_logger.debug(f"Equipment {equipment_inst.name} is not linked to any ProductionLine. Skipping.")
-            continue
-        
-        total_equipment_with_line += 1
-        
-        # Get the EquipmentClass this equipment belongs to
-        equipment_class_ind = getattr(equipment_inst, prop_memberOfClass.python_name, None)
-        
-        # More detailed logging when missing EquipmentClass link
-        if not equipment_class_ind:
-            eq_id = getattr(equipment_inst, "name", "unknown")
-            pop_logger.warning(f"Equipment {eq_id} has no memberOfClass relationship. Skipping for sequence setup.")
-            continue
-        
-        if not isinstance(equipment_class_ind, cls_EquipmentClass):
-            eq_id = getattr(equipment_inst, "name", "unknown")
-            pop_logger.warning(f"Equipment {eq_id} linked to non-EquipmentClass '{equipment_class_ind}'. Skipping for sequence setup.")
-            continue
-        
-        total_equipment_with_class += 1
-        
-        # Add equipment to each of its production lines
-        for line in equipment_lines:
-            if not isinstance(line, cls_ProductionLine):
-                pop_logger.warning(f"Equipment {equipment_inst.name} linked to non-ProductionLine '{line}'. Skipping this link.")
+    equipment_line_index = getattr(population_context, "equipment_line_index", None)
+    if equipment_line_index:
+        # Pass 1 already recorded line, class and position for every placed equipment,
+        # so grouping costs O(equipment) instead of a search over the whole ontology.
+        pop_logger.info(f"Grouping equipment instances by production line using the population index ({len(equipment_line_index)} lines)...")
+        seen_equipment = set()
+        for line_ind, placements in equipment_line_index.items():
+            entries = line_equipment_map.setdefault(line_ind, [])
+            for equipment_inst, (eq_class_id, position, eq_id) in placements.items():
+                if equipment_inst not in seen_equipment:
+                    seen_equipment.add(equipment_inst)
+                    total_equipment_processed += 1
+                    total_equipment_with_line += 1
+                    if eq_class_id:
+                        total_equipment_with_class += 1
+                if not eq_class_id:
+                    pop_logger.warning(f"Equipment {eq_id} has no equipment class recorded. Skipping for sequence setup.")
+                    continue
+                entries.append((equipment_inst, eq_class_id, position, eq_id))
+    else:
+        pop_logger.info("Grouping equipment instances by production line...")
+        for equipment_inst in onto.search(type=cls_Equipment):
+            total_equipment_processed += 1
+            
+            # Get the line(s) this equipment belongs to
+            equipment_lines = getattr(equipment_inst, prop_isPartOfProductionLine.python_name, [])
+            if not equipment_lines:
+                pop_logger.debug(f"Equipment {equipment_inst.name} is not linked to any ProductionLine. Skipping.")
                 continue
             
-            if line not in line_equipment_map:
-                line_equipment_map[line] = []
+            total_equipment_with_line += 1
+            
+            # Get the EquipmentClass this equipment belongs to
+            equipment_class_ind = getattr(equipment_inst, prop_memberOfClass.python_name, None)
             
-            line_equipment_map[line].append(equipment_inst)
+            # More detailed logging when missing EquipmentClass link
+            if not equipment_class_ind:
+                eq_id = getattr(equipment_inst, "name", "unknown")
+                pop_logger.warning(f"Equipment {eq_id} has no memberOfClass relationship. Skipping for sequence setup.")
+                continue
+            
+            if not isinstance(equipment_class_ind, cls_EquipmentClass):
+                eq_id = getattr(equipment_inst, "name", "unknown")
+                pop_logger.warning(f"Equipment {eq_id} linked to non-EquipmentClass '{equipment_class_ind}'. Skipping for sequence setup.")
+                continue
+            
+            total_equipment_with_class += 1
+            
+            eq_class_id = getattr(equipment_class_ind, prop_equipmentClassId.python_name, equipment_class_ind.name)
+            position = getattr(equipment_inst, prop_sequencePosition.python_name, None)
+            eq_id = safe_get_equipment_id(equipment_inst)
+            
+            # Add equipment to each of its production lines
+            for line in equipment_lines:
+                if not isinstance(line, cls_ProductionLine):
+                    pop_logger.warning(f"Equipment {equipment_inst.name} linked to non-ProductionLine '{line}'. Skipping this link.")
+                    continue
+                
+                line_equipment_map.setdefault(line, []).append((equipment_inst, eq_class_id, position, eq_id))
     
     # Log summary of equipment distribution for diagnosis
     pop_logger.info(f"Equipment distribution summary:")
@@ -188,14 +307,8 @@ def setup_equipment_instance_relationships(onto: Ontology,
     # TKT-007: Track parallel relationships
     total_parallel_relationships = 0
     line_parallel_counts: Dict[str, int] = {}
-    
-    def safe_get_equipment_id(equipment: Thing) -> str:
-        """Helper to safely get equipmentId or fallback to name for sorting."""
-        if prop_equipmentId:
-            equipment_id = getattr(equipment, prop_equipmentId.python_name, None)
-            if equipment_id:
-                return str(equipment_id)
-        return equipment.name
+    total_stages = 0
+    total_parallel_stages = 0
     
     with onto:
         for line_ind, equipment_instances in line_equipment_map.items():
@@ -211,19 +324,7 @@ def setup_equipment_instance_relationships(onto: Ontology,
             equipment_without_positions = []
             
             # TKT-006: Enhanced collection of equipment with their sequence positions
-            for equipment_inst in equipment_instances:
-                # Get the equipment ID for consistent reference
-                eq_id = safe_get_equipment_id(equipment_inst)
-                
-                # TKT-006: Get sequencePosition value for this equipment
-                position = getattr(equipment_inst, prop_sequencePosition.python_name, None)
-                
-                # Get the equipment class for logging
-                eq_class_ind = getattr(equipment_inst, prop_memberOfClass.python_name, None)
-                eq_class_id = "Unknown"
-                if eq_class_ind and prop_equipmentClassId:
-                    eq_class_id = getattr(eq_class_ind, prop_equipmentClassId.python_name, eq_class_ind.name)
-                
+            for equipment_inst, eq_class_id, position, eq_id in equipment_instances:
                 if position is not None:
                     # Store equipment with sequence position information
                     equipment_with_positions.append((equipment_inst, position, eq_id))
@@ -231,14 +332,11 @@ def setup_equipment_instance_relationships(onto: Ontology,
                     total_equipment_with_sequence_position += 1
                 else:
                     # Try to look up the position from its class using the config
-                    if eq_class_ind and prop_equipmentClassId:
-                        # Get class ID to look up in configuration
-                        equipment_class_id = getattr(eq_class_ind, prop_equipmentClassId.python_name, eq_class_ind.name)
-                        
+                    if eq_class_id:
                         # Try line-specific sequence first
-                        if line_id in LINE_SPECIFIC_EQUIPMENT_SEQUENCE and equipment_class_id in LINE_SPECIFIC_EQUIPMENT_SEQUENCE[line_id]:
-                            position = LINE_SPECIFIC_EQUIPMENT_SEQUENCE[line_id].get(equipment_class_id)
-                            pop_logger.info(f"TKT-006: Found position {position} for {eq_id} using line-specific config for class {equipment_class_id}")
+                        if line_id in LINE_SPECIFIC_EQUIPMENT_SEQUENCE and eq_class_id in LINE_SPECIFIC_EQUIPMENT_SEQUENCE[line_id]:
+                            position = LINE_SPECIFIC_EQUIPMENT_SEQUENCE[line_id].get(eq_class_id)
+                            pop_logger.info(f"TKT-006: Found position {position} for {eq_id} using line-specific config for class {eq_class_id}")
                             
                             # Set the position on the equipment individual - TKT-004: Pass context
                             _set_property_value(equipment_inst, prop_sequencePosition, position, is_functional=True, context=context)
@@ -247,9 +345,9 @@ def setup_equipment_instance_relationships(onto: Ontology,
                             continue
                         
                         # Try default sequence as fallback
-                        if equipment_class_id in DEFAULT_EQUIPMENT_SEQUENCE:
-                            position = DEFAULT_EQUIPMENT_SEQUENCE.get(equipment_class_id)
-                            pop_logger.info(f"TKT-006: Found position {position} for {eq_id} using default config for class {equipment_class_id}")
+                        if eq_class_id in DEFAULT_EQUIPMENT_SEQUENCE:
+                            position = DEFAULT_EQUIPMENT_SEQUENCE.get(eq_class_id)
+                            pop_logger.info(f"TKT-006: Found position {position} for {eq_id} using default config for class {eq_class_id}")
                             
                             # Set the position on the equipment individual - TKT-004: Pass context
                             _set_property_value(equipment_inst, prop_sequencePosition, position, is_functional=True, context=context)
@@ -258,9 +356,9 @@ def setup_equipment_instance_relationships(onto: Ontology,
                             continue
                         
                         # TKT-004: Try using the equipment class positions we were given
-                        if equipment_class_id in equipment_class_positions:
-                            position = equipment_class_positions.get(equipment_class_id)
-                            pop_logger.info(f"TKT-004: Found position {position} for {eq_id} using provided equipment_class_positions for class {equipment_class_id}")
+                        if eq_class_id in equipment_class_positions:
+                            position = equipment_class_positions.get(eq_class_id)
+                            pop_logger.info(f"TKT-004: Found position {position} for {eq_id} using provided equipment_class_positions for class {eq_class_id}")
                             
                             # Set the position on the equipment individual
                             _set_property_value(equipment_inst, prop_sequencePosition, position, is_functional=True, context=context)
@@ -270,7 +368,7 @@ def setup_equipment_instance_relationships(onto: Ontology,
                     
                     # If we get here, we couldn't find or set a position
                     equipment_without_positions.append((equipment_inst, eq_id))
-                    pop_logger.warning(f"TKT-006: Equipment {eq_id} (class: {eq_class_id}) on line {line_id} has no sequencePosition and none could be determined.")
+                    pop_logger.warning(f"TKT-006: Equipment {eq_id} (class: {eq_class_id or 'Unknown'}) on line {line_id} has no sequencePosition and none could be determined.")
             
             # Step 2: Sort equipment instances by sequencePosition, then by equipmentId
             sorted_equipment = sorted(equipment_with_positions, key=lambda x: (x[1], x[2]))
@@ -317,7 +415,12 @@ def setup_equipment_instance_relationships(onto: Ontology,
                 pop_logger.info(f"Established {relationships_created} instance relationships for line {line_id}.")
             
             # TKT-007: Step 4: Identify and link parallel equipment (equipment with same sequence position)
-            if prop_isParallelWith:
+            if stage_class is not None:
+                stages_created, parallel_stage_count = _create_parallel_stages(onto, stage_class, line_ind, sorted_equipment)
+                total_stages += stages_created
+                total_parallel_stages += parallel_stage_count
+                pop_logger.info(f"Created {stages_created} {PARALLEL_STAGE_CLASS_NAME} individuals for line {line_id} ({parallel_stage_count} with parallel equipment).")
+            elif prop_isParallelWith:
                 # Group equipment by sequence position
                 position_equipment_map = {}
                 for eq, pos, eq_id in sorted_equipment:
@@ -389,7 +492,11 @@ def setup_equipment_instance_relationships(onto: Ontology,
         print("  • No equipment found on the same line")
     
     # TKT-007: Print parallel relationship summary
-    if prop_isParallelWith and total_parallel_relationships > 0:
+    if stage_class is not None:
+        print(f"\nCreated {total_stages} {PARALLEL_STAGE_CLASS_NAME} individuals ({total_parallel_stages} with parallel equipment)")
+        print("  • Equipment is linked to the stage of its line and sequence position via isMemberOfStage")
+        print("  • Equipment sharing a stage is parallel; adjacent stages are linked via stageIsImmediatelyUpstreamOf")
+    elif prop_isParallelWith and total_parallel_relationships > 0:
         pop_logger.info(f"TKT-007: Established {total_parallel_relationships} parallel equipment relationships across {len(line_parallel_counts)} production lines.")
         print(f"\nEstablished {total_parallel_relationships} parallel equipment relationships on {len(line_parallel_counts)} lines:")
         for line_id, count in sorted(line_parallel_counts.items()):
@@ -0,0 +1,4 @@
+"""Query package for the ontology generator."""
+from .sparql import (
+    PreparedQueryCache, run_query, iter_bindings, write_results, format_timings
+)
@@ -0,0 +1,6 @@
+"""Run SPARQL queries from the command line: python -m ontology_generator.query --help"""
+import sys
+
+from .sparql import main
+
+sys.exit(main())
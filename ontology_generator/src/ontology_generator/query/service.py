@@ -0,0 +1,312 @@
+"""
+Local query service module for the ontology generator.
+
+This module loads one generated world once and answers common operational
+questions over HTTP from in-memory indexes built at startup:
+
+    GET  /health
+    GET  /events?resource=R&start=T1&end=T2    events of a resource (or ?line=L) overlapping [T1, T2)
+    GET  /downtime-by-reason[?line=L]           downtime minutes and event counts per reason
+    GET  /events-per-shift[?line=L]             event counts per shift
+    GET  /lines/<line>/sequence                 equipment sequence of a line (lineId or individual name)
+    GET  /sparql?query=...  (or POST the query)  SPARQL JSON results from the native engine
+
+Times are ISO 8601 local times without a UTC offset, like the stored event
+times; /events also takes a non-negative ?limit=N. Indexes are read-only after
+startup; SPARQL queries share one prepared-query cache and are serialized on
+the world's connection.
+
+Usage:
+    ontology-service output.owl --port 8050
+"""
+import argparse
+import json
+import logging
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, unquote, urlparse
+
+from owlready2 import World, Ontology
+
+from ontology_generator.analysis.sequence_analysis import analyze_equipment_sequences
+from ontology_generator.analysis.time_index import TimeRangeIndex
+from ontology_generator.query.sparql import PreparedQueryCache, run_query
+from ontology_generator.utils.logging import analysis_logger, configure_logging
+
+# One row per event: the event with its resource, interval, state, reason, shift and downtime
+_EVENTS_QUERY = """
+PREFIX onto: <{base}>
+SELECT ?event ?resource ?start ?end ?state ?reason ?shift ?downtime
+WHERE {{
+    ?event a onto:EventRecord ; onto:involvesResource ?resource .
+    OPTIONAL {{ ?event onto:occursDuring ?interval . ?interval onto:startTime ?start . OPTIONAL {{ ?interval onto:endTime ?end }} }}
+    OPTIONAL {{ ?event onto:eventHasState ?s . ?s onto:stateDescription ?state }}
+    OPTIONAL {{ ?event onto:eventHasReason ?r . ?r onto:reasonDescription ?reason }}
+    OPTIONAL {{ ?event onto:duringShift ?sh . ?sh onto:shiftId ?shift }}
+    OPTIONAL {{ ?event onto:downtimeMinutes ?downtime }}
+}}
+"""
+
+_EQUIPMENT_LINES_QUERY = """
+PREFIX onto: <{base}>
+SELECT ?equipment ?line WHERE {{ ?equipment onto:isPartOfProductionLine ?line }}
+"""
+
+def _name(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return getattr(value, "name", None) or str(value)
+
+class OntologyIndexes:
+    """
+    In-memory indexes over one loaded ontology.
+
+    Attributes:
+        events: One record per EventRecord (event, resource, line, start, end, state, reason, shift, downtimeMinutes)
+        time_index: Time-range index of the event records per resource and line
+        sequences: Equipment names in sequence order per line id
+    """
+    def __init__(self, world: World, onto: Ontology, cache: Optional[PreparedQueryCache] = None):
+        """
+        Build the indexes.
+
+        Args:
+            world: The loaded world
+            onto: The generated ontology (its base IRI prefixes the queries)
+            cache: Prepared-query cache shared with the SPARQL passthrough
+        """
+        self.world = world
+        self.onto = onto
+        self.cache = cache if cache is not None else PreparedQueryCache()
+
+        equipment_line = {
+            _name(equipment): _name(line)
+            for equipment, line in self._select(_EQUIPMENT_LINES_QUERY)
+        }
+        seen = set()
+        self.events: List[Dict[str, Any]] = []
+        for event, resource, start, end, state, reason, shift, downtime in self._select(_EVENTS_QUERY):
+            event_name = _name(event)
+            if event_name in seen: # Multi-valued optionals repeat the event; keep the first row
+                continue
+            seen.add(event_name)
+            resource_name = _name(resource)
+            self.events.append({
+                'event': event_name,
+                'resource': resource_name,
+                'line': equipment_line.get(resource_name, resource_name),
+                'start': start,
+                'end': end,
+                'state': _name(state),
+                'reason': _name(reason),
+                'shift': _name(shift),
+                'downtimeMinutes': downtime,
+            })
+
+        self.time_index = TimeRangeIndex((e, e['resource'], e['line'], e['start'], e['end']) for e in self.events)
+        self.downtime_by_reason = self._downtime_by_reason()
+        self.events_per_shift = self._events_per_shift()
+
+        sequences, _ = analyze_equipment_sequences(onto)
+        self.sequences = {line_id: [equipment.name for equipment in sequence] for line_id, sequence in sequences.items()}
+        analysis_logger.info(f"Built query indexes: {len(self.events)} events, {len(self.time_index.by_resource)} resources, "
+                             f"{len(self.time_index.by_line)} lines, {len(self.sequences)} sequences")
+
+    def _select(self, template: str) -> List[List[Any]]:
+        try:
+            prepared, _, _ = self.cache.get(self.world, template.format(base=self.onto.base_iri))
+        except Exception as e:
+            analysis_logger.warning(f"Could not build index query (missing classes/properties?): {e}")
+            return []
+        return list(prepared.execute())
+
+    def _downtime_by_reason(self) -> Dict[Optional[str], Dict[str, Dict[str, float]]]:
+        totals: Dict[Optional[str], Dict[str, Dict[str, float]]] = {None: {}}
+        for event in self.events:
+            for line in (None, event['line']):
+                entry = totals.setdefault(line, {}).setdefault(event['reason'] or "Unknown", {'downtimeMinutes': 0.0, 'events': 0})
+                entry['downtimeMinutes'] += event['downtimeMinutes'] or 0.0
+                entry['events'] += 1
+        return totals
+
+    def _events_per_shift(self) -> Dict[Optional[str], Dict[str, int]]:
+        counts: Dict[Optional[str], Dict[str, int]] = {None: {}}
+        for event in self.events:
+            for line in (None, event['line']):
+                shift_counts = counts.setdefault(line, {})
+                shift = event['shift'] or "Unknown"
+                shift_counts[shift] = shift_counts.get(shift, 0) + 1
+        return counts
+
+    def events_in_range(self, resource: Optional[str] = None, line: Optional[str] = None,
+                        start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Return events of a resource or line overlapping [start, end).
+
+        Args:
+            resource: Resource (equipment or line) individual name
+            line: Production line individual name, used when no resource is given
+            start: Range start (open if None)
+            end: Range end, exclusive (open if None)
+
+        Returns:
+            Event records ordered by start time
+        """
+        if not resource and not line:
+            return []
+        return self.time_index.overlapping(start, end, resource=resource or None, line=line or None)
+
+    def sequence_for(self, line: str) -> Optional[List[str]]:
+        """
+        Return the equipment sequence of a line given its lineId or individual name.
+
+        Args:
+            line: Line id (e.g. "LINE1") or ProductionLine individual name
+
+        Returns:
+            Equipment names in sequence order, or None if the line is unknown
+        """
+        if line in self.sequences:
+            return self.sequences[line]
+        individual = self.onto[line]
+        line_id = getattr(individual, "lineId", None) if individual is not None else None
+        return self.sequences.get(str(line_id)) if line_id is not None else None
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse a start/end parameter; event times are stored as naive local times, so offsets are refused."""
+    if not value:
+        return None
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is not None:
+        raise ValueError(f"time '{value}' has a UTC offset; give the local time without one")
+    return moment
+
+def _parse_limit(value: Optional[str]) -> int:
+    limit = int(value or 0)
+    if limit < 0:
+        raise ValueError(f"'limit' must not be negative, got {limit}")
+    return limit
+
+class QueryRequestHandler(BaseHTTPRequestHandler):
+    """Serves the index endpoints and the SPARQL passthrough for one OntologyIndexes."""
+    indexes: OntologyIndexes = None
+    sparql_lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        analysis_logger.debug("%s - %s" % (self.address_string(), format % args))
+
+    def _send_json(self, payload: Any, status: int = 200, raw: Optional[str] = None) -> None:
+        body = (raw if raw is not None else json.dumps(payload, default=_json_default)).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/sparql-results+json" if raw is not None else "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _sparql(self, query: Optional[str]) -> None:
+        if not query:
+            self._send_json({'error': "missing 'query'"}, 400)
+            return
+        stream = StringIO()
+        try:
+            with self.sparql_lock:
+                run_query(self.indexes.world, query, stream, format="json", cache=self.indexes.cache, name="service")
+        except Exception as e:
+            self._send_json({'error': str(e)}, 400)
+            return
+        self._send_json(None, raw=stream.getvalue())
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        indexes = self.indexes
+        parts = [unquote(p) for p in url.path.strip("/").split("/") if p]
+        try:
+            if parts == ["health"]:
+                self._send_json({'status': 'ok', 'events': len(indexes.events)})
+            elif parts == ["events"]:
+                if not params.get("resource") and not params.get("line"):
+                    self._send_json({'error': "give 'resource' or 'line'"}, 400)
+                    return
+                events = indexes.events_in_range(params.get("resource"), params.get("line"),
+                                                 _parse_time(params.get("start")), _parse_time(params.get("end")))
+                limit = _parse_limit(params.get("limit"))
+                self._send_json({'count': len(events), 'events': events[:limit] if limit else events})
+            elif parts == ["downtime-by-reason"]:
+                self._send_json(indexes.downtime_by_reason.get(params.get("line"), {}))
+            elif parts == ["events-per-shift"]:
+                self._send_json(indexes.events_per_shift.get(params.get("line"), {}))
+            elif len(parts) == 3 and parts[0] == "lines" and parts[2] == "sequence":
+                sequence = indexes.sequence_for(parts[1])
+                if sequence is None:
+                    self._send_json({'error': f"unknown line '{parts[1]}'"}, 404)
+                else:
+                    self._send_json({'line': parts[1], 'sequence': sequence})
+            elif parts == ["sparql"]:
+                self._sparql(params.get("query"))
+            else:
+                self._send_json({'error': f"unknown endpoint '{url.path}'"}, 404)
+        except ValueError as e:
+            self._send_json({'error': str(e)}, 400)
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip("/") != "/sparql":
+            self._send_json({'error': f"unknown endpoint '{self.path}'"}, 404)
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8")
+        if self.headers.get("Content-Type", "").startswith("application/x-www-form-urlencoded"):
+            body = parse_qs(body).get("query", [""])[0]
+        self._sparql(body)
+
+def create_server(indexes: OntologyIndexes, host: str = "127.0.0.1", port: int = 8050) -> ThreadingHTTPServer:
+    """
+    Create (but do not start) an HTTP server answering from the given indexes.
+
+    Args:
+        indexes: Indexes built over the loaded ontology
+        host: Interface to bind (local only by default)
+        port: Port to bind (0 picks a free port)
+
+    Returns:
+        The server; call serve_forever() to run it
+    """
+    handler = type("BoundQueryRequestHandler", (QueryRequestHandler,), {'indexes': indexes, 'sparql_lock': threading.Lock()})
+    return ThreadingHTTPServer((host, port), handler)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point for the local query service."""
+    parser = argparse.ArgumentParser(description="Serve operational queries over one generated ontology from in-memory indexes.")
+    parser.add_argument("ontology", nargs="?", help="OWL file or quadstore snapshot (a fresh snapshot next to an OWL file is used if present).")
+    parser.add_argument("--worlddb", default=None, help="Serve a persistent SQLite world database instead of a file.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=8050, help="Port to listen on (default: 8050).")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose (DEBUG level) logging.")
+    args = parser.parse_args(argv)
+
+    configure_logging(logging.DEBUG if args.verbose else logging.INFO)
+    if not args.ontology and not args.worlddb:
+        parser.error("an ontology file or --worlddb is required")
+
+    from ontology_generator.export.snapshot import load_ontology, load_snapshot
+    world, onto = load_snapshot(args.worlddb) if args.worlddb else load_ontology(args.ontology)
+    server = create_server(OntologyIndexes(world, onto), args.host, args.port)
+    analysis_logger.info(f"Query service listening on http://{args.host}:{server.server_address[1]}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
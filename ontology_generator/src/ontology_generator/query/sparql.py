@@ -0,0 +1,298 @@
+"""
+SPARQL query module for the ontology generator.
+
+This module runs SPARQL SELECT queries with owlready2's native engine, which
+translates them to SQL over the quadstore instead of going through the rdflib
+bridge. Prepared queries are cached by their text, results are streamed from
+the SQLite cursor as CSV or SPARQL JSON one row at a time, and each run reports
+its prepare/execute timings.
+
+Usage:
+    ontology-query output.owl -q "SELECT ?s WHERE { ?s a <...#Equipment> }"
+    python -m ontology_generator.query output.owl -f downtime.rq --format json -o downtime.json
+"""
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Dict, IO, Iterator, List, Optional, Sequence, Tuple
+
+from owlready2 import World, Ontology
+from owlready2.sparql.main import PreparedSelectQuery
+
+from ontology_generator.utils.logging import analysis_logger, configure_logging
+
+RESULT_FORMATS = ['csv', 'json']
+
+# SPARQL JSON binding of one result cell: {"type": "uri"|"bnode"|"literal", "value": ..., ["datatype"|"xml:lang"]: ...}
+Binding = Optional[Dict[str, str]]
+
+class PreparedQueryCache:
+    """
+    LRU cache of prepared SPARQL queries, keyed by world and query text.
+
+    Attributes:
+        max_size: Maximum number of prepared queries kept
+        hits: Number of lookups served from the cache
+        misses: Number of lookups that prepared the query
+    """
+    def __init__(self, max_size: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of prepared queries kept
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._queries: "OrderedDict[Tuple[int, str], PreparedSelectQuery]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def get(self, world: World, query: str) -> Tuple[PreparedSelectQuery, float, bool]:
+        """
+        Return the prepared query for a text, preparing it on a miss.
+
+        Args:
+            world: The world the query runs against
+            query: SPARQL query text
+
+        Returns:
+            Tuple of (prepared query, seconds spent preparing, whether it was cached)
+
+        Raises:
+            ValueError: If the query is not a SELECT query
+        """
+        key = (id(world), query.strip())
+        prepared = self._queries.get(key)
+        if prepared is not None:
+            self._queries.move_to_end(key)
+            self.hits += 1
+            return prepared, 0.0, True
+
+        start = time.perf_counter()
+        prepared = world.prepare_sparql(query)
+        elapsed = time.perf_counter() - start
+        if not isinstance(prepared, PreparedSelectQuery):
+            raise ValueError("Only SELECT queries can be run by the query runner.")
+        self.misses += 1
+        self._queries[key] = prepared
+        if len(self._queries) > self.max_size:
+            self._queries.popitem(last=False)
+        return prepared, elapsed, False
+
+def _lexical(value: Any) -> str:
+    """Return the XSD lexical form of a decoded literal value."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+def iter_bindings(world: World, prepared: PreparedSelectQuery, params: Sequence[Any] = ()) -> Iterator[List[Binding]]:
+    """
+    Execute a prepared query and yield each row as SPARQL JSON bindings.
+
+    Rows are decoded straight from the SQLite cursor, without building Python
+    entities, so memory stays flat however many rows the query returns.
+
+    Args:
+        world: The world the query was prepared for
+        prepared: The prepared SELECT query
+        params: Values for the query's ?? / ??1 parameters
+
+    Yields:
+        One list of bindings (None for unbound cells) per result row
+    """
+    column_types = prepared.column_types
+    unabbreviate = world._unabbreviate
+    for raw in prepared.execute_raw(params):
+        row: List[Binding] = []
+        i = 0
+        while i < len(raw):
+            kind = column_types[i]
+            if kind == "onto":
+                row.append({"type": "uri", "value": world.graph.c_2_onto[raw[i]].base_iri})
+                i += 1
+                continue
+            value = raw[i]
+            if kind == "objs":
+                datatype = "o"
+                i += 1
+            else:
+                datatype = raw[i + 1]
+                i += 2
+            if value is None:
+                row.append(None)
+            elif datatype == "o":
+                row.append({"type": "uri", "value": unabbreviate(value)} if value > 0 else {"type": "bnode", "value": f"r{-value}"})
+            elif isinstance(datatype, str):
+                row.append({"type": "literal", "value": str(value), "xml:lang": datatype[1:]})
+            elif datatype:
+                row.append({"type": "literal", "value": _lexical(world._to_python(value, datatype)), "datatype": unabbreviate(datatype)})
+            else:
+                row.append({"type": "literal", "value": str(value)})
+        yield row
+
+def _csv_cell(binding: Binding) -> str:
+    if binding is None:
+        return ""
+    if binding["type"] == "bnode":
+        return f"_:{binding['value']}"
+    return binding["value"]
+
+def write_results(columns: List[str], rows: Iterator[List[Binding]], stream: IO[str], format: str = "csv") -> int:
+    """
+    Stream result rows to a text stream as CSV or SPARQL 1.1 JSON results.
+
+    Args:
+        columns: Result variable names (without '?')
+        rows: Iterator of binding rows (see iter_bindings)
+        stream: Writable text stream
+        format: 'csv' or 'json'
+
+    Returns:
+        int: Number of rows written
+    """
+    if format not in RESULT_FORMATS:
+        raise ValueError(f"Unknown result format '{format}'. Expected one of {RESULT_FORMATS}.")
+    count = 0
+    if format == "csv":
+        writer = csv.writer(stream)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow([_csv_cell(binding) for binding in row])
+            count += 1
+        return count
+
+    stream.write('{"head": {"vars": %s}, "results": {"bindings": [' % json.dumps(columns))
+    for row in rows:
+        binding = {column: cell for column, cell in zip(columns, row) if cell is not None}
+        stream.write(("," if count else "") + "\n" + json.dumps(binding, ensure_ascii=False))
+        count += 1
+    stream.write("\n]}}\n")
+    return count
+
+def run_query(world: World,
+              query: str,
+              stream: IO[str],
+              format: str = "csv",
+              params: Sequence[Any] = (),
+              cache: Optional[PreparedQueryCache] = None,
+              name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run one SELECT query and stream its results.
+
+    Args:
+        world: The world to query
+        query: SPARQL query text
+        stream: Writable text stream receiving the results
+        format: 'csv' or 'json'
+        params: Values for the query's parameters
+        cache: Prepared-query cache (a private one is used if omitted)
+        name: Label used in the timing record and log line
+
+    Returns:
+        Dict with 'name', 'rows', 'cached', 'prepare_ms', 'first_row_ms' and 'execute_ms'
+    """
+    cache = cache if cache is not None else PreparedQueryCache()
+    prepared, prepare_seconds, cached = cache.get(world, query)
+
+    first_row_seconds = None
+    start = time.perf_counter()
+    def timed_rows():
+        nonlocal first_row_seconds
+        for row in iter_bindings(world, prepared, params):
+            if first_row_seconds is None:
+                first_row_seconds = time.perf_counter() - start
+            yield row
+    columns = [column.lstrip("?") for column in prepared.column_names]
+    rows = write_results(columns, timed_rows(), stream, format)
+    execute_seconds = time.perf_counter() - start
+
+    timing = {
+        'name': name or query.strip().splitlines()[0][:60],
+        'rows': rows,
+        'cached': cached,
+        'prepare_ms': prepare_seconds * 1000,
+        'first_row_ms': (first_row_seconds if first_row_seconds is not None else execute_seconds) * 1000,
+        'execute_ms': execute_seconds * 1000,
+    }
+    analysis_logger.info(f"Query '{timing['name']}': {rows} rows, prepare {timing['prepare_ms']:.1f} ms"
+                         f"{' (cached)' if cached else ''}, execute {timing['execute_ms']:.1f} ms")
+    return timing
+
+def format_timings(timings: List[Dict[str, Any]]) -> str:
+    """Format timing records as a fixed-width table."""
+    lines = [f"{'query':<40} {'rows':>8} {'prepare ms':>11} {'first row ms':>13} {'execute ms':>11}"]
+    for t in timings:
+        prepare = "cached" if t['cached'] else f"{t['prepare_ms']:.1f}"
+        lines.append(f"{t['name'][:40]:<40} {t['rows']:>8} {prepare:>11} {t['first_row_ms']:>13.1f} {t['execute_ms']:>11.1f}")
+    return "\n".join(lines)
+
+def _load_world(ontology_path: Optional[str], world_db_path: Optional[str]) -> Tuple[World, Optional[Ontology]]:
+    if world_db_path:
+        world = World(filename=world_db_path, exclusive=False)
+        return world, None
+    from ontology_generator.export.snapshot import load_ontology
+    return load_ontology(ontology_path)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point for running SPARQL queries against a generated ontology."""
+    parser = argparse.ArgumentParser(description="Run SPARQL SELECT queries with owlready2's native engine and stream the results.")
+    parser.add_argument("ontology", nargs="?", help="OWL file or quadstore snapshot to query (a fresh snapshot next to an OWL file is used if present).")
+    parser.add_argument("--worlddb", default=None, help="Query a persistent SQLite world database instead of a file.")
+    parser.add_argument("-q", "--query", action="append", default=[], help="SPARQL query text (repeatable).")
+    parser.add_argument("-f", "--query-file", action="append", default=[], help="File containing one SPARQL query (repeatable).")
+    parser.add_argument("--format", default="csv", choices=RESULT_FORMATS, help="Result format (default: csv).")
+    parser.add_argument("-o", "--output", default=None,
+                        help="Output file for a single query, or directory receiving <query name>.<format> per query (default: stdout).")
+    parser.add_argument("--repeat", type=int, default=1, help="Run each query this many times (later runs use the prepared-query cache).")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose (DEBUG level) logging.")
+    args = parser.parse_args(argv)
+
+    configure_logging(logging.DEBUG if args.verbose else logging.WARNING)
+    if not args.ontology and not args.worlddb:
+        parser.error("an ontology file or --worlddb is required")
+
+    queries: List[Tuple[str, str]] = [(f"query_{i + 1}", text) for i, text in enumerate(args.query)]
+    for path in args.query_file:
+        with open(path, encoding="utf-8") as f:
+            queries.append((os.path.splitext(os.path.basename(path))[0], f.read()))
+    if not queries:
+        parser.error("no query given (use -q or -f)")
+
+    world, _ = _load_world(args.ontology, args.worlddb)
+    cache = PreparedQueryCache()
+    timings = []
+    multiple = len(queries) > 1
+    if args.output and multiple:
+        os.makedirs(args.output, exist_ok=True)
+
+    failed = 0
+    for name, text in queries:
+        for _ in range(max(1, args.repeat)):
+            try:
+                if args.output:
+                    path = os.path.join(args.output, f"{name}.{args.format}") if multiple else args.output
+                    with open(path, "w", newline="", encoding="utf-8") as stream:
+                        timing = run_query(world, text, stream, args.format, cache=cache, name=name)
+                else:
+                    timing = run_query(world, text, sys.stdout, args.format, cache=cache, name=name)
+            except Exception as e:
+                analysis_logger.error(f"Query '{name}' failed: {e}")
+                failed += 1
+                break
+            timings.append(timing)
+
+    print(format_timings(timings), file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
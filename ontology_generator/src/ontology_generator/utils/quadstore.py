@@ -0,0 +1,71 @@
+"""
+Quadstore utility module for the ontology generator.
+
+This module provides helpers for querying the owlready2 SQLite quadstore directly.
+Analyses that only need counts or a handful of names can use aggregate queries
+here instead of loading every entity into Python through the owlready2 API.
+"""
+from typing import Any, Iterable, List, Optional, Sequence
+
+from owlready2 import World
+from owlready2.base import (
+    rdf_type, rdfs_subclassof, rdfs_subpropertyof, rdf_domain, rdf_range,
+    owl_class, owl_named_individual, owl_object_property, owl_data_property,
+    owl_inverse_property, owl_thing, owl_ontology, owl_equivalentclass,
+    owl_equivalentproperty
+)
+
+# Quadstore helpers and the owlready2 storid constants re-exported for them
+# (callers use quadstore.rdf_type etc. as query parameters)
+__all__ = [
+    'execute', 'fetch_all', 'fetch_column', 'sql_placeholders', 'storid_iri', 'storid_name',
+    'rdf_type', 'rdfs_subclassof', 'rdfs_subpropertyof', 'rdf_domain', 'rdf_range',
+    'owl_class', 'owl_named_individual', 'owl_object_property', 'owl_data_property',
+    'owl_inverse_property', 'owl_thing', 'owl_ontology', 'owl_equivalentclass',
+    'owl_equivalentproperty',
+]
+
+def execute(world: World, sql: str, params: Sequence[Any] = ()):
+    """
+    Execute a SQL statement against a World's quadstore.
+
+    Args:
+        world: The owlready2 World whose graph should be queried
+        sql: The SQL statement
+        params: Statement parameters
+
+    Returns:
+        The sqlite3 cursor
+    """
+    return world.graph.execute(sql, tuple(params))
+
+def fetch_all(world: World, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+    """Execute a query and return all rows."""
+    return execute(world, sql, params).fetchall()
+
+def fetch_column(world: World, sql: str, params: Sequence[Any] = ()) -> List[Any]:
+    """Execute a query and return the first column of every row."""
+    return [row[0] for row in execute(world, sql, params)]
+
+def sql_placeholders(values: Iterable[Any]) -> str:
+    """Build a '?, ?, ...' placeholder list for an IN clause."""
+    return ", ".join("?" for _ in values)
+
+def storid_iri(world: World, storid: int) -> Optional[str]:
+    """Return the full IRI for a storid, or None for blank nodes/unknown ids."""
+    if storid is None or storid < 0:
+        return None
+    return world._unabbreviate(storid)
+
+def storid_name(world: World, storid: int) -> str:
+    """
+    Return the owlready2 entity name for a storid.
+
+    The entity is loaded so the name matches ``entity.name`` exactly; callers
+    should only use this for the few names they report, not for every row.
+    """
+    entity = world._get_by_storid(storid)
+    if entity is not None and hasattr(entity, "name"):
+        return entity.name
+    iri = storid_iri(world, storid) or str(storid)
+    return iri.rsplit("#", 1)[-1].rsplit("/", 1)[-1]
@@ -0,0 +1,173 @@
+"""
+Rejected-row quarantine module for the ontology generator.
+
+Rows that fail population are written, unchanged, to a quarantine sidecar file
+together with their row number, the population phase and a machine-readable
+reason code, so bad rows can be found without searching the logs and fixed rows
+can be reprocessed from the quarantine file alone.
+
+The sidecar is CSV (the data columns after four `_quarantine_*` columns) or,
+for a .jsonl/.ndjson path, one JSON object per row. Rows are handed to a
+background thread that writes them in batches, so a failing run does not wait
+on the file. read_data() accepts both formats as input and drops the
+quarantine columns.
+"""
+import csv
+import json
+import os
+import queue
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ontology_generator.utils.logging import main_logger
+
+# Reason codes and their meaning
+QUARANTINE_REASONS = {
+    "missing_plant": "Pass 1 could not create the row's Plant, so the row has no asset hierarchy.",
+    "missing_event": "The row has an EVENT_TYPE but no EventRecord could be created for it.",
+    "dimension_error": "A dimension of the row (asset, equipment, material, ...) raised an error in dimension-first population.",
+    "pass1_error": "Unexpected error while creating the row's individuals (Pass 1).",
+    "pass2_error": "Unexpected error while linking the row's individuals (Pass 2).",
+}
+
+QUARANTINE_COLUMNS = ["_quarantine_row_num", "_quarantine_phase", "_quarantine_reason", "_quarantine_detail"]
+JSONL_EXTENSIONS = (".jsonl", ".ndjson")
+
+# Keys added to data rows during population that are not data columns
+_TRANSIENT_KEYS = ("row_num",)
+
+def is_jsonl_path(path: str) -> bool:
+    """True if the path has a JSON Lines extension."""
+    return path.lower().endswith(JSONL_EXTENSIONS)
+
+class QuarantineWriter:
+    """
+    Buffered background writer of rejected rows.
+
+    add() only copies the row and puts it on a queue; a daemon thread writes the
+    queued rows in batches and flushes after each batch. close() writes the
+    remaining rows and re-raises the first write error, if any.
+
+    Attributes:
+        path: The quarantine file
+        fieldnames: Data columns of the CSV sidecar (default: the keys of the first row added)
+        counts: {(phase, reason): rows quarantined}
+    """
+    def __init__(self, path: str, fieldnames: Optional[Iterable[str]] = None, batch_size: int = 500):
+        self.path = path
+        self.fieldnames = [name for name in fieldnames if name not in _TRANSIENT_KEYS] if fieldnames else None
+        self.batch_size = batch_size
+        self.counts: Dict[Tuple[str, str], int] = {}
+        self._jsonl = is_jsonl_path(path)
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=batch_size * 20)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._thread = threading.Thread(target=self._run, name="quarantine-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "QuarantineWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def count(self) -> int:
+        """Number of rows quarantined."""
+        return sum(self.counts.values())
+
+    def add(self, row: Dict[str, Any], row_num: int, phase: str, reason: str, detail: str = "") -> None:
+        """
+        Queue a rejected row.
+
+        Args:
+            row: The data row (copied; later changes to it are not written)
+            row_num: Line number of the row in the input file
+            phase: Population phase that rejected it ('pass1', 'dimensions', 'pass2')
+            reason: Reason code (a key of QUARANTINE_REASONS)
+            detail: Free-text detail, e.g. the exception message
+        """
+        if self._closed:
+            raise ValueError(f"Quarantine file {self.path} is closed")
+        key = (phase, reason)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        data = {name: value for name, value in row.items() if name not in _TRANSIENT_KEYS}
+        self._queue.put({"row_num": row_num, "phase": phase, "reason": reason, "detail": detail, "row": data})
+
+    def close(self) -> None:
+        """Write the queued rows, stop the writer thread and close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        writer = None
+        batch: List[Dict[str, Any]] = []
+        done = False
+        while not done:
+            entry = self._queue.get()
+            batch.append(entry)
+            # Drain what is already queued, up to a batch
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                done = True
+                batch.pop()
+            if batch and self._error is None:
+                try:
+                    writer = self._write_batch(batch, writer)
+                except Exception as e:
+                    self._error = e
+            batch = []
+
+    def _write_batch(self, batch: List[Dict[str, Any]], writer: Optional[csv.DictWriter]) -> Optional[csv.DictWriter]:
+        if self._jsonl:
+            self._file.write("".join(json.dumps(entry, default=str) + "\n" for entry in batch))
+        else:
+            if writer is None:
+                fieldnames = self.fieldnames or list(batch[0]["row"])
+                writer = csv.DictWriter(self._file, QUARANTINE_COLUMNS + fieldnames, restval="", extrasaction="ignore")
+                writer.writeheader()
+            for entry in batch:
+                record = dict(entry["row"])
+                record.update(zip(QUARANTINE_COLUMNS, (entry["row_num"], entry["phase"], entry["reason"], entry["detail"])))
+                writer.writerow(record)
+        self._file.flush()
+        return writer
+
+    def log_summary(self, logger=main_logger) -> None:
+        """Log the number of quarantined rows per phase and reason."""
+        if not self.counts:
+            logger.info(f"No rows were quarantined ({self.path} is empty).")
+            return
+        logger.warning(f"Quarantined {self.count} rejected rows to {self.path}:")
+        for (phase, reason), count in sorted(self.counts.items()):
+            logger.warning(f"  {phase}/{reason}: {count}")
+
+def read_quarantine_jsonl(path: str) -> List[Dict[str, str]]:
+    """
+    Read the data rows of a JSONL quarantine file, for reprocessing.
+
+    Args:
+        path: The quarantine file
+
+    Returns:
+        List of the rejected data rows, in file order
+    """
+    rows = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                rows.append(json.loads(line)["row"])
+    return rows
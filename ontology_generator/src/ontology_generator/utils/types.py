@@ -30,6 +30,12 @@ def safe_cast(value: Any, target_type: Type[T], default: Optional[T] = None) ->
     if value is None or value == '':
         return default
     try:
+        # Typed values (e.g. from Parquet/Arrow input) need no parsing
+        if target_type is datetime and isinstance(value, datetime):
+            return value.replace(tzinfo=None) if value.tzinfo is not None else value
+        if target_type in (int, float) and isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+            return target_type(value)
+
         original_value_repr = repr(value)  # For logging
         value_str = str(value).strip()
 
@@ -102,12 +108,12 @@ def safe_cast(value: Any, target_type: Type[T], default: Optional[T] = None) ->
                 # owlready2 stores naive datetimes.
                 # Maintain existing behavior: make it naive (loses original offset info).
                 if has_timezone:
-                    pop_logger.debug(f"Parsed datetime {original_value_repr} with timezone {timezone_name}, storing as naive datetime.")
+                    pop_logger.debug("Parsed datetime %s with timezone %s, storing as naive datetime.", original_value_repr, timezone_name)
                     parsed_dt = parsed_dt.replace(tzinfo=None)
                 else:
-                    pop_logger.debug(f"Parsed datetime {original_value_repr} without timezone, storing as naive datetime.")
+                    pop_logger.debug("Parsed datetime %s without timezone, storing as naive datetime.", original_value_repr)
 
-                pop_logger.debug(f"Successfully parsed datetime '{original_value_repr}' → {parsed_dt}")
+                pop_logger.debug("Successfully parsed datetime '%s' → %s", original_value_repr, parsed_dt)
                 return parsed_dt
 
             except (ParserError, ValueError, TypeError) as e:  # Catch errors from dateutil and potential downstream issues
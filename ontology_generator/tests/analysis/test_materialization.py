@@ -0,0 +1,126 @@
+"""
+Unit tests for ontology_generator.analysis.materialization module.
+
+This module tests the in-process OWL RL materializer, including:
+- Inverse, symmetric, transitive and sub-property rules
+- Domain/range typing and the most-specific-type filter
+- Refreshing already-loaded Python entities
+- Writing inferences into a separate target ontology
+"""
+import pytest
+
+from owlready2 import (
+    World, Thing, ObjectProperty, DataProperty, SymmetricProperty, TransitiveProperty
+)
+
+from ontology_generator.analysis.materialization import materialize_owl_rl
+from ontology_generator.utils import quadstore
+
+
+@pytest.fixture
+def rl_onto():
+    """Create an ontology exercising each supported rule."""
+    world = World()
+    onto = world.get_ontology("http://test.org/materialization-test")
+    with onto:
+        class Equipment(Thing): pass
+        class Filler(Equipment): pass
+        class ProductionLine(Thing): pass
+        class Location(Thing): pass
+        class isImmediatelyUpstreamOf(ObjectProperty):
+            domain = [Equipment]
+            range = [Equipment]
+        class isImmediatelyDownstreamOf(ObjectProperty):
+            inverse_property = isImmediatelyUpstreamOf
+        class isParallelWith(ObjectProperty, SymmetricProperty): pass
+        class isPartOfProductionLine(ObjectProperty):
+            range = [ProductionLine]
+        class isPartOfFirstSegment(isPartOfProductionLine): pass
+        class locatedIn(ObjectProperty, TransitiveProperty):
+            range = [Location]
+        class equipmentId(DataProperty):
+            domain = [Equipment]
+            range = [str]
+        class fillerId(equipmentId): pass
+
+        filler = Filler("Filler_1")
+        bundler = Thing("Bundler_1")
+        bundler_2 = Thing("Bundler_2")
+        line = Thing("Line_1")
+        area, plant, site = Location("Area_1"), Location("Plant_1"), Location("Site_1")
+        filler.isImmediatelyUpstreamOf = [bundler]
+        bundler.isParallelWith = [bundler_2]
+        filler.isPartOfFirstSegment = [line]
+        area.locatedIn = [plant]
+        plant.locatedIn = [site]
+        bundler_2.fillerId = ["B2"]
+    return world, onto
+
+
+def test_property_rules(rl_onto):
+    """Inverse, symmetric, transitive and sub-property triples are materialized."""
+    world, onto = rl_onto
+
+    counts = materialize_owl_rl(onto)
+
+    assert counts['inverse'] == 1
+    assert counts['symmetric'] == 1
+    assert counts['transitive'] == 1
+    assert counts['subproperty'] == 2
+    assert list(onto.Bundler_1.isImmediatelyDownstreamOf) == [onto.Filler_1]
+    assert list(onto.Bundler_2.isParallelWith) == [onto.Bundler_1]
+    assert set(onto.Area_1.locatedIn) == {onto.Plant_1, onto.Site_1}
+    assert list(onto.Filler_1.isPartOfProductionLine) == [onto.Line_1]
+    assert list(onto.Bundler_2.equipmentId) == ["B2"]
+    # Inferred triples are real quadstore triples, not just Python values
+    assert world._has_obj_triple_spo(onto.Bundler_1.storid, onto.isImmediatelyDownstreamOf.storid, onto.Filler_1.storid)
+
+
+def test_type_rules_keep_most_specific(rl_onto):
+    """Domain/range types are added only where not already implied."""
+    _, onto = rl_onto
+
+    counts = materialize_owl_rl(onto)
+
+    # Filler_1 is already a Filler, so the Equipment domain type is not written
+    assert onto.Filler_1.is_a == [onto.Filler]
+    assert onto.Bundler_1.is_a == [onto.Equipment]
+    assert onto.Bundler_2.is_a == [onto.Equipment]
+    assert onto.Line_1.is_a == [onto.ProductionLine]
+    assert counts['domain'] == 1
+    assert counts['range'] == 2
+    assert counts['subclass'] == 0
+
+
+def test_superclass_types(rl_onto):
+    """With include_superclass_types, types implied by the hierarchy are written too."""
+    world, onto = rl_onto
+
+    materialize_owl_rl(onto, include_superclass_types=True)
+
+    assert world._has_obj_triple_spo(onto.Filler_1.storid, quadstore.rdf_type, onto.Equipment.storid)
+    assert world._has_obj_triple_spo(onto.Line_1.storid, quadstore.rdf_type, onto.ProductionLine.storid)
+    assert set(onto.Filler_1.is_a) == {onto.Filler, onto.Equipment}
+
+
+def test_materialization_is_idempotent(rl_onto):
+    """A second run finds nothing new and leaves no temporary tables."""
+    world, onto = rl_onto
+    materialize_owl_rl(onto)
+
+    counts = materialize_owl_rl(onto)
+
+    assert sum(counts.values()) == 0
+    assert list(world.graph.execute("SELECT name FROM temp.sqlite_master WHERE name LIKE 'rl_%'")) == []
+
+
+def test_target_ontology(rl_onto):
+    """Inferred triples are written into the target ontology only."""
+    world, onto = rl_onto
+    inferences = world.get_ontology("http://inferrences/")
+    asserted_before = len(list(onto.get_triples()))
+
+    counts = materialize_owl_rl(onto, target_onto=inferences)
+
+    assert len(list(onto.get_triples())) == asserted_before
+    assert len(list(inferences.get_triples())) >= sum(counts.values())
@@ -0,0 +1,162 @@
+"""
+Unit tests for ontology_generator.analysis.partitioned_reasoning module.
+
+This module tests partitioned reasoning, including:
+- Splitting individuals into per-line partitions and a shared partition
+- Exporting partitions with the types of referenced individuals
+- Reasoning partitions in worker processes and merging the inferences
+- Reporting partitions that time out instead of failing the run
+- Keeping the inferences of inconsistent partitions out of the ontology
+"""
+import pytest
+
+from owlready2 import World, Thing, ObjectProperty
+
+from ontology_generator.analysis import partitioned_reasoning
+from ontology_generator.analysis.materialization import materialize_owl_rl
+from ontology_generator.analysis.partitioned_reasoning import (
+    assign_partitions, export_partition, export_tbox, reason_over_triples,
+    run_partitioned_reasoning, generate_partition_report, SHARED_PARTITION
+)
+
+
+def _build_plant(world):
+    """Build two lines with equipment, events and a shift shared by both lines."""
+    onto = world.get_ontology("http://test.org/partition-test")
+    with onto:
+        class ProductionLine(Thing): pass
+        class Equipment(Thing): pass
+        class EventRecord(Thing): pass
+        class Shift(Thing): pass
+        class isPartOfProductionLine(ObjectProperty):
+            domain = [Equipment]
+            range = [ProductionLine]
+        class hasEquipmentPart(ObjectProperty):
+            inverse_property = isPartOfProductionLine
+        class involvesResource(ObjectProperty):
+            domain = [EventRecord]
+        class duringShift(ObjectProperty):
+            range = [Shift]
+
+        shift = Thing("Shift_1")
+        for line_id in ["L1", "L2"]:
+            line = ProductionLine(f"Line_{line_id}")
+            equipment = Thing(f"Equipment_{line_id}")
+            equipment.isPartOfProductionLine = [line]
+            event = Thing(f"Event_{line_id}")
+            event.involvesResource = [equipment]
+            event.duringShift = [shift]
+    return onto
+
+
+def _iri_triples(onto):
+    """Return an ontology's object triples as IRIs, comparable across Worlds."""
+    world = onto.world
+    return sorted(
+        (world._unabbreviate(s), world._unabbreviate(p), world._unabbreviate(o))
+        for s, p, o in world.graph.execute("SELECT s, p, o FROM objs WHERE c = ? AND s > 0 AND o > 0", (onto.graph.c,))
+    )
+
+
+@pytest.fixture
+def plant_onto():
+    """Create the test plant in its own World."""
+    return _build_plant(World())
+
+
+def test_assign_partitions(plant_onto):
+    """Equipment and events join their line's partition; the shift is shared."""
+    onto = plant_onto
+
+    partitions = assign_partitions(onto)
+
+    names = {name: sorted(onto.world._get_by_storid(s).name for s in members) for name, members in partitions.items()}
+    assert names == {
+        "Line_L1": ["Equipment_L1", "Event_L1", "Line_L1"],
+        "Line_L2": ["Equipment_L2", "Event_L2", "Line_L2"],
+        SHARED_PARTITION: ["Shift_1"],
+    }
+    assert list(assign_partitions(onto, lines_per_partition=2)) == ["Line_L1 (+1)", SHARED_PARTITION]
+
+
+def test_export_partition_includes_referenced_types(plant_onto):
+    """A partition carries its members' triples and the types of referenced individuals."""
+    onto = plant_onto
+    partitions = assign_partitions(onto)
+
+    triples = export_partition(onto, partitions["Line_L1"])
+
+    subjects = {t[1].rsplit("#", 1)[-1] for t in triples}
+    assert {"Line_L1", "Equipment_L1", "Event_L1", "Shift_1"} <= subjects
+    assert "Line_L2" not in subjects
+    shift_triples = [t for t in triples if t[1].endswith("#Shift_1")]
+    assert all(t[2].endswith("#type") for t in shift_triples)
+
+
+def test_reason_over_triples_in_process(plant_onto):
+    """The worker function reasons over exported triples in a fresh World."""
+    onto = plant_onto
+    triples = export_tbox(onto) + export_partition(onto, assign_partitions(onto)["Line_L1"])
+
+    result = reason_over_triples(triples, engine="rl")
+
+    assert result['status'] == 'ok'
+    inferred = {(t[1].rsplit("#", 1)[-1], t[2].rsplit("#", 1)[-1], t[3].rsplit("#", 1)[-1]) for t in result['inferred']}
+    assert ("Line_L1", "hasEquipmentPart", "Equipment_L1") in inferred
+    assert ("Event_L1", "type", "EventRecord") in inferred
+
+
+def test_partitioned_matches_whole_world(plant_onto):
+    """Merged partition inferences equal a whole-world materialization for independent lines."""
+    onto = plant_onto
+    reference = _build_plant(World())
+    materialize_owl_rl(reference)
+
+    summary = run_partitioned_reasoning(onto, engine="rl", max_workers=2, timeout=120)
+
+    assert [p['status'] for p in summary['partitions']] == ['ok', 'ok', 'ok']
+    assert _iri_triples(onto) == _iri_triples(reference)
+    assert list(onto.Line_L1.hasEquipmentPart) == [onto.Equipment_L1]
+    assert onto.Event_L2.is_a == [onto.EventRecord]
+
+
+def test_partition_timeouts_are_reported(plant_onto):
+    """Partitions that time out are reported without raising."""
+    onto = plant_onto
+
+    summary = run_partitioned_reasoning(onto, engine="rl", max_workers=3, timeout=0.001)
+    report, has_issues = generate_partition_report(summary)
+
+    assert has_issues
+    assert {p['status'] for p in summary['partitions']} == {'timeout'}
+    assert summary['merged_triples'] == 0
+    assert "Line_L1 (3 individuals): TIMEOUT" in report
+
+
+def test_inconsistent_partitions_are_not_merged(plant_onto, monkeypatch):
+    """An inconsistent partition is reported with its inference count, and its inferences are not merged."""
+    onto = plant_onto
+    run_in_workers = partitioned_reasoning._run_in_workers
+
+    def with_inconsistent_line(jobs, *args):
+        results = run_in_workers(jobs, *args)
+        if "Line_L2" in results: # Not the TBox classification
+            results["Line_L2"].update(status='inconsistent', inconsistent_classes=['EventRecord'])
+        return results
+    monkeypatch.setattr(partitioned_reasoning, "_run_in_workers", with_inconsistent_line)
+
+    summary = run_partitioned_reasoning(onto, engine="rl", max_workers=2, timeout=120)
+    report, has_issues = generate_partition_report(summary)
+
+    line2, = [p for p in summary['partitions'] if p['name'] == "Line_L2"]
+    assert has_issues and line2['inferred_count'] > 0
+    assert f"Line_L2 (3 individuals): INCONSISTENT EventRecord ({line2['inferred_count']} inferred triples not merged)" in report
+    assert list(onto.Line_L1.hasEquipmentPart) == [onto.Equipment_L1]
+    assert onto.Event_L1.is_a == [onto.EventRecord]
+    assert onto.Event_L2.is_a == [Thing]
+
+
+def test_unknown_engine_rejected(plant_onto):
+    """An unknown engine raises ValueError."""
+    with pytest.raises(ValueError):
+        run_partitioned_reasoning(plant_onto, engine="pellet")
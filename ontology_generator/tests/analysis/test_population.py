@@ -0,0 +1,91 @@
+"""
+Unit tests for ontology_generator.analysis.population module.
+
+This module tests population analysis, including:
+- The SQL (quadstore aggregate) backend
+- Equivalence of the SQL and search backends, including the generated report
+"""
+import pytest
+
+from owlready2 import World, Thing, ObjectProperty, DataProperty
+
+from ontology_generator.analysis.population import (
+    analyze_ontology_population,
+    generate_population_report
+)
+
+
+@pytest.fixture
+def populated_onto():
+    """Create a small populated ontology with a class hierarchy."""
+    world = World()
+    onto = world.get_ontology("http://test.org/population-analysis")
+    with onto:
+        class ProductionLine(Thing): pass
+        class Equipment(Thing): pass
+        class Filler(Equipment): pass
+        class EventRecord(Thing): pass
+        class Shift(Thing): pass
+        class involvesResource(ObjectProperty):
+            domain = [EventRecord]
+            range = [Equipment]
+        class lineId(DataProperty):
+            domain = [ProductionLine]
+            range = [str]
+
+        ProductionLine("Line_1")
+        for i in range(3):
+            Equipment(f"Equipment_{i}")
+        Filler("Filler_1")
+        for i in range(25):
+            EventRecord(f"Event_{i}")
+
+    defined_classes = {cls.name: cls for cls in [onto.ProductionLine, onto.Equipment, onto.Filler, onto.EventRecord, onto.Shift]}
+    specification = [{"Proposed OWL Entity": name} for name in ["ProductionLine", "Equipment", "EventRecord", "Shift"]]
+    return onto, defined_classes, specification
+
+
+def test_sql_backend_counts(populated_onto):
+    """The SQL backend counts with the same semantics as onto.search(is_a=...)."""
+    onto, defined_classes, specification = populated_onto
+
+    counts, empty, samples, usage = analyze_ontology_population(onto, defined_classes, specification, backend="sql")
+
+    # search(is_a=...) includes the class itself and its subclasses
+    assert counts["Equipment"] == len(list(onto.search(is_a=onto.Equipment)))
+    assert counts["Filler"] == 2
+    assert counts["EventRecord"] == 26
+    assert len(samples["EventRecord"]) == 10
+    assert set(usage["in_property_domains"]) == {"EventRecord", "ProductionLine"}
+    assert set(usage["in_property_ranges"]) == {"Equipment"}
+
+
+def test_sql_and_search_backends_match(populated_onto):
+    """Both backends return the same analysis and an identical report."""
+    onto, defined_classes, specification = populated_onto
+
+    sql_result = analyze_ontology_population(onto, defined_classes, specification, backend="sql")
+    search_result = analyze_ontology_population(onto, defined_classes, specification, backend="search")
+
+    assert sql_result[0] == search_result[0]
+    assert sql_result[1] == search_result[1]
+    assert sql_result[2] == search_result[2]
+    for key in search_result[3]:
+        assert sorted(sql_result[3][key]) == sorted(search_result[3][key])
+
+    sql_report = generate_population_report(sql_result[0], sql_result[1], sql_result[2], defined_classes, sql_result[3])
+    search_report = generate_population_report(search_result[0], search_result[1], search_result[2], defined_classes, search_result[3])
+    assert sql_report == search_report
+
+
+def test_sql_backend_falls_back_on_error(populated_onto, mocker):
+    """A failing quadstore query falls back to the search backend."""
+    onto, defined_classes, specification = populated_onto
+    mocker.patch(
+        "ontology_generator.analysis.population._collect_class_population_sql",
+        side_effect=RuntimeError("boom")
+    )
+
+    counts, _, _, _ = analyze_ontology_population(onto, defined_classes, specification, backend="sql")
+
+    assert counts["EventRecord"] == 26
@@ -0,0 +1,107 @@
+"""
+Unit tests for ontology_generator.analysis.reasoning module.
+
+This module tests reasoning report collection, including:
+- Quadstore entity statistics
+- Diffing the quadstore against a pre-reasoning snapshot
+"""
+import pytest
+
+from owlready2 import World, Thing, ObjectProperty, DataProperty
+
+from ontology_generator.analysis.reasoning import (
+    collect_quadstore_stats,
+    ReasoningReportCollector
+)
+
+
+@pytest.fixture
+def reasoning_onto():
+    """Create a small ontology with a few asserted facts."""
+    world = World()
+    onto = world.get_ontology("http://test.org/reasoning-test")
+    with onto:
+        class Equipment(Thing): pass
+        class Filler(Equipment): pass
+        class ProductionLine(Thing): pass
+        class isPartOfProductionLine(ObjectProperty):
+            domain = [Equipment]
+            range = [ProductionLine]
+        class equipmentId(DataProperty):
+            domain = [Equipment]
+            range = [str]
+
+        ProductionLine("Line_1")
+        filler = Filler("Filler_1")
+        filler.equipmentId = ["F1"]
+        Equipment("Equipment_2")
+    return world, onto
+
+
+def _temp_tables(world):
+    return [row[0] for row in world.graph.execute("SELECT name FROM temp.sqlite_master WHERE name LIKE 'reasoning_snapshot_%'")]
+
+
+def test_collect_quadstore_stats(reasoning_onto):
+    """Statistics match the counts from the owlready2 API."""
+    _, onto = reasoning_onto
+
+    stats = collect_quadstore_stats(onto)
+
+    assert stats == {
+        'classes': len(list(onto.classes())),
+        'object_properties': len(list(onto.object_properties())),
+        'data_properties': len(list(onto.data_properties())),
+        'individuals': len(list(onto.individuals())),
+    }
+
+
+def test_collector_reports_only_new_triples(reasoning_onto):
+    """Only triples added after the snapshot are reported, in report shapes."""
+    world, onto = reasoning_onto
+    collector = ReasoningReportCollector(onto)
+    pre_stats = collector.snapshot()
+
+    # Simulate reasoner output written into a separate ontology
+    inferences = world.get_ontology("http://inferrences/")
+    with inferences:
+        class MachineGroup(Thing): pass
+        onto.Filler.is_a.append(MachineGroup)
+        onto.Equipment_2.is_a.append(onto.Filler)
+        onto.Equipment_2.isPartOfProductionLine = [onto.Line_1]
+        onto.Equipment_2.equipmentId = ["E2"]
+
+    post_stats, hierarchy, properties, individuals = collector.collect()
+
+    assert pre_stats == collect_quadstore_stats(onto)
+    assert post_stats == pre_stats
+    assert hierarchy == {"MachineGroup": {'subclasses': ["Filler"], 'equivalent': []}}
+    assert properties == {}
+    assert list(individuals) == ["Equipment_2"]
+    assert individuals["Equipment_2"]['types'] == ["Filler"]
+    assert individuals["Equipment_2"]['properties'] == {
+        "equipmentId": ["'E2'"],
+        "isPartOfProductionLine": ["Line_1"],
+    }
+    assert _temp_tables(world) == []
+
+
+def test_collector_requires_snapshot(reasoning_onto):
+    """Collecting without a snapshot is an error."""
+    _, onto = reasoning_onto
+    with pytest.raises(RuntimeError):
+        ReasoningReportCollector(onto).collect()
+
+
+def test_collector_discard_drops_snapshot(reasoning_onto):
+    """Discarding drops the temporary snapshot tables."""
+    world, onto = reasoning_onto
+    collector = ReasoningReportCollector(onto)
+    collector.snapshot()
+    assert len(_temp_tables(world)) == 2
+
+    collector.discard()
+
+    assert _temp_tables(world) == []
+    with pytest.raises(RuntimeError):
+        collector.collect()
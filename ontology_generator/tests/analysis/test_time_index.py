@@ -0,0 +1,91 @@
+"""
+Unit tests for ontology_generator.analysis.time_index module.
+
+This module tests the time-range index, including:
+- Range, overlap and point-in-time queries per resource, per line and overall
+- Default durations for events without an end time
+- Building the index from Pass 1 event facts and from a loaded ontology
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from owlready2 import World, Thing, ObjectProperty, DataProperty, FunctionalProperty
+
+from ontology_generator.analysis.time_index import TimeRangeIndex
+from ontology_generator.population.core import PopulationContext
+
+T0 = datetime(2025, 1, 1, 6)
+
+
+def _at(hours):
+    return T0 + timedelta(hours=hours)
+
+
+@pytest.fixture
+def index():
+    """A long line event, two machine events (one open-ended) and a zero-length event."""
+    return TimeRangeIndex([
+        ("line_run", "Line_1", "Line_1", _at(0), _at(8)),
+        ("filler_jam", "Filler_1", "Line_1", _at(1), _at(2)),
+        ("capper_stop", "Capper_1", "Line_1", _at(3), None),
+        ("capper_blip", "Capper_1", "Line_1", _at(6), _at(6)),
+        ("line2_run", "Line_2", None, _at(2), _at(4)),
+    ], default_duration=timedelta(hours=1))
+
+
+def test_overlapping(index):
+    """Overlap is half-open and respects long intervals that started before the window."""
+    assert index.overlapping(_at(2), _at(3), line="Line_1") == ["line_run"]
+    assert index.overlapping(_at(1.5), _at(3.5), line="Line_1") == ["line_run", "filler_jam", "capper_stop"]
+    assert index.overlapping(_at(6), _at(7), resource="Capper_1") == ["capper_blip"]
+    assert index.overlapping(_at(4), resource="Capper_1") == ["capper_blip"] # capper_stop ended at 4h (default duration)
+    assert index.overlapping(end=_at(2)) == ["line_run", "filler_jam"]
+    assert index.overlapping(_at(0), _at(1), resource="Unknown_1") == []
+
+
+def test_starting_between_and_active_at(index):
+    """Range queries bisect on start times; point queries return intervals in progress."""
+    assert index.starting_between(_at(1), _at(3)) == ["filler_jam", "line2_run"]
+    assert index.starting_between(_at(3), line="Line_1") == ["capper_stop", "capper_blip"]
+    assert index.active_at(_at(3.5)) == ["line_run", "line2_run", "capper_stop"]
+    assert index.active_at(_at(2), resource="Filler_1") == []
+    assert len(index) == 5
+    assert sorted(index.by_line) == ["Line_1", "Line_2"]
+
+
+def test_from_event_facts_and_ontology():
+    """Indexes built from Pass 1 event facts and from the ontology agree."""
+    world = World()
+    onto = world.get_ontology("http://test.org/time-index-test#")
+    with onto:
+        class ProductionLine(Thing): pass
+        class Equipment(Thing): pass
+        class EventRecord(Thing): pass
+        class TimeInterval(Thing): pass
+        class involvesResource(ObjectProperty, FunctionalProperty): pass
+        class isPartOfProductionLine(ObjectProperty): pass
+        class occursDuring(ObjectProperty, FunctionalProperty): pass
+        class startTime(DataProperty, FunctionalProperty): pass
+        class endTime(DataProperty, FunctionalProperty): pass
+        line = ProductionLine("Line_1")
+        filler = Equipment("Filler_1", isPartOfProductionLine=[line])
+        facts = []
+        for i, resource in enumerate([line, filler, filler]):
+            interval = TimeInterval(f"Interval_{i}", startTime=_at(i), endTime=_at(i + 1))
+            event = EventRecord(f"Event_{i}", involvesResource=resource, occursDuring=interval)
+            fact = {"EventRecord": event, "TimeInterval": interval, "ProductionLine": line}
+            if resource is filler:
+                fact["Equipment"] = filler
+            facts.append(fact)
+
+    # A context that does not collect facts (no --export-facts) builds its index from the ontology
+    context = PopulationContext(onto, {}, {}, {})
+    for fact in facts:
+        context.record_event_fact(fact)
+    assert context.event_facts == []
+
+    for built in (TimeRangeIndex.from_event_facts(facts), TimeRangeIndex.from_ontology(world, onto),
+                  context.get_time_index()):
+        assert [e.name for e in built.overlapping(_at(0.5), _at(2), line="Line_1")] == ["Event_0", "Event_1"]
+        assert [e.name for e in built.active_at(_at(2.5), resource="Filler_1")] == ["Event_2"]
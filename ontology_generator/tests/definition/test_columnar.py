@@ -0,0 +1,84 @@
+"""
+Tests for Parquet/Arrow data input.
+"""
+from datetime import datetime, timezone, timedelta
+
+import pytest
+from owlready2 import locstr
+
+from ontology_generator.config import init_xsd_type_map
+from ontology_generator.definition.columnar import (
+    read_columnar, projection_columns, typed_columns_from_mappings
+)
+from ontology_generator.definition.parser import read_data, RowFilter
+from ontology_generator.utils.types import safe_cast
+
+START = datetime(2025, 2, 4, 15, 20, 53)
+
+
+def _table(pa):
+    return pa.table({
+        "PLANT": pa.array(["MX11", "MX11", "MX12"]),
+        "LINE_NAME": pa.array(["L1", None, "L1"]),
+        "EQUIPMENT_ID": pa.array([100, 101, 102], pa.int64()),
+        "MATERIAL_ID": pa.array([1002.0, None, 7.5]),
+        "JOB_START_TIME_LOC": pa.array([START, None, START + timedelta(days=1)], pa.timestamp("ms")),
+        "DOWNTIME": pa.array([10.5, None, 3.0]),
+        "UNUSED": pa.array(["x", "y", "z"]),
+    })
+
+
+@pytest.mark.parametrize("extension", ["parquet", "arrow"])
+def test_read_columnar_typed_projection(tmp_path, extension):
+    """Mapped timestamps and numbers stay typed, other columns are text as in a CSV export, nulls are empty strings"""
+    pa = pytest.importorskip("pyarrow")
+    path = str(tmp_path / f"data.{extension}")
+    if extension == "parquet":
+        import pyarrow.parquet as pq
+        pq.write_table(_table(pa), path)
+    else:
+        import pyarrow.feather as feather
+        feather.write_feather(_table(pa), path)
+
+    typed = {"JOB_START_TIME_LOC": datetime, "DOWNTIME": float, "EQUIPMENT_ID": float}
+    columns = ["PLANT", "EQUIPMENT_ID", "MATERIAL_ID", "JOB_START_TIME_LOC", "DOWNTIME", "NOT_IN_FILE"]
+    rows = read_data(path, columns=columns, typed_columns={"JOB_START_TIME_LOC": datetime, "DOWNTIME": float})
+    assert rows[0] == {"PLANT": "MX11", "EQUIPMENT_ID": "100", "MATERIAL_ID": "1002.0", "JOB_START_TIME_LOC": START,
+                       "DOWNTIME": 10.5}
+    assert rows[1] == {"PLANT": "MX11", "EQUIPMENT_ID": "101", "MATERIAL_ID": "", "JOB_START_TIME_LOC": "", "DOWNTIME": ""}
+    untyped = read_data(path, columns=["JOB_START_TIME_LOC", "DOWNTIME"])
+    assert [row["JOB_START_TIME_LOC"] for row in untyped] == ["2025-02-04 15:20:53", "", "2025-02-05 15:20:53"]
+    assert [row["DOWNTIME"] for row in untyped] == ["10.5", "", "3.0"]
+
+    row_filter = RowFilter(lines=["L1"], date_from="2025-02-05", date_column="JOB_START_TIME_LOC")
+    filtered = read_columnar(path, columns, typed, row_filter)
+    assert [row["PLANT"] for row in filtered] == ["MX12"]
+    assert filtered[0]["EQUIPMENT_ID"] == 102
+    assert "LINE_NAME" in filtered[0] and "UNUSED" not in filtered[0]
+    assert (row_filter.kept, row_filter.skipped) == (1, {"line": 1, "date": 1})
+
+
+def test_typed_columns_and_safe_cast():
+    """Only columns cast to one datetime/number type are typed; safe_cast passes typed values through"""
+    init_xsd_type_map(locstr)
+    mappings = {
+        "EventRecord": {
+            "data_properties": {
+                "downtimeMinutes": {"column": "DOWNTIME", "data_type": "xsd:double"},
+                "startTime": {"column": "JOB_START_TIME_LOC", "data_type": "xsd:dateTime"},
+                "lineLabel": {"column": "LINE_NAME", "data_type": "xsd:string"},
+                "shiftId": {"column": "SHIFT_NAME", "data_type": "xsd:string"},
+            },
+            "object_properties": {"involvesResource": {"column": "SHIFT_NAME"}},
+        },
+        "Shift": {"data_properties": {"shiftNumber": {"column": "SHIFT_NAME", "data_type": "xsd:integer"}}},
+    }
+    assert typed_columns_from_mappings(mappings) == {"DOWNTIME": float, "JOB_START_TIME_LOC": datetime}
+    assert projection_columns([{"Raw Data Column Name": "PLANT"}, {"Raw Data Column Name": "N/A"},
+                               {"Raw Data Column Name": "PLANT"}]) == ["PLANT", "EVENT_TYPE", "EQUIPMENT_TYPE"]
+
+    aware = START.replace(tzinfo=timezone(timedelta(hours=-5)))
+    assert safe_cast(aware, datetime) == START
+    assert safe_cast(224.7, int) == 224
+    assert safe_cast(3, float) == 3.0 and isinstance(safe_cast(3, float), float)
+    assert safe_cast(START, str) == "2025-02-04 15:20:53"
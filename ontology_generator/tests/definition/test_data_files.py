@@ -0,0 +1,54 @@
+"""
+Tests for compressed and multi-file data input.
+"""
+import gzip
+
+import pytest
+
+from ontology_generator.definition.data_files import resolve_data_files, read_data_files
+from ontology_generator.definition.parser import read_data, RowFilter
+
+HEADER = "PLANT,LINE_NAME,DOWNTIME\n"
+PARTS = {
+    "day0.csv.gz": "MX11,L1,1\nMX11,L2,2\n",
+    "day1.csv": "MX12,L1,3\n\n",
+    "day2.csv.gz": "MX11,L1,4\n",
+}
+
+
+def _write_parts(directory, parts, header=HEADER):
+    for name, body in parts.items():
+        opener = gzip.open if name.endswith(".gz") else open
+        with opener(directory / name, "wt", encoding="utf-8", newline="") as f:
+            f.write(header + body)
+
+
+def test_read_data_parts_match_single_file(tmp_path):
+    """A directory or glob of compressed parts reads like the concatenated file, in sorted order"""
+    parts_dir = tmp_path / "parts"
+    parts_dir.mkdir()
+    _write_parts(parts_dir, PARTS)
+    (parts_dir / "notes.txt").write_text("not data")
+    single = tmp_path / "all.csv"
+    single.write_text(HEADER + "".join(PARTS[name] for name in sorted(PARTS)), encoding="utf-8")
+
+    assert [p.rsplit("/", 1)[-1] for p in resolve_data_files(str(parts_dir))] == sorted(PARTS)
+    expected = read_data(str(single))
+    assert read_data(str(parts_dir), workers=1) == expected
+    assert read_data(str(parts_dir / "day*.csv*"), workers=1) == expected
+    assert read_data(str(parts_dir / "day0.csv.gz")) == expected[:2]
+
+    row_filter = RowFilter(lines=["L1"])
+    assert [row["DOWNTIME"] for row in read_data(str(parts_dir), row_filter, workers=1)] == ["1", "3", "4"]
+    assert (row_filter.kept, row_filter.skipped) == (3, {"line": 1})
+
+    with pytest.raises(FileNotFoundError):
+        resolve_data_files(str(tmp_path / "missing*.csv"))
+
+
+def test_read_data_files_header_mismatch(tmp_path):
+    """Parts whose header differs from the first part's are rejected"""
+    _write_parts(tmp_path, {"a.csv": "MX11,L1,1\n"})
+    _write_parts(tmp_path, {"b.csv.gz": "MX11,1\n"}, header="PLANT,DOWNTIME\n")
+    with pytest.raises(ValueError, match="missing: \\['LINE_NAME'\\]"):
+        read_data_files(resolve_data_files(str(tmp_path)), workers=1)
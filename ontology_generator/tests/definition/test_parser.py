@@ -14,7 +14,8 @@ from ontology_generator.definition.parser import (
     parse_specification,
     parse_property_mappings,
     validate_property_mappings,
-    read_data
+    read_data,
+    RowFilter
 )
 
 # Sample CSV content for testing
@@ -398,4 +399,42 @@ def test_read_data_exception():
     """Test handling of general exceptions during data reading"""
     with patch('builtins.open', side_effect=Exception("Mock error")):
         with pytest.raises(Exception):
-            read_data('mock_data.csv') 
\ No newline at end of file
+            read_data('mock_data.csv') 
+
+FILTER_DATA_CSV = """PLANT,LINE_NAME,PRODUCTIONDATE_DAY_LOC,JOB_START_TIME_LOC,DOWNTIME
+MX11,L1,2025-02-05,2025-02-04 15:20:53.000 -0500,1
+MX11,L2,2025-02-06,2025-02-06 01:00:00.000 -0500,2
+
+MX12,L1,2025-02-06,2025-02-06 02:00:00.000 -0500,3
+MX11,L1,2025-02-07,2025-02-07 03:00:00.000 -0500
+"""
+
+@pytest.mark.parametrize("criteria,expected_downtimes,skipped", [
+    ({}, ['1', '2', '3', None], {}),
+    ({"plants": ["MX11"]}, ['1', '2', None], {"plant": 1}),
+    ({"plants": ["MX11"], "lines": ["L1"]}, ['1', None], {"plant": 1, "line": 1}),
+    ({"date_from": "2025-02-06", "date_to": "2025-02-06"}, ['2', '3'], {"date": 2}),
+    ({"date_from": "2025-02-06", "date_column": "JOB_START_TIME_LOC"}, ['2', '3', None], {"date": 1}),
+])
+def test_read_data_row_filter(criteria, expected_downtimes, skipped):
+    """Filtered rows match the unfiltered read, restricted to the selected slice"""
+    row_filter = RowFilter(**criteria)
+    with patch('builtins.open', mock_open(read_data=FILTER_DATA_CSV)):
+        unfiltered = read_data('mock_data.csv')
+        result = read_data('mock_data.csv', row_filter)
+
+    assert [row['DOWNTIME'] for row in result] == expected_downtimes
+    assert all(row in unfiltered for row in result)
+    assert row_filter.skipped == skipped
+    if criteria:
+        assert row_filter.kept == len(expected_downtimes)
+
+def test_row_filter_validation():
+    """Invalid dates, empty ranges and missing columns are rejected"""
+    with pytest.raises(ValueError):
+        RowFilter(date_from="2025-02-30")
+    with pytest.raises(ValueError):
+        RowFilter(date_from="2025-02-07", date_to="2025-02-06")
+    assert not RowFilter().is_active
+    with pytest.raises(ValueError):
+        RowFilter(lines=["L1"]).bind(["PLANT", "DOWNTIME"])
@@ -0,0 +1,44 @@
+"""
+Tests for the compact data row representation.
+"""
+import csv
+import pickle
+from io import StringIO
+
+from ontology_generator.definition import rows as rows_module
+from ontology_generator.definition.rows import compact_rows
+
+RAGGED_CSV = """PLANT,LINE_NAME,DOWNTIME
+MX11,L1,1.5
+MX11,L1
+MX11,L2,3,extra1,extra2
+"""
+
+
+def test_compact_rows_behave_like_dict_reader():
+    """Rows compare equal to csv.DictReader dicts and support the dict operations population uses"""
+    records = list(csv.reader(StringIO(RAGGED_CSV)))
+    rows = compact_rows(records[0], records[1:])
+    assert rows == list(csv.DictReader(StringIO(RAGGED_CSV)))
+    assert rows[1]["DOWNTIME"] is None and None not in rows[1]
+    assert rows[2][None] == ["extra1", "extra2"]
+    assert rows[0]["PLANT"] is rows[2]["PLANT"]
+
+    row = rows[0]
+    row["row_num"] = 2
+    assert row.get("row_num") == 2 and "row_num" in row
+    assert "row_num" not in rows[1] and rows[1].get("row_num", "-") == "-"
+    del row["LINE_NAME"]
+    assert list(row) == ["PLANT", "DOWNTIME", "row_num"]
+    assert dict(row.items()) == {"PLANT": "MX11", "DOWNTIME": "1.5", "row_num": 2}
+    assert pickle.loads(pickle.dumps(rows)) == rows
+
+
+def test_compact_rows_interns_low_cardinality_columns(monkeypatch):
+    """Repeated values are shared across chunks; columns of distinct values stop being cached"""
+    monkeypatch.setattr(rows_module, "INTERN_CHUNK_ROWS", 4)
+    records = [["".join(["MX", "11"]), f"{i}.0"] for i in range(10)] # Distinct equal strings
+    rows = compact_rows(["PLANT", "DOWNTIME"], records)
+    assert [row["DOWNTIME"] for row in rows] == [f"{i}.0" for i in range(10)]
+    assert len({id(row["PLANT"]) for row in rows}) == 1
+    assert compact_rows(["PLANT"], []) == []
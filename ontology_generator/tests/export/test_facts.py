@@ -0,0 +1,124 @@
+"""
+Unit tests for ontology_generator.export.facts module.
+
+This module tests the columnar fact-table export, including:
+- Recording events with their linked individuals on the PopulationContext
+- Building the denormalized event fact table and dimension tables
+- Writing CSV output (Parquet when pyarrow is available)
+"""
+import csv
+from datetime import datetime
+
+import pytest
+
+from owlready2 import World, Thing, DataProperty, FunctionalProperty, locstr
+
+from ontology_generator.population.core import PopulationContext
+from ontology_generator.export.facts import (
+    build_event_fact_table, build_dimension_table, write_table, export_fact_tables
+)
+
+PROPERTY_MAPPINGS = {
+    "EventRecord": {"data_properties": {"downtimeMinutes": {"column": "DOWNTIME"}, "goodProductionQuantity": {"column": "GOOD_QTY"}}},
+    "TimeInterval": {"data_properties": {"startTime": {"column": "START"}, "endTime": {"column": "END"}}},
+    "OperationalState": {"data_properties": {"stateDescription": {"column": "STATE"}}},
+    "OperationalReason": {"data_properties": {"reasonDescription": {"column": "REASON"}}},
+    "Shift": {"data_properties": {"shiftId": {"column": "SHIFT"}}},
+    "Equipment": {"data_properties": {"equipmentId": {"column": "EQUIPMENT_ID"}, "equipmentName": {"column": "EQUIPMENT_NAME"}}},
+    "Material": {"data_properties": {"materialId": {"column": "MATERIAL_ID"}}},
+}
+
+
+@pytest.fixture
+def facts_env():
+    """Create two events (one equipment event, one line event) recorded as in Pass 1."""
+    world = World()
+    onto = world.get_ontology("http://test.org/facts-test")
+    with onto:
+        for name in ["EventRecord", "TimeInterval", "ProductionLine", "Equipment", "OperationalState",
+                     "OperationalReason", "Shift", "Material"]:
+            type(name, (Thing,), {"namespace": onto})
+        for name in ["downtimeMinutes", "goodProductionQuantity", "startTime", "endTime", "stateDescription",
+                     "reasonDescription", "shiftId", "lineId", "equipmentId", "equipmentName", "materialId"]:
+            type(name, (DataProperty, FunctionalProperty), {"namespace": onto})
+
+    context = PopulationContext(onto, {}, {}, {})
+    context.collect_event_facts = True
+    registry = {}
+    with onto:
+        line = onto.ProductionLine("Line_L1", lineId="L1")
+        equipment = onto.Equipment("Equipment_F1", equipmentId="F1", equipmentName="Filler 1")
+        material = onto.Material("Material_M1", materialId="M1")
+        shift = onto.Shift("Shift_1", shiftId="Shift1")
+        state = onto.OperationalState("State_Down", stateDescription="DOWNTIME")
+        reason = onto.OperationalReason("Reason_Jam", reasonDescription=locstr("Jam", "en"))
+        registry.update({("ProductionLine", "L1"): line, ("Equipment", "F1"): equipment, ("Material", "M1"): material})
+
+        for i, (resource, downtime) in enumerate([(equipment, 12.5), (None, 3.0)]):
+            interval = onto.TimeInterval(f"Interval_{i}", startTime=datetime(2025, 2, 5, 8 + i), endTime=datetime(2025, 2, 5, 9 + i))
+            event = onto.EventRecord(f"Event_{i}", downtimeMinutes=downtime, goodProductionQuantity=i)
+            row_individuals = {"EventRecord": event, "TimeInterval": interval, "ProductionLine": line, "Shift": shift,
+                               "OperationalState": state, "OperationalReason": reason, "Material": material}
+            if resource is not None:
+                row_individuals["Equipment"] = resource
+            context.record_event_fact(row_individuals)
+        context.record_event_fact({"Shift": shift}) # Rows without an event are not recorded
+        context.record_equipment_placement(line, equipment, "Filler", 1, "F1")
+
+    return {"context": context, "registry": registry}
+
+
+def test_event_fact_table(facts_env):
+    """Each recorded event becomes one row joined with its linked individuals."""
+    table = build_event_fact_table(facts_env["context"], PROPERTY_MAPPINGS)
+
+    assert table["event"] == ["Event_0", "Event_1"]
+    assert table["resourceType"] == ["Equipment", "Line"]
+    assert table["downtimeMinutes"] == [12.5, 3.0]
+    assert table["startTime"] == [datetime(2025, 2, 5, 8), datetime(2025, 2, 5, 9)]
+    assert table["lineId"] == ["L1", "L1"]
+    assert table["equipmentId"] == ["F1", None]
+    assert table["reasonDescription"] == ["Jam", "Jam"]
+    assert type(table["reasonDescription"][0]) is str
+    assert "equipmentName" not in table # Equipment details live in the dimension table
+    assert len({len(values) for values in table.values()}) == 1
+
+
+def test_dimension_table(facts_env):
+    """Dimension tables list registry individuals with their mapped properties."""
+    context = facts_env["context"]
+    table = build_dimension_table(facts_env["registry"], "Equipment", PROPERTY_MAPPINGS,
+                                  extra_columns={"equipmentClassId": {ind: c for placements in context.equipment_line_index.values() for ind, (c, _, _) in placements.items()}})
+
+    assert table == {
+        "individual": ["Equipment_F1"],
+        "equipmentId": ["F1"],
+        "equipmentName": ["Filler 1"],
+        "equipmentClassId": ["Filler"],
+    }
+
+
+def test_export_fact_tables_csv(facts_env, tmp_path):
+    """CSV output writes datetimes as ISO strings and missing values as empty cells."""
+    paths = export_fact_tables(facts_env["context"], facts_env["registry"], PROPERTY_MAPPINGS, str(tmp_path / "facts"), format="csv")
+
+    assert sorted(paths) == ["equipment", "event_facts", "materials"]
+    with open(paths["event_facts"], newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["startTime"] for r in rows] == ["2025-02-05T08:00:00", "2025-02-05T09:00:00"]
+    assert [r["equipmentId"] for r in rows] == ["F1", ""]
+    with open(paths["equipment"], newline="") as f:
+        assert list(csv.DictReader(f))[0]["productionLine"] == "Line_L1"
+
+
+def test_write_table_parquet(tmp_path):
+    """Parquet output round-trips through pyarrow."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = write_table({"a": [1, 2], "b": ["x", None]}, str(tmp_path / "table"), format="parquet")
+    assert pq.read_table(path).to_pydict() == {"a": [1, 2], "b": ["x", None]}
+
+
+def test_write_table_unknown_format(tmp_path):
+    """Unknown formats raise ValueError."""
+    with pytest.raises(ValueError):
+        write_table({"a": [1]}, str(tmp_path / "table"), format="xlsx")
@@ -0,0 +1,99 @@
+"""
+Unit tests for ontology_generator.export.ntriples module.
+
+This module tests the streaming N-Triples / N-Quads writer, including:
+- Equivalence with owlready2's own N-Triples/N-Quads serialization
+- Byte-for-byte reproducible output, including blank nodes
+- gzip compression on the fly
+"""
+import gzip
+
+import pytest
+
+from owlready2 import World, Thing, ObjectProperty, DataProperty, locstr
+
+from ontology_generator.export.ntriples import stream_ontology, compression_for_path
+
+
+def _build_ontology(world, reverse=False):
+    """Build a small ontology with restrictions, literals and individuals."""
+    onto = world.get_ontology("http://test.org/export-test")
+    with onto:
+        class Equipment(Thing): pass
+        class ProductionLine(Thing): pass
+        class isPartOfProductionLine(ObjectProperty):
+            domain = [Equipment]
+            range = [ProductionLine]
+        class equipmentId(DataProperty):
+            domain = [Equipment]
+        names = ["Filler_1", "Bundler_1", "Palletizer_1"]
+        for name in (reversed(names) if reverse else names):
+            equipment = Equipment(name)
+            equipment.equipmentId = [name.split("_")[0], 143.0, '143.0', 'quote "and"\nnewline']
+        line = ProductionLine("Line_1")
+        line.comment = [locstr("Finishing line", "en")]
+        restrictions = [isPartOfProductionLine.some(ProductionLine), isPartOfProductionLine.only(ProductionLine | Equipment)]
+        for restriction in (reversed(restrictions) if reverse else restrictions):
+            Equipment.is_a.append(restriction)
+    return onto
+
+
+def _lines(path, opener=open):
+    with opener(path, "rt", encoding="utf8") as f:
+        return f.read().splitlines()
+
+
+def test_ntriples_match_owlready_save(tmp_path):
+    """The streamed file holds exactly the triples onto.save writes (blank-node free lines)."""
+    onto = _build_ontology(World())
+    reference = tmp_path / "reference.nt"
+    onto.save(file=str(reference), format="ntriples")
+
+    count = stream_ontology(onto, str(tmp_path / "streamed.nt"))
+
+    streamed = _lines(tmp_path / "streamed.nt")
+    expected = _lines(reference)
+    assert count == len(streamed) == len(expected)
+    assert sorted(l for l in streamed if "_:" not in l) == sorted(l for l in expected if "_:" not in l)
+
+
+def test_nquads_match_owlready_save(tmp_path):
+    """N-Quads lines carry the ontology graph IRI like onto.save does."""
+    onto = _build_ontology(World())
+    reference = tmp_path / "reference.nq"
+    onto.save(file=str(reference), format="nquads")
+
+    stream_ontology(onto, str(tmp_path / "streamed.nq"), format="nquads")
+
+    streamed = _lines(tmp_path / "streamed.nq")
+    expected = _lines(reference)
+    assert sorted(l for l in streamed if "_:" not in l) == sorted(l for l in expected if "_:" not in l)
+    assert len(streamed) == len(expected)
+
+
+def test_output_is_reproducible(tmp_path):
+    """Worlds built in a different order give byte-identical output."""
+    first = _build_ontology(World())
+    second = _build_ontology(World(), reverse=True)
+
+    stream_ontology(first, str(tmp_path / "first.nt.gz"))
+    stream_ontology(second, str(tmp_path / "second.nt.gz"))
+
+    assert (tmp_path / "first.nt.gz").read_bytes() == (tmp_path / "second.nt.gz").read_bytes()
+    lines = _lines(tmp_path / "first.nt.gz", gzip.open)
+    stream_ontology(first, str(tmp_path / "first.nt"))
+    assert lines == _lines(tmp_path / "first.nt")
+    assert any(l.startswith("_:b0 ") for l in lines)
+
+
+def test_compression_for_path():
+    """Compression is inferred from the output extension."""
+    assert compression_for_path("out.nt.gz") == "gzip"
+    assert compression_for_path("out.nq.zst") == "zstd"
+    assert compression_for_path("out.nt") is None
+
+
+def test_unknown_format_rejected(tmp_path):
+    """Unsupported formats raise ValueError."""
+    with pytest.raises(ValueError):
+        stream_ontology(_build_ontology(World()), str(tmp_path / "out.xml"), format="rdfxml")
@@ -0,0 +1,81 @@
+"""
+Unit tests for ontology_generator.export.snapshot module.
+
+This module tests quadstore snapshots, including:
+- Writing a snapshot and loading it back with the same triples
+- Preferring a fresh snapshot over parsing the OWL file
+- Ignoring snapshots that no longer match their OWL file
+"""
+import os
+
+import pytest
+
+from owlready2 import World, Thing, ObjectProperty, DataProperty
+
+from ontology_generator.export.snapshot import (
+    write_snapshot, load_snapshot, load_ontology, snapshot_path_for, snapshot_is_fresh
+)
+
+
+@pytest.fixture
+def saved_onto(tmp_path):
+    """Create a small ontology and save it as RDF/XML."""
+    world = World()
+    onto = world.get_ontology("http://test.org/snapshot-test#")
+    with onto:
+        class ProductionLine(Thing): pass
+        class Equipment(Thing): pass
+        class isPartOfProductionLine(ObjectProperty): pass
+        class equipmentId(DataProperty): pass
+        line = ProductionLine("Line_1")
+        for i in range(3):
+            equipment = Equipment(f"Equipment_{i}")
+            equipment.isPartOfProductionLine = [line]
+            equipment.equipmentId = [f"E{i}"]
+    owl_path = str(tmp_path / "plant.owl")
+    onto.save(file=owl_path, format="rdfxml")
+    return onto, owl_path
+
+
+def test_snapshot_round_trip(saved_onto):
+    """A loaded snapshot has the ontology's triples and individuals."""
+    onto, owl_path = saved_onto
+    snapshot_path = write_snapshot(onto, snapshot_path_for(owl_path), source_owl_path=owl_path)
+
+    world, loaded = load_snapshot(snapshot_path)
+
+    assert snapshot_path.endswith("plant.snapshot.sqlite3")
+    assert loaded.base_iri == "http://test.org/snapshot-test#"
+    assert sorted(e.name for e in loaded.Equipment.instances()) == ["Equipment_0", "Equipment_1", "Equipment_2"]
+    assert loaded.Equipment_0.isPartOfProductionLine == [loaded.Line_1]
+    assert len(list(loaded.get_triples())) == len(list(onto.get_triples()))
+    assert not os.path.exists(snapshot_path + ".tmp")
+
+
+def test_load_ontology_prefers_fresh_snapshot(saved_onto):
+    """load_ontology uses a matching snapshot and parses the OWL file otherwise."""
+    onto, owl_path = saved_onto
+    write_snapshot(onto, snapshot_path_for(owl_path), source_owl_path=owl_path)
+
+    world, loaded = load_ontology(owl_path)
+    assert world.filename == snapshot_path_for(owl_path)
+
+    parsed_world, parsed = load_ontology(owl_path, use_snapshot=False)
+    assert parsed_world.filename == ":memory:"
+    assert sorted(e.name for e in parsed.individuals()) == sorted(e.name for e in loaded.individuals())
+
+
+def test_stale_snapshot_is_ignored(saved_onto):
+    """A snapshot no longer matching its OWL file falls back to parsing."""
+    onto, owl_path = saved_onto
+    snapshot_path = write_snapshot(onto, snapshot_path_for(owl_path), source_owl_path=owl_path)
+    assert snapshot_is_fresh(snapshot_path, owl_path)
+
+    with onto:
+        onto.Equipment("Equipment_3")
+    onto.save(file=owl_path, format="rdfxml")
+
+    assert not snapshot_is_fresh(snapshot_path, owl_path)
+    world, loaded = load_ontology(owl_path)
+    assert world.filename == ":memory:"
+    assert loaded.Equipment_3 is not None
@@ -29,7 +29,8 @@ from ontology_generator.population.core import (
     apply_data_property_mappings,
     apply_object_property_mappings,
     IndividualRegistry,
-    set_prop_if_col_exists
+    set_prop_if_col_exists,
+    resolve_column_links
 )
 
 # Configure logging for tests
@@ -682,6 +683,39 @@ def test_apply_object_property_mappings_context_lookup(mock_onto, mock_context,
     assert individual.test_obj_prop == [target]
 
 
+def test_resolve_column_links(mock_onto, mock_context):
+    """Test resolve_column_links resolves each distinct ID once, sanitized, and summarizes misses."""
+    individual = mock_onto.TestClass("TestIndividual")
+    target = mock_onto.AnotherClass("TargetIndividual")
+    other = mock_onto.AnotherClass("OtherIndividual")
+
+    # Registry keys are sanitized as in get_or_create_individual ('42 A' -> '_42_A')
+    registry = {("AnotherClass", "_42_A"): target, ("AnotherClass", "B7"): other}
+    property_mappings = {
+        "TestClass": {"object_properties": {
+            "test_obj_prop": {"target_class": "AnotherClass", "column": "target_id"},
+            "test_func_obj_prop": {"target_class": "AnotherClass", "target_link_context": "AnotherClass"},
+        }},
+    }
+    data_rows = [{"target_id": "42 A"}, {"target_id": "B7"}, {"target_id": "missing"},
+                 {"target_id": ""}, {"target_id": "42 A"}, {"target_id": "missing"}]
+    mock_logger = MagicMock()
+
+    column_links = resolve_column_links(data_rows, property_mappings, registry, mock_logger)
+
+    assert column_links == {"TestClass": {"test_obj_prop": [target, other, None, None, target, None]}}
+    assert mock_logger.warning.call_count == 1
+    assert "2 rows" in mock_logger.warning.call_args[0][0]
+    assert "'missing' (2)" in mock_logger.warning.call_args[0][0]
+
+    # Pass 2 takes the target from the resolved column without a registry lookup
+    apply_object_property_mappings(
+        individual, property_mappings["TestClass"], data_rows[0], mock_context, "TestClass",
+        mock_logger, {}, {}, resolved_targets={"test_obj_prop": column_links["TestClass"]["test_obj_prop"][0]}
+    )
+    assert individual.test_obj_prop == [target]
+
+
 def test_set_prop_if_col_exists(mock_onto, mock_context, mocker):
     """Test set_prop_if_col_exists handles column existence and value casting."""
     # Create test individual
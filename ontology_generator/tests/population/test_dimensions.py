@@ -0,0 +1,123 @@
+"""
+Unit tests for ontology_generator.population.dimensions module.
+
+This module tests dimension-first population, including:
+- Collecting the columns a dimension is built from
+- Processing each distinct dimension tuple once, in order of last occurrence
+- Failing the rows of a tuple whose processor raised
+- Skipping and rejecting once the rows that failed an earlier dimension
+"""
+from ontology_generator.population import dimensions
+from ontology_generator.population.dimensions import dimension_columns, _resolve_distinct, resolve_dimensions
+
+PROPERTY_MAPPINGS = {
+    "Material": {"data_properties": {
+        "materialId": {"column": "MATERIAL_ID", "data_type": "xsd:string"},
+        "materialDescription": {"column": "SHORT_MATERIAL_ID", "data_type": "xsd:string"},
+        "sequencePosition": {"data_type": "xsd:integer"},
+    }},
+    "Shift": {"data_properties": {
+        "shiftId": {"column": "SHIFT_NAME", "data_type": "xsd:string"},
+        "shiftStartTime": {"column": "SHIFT_START_DATE_LOC", "data_type": "xsd:dateTime"},
+    }},
+}
+
+
+def test_dimension_columns():
+    """Mapped columns come first, without duplicates; unmapped properties are skipped."""
+    assert dimension_columns(PROPERTY_MAPPINGS, ["Material"]) == ["MATERIAL_ID", "SHORT_MATERIAL_ID"]
+    assert dimension_columns(PROPERTY_MAPPINGS, ["Material", "Shift"], ["MATERIAL_ID", "LINE_NAME"]) == [
+        "MATERIAL_ID", "SHORT_MATERIAL_ID", "SHIFT_NAME", "SHIFT_START_DATE_LOC", "LINE_NAME"
+    ]
+    assert dimension_columns(PROPERTY_MAPPINGS, ["Unknown"]) == []
+
+
+def test_resolve_distinct():
+    """Each distinct key is processed once with its last row; rows of a failed key fail."""
+    data_rows = [
+        {"MATERIAL_ID": "M1", "QTY": "1"},
+        {"MATERIAL_ID": "M2", "QTY": "2"},
+        {"MATERIAL_ID": "M1", "QTY": "3"},
+        {"MATERIAL_ID": "BAD", "QTY": "4"},
+        {"MATERIAL_ID": "M3", "QTY": "5"},
+    ]
+    processed = []
+
+    def process(i):
+        if data_rows[i]["MATERIAL_ID"] == "BAD":
+            raise ValueError("cannot resolve")
+        processed.append(i)
+        return f"{data_rows[i]['MATERIAL_ID']}@{data_rows[i]['QTY']}"
+
+    results = [None] * len(data_rows)
+    failed_rows = set()
+    _resolve_distinct("Material", data_rows, [0, 1, 2, 3, 4], lambda i: (data_rows[i]["MATERIAL_ID"],),
+                      process, results, failed_rows)
+
+    # M2 last occurs before M1, so it is processed first
+    assert processed == [1, 2, 4]
+    assert results == ["M1@3", "M2@2", "M1@3", None, "M3@5"]
+    assert failed_rows == {3}
+
+
+class _RejectingContext:
+    """Records the rows rejected through reject_row."""
+    def __init__(self):
+        self.rejected = []
+
+    def reject_row(self, row, row_num, phase, reason, detail=None):
+        self.rejected.append((row_num, reason, detail))
+
+
+def test_resolve_dimensions_skips_failed_rows(monkeypatch):
+    """Rows that failed a dimension are not processed by later ones and are rejected once."""
+    data_rows = [
+        {"EQUIPMENT_TYPE": "Line", "MATERIAL_ID": "M1", "SHIFT_NAME": "S0"},
+        {"EQUIPMENT_TYPE": "Equipment", "EQUIPMENT_NAME": "BAD", "MATERIAL_ID": "BAD", "SHIFT_NAME": "S1"},
+        {"EQUIPMENT_TYPE": "Line", "MATERIAL_ID": "BAD", "SHIFT_NAME": "S2"},
+        {"EQUIPMENT_TYPE": "Line", "MATERIAL_ID": "M1", "SHIFT_NAME": "S3"},
+    ]
+    processed = {}
+
+    def processor(name, fails=lambda row: False):
+        def process(row, *args, **kwargs):
+            processed.setdefault(name, []).append(data_rows.index(row))
+            if fails(row):
+                raise ValueError(f"bad {name}")
+            return name if name != "asset" else ("plant", "area", "cell", "line")
+        return process
+
+    monkeypatch.setattr(dimensions, "process_asset_hierarchy", processor("asset"))
+    monkeypatch.setattr(dimensions, "process_equipment_and_class",
+                        processor("equipment", lambda row: row.get("EQUIPMENT_NAME") == "BAD"))
+    monkeypatch.setattr(dimensions, "process_material", processor("Material", lambda row: row["MATERIAL_ID"] == "BAD"))
+    for name in ("production_request", "shift", "state", "reason"):
+        monkeypatch.setattr(dimensions, f"process_{name}", processor(name))
+
+    context = _RejectingContext()
+    row_dimensions = resolve_dimensions(data_rows, context, PROPERTY_MAPPINGS, {})
+
+    # Row 1 fails its equipment, so later dimensions skip it; row 2 then fails its material
+    assert processed["Material"] == [2, 3]
+    assert processed["shift"] == [0, 3]
+    assert [(row_num, reason) for row_num, reason, _ in context.rejected] == [
+        (3, "dimension_error"), (4, "dimension_error")
+    ]
+    assert context.rejected[0][2].startswith("equipment:")
+    assert context.rejected[1][2].startswith("Material:")
+    assert [dims is not None for dims in row_dimensions] == [True, False, False, True]
+
+
+def test_resolve_distinct_rejects_rows_once():
+    """Rows already in failed_rows are neither counted nor rejected again."""
+    data_rows = [{"MATERIAL_ID": "BAD"}, {"MATERIAL_ID": "BAD"}]
+    rejected = []
+
+    def process(i):
+        raise ValueError("cannot resolve")
+
+    failed_rows = {0}
+    _resolve_distinct("Material", data_rows, [0, 1], lambda i: (data_rows[i]["MATERIAL_ID"],), process,
+                      [None, None], failed_rows, lambda i, detail: rejected.append(i))
+    assert failed_rows == {0, 1}
+    assert rejected == [1]
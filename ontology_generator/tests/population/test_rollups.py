@@ -0,0 +1,99 @@
+"""
+Unit tests for ontology_generator.population.rollups module.
+
+This module tests the AE/OEE rollup accumulator, including:
+- Grouping events by line, equipment, shift, production date, state and reason
+- Summing metrics read from the raw rows, with integer quantities kept integral
+- Falling back to the event start date when the production date column is empty
+- Storing rollups as AERollup individuals and as a table
+"""
+from datetime import date, datetime
+
+import pytest
+
+from owlready2 import World, Thing, DataProperty, FunctionalProperty
+
+from ontology_generator.population.rollups import AERollupAccumulator, create_rollup_individuals
+
+PROPERTY_MAPPINGS = {
+    "EventRecord": {"data_properties": {
+        "downtimeMinutes": {"column": "DOWNTIME", "data_type": "xsd:double"},
+        "goodProductionQuantity": {"column": "GOOD_PRODUCTION_QTY", "data_type": "xsd:integer"},
+        "reportedDurationMinutes": {"column": "TOTAL_TIME", "data_type": "xsd:double"},
+    }},
+}
+
+
+@pytest.fixture
+def rollup_onto():
+    """Create a line with one machine, a shift, two states and a time interval."""
+    world = World()
+    onto = world.get_ontology("http://test.org/rollup-test#")
+    with onto:
+        class ProductionLine(Thing): pass
+        class Equipment(Thing): pass
+        class Shift(Thing): pass
+        class OperationalState(Thing): pass
+        class EventRecord(Thing): pass
+        class TimeInterval(Thing): pass
+        class startTime(DataProperty, FunctionalProperty): pass
+        individuals = {
+            "line": ProductionLine("Line_1"),
+            "filler": Equipment("Filler_1"),
+            "shift": Shift("Shift_A"),
+            "down": OperationalState("Down"),
+            "run": OperationalState("Run"),
+            "interval": TimeInterval("Interval_1", startTime=datetime(2025, 1, 2, 23, 0)),
+        }
+    return onto, individuals
+
+
+def _add(accumulator, inds, state, row, equipment=True, interval=False):
+    row_individuals = {"EventRecord": object(), "ProductionLine": inds["line"], "Shift": inds["shift"], "OperationalState": inds[state]}
+    if equipment:
+        row_individuals["Equipment"] = inds["filler"]
+    if interval:
+        row_individuals["TimeInterval"] = inds["interval"]
+    accumulator.add(row_individuals, row)
+
+
+def test_accumulate_groups(rollup_onto):
+    """Events of the same group are summed; unmapped metrics are ignored."""
+    _, inds = rollup_onto
+    accumulator = AERollupAccumulator(PROPERTY_MAPPINGS)
+    day = "2025-01-01"
+    _add(accumulator, inds, "down", {"PRODUCTIONDATE_DAY_LOC": day, "DOWNTIME": "5.5", "GOOD_PRODUCTION_QTY": "0"})
+    _add(accumulator, inds, "down", {"PRODUCTIONDATE_DAY_LOC": day, "DOWNTIME": "4.5", "GOOD_PRODUCTION_QTY": ""})
+    _add(accumulator, inds, "run", {"PRODUCTIONDATE_DAY_LOC": day, "DOWNTIME": "0", "GOOD_PRODUCTION_QTY": "120"})
+    _add(accumulator, inds, "run", {"PRODUCTIONDATE_DAY_LOC": day, "GOOD_PRODUCTION_QTY": "30"}, equipment=False)
+    _add(accumulator, inds, "run", {"PRODUCTIONDATE_DAY_LOC": "", "GOOD_PRODUCTION_QTY": "7"}, interval=True)
+
+    assert accumulator.metrics == ["downtimeMinutes", "goodProductionQuantity"]
+    assert accumulator.event_count == 5
+    assert len(accumulator) == 4
+
+    table = accumulator.to_table()
+    assert table["equipment"] == [None, "Filler_1", "Filler_1", "Filler_1"]
+    assert table["productionDate"] == [date(2025, 1, 1), date(2025, 1, 1), date(2025, 1, 1), date(2025, 1, 2)]
+    assert table["state"] == ["Run", "Down", "Run", "Run"]
+    assert table["eventCount"] == [1, 2, 1, 1]
+    assert table["totalDowntimeMinutes"] == [0.0, 10.0, 0.0, 0.0]
+    assert table["totalGoodProductionQuantity"] == [30, 0, 120, 7]
+    assert all(isinstance(value, int) for value in table["totalGoodProductionQuantity"])
+
+
+def test_create_rollup_individuals(rollup_onto):
+    """Rollups become AERollup individuals linked to their dimensions."""
+    onto, inds = rollup_onto
+    accumulator = AERollupAccumulator(PROPERTY_MAPPINGS)
+    _add(accumulator, inds, "down", {"PRODUCTIONDATE_DAY_LOC": "2025-01-01", "DOWNTIME": "5.5", "GOOD_PRODUCTION_QTY": "3"})
+    _add(accumulator, inds, "down", {"PRODUCTIONDATE_DAY_LOC": "2025-01-01", "DOWNTIME": "1", "GOOD_PRODUCTION_QTY": "4"})
+
+    assert create_rollup_individuals(onto, accumulator) == 1
+    rollup, = onto.AERollup.instances()
+    assert rollup.summarizesLine is inds["line"]
+    assert rollup.summarizesEquipment is inds["filler"]
+    assert rollup.summarizesState is inds["down"]
+    assert rollup.productionDate == date(2025, 1, 1)
+    assert (rollup.eventCount, rollup.totalDowntimeMinutes, rollup.totalGoodProductionQuantity) == (2, 6.5, 7)
+    assert create_rollup_individuals(onto, AERollupAccumulator(PROPERTY_MAPPINGS)) == 0
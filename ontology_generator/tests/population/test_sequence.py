@@ -0,0 +1,211 @@
+"""
+Unit tests for ontology_generator.population.sequence module.
+
+This module tests equipment instance sequencing, including:
+- Grouping equipment from the Pass 1 line index on the PopulationContext
+- Falling back to an ontology search when no index is available
+- Grouping parallel equipment into ParallelStage individuals
+"""
+import pytest
+from typing import Dict, Any
+
+from owlready2 import World, Thing, ObjectProperty, DataProperty, FunctionalProperty
+
+from ontology_generator.population.core import PopulationContext
+from ontology_generator.population.sequence import setup_equipment_instance_relationships
+from ontology_generator.analysis.sequence_analysis import get_parallel_equipment_pairs
+
+
+@pytest.fixture
+def sequence_env():
+    """Create a small ontology with the classes and properties used for sequencing."""
+    world = World()
+    onto = world.get_ontology("http://test.org/sequence-test")
+    with onto:
+        class ProductionLine(Thing): pass
+        class Equipment(Thing): pass
+        class EquipmentClass(Thing): pass
+        class isPartOfProductionLine(ObjectProperty):
+            domain = [Equipment]
+            range = [ProductionLine]
+        class memberOfClass(ObjectProperty, FunctionalProperty):
+            domain = [Equipment]
+            range = [EquipmentClass]
+        class isImmediatelyUpstreamOf(ObjectProperty):
+            domain = [Equipment]
+            range = [Equipment]
+        class isImmediatelyDownstreamOf(ObjectProperty):
+            domain = [Equipment]
+            range = [Equipment]
+        class isParallelWith(ObjectProperty):
+            domain = [Equipment]
+            range = [Equipment]
+        class equipmentClassId(DataProperty, FunctionalProperty):
+            domain = [EquipmentClass]
+            range = [str]
+        class equipmentId(DataProperty, FunctionalProperty):
+            domain = [Equipment]
+            range = [str]
+        class sequencePosition(DataProperty, FunctionalProperty):
+            domain = [Equipment]
+            range = [int]
+        class lineId(DataProperty, FunctionalProperty):
+            domain = [ProductionLine]
+            range = [str]
+
+    defined_classes = {
+        "ProductionLine": onto.ProductionLine,
+        "Equipment": onto.Equipment,
+        "EquipmentClass": onto.EquipmentClass,
+    }
+    defined_properties = {
+        name: getattr(onto, name) for name in [
+            "isPartOfProductionLine", "memberOfClass", "isImmediatelyUpstreamOf",
+            "isImmediatelyDownstreamOf", "isParallelWith", "equipmentClassId",
+            "equipmentId", "sequencePosition", "lineId",
+        ]
+    }
+    property_is_functional = {
+        name: FunctionalProperty in prop.is_a for name, prop in defined_properties.items()
+    }
+    context = PopulationContext(onto, defined_classes, defined_properties, property_is_functional)
+
+    # Line L1: Filler (1) -> two parallel Bundlers (3) -> Palletizer (7)
+    placements = [("F1", "Filler", 1), ("C1", "Bundler", 3), ("C2", "Bundler", 3), ("P1", "Palletizer", 7)]
+    with onto:
+        line = onto.ProductionLine("Line_L1")
+        line.lineId = "L1"
+        for eq_id, class_id, position in placements:
+            eq_class = onto.EquipmentClass(f"EquipmentClass_{class_id}")
+            eq_class.equipmentClassId = class_id
+            equipment = onto.Equipment(f"Equipment_{eq_id}")
+            equipment.equipmentId = eq_id
+            equipment.memberOfClass = eq_class
+            equipment.sequencePosition = position
+            equipment.isPartOfProductionLine = [line]
+            context.record_equipment_placement(line, equipment, class_id, position, eq_id)
+
+    return {
+        "onto": onto,
+        "line": line,
+        "defined_classes": defined_classes,
+        "defined_properties": defined_properties,
+        "property_is_functional": property_is_functional,
+        "context": context,
+    }
+
+
+def _upstream_links(onto) -> Dict[str, Any]:
+    """Collect isImmediatelyUpstreamOf links as {equipmentId: sorted downstream ids}."""
+    return {
+        eq.equipmentId: sorted(d.equipmentId for d in eq.isImmediatelyUpstreamOf)
+        for eq in onto.Equipment.instances()
+    }
+
+
+def test_record_equipment_placement_overwrites_entry(sequence_env):
+    """Repeated placements of the same equipment keep a single, latest entry."""
+    context = sequence_env["context"]
+    line = sequence_env["line"]
+    equipment = sequence_env["onto"].Equipment_F1
+
+    context.record_equipment_placement(line, equipment, "Filler", 2, "F1")
+
+    assert len(context.equipment_line_index[line]) == 4
+    assert context.equipment_line_index[line][equipment] == ("Filler", 2, "F1")
+
+
+def test_record_equipment_placement_ignores_missing_line(sequence_env):
+    """Placements without a line are not recorded."""
+    context = sequence_env["context"]
+    context.record_equipment_placement(None, sequence_env["onto"].Equipment_F1, "Filler", 1, "F1")
+    assert None not in context.equipment_line_index
+
+
+def test_sequence_setup_uses_population_index(sequence_env, mocker):
+    """With a populated index, equipment is grouped without searching the ontology."""
+    onto = sequence_env["onto"]
+    search_spy = mocker.spy(onto, "search")
+
+    count, _ = setup_equipment_instance_relationships(
+        onto, sequence_env["defined_classes"], sequence_env["defined_properties"],
+        sequence_env["property_is_functional"], {}, sequence_env["context"]
+    )
+
+    assert count == 3
+    search_spy.assert_not_called()
+    assert _upstream_links(onto) == {"F1": ["C1"], "C1": ["C2"], "C2": ["P1"], "P1": []}
+    assert list(onto.Equipment_C1.isParallelWith) == [onto.Equipment_C2]
+
+
+def test_sequence_setup_search_fallback_matches_index(sequence_env):
+    """Without an index, the ontology search fallback creates the same links."""
+    onto = sequence_env["onto"]
+    sequence_env["context"].equipment_line_index.clear()
+
+    count, _ = setup_equipment_instance_relationships(
+        onto, sequence_env["defined_classes"], sequence_env["defined_properties"],
+        sequence_env["property_is_functional"], {}, sequence_env["context"]
+    )
+
+    assert count == 3
+    assert _upstream_links(onto) == {"F1": ["C1"], "C1": ["C2"], "C2": ["P1"], "P1": []}
+
+
+def test_sequence_setup_index_position_fallback(sequence_env):
+    """Index entries without a position fall back to the configured class sequence."""
+    onto = sequence_env["onto"]
+    context = sequence_env["context"]
+    line = sequence_env["line"]
+    context.equipment_line_index[line][onto.Equipment_P1] = ("Palletizer", None, "P1")
+
+    count, _ = setup_equipment_instance_relationships(
+        onto, sequence_env["defined_classes"], sequence_env["defined_properties"],
+        sequence_env["property_is_functional"], {}, context
+    )
+
+    assert count == 3
+    assert onto.Equipment_P1.sequencePosition == 7
+
+
+def test_sequence_setup_parallel_stages(sequence_env):
+    """Parallel stages replace pairwise isParallelWith links with one stage per position."""
+    onto = sequence_env["onto"]
+    world = onto.world
+    # A third Bundler: 3 pairwise links, but still one stage with 3 memberships
+    with onto:
+        equipment = onto.Equipment("Equipment_C3")
+        equipment.equipmentId = "C3"
+        equipment.isPartOfProductionLine = [sequence_env["line"]]
+        sequence_env["context"].record_equipment_placement(sequence_env["line"], equipment, "Bundler", 3, "C3")
+
+    count, _ = setup_equipment_instance_relationships(
+        onto, sequence_env["defined_classes"], sequence_env["defined_properties"],
+        sequence_env["property_is_functional"], {}, sequence_env["context"], parallel_stages=True
+    )
+
+    assert count == 4
+    assert not list(onto.isParallelWith.get_relations())
+    stages = sorted(onto.ParallelStage.instances(), key=lambda stage: stage.stagePosition)
+    assert [(stage.stagePosition, sorted(e.equipmentId for e in stage.hasStageMember)) for stage in stages] == [
+        (1, ["F1"]), (3, ["C1", "C2", "C3"]), (7, ["P1"])
+    ]
+    assert all(stage.isStageOfProductionLine is sequence_env["line"] for stage in stages)
+    assert [list(stage.stageIsImmediatelyUpstreamOf) for stage in stages] == [[stages[1]], [stages[2]], []]
+    assert stages[2].stageIsImmediatelyDownstreamOf == [stages[1]]
+    # Inverses are not stored: one membership triple per equipment, one link per adjacent stage pair
+    assert len(list(world.sparql("SELECT ?e ?s WHERE { ?e <http://test.org/sequence-test#isMemberOfStage> ?s }"))) == 5
+    assert len(list(world.sparql("SELECT ?s ?t WHERE { ?s <http://test.org/sequence-test#stageIsImmediatelyUpstreamOf> ?t }"))) == 2
+
+    pairs = [(a.equipmentId, b.equipmentId) for a, b in get_parallel_equipment_pairs(onto)]
+    assert pairs == [("C1", "C2"), ("C1", "C3"), ("C2", "C3")]
+
+
+def test_parallel_pairs_from_isparallelwith(sequence_env):
+    """Without stages, parallel pairs are read from the asserted isParallelWith links."""
+    onto = sequence_env["onto"]
+    setup_equipment_instance_relationships(
+        onto, sequence_env["defined_classes"], sequence_env["defined_properties"],
+        sequence_env["property_is_functional"], {}, sequence_env["context"]
+    )
+    assert get_parallel_equipment_pairs(onto) == [(onto.Equipment_C1, onto.Equipment_C2)]
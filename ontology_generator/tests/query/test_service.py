@@ -0,0 +1,124 @@
+"""
+Unit tests for ontology_generator.query.service module.
+
+This module tests the local query service, including:
+- Building event indexes and answering time-range queries
+- Precomputed downtime-by-reason and events-per-shift rollups
+- Serving the indexes and SPARQL over HTTP
+"""
+import json
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import datetime, timedelta
+
+import pytest
+
+from owlready2 import World, Thing, ObjectProperty, DataProperty, FunctionalProperty
+
+from ontology_generator.query.service import OntologyIndexes, create_server
+
+
+@pytest.fixture
+def service_onto():
+    """Create one line with two machines and six hour-long events across two shifts."""
+    world = World()
+    onto = world.get_ontology("http://test.org/service-test#")
+    with onto:
+        class ProductionLine(Thing): pass
+        class Equipment(Thing): pass
+        class EventRecord(Thing): pass
+        class TimeInterval(Thing): pass
+        class OperationalState(Thing): pass
+        class OperationalReason(Thing): pass
+        class Shift(Thing): pass
+        class involvesResource(ObjectProperty, FunctionalProperty): pass
+        class isPartOfProductionLine(ObjectProperty): pass
+        class occursDuring(ObjectProperty, FunctionalProperty): pass
+        class eventHasState(ObjectProperty, FunctionalProperty): pass
+        class eventHasReason(ObjectProperty, FunctionalProperty): pass
+        class duringShift(ObjectProperty, FunctionalProperty): pass
+        class lineId(DataProperty, FunctionalProperty): pass
+        class startTime(DataProperty, FunctionalProperty): pass
+        class endTime(DataProperty, FunctionalProperty): pass
+        class stateDescription(DataProperty, FunctionalProperty): pass
+        class reasonDescription(DataProperty, FunctionalProperty): pass
+        class shiftId(DataProperty, FunctionalProperty): pass
+        class downtimeMinutes(DataProperty, FunctionalProperty): pass
+
+        line = ProductionLine("Line_1", lineId="LINE1")
+        filler, capper = Equipment("Filler_1"), Equipment("Capper_1")
+        for equipment in (filler, capper):
+            equipment.isPartOfProductionLine = [line]
+        down = OperationalState("Down", stateDescription="DOWNTIME")
+        jam = OperationalReason("Jam", reasonDescription="Jam")
+        shifts = [Shift("Shift_A", shiftId="A"), Shift("Shift_B", shiftId="B")]
+        start = datetime(2025, 1, 1, 6)
+        for i in range(6):
+            begin = start + timedelta(hours=i)
+            interval = TimeInterval(f"Interval_{i}", startTime=begin, endTime=begin + timedelta(hours=1))
+            EventRecord(f"Event_{i}", involvesResource=filler if i % 2 == 0 else capper, occursDuring=interval,
+                        eventHasState=down, eventHasReason=jam, duringShift=shifts[i // 3], downtimeMinutes=10.0)
+    return world, onto
+
+
+def test_events_in_range(service_onto):
+    """Range queries return overlapping events per resource and per line, ordered by start."""
+    world, onto = service_onto
+    indexes = OntologyIndexes(world, onto)
+
+    assert len(indexes.events) == 6
+    assert [e['event'] for e in indexes.events_in_range(resource="Filler_1")] == ["Event_0", "Event_2", "Event_4"]
+    overlapping = indexes.events_in_range(line="Line_1", start=datetime(2025, 1, 1, 7, 30), end=datetime(2025, 1, 1, 9))
+    assert [e['event'] for e in overlapping] == ["Event_1", "Event_2"]
+    assert indexes.events_in_range(resource="Unknown_1") == []
+
+
+def test_rollups(service_onto):
+    """Downtime by reason and events per shift are computed globally and per line."""
+    world, onto = service_onto
+    indexes = OntologyIndexes(world, onto)
+
+    assert indexes.downtime_by_reason[None] == {"Jam": {'downtimeMinutes': 60.0, 'events': 6}}
+    assert indexes.downtime_by_reason["Line_1"] == indexes.downtime_by_reason[None]
+    assert indexes.events_per_shift[None] == {"A": 3, "B": 3}
+
+
+def test_http_endpoints(service_onto):
+    """The server answers index endpoints and SPARQL, and reports unknown endpoints."""
+    world, onto = service_onto
+    server = create_server(OntologyIndexes(world, onto), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def get(path):
+        with urllib.request.urlopen(base + path) as response:
+            return json.loads(response.read())
+
+    try:
+        assert get("/health") == {'status': 'ok', 'events': 6}
+        events = get("/events?resource=Capper_1&start=2025-01-01T08:30:00&limit=1")
+        assert events['count'] == 2
+        assert events['events'][0]['event'] == "Event_3"
+        assert events['events'][0]['start'] == "2025-01-01T09:00:00"
+        assert get("/events-per-shift?line=Line_1") == {"A": 3, "B": 3}
+
+        query = "SELECT ?e WHERE { ?e a <http://test.org/service-test#EventRecord> } ORDER BY ?e LIMIT 1"
+        results = get("/sparql?query=" + urllib.parse.quote(query))
+        assert results['results']['bindings'] == [{'e': {'type': 'uri', 'value': "http://test.org/service-test#Event_0"}}]
+
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            get("/nowhere")
+        assert excinfo.value.code == 404
+
+        # Offsets cannot be matched against the naive local event times; limits must not be negative
+        for bad in ("start=2025-01-01T08:30:00-05:00", "end=2025-01-01T08:30:00Z", "limit=-1", "limit=x"):
+            with pytest.raises(urllib.error.HTTPError) as excinfo:
+                get(f"/events?resource=Capper_1&{bad}")
+            assert excinfo.value.code == 400
+        assert get("/events?resource=Capper_1&limit=0")['count'] == len(get("/events?resource=Capper_1")['events'])
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,117 @@
+"""
+Unit tests for ontology_generator.query.sparql module.
+
+This module tests the native SPARQL query runner, including:
+- Caching prepared queries by text
+- Streaming results as CSV and SPARQL JSON
+- Rejecting non-SELECT queries
+- The command-line entry point
+"""
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from owlready2 import World, Thing, ObjectProperty, DataProperty, FunctionalProperty, locstr
+
+from ontology_generator.query.sparql import PreparedQueryCache, run_query, main
+
+PREFIX = "PREFIX onto: <http://test.org/query-test#>\n"
+
+
+@pytest.fixture
+def query_onto():
+    """Create equipment on a line with typed and language-tagged literals."""
+    world = World()
+    onto = world.get_ontology("http://test.org/query-test#")
+    with onto:
+        class ProductionLine(Thing): pass
+        class Equipment(Thing): pass
+        class isPartOfProductionLine(ObjectProperty): pass
+        class equipmentId(DataProperty, FunctionalProperty): pass
+        class installedAt(DataProperty, FunctionalProperty): pass
+        class rampUpFlag(DataProperty, FunctionalProperty): pass
+        line = ProductionLine("Line_1")
+        line.label = [locstr("Línea 1", "es")]
+        for i in range(3):
+            equipment = Equipment(f"Equipment_{i}", equipmentId=f"E{i}", installedAt=datetime(2025, 1, i + 1))
+            equipment.isPartOfProductionLine = [line]
+        onto.Equipment_0.rampUpFlag = True
+    return world, onto
+
+
+def test_prepared_query_cache(query_onto):
+    """The same text is prepared once; surrounding whitespace does not matter."""
+    world, _ = query_onto
+    cache = PreparedQueryCache(max_size=1)
+    query = PREFIX + "SELECT ?e WHERE { ?e a onto:Equipment }"
+
+    first, _, first_cached = cache.get(world, query)
+    second, elapsed, second_cached = cache.get(world, "\n" + query + "  ")
+
+    assert first is second
+    assert (first_cached, second_cached, elapsed) == (False, True, 0.0)
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.get(world, PREFIX + "SELECT ?l WHERE { ?l a onto:ProductionLine }")
+    assert len(cache) == 1
+
+
+def test_run_query_csv(query_onto):
+    """CSV output has IRIs, XSD lexical forms and empty cells for unbound values."""
+    world, _ = query_onto
+    stream = io.StringIO()
+
+    timing = run_query(world, PREFIX + """
+        SELECT ?id ?at ?flag WHERE { ?e onto:equipmentId ?id ; onto:installedAt ?at . OPTIONAL { ?e onto:rampUpFlag ?flag } }
+        ORDER BY ?id""", stream, name="equipment")
+
+    assert stream.getvalue().splitlines() == [
+        "id,at,flag",
+        "E0,2025-01-01T00:00:00,true",
+        "E1,2025-01-02T00:00:00,",
+        "E2,2025-01-03T00:00:00,",
+    ]
+    assert timing['name'] == "equipment"
+    assert timing['rows'] == 3
+    assert timing['cached'] is False
+
+
+def test_run_query_json(query_onto):
+    """JSON output follows the SPARQL 1.1 results format."""
+    world, _ = query_onto
+    stream = io.StringIO()
+
+    run_query(world, PREFIX + "SELECT ?line ?label WHERE { ?line a onto:ProductionLine ; <http://www.w3.org/2000/01/rdf-schema#label> ?label }",
+              stream, format="json")
+
+    result = json.loads(stream.getvalue())
+    assert result["head"]["vars"] == ["line", "label"]
+    assert result["results"]["bindings"] == [{
+        "line": {"type": "uri", "value": "http://test.org/query-test#Line_1"},
+        "label": {"type": "literal", "value": "Línea 1", "xml:lang": "es"},
+    }]
+
+
+def test_run_query_rejects_updates(query_onto):
+    """Only SELECT queries are accepted."""
+    world, _ = query_onto
+    with pytest.raises(ValueError):
+        run_query(world, PREFIX + "INSERT { onto:Equipment_0 onto:equipmentId 'X' } WHERE {}", io.StringIO())
+
+
+def test_main_writes_one_file_per_query(query_onto, tmp_path, capsys):
+    """The CLI runs each query file into its own output file and prints timings."""
+    _, onto = query_onto
+    owl_path = str(tmp_path / "plant.owl")
+    onto.save(file=owl_path)
+    (tmp_path / "lines.rq").write_text(PREFIX + "SELECT ?l WHERE { ?l a onto:ProductionLine }")
+
+    exit_code = main([owl_path, "-f", str(tmp_path / "lines.rq"), "-q", PREFIX + "SELECT ?e WHERE { ?e a onto:Equipment }",
+                      "-o", str(tmp_path / "results"), "--repeat", "2"])
+
+    assert exit_code == 0
+    assert sorted(p.name for p in (tmp_path / "results").iterdir()) == ["lines.csv", "query_1.csv"]
+    assert len((tmp_path / "results" / "query_1.csv").read_text().splitlines()) == 4
+    timings = capsys.readouterr().err
+    assert "cached" in timings
@@ -0,0 +1,80 @@
+"""
+Tests for the synthetic data generator script.
+"""
+import csv
+import gzip
+import importlib.util
+import inspect
+import os
+
+import pytest
+
+from ontology_generator.config import DEFAULT_EQUIPMENT_SEQUENCE
+
+_SCRIPT = os.path.join(os.path.dirname(__file__), '..', '..', 'scripts', 'generate_synthetic_data.py')
+
+
+@pytest.fixture(scope="module")
+def synth():
+    """The generator script, loaded as a module (scripts/ is not a package)."""
+    spec = importlib.util.spec_from_file_location("generate_synthetic_data", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def profile(synth):
+    return synth.TemplateProfile(synth.DEFAULT_TEMPLATE_DATA_PATH)
+
+
+def _read(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_same_seed_same_output(synth, tmp_path):
+    """The same seed and sizes produce the same file; another seed does not."""
+    first = synth.write_synthetic_data(str(tmp_path / "a.csv"), 300, num_plants=1, lines_per_plant=3, seed=7)
+    second = synth.write_synthetic_data(str(tmp_path / "b.csv"), 300, num_plants=1, lines_per_plant=3, seed=7)
+    other = synth.write_synthetic_data(str(tmp_path / "c.csv"), 300, num_plants=1, lines_per_plant=3, seed=8)
+    assert _read(first) == _read(second)
+    assert _read(first) != _read(other)
+
+
+def test_header_matches_template(synth, profile):
+    """Rows use the template's columns, in its order."""
+    with open(synth.DEFAULT_TEMPLATE_DATA_PATH, newline="", encoding="utf-8") as f:
+        template_header = next(csv.reader(f))
+    generator = synth.SyntheticDataGenerator(profile, num_plants=1, lines_per_plant=2)
+    assert generator.header == template_header
+    assert all(len(row) == len(template_header) for row in generator.rows(50))
+
+
+def test_line_equipment_follows_sequence(synth, profile):
+    """Each line is followed by its equipment in DEFAULT_EQUIPMENT_SEQUENCE order, always with a Filler."""
+    generator = synth.SyntheticDataGenerator(profile, num_plants=2, lines_per_plant=6, seed=3)
+    assert len(generator.lines) == 12
+    for line in generator.lines:
+        assert line.resources[0].name == line.name and line.resources[0].is_line
+        equipment = line.resources[1:]
+        assert not any(resource.is_line for resource in equipment)
+        classes = [resource.name[len(line.name) + 1:] for resource in equipment]
+        assert all(resource.name == f"{line.name}_{cls}" for resource, cls in zip(equipment, classes))
+        positions = [DEFAULT_EQUIPMENT_SEQUENCE[cls] for cls in classes]
+        assert positions == sorted(set(positions))
+        assert classes[0] == "Filler"
+
+
+def test_write_streams_requested_rows(synth, profile, tmp_path):
+    """Rows are generated lazily and the written file holds exactly the requested count."""
+    generator = synth.SyntheticDataGenerator(profile, num_plants=1, lines_per_plant=2)
+    assert inspect.isgenerator(generator.rows(10))
+    assert sum(1 for _ in generator.rows(123)) == 123
+
+    for name, count in (("rows.csv", 1), ("rows.csv.gz", 457)):
+        path = synth.write_synthetic_data(str(tmp_path / name), count, lines_per_plant=2, seed=1)
+        rows = _read(path)
+        assert rows[0] == profile.header
+        assert len(rows) - 1 == count
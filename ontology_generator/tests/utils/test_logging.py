@@ -0,0 +1,63 @@
+"""
+Tests for the logging utilities.
+"""
+import logging
+
+from ontology_generator.utils import logging as logging_utils
+from ontology_generator.utils.logging import MessageMatcher, RepeatedWarningAggregator
+
+
+def _record(message, lineno=10, level=logging.WARNING):
+    return logging.LogRecord("ontology_population", level, "/src/events.py", lineno, message, None, None)
+
+
+def test_message_matcher():
+    """One pattern matches any substring, reporting the longest; special characters are literal."""
+    matcher = MessageMatcher(["Skipping", "Skipping link", "(Pass 2)", ""])
+    assert matcher.match("Row 5 - Skipping link to missing target") == "Skipping link"
+    assert matcher.match("Row 5 - Skipping row") == "Skipping"
+    assert matcher.match("Linked (Pass 2) event") == "(Pass 2)"
+    assert matcher.match("Pass 2 done") is None
+    assert MessageMatcher([]).match("anything") is None
+
+
+def test_repeated_warning_aggregator():
+    """The first warnings of a call site pass, later ones are counted with sampled examples."""
+    aggregator = RepeatedWarningAggregator(max_per_site=2, max_examples=2)
+    shown = [aggregator.filter(_record(f"Row {i} - missing shift")) for i in range(20)]
+    assert shown == [True, True] + [False] * 18
+    assert aggregator.filter(_record("Other site", lineno=11))
+    assert aggregator.filter(_record("Info message", level=logging.INFO))
+
+    # Errors report rejected rows and are never held back
+    errors = [aggregator.filter(_record(f"Row {i} - Pass 1: Critical error", lineno=12, level=logging.ERROR))
+              for i in range(3)]
+    assert errors == [True, True, True]
+
+    # A second handler sees the decision already taken for the record
+    record = _record("Row 20 - missing shift")
+    assert not aggregator.filter(record)
+    assert not aggregator.filter(record)
+
+    assert aggregator.aggregated_count == 19
+    assert aggregator.summary() == [
+        "events.py:10 (ontology_population): 19 more, e.g. 'Row 2 - missing shift'; 'Row 11 - missing shift'"
+    ]
+    aggregator.reset()
+    assert aggregator.aggregated_count == 0
+
+
+def test_repeated_warnings_summary_level(monkeypatch, caplog):
+    """The summary of held-back warnings is logged at WARNING, so it survives -q."""
+    aggregator = RepeatedWarningAggregator(max_per_site=1)
+    for site in range(3):
+        for i in range(3):
+            aggregator.filter(_record(f"Row {i} - missing shift", lineno=10 + site))
+    monkeypatch.setattr(logging_utils, "_warning_aggregator", aggregator)
+
+    with caplog.at_level(logging.WARNING, logger="create_ontology"):
+        logging_utils.log_suppressed_message_counts()
+    assert [record.levelno for record in caplog.records] == [logging.WARNING] * 4
+    assert "6 more warnings from 3 call sites" in caplog.records[0].getMessage()
+    # The summary lines share one call site but are not held back by the aggregator
+    assert all(aggregator.filter(record) for record in caplog.records)
@@ -0,0 +1,57 @@
+"""
+Tests for the run metrics registry.
+"""
+import json
+
+from ontology_generator.utils.metrics import MetricsRegistry
+
+
+def test_counters_gauges_and_histograms():
+    """Labelled series are kept apart and histograms bucket their observations."""
+    registry = MetricsRegistry()
+    registry.inc("cast_failures_total", column="GOOD_PRODUCTION_QTY", type="int")
+    registry.inc("cast_failures_total", 2, column="GOOD_PRODUCTION_QTY", type="int")
+    registry.inc("cast_failures_total", column="DOWNTIME", type="float")
+    registry.set("rows_per_second", 1500.0, phase="pass1")
+    for seconds in (0.0002, 0.003, 20.0):
+        registry.observe("row_seconds", seconds, phase="pass1")
+
+    assert registry.value("cast_failures_total", column="GOOD_PRODUCTION_QTY", type="int") == 3
+    assert registry.value("rows_per_second", phase="pass1") == 1500.0
+    assert registry.value("rows_per_second", phase="pass2") is None
+
+    histogram = registry.to_dict()["histograms"]["row_seconds"][0]
+    assert histogram["labels"] == {"phase": "pass1"}
+    assert histogram["count"] == 3
+    assert histogram["buckets"]["0.0005"] == 1
+    assert histogram["buckets"]["10.0"] == 2
+    assert histogram["buckets"]["+Inf"] == 3
+
+    registry.reset()
+    assert registry.to_dict() == {"counters": {}, "gauges": {}, "histograms": {}}
+
+
+def test_exports(tmp_path):
+    """The JSON summary carries extra sections; the textfile uses the exposition format."""
+    registry = MetricsRegistry()
+    registry.describe("individuals_created_total", "Individuals created per class.")
+    registry.inc("individuals_created_total", 4, owl_class='Odd "name"')
+    registry.observe("row_seconds", 0.01, buckets=(0.1, 1.0), phase="pass2")
+
+    json_path = tmp_path / "run.json"
+    registry.write_json(str(json_path), run={"success": True})
+    summary = json.loads(json_path.read_text())
+    assert summary["run"] == {"success": True}
+    assert summary["counters"]["individuals_created_total"] == [{"labels": {"owl_class": 'Odd "name"'}, "value": 4}]
+
+    prom_path = tmp_path / "metrics" / "ontology_generator.prom"
+    registry.write_prometheus(str(prom_path))
+    lines = prom_path.read_text().splitlines()
+    assert "# HELP ontology_generator_individuals_created_total Individuals created per class." in lines
+    assert "# TYPE ontology_generator_individuals_created_total counter" in lines
+    assert 'ontology_generator_individuals_created_total{owl_class="Odd \\"name\\""} 4' in lines
+    assert "# TYPE ontology_generator_row_seconds histogram" in lines
+    assert 'ontology_generator_row_seconds_bucket{phase="pass2",le="0.1"} 1' in lines
+    assert 'ontology_generator_row_seconds_bucket{phase="pass2",le="+Inf"} 1' in lines
+    assert 'ontology_generator_row_seconds_count{phase="pass2"} 1' in lines
+    assert not list(prom_path.parent.glob("*.tmp"))
@@ -0,0 +1,35 @@
+"""
+Tests for the pipeline phase timer.
+"""
+from ontology_generator.utils.phases import PhaseTimer, phase
+
+
+def test_phases_recorded_on_active_timers():
+    """Phases are recorded in order on every active timer and accumulate across runs."""
+    with PhaseTimer() as outer:
+        inner = PhaseTimer()
+        inner.start()
+        with phase("pass1"):
+            pass
+        inner.stop()
+        with phase("pass2"):
+            pass
+        with phase("pass1"):
+            pass
+
+    assert list(inner.phases) == ["pass1"]
+    assert list(outer.phases) == ["pass1", "pass2"]
+    assert outer.phases["pass1"]["calls"] == 2
+
+    result = outer.to_dict()
+    assert set(result) == {"phases", "total_seconds", "peak_rss_mb"}
+    assert result["phases"]["pass2"]["seconds"] >= 0
+    assert "pass1" in outer.summary()
+
+
+def test_phase_without_timer_is_noop():
+    """Marking a phase without an active timer records nothing."""
+    timer = PhaseTimer()
+    with phase("read"):
+        pass
+    assert timer.phases == {}
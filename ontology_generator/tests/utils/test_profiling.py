@@ -0,0 +1,65 @@
+"""
+Tests for the per-phase profiler.
+"""
+import json
+import os
+import tracemalloc
+
+from ontology_generator.utils.phases import phase
+from ontology_generator.utils.profiling import PhaseProfiler, profile_row
+
+
+def _build_rows(n):
+    return [{"row": str(i) * 50} for i in range(n)]
+
+
+def test_phase_profiler_writes_profiles(tmp_path):
+    """Every phase gets a pstats file and summary entries with functions and allocation sites."""
+    profile_dir = str(tmp_path / "profile")
+    kept = []
+    with PhaseProfiler(profile_dir, top_n=5) as profiler:
+        with phase("read"):
+            kept.append(_build_rows(2000))
+        with phase("save"):
+            _build_rows(10)
+    assert not tracemalloc.is_tracing()
+
+    written = profiler.write()
+    assert sorted(os.listdir(profile_dir)) == ["profile_summary.json", "profile_summary.txt", "read.pstats", "save.pstats"]
+    assert len(written) == 4
+
+    with open(os.path.join(profile_dir, "profile_summary.json")) as f:
+        summary = json.load(f)
+    read = summary["phases"]["read"]
+    assert read["calls"] == 1
+    assert any("_build_rows" in entry["function"] for entry in read["top_functions"])
+    assert len(read["top_allocations"]) <= 5
+    assert any(__file__ in entry["site"] and entry["size_kb"] > 0 for entry in read["top_allocations"])
+    with open(os.path.join(profile_dir, "profile_summary.txt")) as f:
+        assert "=== read:" in f.read()
+
+
+def test_phase_profiler_samples_rows(tmp_path):
+    """With row sampling, only every Nth row of a row phase is profiled and traced."""
+    kept = []
+    tracing = []
+    with PhaseProfiler(str(tmp_path), row_sample_every=10) as profiler:
+        with phase("pass1"):
+            for i in range(25):
+                profile_row(i)
+                tracing.append(tracemalloc.is_tracing())
+                kept.append(_build_rows(1))
+        assert tracemalloc.is_tracing()
+        with phase("spec"):
+            _build_rows(1)
+        profile_row(0) # Outside a row phase: ignored
+
+    assert profiler.sampled_rows == {"pass1": 3}
+    result = profiler.phase_profile("pass1")
+    assert result["sampled_rows"] == 3
+    calls = {entry["function"].split("(")[-1]: entry["ncalls"] for entry in result["top_functions"]}
+    assert calls["_build_rows)"] == 3
+    assert tracing == [i % 10 == 0 for i in range(25)]
+    blocks = sum(entry["blocks"] for entry in result["top_allocations"] if __file__ in entry["site"])
+    assert 0 < blocks < 25 * 2 # The sampled rows' dicts and strings, not every row's
+    assert "sampled_rows" not in profiler.phase_profile("spec")
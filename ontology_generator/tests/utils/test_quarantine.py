@@ -0,0 +1,48 @@
+"""
+Tests for the rejected-row quarantine writer.
+"""
+import csv
+
+import pytest
+
+from ontology_generator.definition.parser import read_data
+from ontology_generator.utils.quarantine import QUARANTINE_COLUMNS, QuarantineWriter
+
+ROWS = [
+    {"PLANT": "", "LINE_NAME": "L1", "EVENT_TYPE": "State"},
+    {"PLANT": "P1", "LINE_NAME": "L2", "EVENT_TYPE": "State", "row_num": 7},
+]
+
+
+@pytest.mark.parametrize("extension", ["csv", "jsonl"])
+def test_quarantine_round_trip(tmp_path, extension):
+    """Rejected rows are written with their metadata and read back as plain data rows."""
+    path = str(tmp_path / f"rejected.{extension}")
+    with QuarantineWriter(path, fieldnames=["PLANT", "LINE_NAME", "EVENT_TYPE"], batch_size=1) as quarantine:
+        quarantine.add(ROWS[0], 3, "pass1", "missing_plant")
+        quarantine.add(ROWS[1], 7, "pass2", "pass2_error", "KeyError: 'x'")
+    assert quarantine.count == 2
+    assert quarantine.counts == {("pass1", "missing_plant"): 1, ("pass2", "pass2_error"): 1}
+
+    if extension == "csv":
+        with open(path, newline="") as f:
+            written = list(csv.DictReader(f))
+        assert list(written[0])[:len(QUARANTINE_COLUMNS)] == QUARANTINE_COLUMNS
+        assert [row["_quarantine_row_num"] for row in written] == ["3", "7"]
+        assert written[1]["_quarantine_detail"] == "KeyError: 'x'"
+
+    # The transient row_num key is not a data column
+    assert read_data(path) == [
+        {"PLANT": "", "LINE_NAME": "L1", "EVENT_TYPE": "State"},
+        {"PLANT": "P1", "LINE_NAME": "L2", "EVENT_TYPE": "State"},
+    ]
+
+
+def test_quarantine_rejects_rows_after_close(tmp_path):
+    """A closed writer refuses new rows; an empty CSV quarantine is an empty file."""
+    quarantine = QuarantineWriter(str(tmp_path / "rejected.csv"))
+    quarantine.close()
+    quarantine.close()
+    with pytest.raises(ValueError):
+        quarantine.add(ROWS[0], 3, "pass1", "missing_plant")
+    assert read_data(str(tmp_path / "rejected.csv")) == []
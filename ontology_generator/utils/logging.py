@@ -2,10 +2,24 @@
 Logging utilities for the ontology generator.
 
 This module provides functions for setting up and configuring logging.
+
+Population logs from per-row hot paths, so the facilities here keep the cost
+of messages that are never shown low:
+
+- Hot paths pass message arguments lazily (logger.debug("... %s", value)),
+  so disabled levels cost a cached level check instead of string formatting.
+- MessageMatcher compiles the suppressed substrings into one regular
+  expression, tested once per record instead of once per substring.
+- RepeatedWarningAggregator lets the first warnings of each call site
+  through, then counts the rest with a few sampled examples and logs one
+  summary at the end of the run, at WARNING so it is kept with -q. Errors are
+  never held back: each one reports a rejected row.
 """
 import logging
+import os
+import re
 import sys
-from typing import Optional, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from ontology_generator.config import LOG_FORMAT, SUPPRESSED_WARNINGS, MessageFilter, setup_logging_filters
 
@@ -17,6 +31,23 @@ link_logger = logging.getLogger("event_linking")  # Logger for event linking pas
 main_logger = logging.getLogger("create_ontology")  # Logger for main script
 analysis_logger = logging.getLogger("ontology_analysis")  # Logger for analysis module
 
+class MessageMatcher:
+    """
+    Matches messages against a list of substrings with one compiled regular expression.
+    """
+    def __init__(self, substrings: Iterable[str]):
+        self.substrings = [s for s in substrings if s]
+        # Longest first, so the reported substring is the most specific one
+        pattern = "|".join(re.escape(s) for s in sorted(self.substrings, key=len, reverse=True))
+        self._search = re.compile(pattern).search if pattern else None
+
+    def match(self, message: str) -> Optional[str]:
+        """Return the first suppressed substring found in the message, or None."""
+        if self._search is None:
+            return None
+        found = self._search(message)
+        return found.group(0) if found else None
+
 class WarningSuppressionFilter(logging.Filter):
     """
     A logging filter that suppresses specific warning messages based on configured substrings.
@@ -24,17 +55,13 @@ class WarningSuppressionFilter(logging.Filter):
     def __init__(self, suppressed_warnings=None):
         super().__init__()
         self.suppressed_warnings = suppressed_warnings or []
+        self.matcher = MessageMatcher(self.suppressed_warnings)
         self.suppressed_count = 0
         
     def filter(self, record):
-        if record.levelno == logging.WARNING:
-            # Get the formatted message
-            message = record.getMessage()
-            # Check if any suppressed warning substring is in the message
-            for suppressed in self.suppressed_warnings:
-                if suppressed in message:
-                    self.suppressed_count += 1
-                    return False  # Suppress this warning
+        if record.levelno == logging.WARNING and self.matcher.match(record.getMessage()):
+            self.suppressed_count += 1
+            return False  # Suppress this warning
         return True  # Let other messages through
 
 class InfoSuppressionFilter(logging.Filter):
@@ -44,19 +71,80 @@ class InfoSuppressionFilter(logging.Filter):
     def __init__(self, suppressed_info=None):
         super().__init__()
         self.suppressed_info = suppressed_info or []
+        self.matcher = MessageMatcher(self.suppressed_info)
         self.suppressed_count = 0
         
     def filter(self, record):
-        if record.levelno == logging.INFO:
-            # Get the formatted message
-            message = record.getMessage()
-            # Check if any suppressed info substring is in the message
-            for suppressed in self.suppressed_info:
-                if suppressed in message:
-                    self.suppressed_count += 1
-                    return False  # Suppress this info message
+        if record.levelno == logging.INFO and self.matcher.match(record.getMessage()):
+            self.suppressed_count += 1
+            return False  # Suppress this info message
         return True  # Let other messages through
 
+class RepeatedWarningAggregator(logging.Filter):
+    """
+    A handler filter that aggregates repeated warnings per call site.
+
+    The first `max_per_site` warnings of each call site (logger, file and line)
+    are shown; later ones are counted and a few are kept as examples, sampled
+    at the 1st, 10th, 100th, ... repetition so they span the run.
+
+    Attributes:
+        categories: {(logger name, file, line): [shown, aggregated, examples]}
+    """
+    def __init__(self, max_per_site: int = 5, max_examples: int = 3):
+        super().__init__()
+        self.max_per_site = max_per_site
+        self.max_examples = max_examples
+        self.categories: Dict[Tuple[str, str, int], list] = {}
+
+    def filter(self, record):
+        if record.levelno != logging.WARNING:
+            return True
+        decision = getattr(record, "_repeat_shown", None)
+        if decision is not None: # Already decided by another handler
+            return decision
+        record._repeat_shown = self._decide(record)
+        return record._repeat_shown
+
+    def _decide(self, record) -> bool:
+        key = (record.name, record.pathname, record.lineno)
+        category = self.categories.get(key)
+        if category is None:
+            category = self.categories[key] = [0, 0, []]
+        if category[0] < self.max_per_site:
+            category[0] += 1
+            return True
+        category[1] += 1
+        aggregated = category[1]
+        if len(category[2]) < self.max_examples and aggregated == 10 ** len(category[2]):
+            category[2].append(record.getMessage())
+        return False
+
+    @property
+    def aggregated_count(self) -> int:
+        """Number of warnings held back."""
+        return sum(category[1] for category in self.categories.values())
+
+    def summary(self) -> List[str]:
+        """
+        Summary lines of the aggregated warnings, most frequent call site first.
+
+        Returns:
+            List of lines such as "events.py:512 (ontology_population): 1995 more, e.g. '...'"
+        """
+        lines = []
+        ranked = sorted(self.categories.items(), key=lambda item: item[1][1], reverse=True)
+        for (name, pathname, lineno), (_, aggregated, examples) in ranked:
+            if not aggregated:
+                continue
+            sample = "; ".join(f"'{example}'" for example in examples)
+            lines.append(f"{os.path.basename(pathname)}:{lineno} ({name}): {aggregated} more, e.g. {sample}")
+        return lines
+
+    def reset(self) -> None:
+        """Forget all counts (e.g. at the start of a run)."""
+        self.categories.clear()
+
 def configure_logging(
     log_level: int = logging.INFO,
     log_file: Optional[str] = None,
@@ -95,6 +183,11 @@ def configure_logging(
         for handler in handlers:
             root_logger.addHandler(handler)
     
+    # Aggregate repeated warnings on every root handler
+    warning_aggregator = RepeatedWarningAggregator()
+    for handler in root_logger.handlers:
+        handler.addFilter(warning_aggregator)
+
     # Set up warning suppression filter for specific loggers
     warning_filter = WarningSuppressionFilter(SUPPRESSED_WARNINGS)
     for logger_name in [
@@ -111,9 +204,10 @@ def configure_logging(
     pop_logger.addFilter(info_filter)
     
     # Store filters for later access
-    global _warning_filter, _info_filter
+    global _warning_filter, _info_filter, _warning_aggregator
     _warning_filter = warning_filter
     _info_filter = info_filter
+    _warning_aggregator = warning_aggregator
     
     # Set up message filter for SUPPRESSED_WARNINGS at all log levels
     setup_logging_filters()
@@ -131,6 +225,7 @@ def configure_logging(
 # Global variables to store filter instances
 _warning_filter = None
 _info_filter = None
+_warning_aggregator = None
 
 def get_suppressed_message_counts():
     """
@@ -156,6 +251,19 @@ def log_suppressed_message_counts():
     else:
         main_logger.info("No messages have been suppressed by filters")
 
+    if _warning_aggregator and _warning_aggregator.aggregated_count:
+        lines = _warning_aggregator.summary()
+        shown = {"_repeat_shown": True}  # The summary itself is never aggregated
+        main_logger.warning(f"Repeated warnings: {_warning_aggregator.aggregated_count} more warnings from "
+                            f"{len(lines)} call sites were not shown:", extra=shown)
+        for line in lines:
+            main_logger.warning(f"  {line}", extra=shown)
+
+def reset_repeated_warnings() -> None:
+    """Reset the repeated-warning counts, so each run summarizes its own warnings."""
+    if _warning_aggregator:
+        _warning_aggregator.reset()
+
 def get_module_logger(name: str) -> logging.Logger:
     """
     Get a logger for a specific module with the specified name.
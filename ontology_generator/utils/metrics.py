@@ -0,0 +1,241 @@
+"""
+Run metrics module for the ontology generator.
+
+This module provides a small metrics registry with labelled counters, gauges and
+histograms. The pipeline records into the process-wide `metrics` registry
+(reset at the start of every main_ontology_generation run):
+
+- rows processed and rows/sec per population pass, and per-row latency histograms
+- individuals created per class and get_or_create registry hits/misses
+- cast failures per data column
+- wall time, peak RSS and quadstore writes per phase (from the PhaseTimer)
+
+Input-driven metrics (rows, individuals, cast failures) and code-driven ones
+(rows/sec, latency, phase time) are kept apart so alerts can tell slower input
+from slower code. The registry exports a JSON run summary and a Prometheus
+textfile-collector file.
+"""
+import bisect
+import contextlib
+import json
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+METRIC_PREFIX = "ontology_generator_"
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(labels: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _Histogram:
+    """Bucket counts, sum and count of observed values."""
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1) # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+class MetricsRegistry:
+    """
+    Labelled counters, gauges and histograms for one run.
+
+    Attributes:
+        counters: {name: {label key: value}}
+        gauges: {name: {label key: value}}
+        histograms: {name: {label key: _Histogram}}
+        help: {name: description} for the Prometheus export
+    """
+    def __init__(self):
+        self.counters: Dict[str, Dict[LabelKey, float]] = {}
+        self.gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self.histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self.help: Dict[str, str] = {}
+
+    def reset(self) -> None:
+        """Drop all recorded values."""
+        self.counters.clear()
+        self.gauges.clear()
+        self.histograms.clear()
+
+    def describe(self, name: str, text: str) -> None:
+        """Set the help text of a metric."""
+        self.help[name] = text
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        """Add to a counter."""
+        series = self.counters.setdefault(name, {})
+        key = _label_key(labels) if labels else ()
+        series[key] = series.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels: Any) -> None:
+        """Set a gauge."""
+        self.gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def observe(self, name: str, value: float, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, **labels: Any) -> None:
+        """Add an observation to a histogram (buckets are fixed by the first observation)."""
+        series = self.histograms.setdefault(name, {})
+        key = _label_key(labels) if labels else ()
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = _Histogram(tuple(buckets))
+        histogram.observe(value)
+
+    @contextlib.contextmanager
+    def timer(self, name: str, **labels: Any) -> Iterator[None]:
+        """Observe the duration of the enclosed block in seconds on a histogram."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def value(self, name: str, **labels: Any) -> Optional[float]:
+        """Current value of a counter or gauge, or None."""
+        key = _label_key(labels)
+        for store in (self.counters, self.gauges):
+            if name in store and key in store[name]:
+                return store[name][key]
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return all metrics as a JSON-serializable dictionary.
+
+        Returns:
+            Dict with 'counters', 'gauges' and 'histograms'; each maps a metric name to a list
+            of {'labels': {...}, 'value': ...} (histograms: 'count', 'sum', 'buckets')
+        """
+        def series(store, render):
+            return {name: [dict(labels=dict(key), **render(value)) for key, value in sorted(values.items())]
+                    for name, values in sorted(store.items())}
+        return {
+            "counters": series(self.counters, lambda v: {"value": v}),
+            "gauges": series(self.gauges, lambda v: {"value": v}),
+            "histograms": series(self.histograms, lambda h: {
+                "count": h.count, "sum": round(h.sum, 6),
+                "buckets": {_format_value(bound): count for bound, count in h.cumulative()},
+            }),
+        }
+
+    def to_prometheus(self, prefix: str = METRIC_PREFIX) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Prefix added to every metric name
+
+        Returns:
+            str: The exposition text
+        """
+        lines = []
+        for store, kind in ((self.counters, "counter"), (self.gauges, "gauge")):
+            for name, values in sorted(store.items()):
+                full_name = prefix + name
+                if name in self.help:
+                    lines.append(f"# HELP {full_name} {self.help[name]}")
+                lines.append(f"# TYPE {full_name} {kind}")
+                for key, value in sorted(values.items()):
+                    lines.append(f"{full_name}{_format_labels(key)} {_format_value(value)}")
+        for name, values in sorted(self.histograms.items()):
+            full_name = prefix + name
+            if name in self.help:
+                lines.append(f"# HELP {full_name} {self.help[name]}")
+            lines.append(f"# TYPE {full_name} histogram")
+            for key, histogram in sorted(values.items()):
+                for bound, count in histogram.cumulative():
+                    lines.append(f"{full_name}_bucket{_format_labels(key, ('le', _format_value(bound)))} {count}")
+                lines.append(f"{full_name}_sum{_format_labels(key)} {_format_value(histogram.sum)}")
+                lines.append(f"{full_name}_count{_format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path: str, **sections: Any) -> None:
+        """
+        Write a JSON run summary.
+
+        Args:
+            path: Destination file
+            **sections: Extra top-level sections (e.g. run=..., phases=...)
+        """
+        summary = dict(sections)
+        summary.update(self.to_dict())
+        _atomic_write(path, json.dumps(summary, indent=2, default=str))
+
+    def write_prometheus(self, path: str, prefix: str = METRIC_PREFIX) -> None:
+        """
+        Write a Prometheus textfile-collector file (*.prom).
+
+        The file is written to a temporary name and renamed, so the collector
+        never reads a partial file.
+
+        Args:
+            path: Destination file
+            prefix: Prefix added to every metric name
+        """
+        _atomic_write(path, self.to_prometheus(prefix))
+
+def _atomic_write(path: str, text: str) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+# Help texts of the metrics the pipeline records
+PIPELINE_METRICS = {
+    "rows_total": "Data rows processed per population pass and outcome.",
+    "rows_per_second": "Data rows processed per second in each population pass.",
+    "row_seconds": "Processing time per data row in each population pass.",
+    "individuals_created_total": "Individuals created per OWL class.",
+    "get_or_create_total": "get_or_create lookups by result (hit: registry, ontology: found in the ontology, created).",
+    "cast_failures_total": "Values that could not be cast to their mapped type, per data column.",
+    "dimension_tuples_total": "Distinct dimension tuples resolved per dimension by dimension-first population.",
+    "rows_filtered_total": "Data rows skipped by the read-time row filter, per criterion (plant, line, date).",
+    "rows_rejected_total": "Data rows rejected during population, per phase and reason code.",
+    "unresolved_links_total": "Rows whose column-based object property link target was not found, per link.",
+    "property_values_set_total": "Property values set during population, per property.",
+    "phase_seconds": "Wall time per pipeline phase.",
+    "phase_peak_rss_bytes": "Peak resident memory per pipeline phase.",
+    "phase_quadstore_writes": "Rows written to the quadstore per pipeline phase.",
+    "input_bytes": "Size of the input data file.",
+    "run_seconds": "Wall time of the generation run.",
+    "run_success": "1 if the generation run succeeded, else 0.",
+    "run_timestamp_seconds": "Unix time the generation run finished.",
+}
+
+# Process-wide registry the pipeline records into
+metrics = MetricsRegistry()
+for _name, _text in PIPELINE_METRICS.items():
+    metrics.describe(_name, _text)
@@ -0,0 +1,192 @@
+"""
+Pipeline phase timing module for the ontology generator.
+
+This module records wall time and memory for the phases of a generation run
+(spec parsing, TBox, read, Pass 1, Pass 2, sequencing, analysis, reasoning,
+save). main_ontology_generation wraps each step in `phase(name)`; the phases are
+recorded on the active PhaseTimers, if any, so code deep in the pipeline can mark
+a phase without a timer being passed through every call.
+
+Peak RSS is measured per phase on Linux by resetting the kernel's high-water
+mark (/proc/self/clear_refs) when a phase starts and reading VmHWM when it ends.
+Where that is not possible the process-wide peak (getrusage) is reported instead.
+"""
+import contextlib
+import sys
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError: # Windows
+    resource = None
+
+_active_timers: List["PhaseTimer"] = []
+
+def _read_status_kb(field: str) -> Optional[int]:
+    """Read a kB value (VmRSS, VmHWM) from /proc/self/status, or None where unavailable."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+def _reset_peak_rss() -> bool:
+    """Reset the peak RSS high-water mark of this process (Linux 4.0+)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+def _process_peak_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak # macOS reports bytes
+
+class PhaseTimer:
+    """
+    Collects per-phase wall time and memory of a run.
+
+    Use it as a context manager (or start()/stop()) to make it active; phases
+    marked with `phase(name)` while it is active are recorded in order, on every
+    active timer, so a caller's timer sees the phases of a nested run. Subclasses
+    can act when a phase starts and ends (phase_started/phase_finished), e.g. to
+    profile it. A phase that runs
+    several times (e.g. one per partition) accumulates its time and keeps the
+    highest peak. Probes added with add_probe() are read when a phase starts and
+    ends, and their difference is recorded on the phase (e.g. quadstore writes).
+
+    Attributes:
+        phases: {phase name: {'seconds', 'peak_rss_mb', 'rss_mb', 'calls', <probe>...}} in first-run order
+    """
+    def __init__(self):
+        self.phases: Dict[str, Dict[str, Any]] = {}
+        self.probes: Dict[str, Callable[[], float]] = {}
+        self.started = time.perf_counter()
+        self.total_seconds: Optional[float] = None
+
+    def __enter__(self) -> "PhaseTimer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Make this timer active (phases are recorded on every active timer)."""
+        self.started = time.perf_counter()
+        _active_timers.append(self)
+
+    def stop(self) -> None:
+        """Stop recording and fix the total time."""
+        self.total_seconds = time.perf_counter() - self.started
+        if self in _active_timers:
+            _active_timers.remove(self)
+
+    def add_probe(self, name: str, read: Callable[[], float]) -> None:
+        """
+        Record the change of a counter per phase.
+
+        Args:
+            name: Key of the value on each phase entry
+            read: Returns the counter's current value; failures are ignored
+        """
+        self.probes[name] = read
+
+    def read_probes(self) -> Dict[str, float]:
+        """Current value of every probe."""
+        values = {}
+        for name, read in self.probes.items():
+            try:
+                values[name] = read()
+            except Exception:
+                pass
+        return values
+
+    def phase_started(self, name: str) -> None:
+        """Called when a phase starts, before its probes are read (no-op; for subclasses)."""
+
+    def phase_finished(self, name: str) -> None:
+        """Called when a phase ends, before it is recorded (no-op; for subclasses)."""
+
+    def record(self, name: str, seconds: float, peak_rss_kb: Optional[int], rss_kb: Optional[int],
+               deltas: Optional[Dict[str, float]] = None) -> None:
+        """Record one run of a phase."""
+        entry = self.phases.setdefault(name, {"seconds": 0.0, "peak_rss_mb": None, "rss_mb": None, "calls": 0})
+        entry["seconds"] += seconds
+        entry["calls"] += 1
+        for probe, delta in (deltas or {}).items():
+            entry[probe] = entry.get(probe, 0) + delta
+        if peak_rss_kb is not None:
+            entry["peak_rss_mb"] = max(entry["peak_rss_mb"] or 0.0, round(peak_rss_kb / 1024, 1))
+        if rss_kb is not None:
+            entry["rss_mb"] = round(rss_kb / 1024, 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the recorded phases as a JSON-serializable dictionary.
+
+        Returns:
+            Dict with 'phases' (name -> seconds, peak_rss_mb, rss_mb, calls), 'total_seconds'
+            and 'peak_rss_mb' (the highest peak of the run)
+        """
+        # Resetting the high-water mark also resets getrusage's peak, so combine it with the phase peaks
+        peak = _process_peak_rss_kb()
+        peaks = [entry["peak_rss_mb"] for entry in self.phases.values() if entry["peak_rss_mb"] is not None]
+        if peak is not None:
+            peaks.append(round(peak / 1024, 1))
+        total = self.total_seconds if self.total_seconds is not None else time.perf_counter() - self.started
+        return {
+            "phases": {name: dict(entry, seconds=round(entry["seconds"], 4)) for name, entry in self.phases.items()},
+            "total_seconds": round(total, 4),
+            "peak_rss_mb": max(peaks) if peaks else None,
+        }
+
+    def summary(self) -> str:
+        """One-line summary, e.g. 'spec 0.12s, tbox 0.40s (85 MB), ...'."""
+        parts = []
+        for name, entry in self.phases.items():
+            memory = f" ({entry['peak_rss_mb']:.0f} MB)" if entry["peak_rss_mb"] is not None else ""
+            parts.append(f"{name} {entry['seconds']:.2f}s{memory}")
+        return ", ".join(parts)
+
+@contextlib.contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    Record the enclosed block as a phase on the active PhaseTimers.
+
+    Does nothing when no timer is active. Phases should not nest: a nested phase
+    resets the peak RSS of the enclosing one.
+
+    Args:
+        name: Phase name (spec, tbox, read, pass1, pass2, sequencing, analysis, reasoning, save, ...)
+    """
+    timers = list(_active_timers)
+    if not timers:
+        yield
+        return
+    for timer in timers:
+        timer.phase_started(name)
+    per_phase_peak = _reset_peak_rss()
+    before = [timer.read_probes() for timer in timers]
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        for timer in reversed(timers):
+            timer.phase_finished(name)
+        peak = _read_status_kb("VmHWM") if per_phase_peak else None
+        if peak is None:
+            peak = _process_peak_rss_kb()
+        rss = _read_status_kb("VmRSS")
+        for timer, start_values in zip(timers, before):
+            end_values = timer.read_probes()
+            deltas = {probe: end_values[probe] - value for probe, value in start_values.items() if probe in end_values}
+            timer.record(name, seconds, peak, rss, deltas)
@@ -0,0 +1,312 @@
+"""
+Profiling module for the ontology generator.
+
+PhaseProfiler is a PhaseTimer that also runs cProfile and tracemalloc around
+every phase of a run (spec, tbox, read, pass1, pass2, sequencing, analysis,
+reasoning, save), so profiles of production-sized runs can be collected without
+instrumenting code by hand. It writes to its profile directory:
+
+- <phase>.pstats: the cProfile statistics of each phase (open with
+  `python -m pstats` or a viewer such as snakeviz)
+- profile_summary.txt: per phase, the time, the top functions by cumulative
+  time and the top allocation sites (tracemalloc snapshot difference between
+  the start and end of the phase)
+- profile_summary.json: the same summary, machine-readable
+
+On big inputs the row loops of Pass 1 and Pass 2 can be sampled: with
+row_sample_every=N only every Nth row runs under cProfile (the loops mark each
+row with profile_row()). tracemalloc is stopped for the rest of the row phase,
+and each sampled row is traced on its own: tracing starts with the row and a
+snapshot taken when it ends gives the memory the row allocated and still holds.
+The allocation sites of a sampled row phase therefore sum the sampled rows
+only, like its cProfile statistics. Other phases are traced in full.
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+
+from ontology_generator.utils.phases import PhaseTimer
+
+# Phases whose row loops call profile_row()
+ROW_PHASES = ("pass1", "pass2")
+SUMMARY_BASENAME = "profile_summary"
+
+_sampling_profilers: List["PhaseProfiler"] = []
+
+AllocationSites = Dict[str, Tuple[int, int]] # {'file:line': (bytes, blocks)}
+
+def _allocation_sites() -> Optional[AllocationSites]:
+    """
+    Traced memory per allocation site, or None when tracemalloc is not tracing.
+
+    Sites in tracemalloc itself and the import machinery are left out. The
+    sites are grouped before filtering: filtering a snapshot's traces is several
+    times slower than grouping them.
+    """
+    if not tracemalloc.is_tracing():
+        return None
+    sites = {}
+    for stat in tracemalloc.take_snapshot().statistics("lineno"):
+        frame = stat.traceback[0]
+        if frame.filename == tracemalloc.__file__ or frame.filename.startswith(("<frozen importlib", "<unknown>")):
+            continue
+        sites[f"{frame.filename}:{frame.lineno}"] = (stat.size, stat.count)
+    return sites
+
+def _function_label(func) -> str:
+    filename, lineno, name = func
+    if filename == "~": # Built-in
+        return name
+    return f"{os.path.basename(filename)}:{lineno}({name})"
+
+class PhaseProfiler(PhaseTimer):
+    """
+    A PhaseTimer that profiles every phase with cProfile and tracemalloc.
+
+    A phase that runs several times accumulates into one profile. Phases should
+    not nest (see phase()); if they do, the enclosing phase's profile is paused
+    while the inner one runs.
+
+    Allocation sites are compared between the end of the previous phase and the
+    end of each phase (a snapshot is taken per phase, not two), so allocations
+    made between two phases count towards the next one. Snapshots are taken
+    outside the timed part of the phases; their cost is reported as
+    snapshot_seconds.
+
+    Attributes:
+        profile_dir: Directory the profiles and the summary are written to
+        row_sample_every: Profile every Nth row of the Pass 1/Pass 2 loops (1: all rows)
+        top_n: Number of functions and allocation sites listed per phase
+        profiles: {phase name: cProfile.Profile}
+        allocations: {phase name: {'file:line': [size change in bytes, block count change]}}
+        sampled_rows: {phase name: rows profiled} for sampled row phases
+        snapshot_seconds: Time spent taking allocation snapshots
+    """
+    def __init__(self, profile_dir: str, row_sample_every: int = 1, top_n: int = 25, trace_frames: int = 1):
+        super().__init__()
+        self.profile_dir = profile_dir
+        self.row_sample_every = max(1, row_sample_every)
+        self.top_n = top_n
+        self.trace_frames = trace_frames
+        self.profiles: Dict[str, cProfile.Profile] = {}
+        self.allocations: Dict[str, Dict[str, List[int]]] = {}
+        self.sampled_rows: Dict[str, int] = {}
+        self._running: List[str] = [] # Phases being profiled, innermost last
+        self.snapshot_seconds = 0.0
+        self._baselines: List[Optional[AllocationSites]] = []
+        self._last_sites: Optional[AllocationSites] = None # At the end of the last top-level phase
+        self._row_phase: Optional[str] = None
+        self._trace_rows = False # Tracing sampled rows only (tracemalloc stopped between them)
+        self._started_tracing = False
+
+    def start(self) -> None:
+        """Start tracing allocations and make this profiler active."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+            self._started_tracing = True
+        super().start()
+        if self.row_sample_every > 1:
+            _sampling_profilers.append(self)
+
+    def stop(self) -> None:
+        """Stop recording, and stop tracing allocations if this profiler started it."""
+        super().stop()
+        if self in _sampling_profilers:
+            _sampling_profilers.remove(self)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def phase_started(self, name: str) -> None:
+        if self._running:
+            self.profiles[self._running[-1]].disable()
+        sample_rows = self.row_sample_every > 1 and name in ROW_PHASES
+        if sample_rows and self._started_tracing and not self._running:
+            # Allocations are traced per sampled row by sample_row(); no phase-wide difference
+            self._baselines.append(None)
+            tracemalloc.stop()
+            self._trace_rows = True
+        else:
+            self._baselines.append(self._last_sites if self._last_sites is not None and not self._running
+                                   else self._snapshot())
+        self._running.append(name)
+        profile = self.profiles.setdefault(name, cProfile.Profile())
+        if sample_rows:
+            self._row_phase = name # Enabled per sampled row by sample_row()
+            self.sampled_rows.setdefault(name, 0)
+        else:
+            profile.enable()
+
+    def phase_finished(self, name: str) -> None:
+        if not self._running or self._running[-1] != name:
+            return
+        self._running.pop()
+        self.profiles[name].disable()
+        if self._row_phase == name:
+            self._row_phase = None
+            if self._trace_rows:
+                self._finish_row_trace(name)
+                self._trace_rows = False
+                tracemalloc.start(self.trace_frames)
+        before = self._baselines.pop()
+        after = self._snapshot() if before is not None else None
+        if after is not None:
+            self._add_allocations(name, before, after)
+        self._last_sites = None if self._running else after
+        if self._running and self._running[-1] != self._row_phase:
+            self.profiles[self._running[-1]].enable()
+
+    def sample_row(self, index: int) -> None:
+        """Profile the row starting now if it is sampled; stop profiling the previous one."""
+        if self._row_phase is None:
+            return
+        profile = self.profiles[self._row_phase]
+        profile.disable()
+        if self._trace_rows:
+            self._finish_row_trace(self._row_phase)
+        if index % self.row_sample_every == 0:
+            if self._trace_rows:
+                tracemalloc.start(self.trace_frames)
+            profile.enable()
+            self.sampled_rows[self._row_phase] += 1
+
+    def _finish_row_trace(self, name: str) -> None:
+        """Record the allocations of the sampled row being traced, if any, and stop tracing."""
+        if tracemalloc.is_tracing():
+            sites = self._snapshot()
+            tracemalloc.stop()
+            self._add_allocations(name, {}, sites)
+
+    def _snapshot(self) -> Optional[AllocationSites]:
+        start = time.perf_counter()
+        sites = _allocation_sites()
+        self.snapshot_seconds += time.perf_counter() - start
+        return sites
+
+    def _add_allocations(self, name: str, before: AllocationSites, after: AllocationSites) -> None:
+        sites = self.allocations.setdefault(name, {})
+        for key in after.keys() | before.keys():
+            size, count = after.get(key, (0, 0))
+            size_before, count_before = before.get(key, (0, 0))
+            if size != size_before or count != count_before:
+                site = sites.setdefault(key, [0, 0])
+                site[0] += size - size_before
+                site[1] += count - count_before
+
+    def phase_profile(self, name: str) -> Dict[str, Any]:
+        """
+        Summary of one phase's profile.
+
+        Args:
+            name: Phase name
+
+        Returns:
+            Dict with 'seconds', 'calls', 'peak_rss_mb', 'sampled_rows' (sampled row phases only),
+            'top_functions' (function, ncalls, tottime, cumtime) and 'top_allocations'
+            (site, size_kb, blocks), largest first
+        """
+        entry = self.phases.get(name, {})
+        result: Dict[str, Any] = {
+            "seconds": round(entry.get("seconds", 0.0), 4),
+            "calls": entry.get("calls", 0),
+            "peak_rss_mb": entry.get("peak_rss_mb"),
+        }
+        if name in self.sampled_rows:
+            result["sampled_rows"] = self.sampled_rows[name]
+        result["top_functions"] = []
+        stats = self._stats(name)
+        if stats is not None:
+            for func in stats.sort_stats("cumulative").fcn_list[:self.top_n]:
+                _, ncalls, tottime, cumtime, _ = stats.stats[func]
+                result["top_functions"].append({
+                    "function": _function_label(func), "ncalls": ncalls,
+                    "tottime": round(tottime, 4), "cumtime": round(cumtime, 4),
+                })
+        ranked = sorted(self.allocations.get(name, {}).items(), key=lambda item: abs(item[1][0]), reverse=True)
+        result["top_allocations"] = [
+            {"site": site, "size_kb": round(size / 1024, 1), "blocks": count}
+            for site, (size, count) in ranked[:self.top_n]
+        ]
+        return result
+
+    def _stats(self, name: str, stream=None) -> Optional[pstats.Stats]:
+        profile = self.profiles.get(name)
+        if profile is None:
+            return None
+        try:
+            return pstats.Stats(profile, stream=stream)
+        except TypeError: # Nothing was profiled (e.g. no sampled row)
+            return None
+
+    def write(self) -> List[str]:
+        """
+        Write the per-phase pstats files and the text/JSON summary to profile_dir.
+
+        Returns:
+            List of the files written
+        """
+        os.makedirs(self.profile_dir, exist_ok=True)
+        written = []
+        for name in self.profiles:
+            stats = self._stats(name)
+            if stats is not None:
+                path = os.path.join(self.profile_dir, f"{name}.pstats")
+                stats.dump_stats(path)
+                written.append(path)
+
+        timings = self.to_dict()
+        summary = {
+            "total_seconds": timings["total_seconds"],
+            "peak_rss_mb": timings["peak_rss_mb"],
+            "row_sample_every": self.row_sample_every,
+            "snapshot_seconds": round(self.snapshot_seconds, 2),
+            "phases": {name: self.phase_profile(name) for name in self.profiles},
+        }
+        json_path = os.path.join(self.profile_dir, f"{SUMMARY_BASENAME}.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        written.append(json_path)
+
+        text_path = os.path.join(self.profile_dir, f"{SUMMARY_BASENAME}.txt")
+        with open(text_path, "w", encoding="utf-8") as f:
+            f.write(self._summary_text(summary))
+        written.append(text_path)
+        return written
+
+    def _summary_text(self, summary: Dict[str, Any]) -> str:
+        out = io.StringIO()
+        out.write(f"Total {summary['total_seconds']:.2f} s, peak RSS {summary['peak_rss_mb']} MB, "
+                  f"{summary['snapshot_seconds']:.2f} s taking allocation snapshots\n")
+        if self.row_sample_every > 1:
+            out.write(f"Pass 1/Pass 2 profiles and allocation sites cover one row in every {self.row_sample_every}\n")
+        for name, entry in summary["phases"].items():
+            out.write(f"\n=== {name}: {entry['seconds']:.2f} s in {entry['calls']} call(s)")
+            if "sampled_rows" in entry:
+                out.write(f", {entry['sampled_rows']} rows profiled")
+            out.write(" ===\n")
+            stats = self._stats(name, stream=out)
+            if stats is not None:
+                stats.sort_stats("cumulative").print_stats(self.top_n)
+            if entry["top_allocations"]:
+                out.write("Top allocation sites (net change over the phase):\n")
+                for site in entry["top_allocations"]:
+                    out.write(f"  {site['size_kb']:>12.1f} KiB {site['blocks']:>10} blocks  {site['site']}\n")
+        return out.getvalue()
+
+def profile_row(index: int) -> None:
+    """
+    Mark the start of a row in the Pass 1/Pass 2 loops.
+
+    Active PhaseProfilers that sample rows profile the row only if it is every
+    Nth one; does nothing otherwise.
+
+    Args:
+        index: 0-based row index
+    """
+    for profiler in _sampling_profilers:
+        profiler.sample_row(index)